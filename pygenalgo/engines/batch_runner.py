@@ -0,0 +1,397 @@
+""" Batch multi-run driver module. """
+import os
+import random
+import time
+from itertools import product
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from joblib import (Parallel, delayed)
+
+from pygenalgo.engines import logger
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig
+from pygenalgo.operators.genetic_operator import GeneticOperator
+
+# Public interface.
+__all__ = ["RunSpec", "BatchResult", "BatchRunner"]
+
+
+@dataclass(frozen=True)
+class RunSpec:
+    """
+    Auxiliary dataclass with the specification of one run of the batch.
+    """
+
+    factory: Callable[[], GenericGA]
+    '''
+    Function without arguments that creates the engine (with its initial
+    population and genetic operators). It is called in the worker process,
+    after the seeding, so it must be picklable (cloudpickle).
+    '''
+
+    config: RunConfig = field(default_factory=RunConfig)
+    '''
+    The configuration of the run.
+    '''
+
+    seed: int = 0
+    '''
+    The seed of all the random generators of the run.
+    '''
+
+    label: str = ""
+    '''
+    The name of the (factory, config) combination, e.g. for the sweeps.
+    '''
+# _end_class_
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Auxiliary dataclass with the results of all the runs in compact arrays
+    (one row per run, in the order of the specifications).
+    """
+
+    labels: list[str]
+    '''
+    The labels of the runs.
+    '''
+
+    seeds: NDArray
+    '''
+    The seeds of the runs, shape (n_runs,).
+    '''
+
+    best: NDArray
+    '''
+    The best (final) fitness of the runs, shape (n_runs,). It is NaN
+    if the fitness has multiple objectives.
+    '''
+
+    f_evals: NDArray
+    '''
+    The function evaluations of the runs, shape (n_runs,).
+    '''
+
+    elapsed_time: NDArray
+    '''
+    The duration of the runs in seconds, shape (n_runs,).
+    '''
+
+    avg: NDArray
+    '''
+    The average fitness of each epoch, shape (n_runs, max_epochs, ...).
+    Shorter runs (e.g. converged) are padded with NaN.
+    '''
+
+    std: NDArray
+    '''
+    The standard deviation of the fitness of each epoch, with the
+    same shape (and padding) as the 'avg'.
+    '''
+
+    def select(self, label: str) -> NDArray:
+        """
+        Finds the runs with a given label.
+
+        :param label: (str) the label of the runs.
+
+        :return: the indices (rows) of the runs.
+        """
+        return np.flatnonzero(np.asarray(self.labels) == label)
+    # _end_def_
+
+# _end_class_
+
+
+def _seed_all(seed: int, engine: Optional[GenericGA] = None) -> None:
+    """
+    Seeds the global random generators (used by the factories and the
+    genes) and, if the engine is given, the class-level generators of the
+    engine and its genetic operators, with independent streams of the seed.
+
+    :param seed: (int) the seed of the run.
+
+    :param engine: (GenericGA) the engine of the run.
+
+    :return: None.
+    """
+    # Independent seeds from the same root seed.
+    seed_ga, seed_op, seed_np, seed_py = (
+        int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(4)
+    )
+
+    # Global generators.
+    if engine is None:
+        np.random.seed(seed_np)
+        random.seed(seed_py)
+        return
+    # _end_if_
+
+    # Engine generators (the class may shadow the base one).
+    for engine_cls in {GenericGA, type(engine)}:
+        engine_cls.set_seed(seed_ga)
+    # _end_for_
+
+    # Operators generators (the classes may shadow the base one).
+    for op_cls in {GeneticOperator} | {type(op) for op in
+                                       engine._checkpoint_operators().values()}:
+        op_cls.set_seed(seed_op)
+    # _end_for_
+# _end_def_
+
+
+def _run_path(path: Optional[str], index: int) -> Optional[str]:
+    """
+    Gets the file of the results of a run.
+
+    :param path: (str) the directory of the results.
+
+    :param index: (int) the index of the run.
+
+    :return: the path of the '.npz' file (or None).
+    """
+    return None if path is None else os.path.join(path, f"run_{index:05d}.npz")
+# _end_def_
+
+
+def _run_single(spec: RunSpec, index: int, path: Optional[str]) -> dict:
+    """
+    Executes one run of the batch (in a worker process) and saves
+    its results in the directory (if given).
+
+    :param spec: (RunSpec) the specification of the run.
+
+    :param index: (int) the index of the run.
+
+    :param path: (str) the directory of the results.
+
+    :return: a dictionary with the results of the run.
+    """
+    # Seed the global generators before the creation of the engine.
+    _seed_all(spec.seed)
+
+    # Create the engine.
+    engine = spec.factory()
+
+    # Seed the engine and its operators.
+    _seed_all(spec.seed, engine)
+
+    # Execute the run.
+    time_t0: float = time.perf_counter()
+    engine.run(spec.config)
+    time_tf: float = time.perf_counter()
+
+    # Get the best chromosome.
+    best = engine.best_chromosome()
+
+    # Collect the results.
+    result = {"index": index, "seed": spec.seed, "label": spec.label,
+              "best": np.nan if best is None or isinstance(best.fitness, tuple)
+              else float(best.fitness),
+              "f_evals": engine.f_evals,
+              "elapsed_time": time_tf - time_t0,
+              "avg": np.asarray(engine.stats.get("avg", []), dtype=float),
+              "std": np.asarray(engine.stats.get("std", []), dtype=float)}
+
+    # Save the results (first in a temporary file).
+    run_path = _run_path(path, index)
+
+    if run_path is not None:
+        tmp_path = f"{run_path}.tmp"
+
+        with open(tmp_path, "wb") as f_out:
+            np.savez(f_out, **result)
+        # _end_with_
+
+        os.replace(tmp_path, run_path)
+    # _end_if_
+
+    return result
+# _end_def_
+
+
+class BatchRunner:
+    """
+    Description:
+
+        BatchRunner executes many independent runs (e.g. parameter sweeps and
+        seed replicates) in a pool of processes. Before each run all the random
+        generators (global, engine and operators) are seeded from the seed of
+        the run, so the class-level state does not leak between runs and the
+        results do not depend on the scheduling.
+
+        If a directory is given, the results of each run are saved there as
+        soon as it finishes, so an interrupted batch can be resumed by calling
+        'run' again: the completed runs are loaded instead of executed.
+    """
+
+    # Object variables.
+    __slots__ = ("_specs", "_n_jobs", "_path")
+
+    def __init__(self, specs: list[RunSpec], n_jobs: Optional[int] = None,
+                 path: Optional[str] = None) -> None:
+        """
+        Construct a BatchRunner object.
+
+        :param specs: (list) the RunSpecs of all the runs.
+
+        :param n_jobs: (int) number of worker processes (default all CPUs).
+
+        :param path: (str) directory to store the results of the runs.
+        """
+        # Sanity check.
+        if not specs or not all(isinstance(s, RunSpec) for s in specs):
+            raise TypeError(f"{self.__class__.__name__}: "
+                            f"Specs must be a non-empty list of RunSpec.")
+        # _end_if_
+
+        self._specs: list[RunSpec] = list(specs)
+        self._n_jobs: int = n_jobs or GenericGA.MAX_CPUs
+        self._path: Optional[str] = path
+    # _end_def_
+
+    @classmethod
+    def grid(cls, factories: dict[str, Callable[[], GenericGA]],
+             configs: dict[str, RunConfig], seeds: list[int],
+             **kwargs) -> "BatchRunner":
+        """
+        Creates a BatchRunner with all the combinations of factories,
+        configurations and seeds. The label of each run is "factory/config".
+
+        :param factories: (dict) the engine factories by name.
+
+        :param configs: (dict) the run configurations by name.
+
+        :param seeds: (list) the seeds of the replicates.
+
+        :param kwargs: the other parameters of the constructor.
+
+        :return: a new BatchRunner object.
+        """
+        return cls([RunSpec(factory=factories[f_name], config=configs[c_name],
+                            seed=int(seed), label=f"{f_name}/{c_name}")
+                    for f_name, c_name, seed in product(factories, configs, seeds)],
+                   **kwargs)
+    # _end_def_
+
+    @property
+    def specs(self) -> list[RunSpec]:
+        """
+        Accessor of the run specifications.
+
+        :return: the list of the RunSpecs.
+        """
+        return self._specs
+    # _end_def_
+
+    def _load_completed(self) -> dict[int, dict]:
+        """
+        Loads the results of the completed runs from the directory.
+
+        :return: a dictionary {index: results}.
+        """
+        # Completed runs.
+        completed: dict[int, dict] = {}
+
+        # Check if the results are saved.
+        if self._path is None:
+            return completed
+        # _end_if_
+
+        for index, spec in enumerate(self._specs):
+            # Get the file of the run.
+            run_path = _run_path(self._path, index)
+
+            if os.path.isfile(run_path):
+                with np.load(run_path, allow_pickle=False) as data:
+                    result = {key: data[key] for key in data.files}
+                # _end_with_
+
+                # The directory must belong to the same batch.
+                if int(result["seed"]) != spec.seed or str(result["label"]) != spec.label:
+                    raise ValueError(f"{self.__class__.__name__}: "
+                                     f"{run_path} belongs to a different batch.")
+                # _end_if_
+
+                completed[index] = result
+            # _end_if_
+        # _end_for_
+
+        return completed
+    # _end_def_
+
+    @staticmethod
+    def _stack(arrays: list[NDArray]) -> NDArray:
+        """
+        Stacks the per-epoch arrays of the runs, padding with NaN.
+
+        :param arrays: (list) the arrays of the runs.
+
+        :return: an array with shape (n_runs, max_epochs, ...).
+        """
+        # Get the maximum length and the shape of each entry.
+        max_len: int = max(len(x) for x in arrays)
+        shape = next((x.shape[1:] for x in arrays if len(x)), ())
+
+        # Create the padded array.
+        stacked: NDArray = np.full((len(arrays), max_len, *shape), np.nan)
+
+        for k, x in enumerate(arrays):
+            stacked[k, :len(x)] = x
+        # _end_for_
+
+        return stacked
+    # _end_def_
+
+    def run(self) -> BatchResult:
+        """
+        Executes all the runs that are not completed yet and
+        collects the results of the batch.
+
+        :return: the BatchResult of all the runs.
+        """
+        # Create the directory of the results.
+        if self._path is not None:
+            os.makedirs(self._path, exist_ok=True)
+        # _end_if_
+
+        # Load the completed runs (resume).
+        results: dict[int, dict] = self._load_completed()
+
+        # Find the remaining runs.
+        pending = [index for index in range(len(self._specs)) if index not in results]
+
+        # Display an information message.
+        logger.info("%s: %d runs (%d completed) with %d jobs.",
+                    self.__class__.__name__, len(self._specs),
+                    len(results), self._n_jobs)
+
+        # Execute the remaining runs in parallel.
+        if pending:
+            for result in Parallel(n_jobs=min(self._n_jobs, len(pending)), backend="loky")(
+                    delayed(_run_single)(self._specs[index], index, self._path)
+                    for index in pending):
+                results[int(result["index"])] = result
+            # _end_for_
+        # _end_if_
+
+        # Put the results in the order of the specifications.
+        ordered = [results[index] for index in range(len(self._specs))]
+
+        return BatchResult(labels=[spec.label for spec in self._specs],
+                           seeds=np.array([spec.seed for spec in self._specs]),
+                           best=np.array([r["best"] for r in ordered], dtype=float),
+                           f_evals=np.array([r["f_evals"] for r in ordered], dtype=int),
+                           elapsed_time=np.array([r["elapsed_time"] for r in ordered],
+                                                 dtype=float),
+                           avg=self._stack([np.asarray(r["avg"], dtype=float)
+                                            for r in ordered]),
+                           std=self._stack([np.asarray(r["std"], dtype=float)
+                                            for r in ordered]))
+    # _end_def_
+
+# _end_class_
@@ -0,0 +1,450 @@
+""" Cellular GA model module. """
+import time
+from math import isclose
+from typing import Iterator, Optional
+
+# Third party numpy.
+import numpy as np
+from numpy.typing import NDArray
+
+# Custom PyGenaAlgo code.
+from pygenalgo.engines import logger
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
+from pygenalgo.utils.auxiliary import average_hamming_distance
+
+# Public interface.
+__all__ = ["CellularGA", "RunConfig"]
+
+# Offsets (row, col) of the supported neighbourhoods.
+_NEIGHBORHOODS: dict = {
+    "von_neumann": ((-1, 0), (1, 0), (0, -1), (0, 1)),
+    "moore": ((-1, -1), (-1, 0), (-1, 1), (0, -1),
+              (0, 1), (1, -1), (1, 0), (1, 1))
+}
+
+
+class CellularGA(GenericGA):
+    """
+    Description:
+
+        CellularGA (or diffusion) model places the population on a 2-D toroidal grid,
+        where each individual mates only with the individuals of its neighbourhood (von
+        Neumann or Moore). The good solutions spread slowly over the grid, so the model
+        keeps the diversity of the population for longer (similar to the NeighborhoodSelector
+        but without the pairwise distances of the whole population at each epoch).
+
+        The neighbours of the cells are precomputed once as an index array. Hence, the
+        mate selection (binary tournament among the neighbours of each cell) and the
+        replacement (the offspring replaces its cell if it is not worse) are batched
+        numpy operations. The offsprings are produced with the crossover and mutation
+        operators of the engine.
+
+        The update is 'synchronous' (all the cells at once) or 'asynchronous' in line
+        sweeps of row blocks, where each block mates with the cells that are updated by
+        the previous blocks. The offsprings of each block are evaluated together (in
+        parallel if enabled).
+
+        NOTE: The selection operator of the engine is not used for the mates; only its
+        counter is increased at each selection.
+    """
+
+    # Object variables (specific for the CellularGA).
+    __slots__ = ("_grid_shape", "_neighbors", "_blocks")
+
+    def __init__(self, grid_shape: tuple[int, int], neighborhood: str = "von_neumann",
+                 update: str = "synchronous", block_rows: int = 1, **kwargs) -> None:
+        """
+        Default constructor of CellularGA object.
+
+        :param grid_shape: (n_rows, n_cols) of the grid. The population size must
+                           be equal to n_rows * n_cols, and the cell (r, c) holds
+                           the chromosome: population[r * n_cols + c].
+
+        :param neighborhood: (str) "von_neumann" (4 neighbours) or "moore" (8).
+
+        :param update: (str) "synchronous" or "asynchronous".
+
+        :param block_rows: (int) number of rows in each block of the asynchronous
+                           update sweeps.
+        """
+        # Call the super constructor with all the input parameters.
+        super().__init__(**kwargs)
+
+        # Get the grid dimensions.
+        n_rows, n_cols = (int(n) for n in grid_shape)
+
+        # Sanity check.
+        if n_rows < 1 or n_cols < 1 or n_rows * n_cols != len(self.population):
+            raise ValueError(f"{self.__class__.__name__}: Grid {n_rows}x{n_cols} does "
+                             f"not match the population size {len(self.population)}.")
+        # _end_if_
+
+        # Sanity check.
+        if neighborhood not in _NEIGHBORHOODS:
+            raise ValueError(f"{self.__class__.__name__}: Unknown neighborhood "
+                             f"{neighborhood!r}. Use 'von_neumann' or 'moore'.")
+        # _end_if_
+
+        # Sanity check.
+        if update not in ("synchronous", "asynchronous"):
+            raise ValueError(f"{self.__class__.__name__}: Update must be "
+                             f"'synchronous' or 'asynchronous'.")
+        # _end_if_
+
+        # Sanity check.
+        if not 1 <= int(block_rows) <= n_rows:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Block rows must be in [1, {n_rows}].")
+        # _end_if_
+
+        # Store the grid dimensions.
+        self._grid_shape: tuple[int, int] = (n_rows, n_cols)
+
+        # Get the row and column of each cell.
+        rows, cols = np.divmod(np.arange(n_rows * n_cols), n_cols)
+
+        # Precompute the neighbours of each cell (with wrap around edges).
+        self._neighbors: NDArray = np.stack([((rows + dr) % n_rows) * n_cols +
+                                             (cols + dc) % n_cols
+                                             for dr, dc in _NEIGHBORHOODS[neighborhood]],
+                                            axis=1)
+
+        # Precompute the cells of each update block.
+        if update == "synchronous":
+            self._blocks: list[NDArray] = [np.arange(n_rows * n_cols)]
+        else:
+            self._blocks: list[NDArray] = [
+                np.arange(r * n_cols, min(r + int(block_rows), n_rows) * n_cols)
+                for r in range(0, n_rows, int(block_rows))
+            ]
+        # _end_if_
+    # _end_def_
+
+    @property
+    def grid_shape(self) -> tuple[int, int]:
+        """
+        Accessor method that returns the shape of the grid.
+
+        :return: the (n_rows, n_cols) tuple.
+        """
+        return self._grid_shape
+    # _end_def_
+
+    @property
+    def neighbors(self) -> NDArray:
+        """
+        Accessor method that returns the (N, K) array with
+        the indices of the neighbours of each cell.
+
+        :return: the neighbours array.
+        """
+        return self._neighbors
+    # _end_def_
+
+    def fitness_array(self) -> NDArray:
+        """
+        Get the fitness values of the grid as an array. The
+        chromosomes without fitness get the value -inf.
+
+        :return: the (N,) array with the fitness values.
+        """
+        return np.array([-np.inf if p.fitness is None else p.fitness
+                         for p in self.population], dtype=float)
+    # _end_def_
+
+    def select_mates(self, cells: NDArray, fitness: NDArray) -> NDArray:
+        """
+        Select a mate for each input cell, with a binary tournament
+        among the neighbours of the cell.
+
+        :param cells: (M,) array with the indices of the cells.
+
+        :param fitness: (N,) array with the fitness values of the grid.
+
+        :return: the (M,) array with the indices of the mates.
+        """
+        # Get the neighbours of the cells.
+        neighbors = self._neighbors[cells]
+
+        # Pick two random neighbours for each cell.
+        candidates = np.take_along_axis(
+            neighbors, self.rng_GA.integers(0, neighbors.shape[1],
+                                            size=(len(cells), 2)), axis=1)
+
+        # Get their fitness values.
+        f_candidates = fitness[candidates]
+
+        # Increase the selection counter.
+        self._select_op.inc_counter()
+
+        # Return the winners of the tournaments.
+        return np.where(f_candidates[:, 0] >= f_candidates[:, 1],
+                        candidates[:, 0], candidates[:, 1])
+    # _end_def_
+
+    def breed(self, cells: NDArray, mates: NDArray) -> list[Chromosome]:
+        """
+        Produce one offspring for each cell, by crossing it over with
+        its mate and then mutating the (first) child.
+
+        :param cells: (M,) array with the indices of the cells.
+
+        :param mates: (M,) array with the indices of the mates.
+
+        :return: the list with the M offsprings.
+        """
+        # Local copy of the population.
+        population = self.population
+
+        # Output list.
+        offsprings: list[Chromosome] = []
+
+        for i, j in zip(cells, mates):
+            # CROSSOVER the cell with its mate.
+            child, _ = self._crossx_op(population[i], population[j])
+
+            # MUTATE in place the offspring.
+            self._mutate_op(child)
+
+            offsprings.append(child)
+        # _end_for_
+
+        return offsprings
+    # _end_def_
+
+    def update_block(self, cells: NDArray, fitness: NDArray,
+                     config: RunConfig) -> bool:
+        """
+        Update a block of cells: select the mates, breed the offsprings,
+        evaluate them and replace the cells. The input fitness array is
+        updated in place.
+
+        :param cells: (M,) array with the indices of the cells.
+
+        :param fitness: (N,) array with the fitness values of the grid.
+
+        :param config: (RunConfig) the configuration params.
+
+        :return: True if a solution has been found.
+        """
+        # SELECT the mates and produce the offsprings.
+        offsprings = self.breed(cells, self.select_mates(cells, fitness))
+
+        # EVALUATE the offsprings.
+        fit_list, found_solution = self.evaluate_fitness(offsprings, config.parallel,
+                                                         as_completed=config.as_completed,
+                                                         max_evals=config.f_max_eval)
+        # Check if 'corrections' are enabled.
+        if config.correction and self.correct_genome(offsprings):
+
+            # Update the fitness list to ensure consistency.
+            fit_list = [p.fitness for p in offsprings]
+        # _end_if_
+
+        # Convert the fitness values to an array.
+        f_new = np.array([-np.inf if f is None else f for f in fit_list], dtype=float)
+
+        # Keep the offsprings that are not worse (if 'elitism' is enabled).
+        if config.elitism:
+            replace = f_new >= fitness[cells]
+        else:
+            replace = np.ones(len(cells), dtype=bool)
+        # _end_if_
+
+        # REPLACE the cells.
+        for k in np.flatnonzero(replace):
+            self.population[cells[k]] = offsprings[k]
+        # _end_for_
+
+        # Update the fitness values of the grid.
+        fitness[cells[replace]] = f_new[replace]
+
+        return found_solution
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
+        """
+        Main method of the CellularGA class that implements
+        the evolutionary routine.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
+        """
+        # Initialize the configuration parameters.
+        config = config or RunConfig()
+
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
+
+        # Start a new run.
+        if first_epoch == 0:
+            # Get the fitness values before optimization.
+            fit_list_0, found_solution = self.evaluate_fitness(self.population,
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # Initial termination check.
+            if found_solution:
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
+
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(fit_list_0)
+
+            # Store the initial crossover and mutation probabilities.
+            self.stats["prob_crossx"].append(self.crossx_op.probability)
+            self.stats["prob_mutate"].append(self.mutate_op.probability)
+        else:
+            # Continue from the last average of the checkpoint.
+            avg_fitness_0 = self.stats["avg"][-1]
+        # _end_if_
+
+        # Get the fitness values of the grid.
+        fitness: NDArray = self.fitness_array()
+
+        # Local variable to display information on the screen.
+        # To avoid cluttering the screen we print info only 10
+        # times regardless of the total number of epochs.
+        print_interval: int = config.epochs // 10 if config.epochs > 10 else 2
+
+        # Display an information message.
+        logger.info("Initial Avg. Fitness = %.4f", avg_fitness_0)
+
+        # Initial time instant.
+        time_t0: float = time.perf_counter()
+
+        # Repeat 'epoch' times.
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
+
+            # Update current iteration.
+            self.iteration = i
+
+            # Flag to indicate if a solution has been found.
+            found_solution: bool = False
+
+            # Sweep the blocks of the grid.
+            for cells in self._blocks:
+
+                # Update the cells of the block.
+                found_solution = self.update_block(cells, fitness, config)
+
+                # Stop the sweep.
+                if found_solution:
+                    break
+                # _end_if_
+            # _end_for_
+
+            # Update the mean/std in the dictionary.
+            avg_fitness_i, std_fitness_i = self.update_stats([p.fitness for p in
+                                                              self.population])
+            # Check for termination.
+            if found_solution:
+                # Log a warning message.
+                logger.warning("%s finished in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Log the information message.
+            if config.verbose and (i % print_interval) == 0:
+                logger.info(
+                    "Epoch: %5d -> Avg. Fitness = %.4f, Spread = %.4f",
+                    i + 1, avg_fitness_i, std_fitness_i
+                )
+            # _end_if_
+
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for the maximum function evaluations.
+            if config.f_max_eval is not None and\
+                    self.f_evals >= config.f_max_eval:
+                # Log a warning message.
+                logger.warning(
+                    "%s reached the maximum number of function evaluations: %d",
+                    self.__class__.__name__, config.f_max_eval
+                )
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for convergence.
+            if config.f_tol is not None and isclose(avg_fitness_i,
+                                                    avg_fitness_0,
+                                                    abs_tol=config.f_tol):
+                # Display a warning message.
+                logger.warning("%s converged in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check the adaptive flag.
+            if config.adapt_probs:
+                # Compute the current average Hamming distance.
+                avg_distance = average_hamming_distance(self.population)
+
+                # Update the genetic probabilities.
+                if self.adapt_probabilities(threshold=avg_distance):
+                    # Store the updated crossover and mutation probabilities.
+                    self.stats["prob_crossx"].append(self.crossx_op.probability)
+                    self.stats["prob_mutate"].append(self.mutate_op.probability)
+            # _end_if_
+
+            # Update the average value for the next iteration.
+            avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
+        # _end_for_
+
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
+        # Final time instant.
+        time_tf: float = time.perf_counter()
+
+        # Display the final average fitness value.
+        logger.info("Final: Avg. Fitness = %.4f", avg_fitness_0)
+
+        # Print final duration in seconds.
+        print(f"Elapsed time: {(time_tf - time_t0):.3f} seconds.")
+    # _end_def_
+
+# _end_class_
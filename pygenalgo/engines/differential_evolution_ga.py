@@ -0,0 +1,621 @@
+""" Differential Evolution model module. """
+import time
+from math import isclose, ceil
+from typing import Iterator, Optional
+
+# Third party numpy.
+import numpy as np
+from numpy.typing import NDArray
+
+# Custom PyGenaAlgo code.
+from pygenalgo.engines import logger
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
+from pygenalgo.operators.mutation.mutate_operator import MutationOperator
+from pygenalgo.operators.selection.select_operator import SelectionOperator
+from pygenalgo.operators.crossover.crossover_operator import CrossoverOperator
+
+# Public interface.
+__all__ = ["DifferentialEvolutionGA", "RunConfig"]
+
+
+class DifferentialEvolutionGA(GenericGA):
+    """
+    Description:
+
+        DifferentialEvolutionGA model implements the Differential Evolution (DE) for
+        real-coded problems. Each target vector of the population creates a mutant
+        vector from the scaled differences of other vectors (strategies: rand/1/bin,
+        best/1/bin and current-to-pbest/1/bin) and then a trial vector with binomial
+        crossover. The trial vector replaces its target if it is not worse.
+
+        The vector operations are batched on the (N, D) array of the population, while
+        the trial vectors are evaluated as Chromosomes with the 'evaluate_fitness' of
+        the engine (so the parallel backends, the feasibility stage and the RunConfig
+        stopping criteria work as in the StandardGA).
+
+        The current-to-pbest strategy uses the JADE parameter adaptation (Zhang and
+        Sanderson 2009): each vector samples its own F and CR around the means mu_F and
+        mu_CR, which move towards the values of the successful trials. The replaced
+        targets are kept in an external archive, which is used for the second difference
+        vector. The means are stored in stats["mu_F"] and stats["mu_CR"].
+
+        NOTE: The genetic operators are optional. They are not used, except for their
+        counters (selection: once per epoch, mutation: mutant vectors and crossover:
+        successful trial vectors).
+    """
+
+    # Supported strategies.
+    _STRATEGIES = ("rand/1/bin", "best/1/bin", "current-to-pbest/1/bin")
+
+    # Object variables (specific for the DifferentialEvolutionGA).
+    __slots__ = ("_strategy", "_f_weight", "_cr", "_p_best", "_c_adapt",
+                 "_bounds", "_x_pop", "_archive")
+
+    def __init__(self, strategy: str = "rand/1/bin", f_weight: float = 0.5,
+                 cr: float = 0.9, p_best: float = 0.05, c_adapt: float = 0.1,
+                 bounds: Optional[tuple] = None, **kwargs) -> None:
+        """
+        Default constructor of DifferentialEvolutionGA object.
+
+        :param strategy: (str) "rand/1/bin", "best/1/bin" or "current-to-pbest/1/bin".
+
+        :param f_weight: (float) the differential weight F in (0, 2]. For the
+                         current-to-pbest strategy it is the initial mu_F.
+
+        :param cr: (float) the crossover rate CR in [0, 1]. For the current-to-pbest
+                   strategy it is the initial mu_CR.
+
+        :param p_best: (float) fraction of the best vectors in (0, 1], used
+                       by the current-to-pbest strategy.
+
+        :param c_adapt: (float) the learning rate of the JADE adaptation in [0, 1].
+
+        :param bounds: (optional) tuple (lower, upper) with the bounds of the genes
+                       (scalars or arrays). The trial values that fall outside are
+                       set to the midpoint between the bound and the target value.
+        """
+        # The genetic operators are optional (they only count the DE steps).
+        kwargs.setdefault("select_op", SelectionOperator(1.0))
+        kwargs.setdefault("mutate_op", MutationOperator(1.0))
+        kwargs.setdefault("crossx_op", CrossoverOperator(1.0))
+
+        # Call the super constructor with all the input parameters.
+        super().__init__(**kwargs)
+
+        # Sanity check.
+        if strategy not in DifferentialEvolutionGA._STRATEGIES:
+            raise ValueError(f"{self.__class__.__name__}: Unknown strategy {strategy!r}. "
+                             f"Use one of {DifferentialEvolutionGA._STRATEGIES}.")
+        # _end_if_
+
+        # Sanity check.
+        if not 0.0 < f_weight <= 2.0:
+            raise ValueError(f"{self.__class__.__name__}: F must be in (0, 2].")
+        # _end_if_
+
+        # Sanity check.
+        if not 0.0 <= cr <= 1.0 or not 0.0 <= c_adapt <= 1.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"CR and c_adapt must be in [0, 1].")
+        # _end_if_
+
+        # Sanity check.
+        if not 0.0 < p_best <= 1.0:
+            raise ValueError(f"{self.__class__.__name__}: p_best must be in (0, 1].")
+        # _end_if_
+
+        # Convert the population to a 2-D array.
+        self._x_pop: NDArray = np.array([p.values() for p in self.population],
+                                        dtype=float)
+        # Sanity check.
+        if self._x_pop.ndim != 2:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Chromosomes must have equal length of real genes.")
+        # _end_if_
+
+        # Sanity check.
+        if self._x_pop.shape[0] < 4:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Population must have at least 4 chromosomes.")
+        # _end_if_
+
+        # Store the settings.
+        self._strategy: str = strategy
+        self._f_weight: float = float(f_weight)
+        self._cr: float = float(cr)
+        self._p_best: float = float(p_best)
+        self._c_adapt: float = float(c_adapt)
+
+        # Store the bounds (broadcast to the number of genes).
+        self._bounds: Optional[tuple] = None if bounds is None else tuple(
+            np.broadcast_to(np.asarray(b, dtype=float), self._x_pop.shape[1:])
+            for b in bounds
+        )
+
+        # External archive of the replaced targets (JADE).
+        self._archive: NDArray = np.empty((0, self._x_pop.shape[1]), dtype=float)
+    # _end_def_
+
+    @property
+    def strategy(self) -> str:
+        """
+        Accessor method that returns the DE strategy.
+
+        :return: the strategy name.
+        """
+        return self._strategy
+    # _end_def_
+
+    @property
+    def x_population(self) -> NDArray:
+        """
+        Accessor method that returns the (N, D) population array.
+
+        :return: the population array.
+        """
+        return self._x_pop
+    # _end_def_
+
+    def _random_indices(self, pool_size: int, exclude: NDArray) -> NDArray:
+        """
+        Draws one random index from [0, pool_size) for each row, which
+        differs from all the excluded indices of the row.
+
+        :param pool_size: (int) the size of the pool.
+
+        :param exclude: (N, M) array with the excluded indices of each row.
+
+        :return: the (N,) array with the random indices.
+        """
+        # Draw the indices.
+        index = self.rng_GA.integers(0, pool_size, size=exclude.shape[0])
+
+        # Redraw the invalid ones (only a few).
+        invalid = np.any(index[:, None] == exclude, axis=1)
+
+        while np.any(invalid):
+            index[invalid] = self.rng_GA.integers(0, pool_size,
+                                                  size=int(invalid.sum()))
+            invalid = np.any(index[:, None] == exclude, axis=1)
+        # _end_while_
+
+        return index
+    # _end_def_
+
+    def sample_parameters(self, mu_f: float, mu_cr: float) -> tuple[NDArray, NDArray]:
+        """
+        Samples the F and CR of each vector. The current-to-pbest strategy
+        uses the JADE distributions: F ~ Cauchy(mu_F, 0.1) truncated to (0, 1]
+        and CR ~ Normal(mu_CR, 0.1) clipped to [0, 1]. The other strategies
+        use the fixed values.
+
+        :param mu_f: (float) the location of the F values.
+
+        :param mu_cr: (float) the mean of the CR values.
+
+        :return: the (N,) arrays with the F and CR values.
+        """
+        # Get the population size.
+        pop_size: int = self._x_pop.shape[0]
+
+        # Fixed parameters.
+        if self._strategy != "current-to-pbest/1/bin":
+            return np.full(pop_size, mu_f), np.full(pop_size, mu_cr)
+        # _end_if_
+
+        # Sample the crossover rates.
+        cr = np.clip(self.rng_GA.normal(mu_cr, 0.1, size=pop_size), 0.0, 1.0)
+
+        # Sample the weights (the non-positive ones are sampled again).
+        f_weight = mu_f + 0.1 * self.rng_GA.standard_cauchy(size=pop_size)
+
+        while np.any(invalid := f_weight <= 0.0):
+            f_weight[invalid] = mu_f + 0.1 * self.rng_GA.standard_cauchy(
+                size=int(invalid.sum()))
+        # _end_while_
+
+        return np.minimum(f_weight, 1.0), cr
+    # _end_def_
+
+    def mutant_vectors(self, fitness: NDArray, f_weight: NDArray) -> NDArray:
+        """
+        Creates the mutant vectors of the population with the DE strategy.
+
+        :param fitness: (N,) array with the fitness values of the population.
+
+        :param f_weight: (N,) array with the F values.
+
+        :return: the (N, D) array with the mutant vectors.
+        """
+        # Local copy of the population.
+        x_pop = self._x_pop
+
+        # Get the population size.
+        pop_size: int = x_pop.shape[0]
+
+        # Indices of the target vectors.
+        targets = np.arange(pop_size)[:, None]
+
+        # Draw the (distinct) random vectors.
+        r1 = self._random_indices(pop_size, targets)
+        r2 = self._random_indices(pop_size, np.column_stack((targets, r1)))
+
+        # The weights as a column.
+        f_col = f_weight[:, None]
+
+        if self._strategy == "rand/1/bin":
+            r3 = self._random_indices(pop_size, np.column_stack((targets, r1, r2)))
+
+            return x_pop[r1] + f_col * (x_pop[r2] - x_pop[r3])
+        # _end_if_
+
+        if self._strategy == "best/1/bin":
+            return x_pop[np.argmax(fitness)] + f_col * (x_pop[r1] - x_pop[r2])
+        # _end_if_
+
+        # Number of the top vectors.
+        n_top: int = max(1, ceil(self._p_best * pop_size))
+
+        # Pick one of the top vectors for each target.
+        p_best = np.argsort(-fitness, kind="stable")[
+            self.rng_GA.integers(0, n_top, size=pop_size)]
+
+        # The second difference vector is drawn from
+        # the union of the population and the archive.
+        x_union = np.vstack((x_pop, self._archive))
+        r2 = self._random_indices(x_union.shape[0], np.column_stack((targets, r1)))
+
+        return x_pop + f_col * (x_pop[p_best] - x_pop) + \
+            f_col * (x_pop[r1] - x_union[r2])
+    # _end_def_
+
+    def binomial_crossover(self, x_mutant: NDArray, cr: NDArray) -> NDArray:
+        """
+        Creates the trial vectors with the binomial crossover of the targets
+        and their mutant vectors. At least one gene comes from the mutant.
+
+        :param x_mutant: (N, D) array with the mutant vectors.
+
+        :param cr: (N,) array with the CR values.
+
+        :return: the (N, D) array with the trial vectors.
+        """
+        # Get the dimensions of the population.
+        pop_size, n_genes = self._x_pop.shape
+
+        # Genes that come from the mutant vectors.
+        mask = self.rng_GA.random((pop_size, n_genes)) < cr[:, None]
+
+        # Make sure at least one gene changes.
+        mask[np.arange(pop_size), self.rng_GA.integers(0, n_genes, size=pop_size)] = True
+
+        # Create the trial vectors.
+        x_trial = np.where(mask, x_mutant, self._x_pop)
+
+        # Repair the values that are outside the bounds.
+        if self._bounds is not None:
+            # Unpack the bounds.
+            lower, upper = self._bounds
+
+            # Move to the midpoint between the bound and the target.
+            x_trial = np.where(x_trial < lower, 0.5 * (lower + self._x_pop), x_trial)
+            x_trial = np.where(x_trial > upper, 0.5 * (upper + self._x_pop), x_trial)
+        # _end_if_
+
+        return x_trial
+    # _end_def_
+
+    def trial_chromosomes(self, x_trial: NDArray) -> list[Chromosome]:
+        """
+        Converts the trial vectors to Chromosomes (clones of their targets).
+
+        :param x_trial: (N, D) array with the trial vectors.
+
+        :return: the list of the trial Chromosomes.
+        """
+        # Output list.
+        trials: list[Chromosome] = []
+
+        for p, row in zip(self.population, x_trial.tolist()):
+            # Copy the target.
+            child = p.clone()
+
+            # Set the new values.
+            for gene, value in zip(child.genome, row):
+                gene.value = value
+            # _end_for_
+
+            child.invalidate_fitness()
+            trials.append(child)
+        # _end_for_
+
+        return trials
+    # _end_def_
+
+    def _checkpoint_state(self) -> dict:
+        """
+        Extends the checkpoint state with the external archive.
+
+        :return: a dictionary with the state of the engine.
+        """
+        # Get the state of the parent class.
+        state = super()._checkpoint_state()
+
+        # Store the archive.
+        state["de_archive"] = self._archive
+
+        return state
+    # _end_def_
+
+    def _restore_state(self, data) -> None:
+        """
+        Restores the checkpoint state, including the external archive
+        and the population array.
+
+        :param data: the loaded arrays (NpzFile or dictionary).
+
+        :return: None.
+        """
+        # Restore the state of the parent class.
+        super()._restore_state(data)
+
+        # Restore the population array.
+        self._x_pop = np.array([p.values() for p in self.population], dtype=float)
+
+        # Restore the archive.
+        if "de_archive" in data:
+            self._archive = np.array(data["de_archive"], dtype=float)
+        # _end_if_
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
+        """
+        Main method of the DifferentialEvolutionGA class that implements
+        the evolutionary routine. The settings 'elitism', 'shuffle' and
+        'adapt_probs' are not used (the DE selection is always elitist).
+
+        :param config: (RunConfig) the configuration params.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
+        """
+        # Initialize the configuration parameters.
+        config = config or RunConfig()
+
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
+
+        # Get the size of the population.
+        pop_size: int = len(self.population)
+
+        # Start a new run.
+        if first_epoch == 0:
+            # Clear the archive.
+            self._archive = self._archive[:0]
+
+            # Get the fitness values before optimization.
+            fit_list_0, found_solution = self.evaluate_fitness(self.population,
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # The feasibility stage may repair the genes in place.
+            self._x_pop = np.array([p.values() for p in self.population], dtype=float)
+
+            # Initial termination check.
+            if found_solution:
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
+
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(fit_list_0)
+
+            # Initial values of the DE parameters.
+            mu_f, mu_cr = self._f_weight, self._cr
+
+            # Store the initial DE parameters.
+            self.stats["mu_F"].append(mu_f)
+            self.stats["mu_CR"].append(mu_cr)
+        else:
+            # Continue from the last values of the checkpoint.
+            avg_fitness_0 = self.stats["avg"][-1]
+            mu_f, mu_cr = self.stats["mu_F"][-1], self.stats["mu_CR"][-1]
+        # _end_if_
+
+        # Get the fitness values of the population.
+        fitness: NDArray = np.array([-np.inf if p.fitness is None else p.fitness
+                                     for p in self.population], dtype=float)
+
+        # Local variable to display information on the screen.
+        # To avoid cluttering the screen we print info only 10
+        # times regardless of the total number of epochs.
+        print_interval: int = config.epochs // 10 if config.epochs > 10 else 2
+
+        # Display an information message.
+        logger.info("Initial Avg. Fitness = %.4f", avg_fitness_0)
+
+        # Initial time instant.
+        time_t0: float = time.perf_counter()
+
+        # Repeat 'epoch' times.
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
+
+            # Update current iteration.
+            self.iteration = i
+
+            # Sample the DE parameters of each vector.
+            f_weight, cr = self.sample_parameters(mu_f, mu_cr)
+
+            # MUTATE and CROSSOVER to produce the trial vectors.
+            x_trial = self.binomial_crossover(self.mutant_vectors(fitness, f_weight), cr)
+
+            # Increase the operator counters.
+            self._select_op.inc_counter()
+            self._mutate_op.inc_counter(pop_size)
+
+            # Create the trial Chromosomes.
+            trials = self.trial_chromosomes(x_trial)
+
+            # Calculate the new fitness values.
+            fit_list_i, found_solution = self.evaluate_fitness(trials,
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # Check if 'corrections' are enabled.
+            if config.correction and self.correct_genome(trials):
+
+                # Update the trial fitness.
+                fit_list_i = [p.fitness for p in trials]
+            # _end_if_
+
+            # Update the trial values (the feasibility stage and
+            # the corrections may change the genes in place).
+            x_trial = np.array([p.values() for p in trials], dtype=float)
+
+            # Convert the fitness values to an array.
+            f_trial = np.array([-np.inf if f is None else f for f in fit_list_i],
+                               dtype=float)
+
+            # SELECT the trials that are not worse than their targets.
+            success = f_trial >= fitness
+
+            # Keep the replaced targets in the archive (JADE).
+            if self._strategy == "current-to-pbest/1/bin":
+                # The trials that are strictly better.
+                improved = f_trial > fitness
+
+                # Add the replaced targets.
+                self._archive = np.vstack((self._archive, self._x_pop[improved]))
+
+                # Remove random solutions to keep the size of the population.
+                if self._archive.shape[0] > pop_size:
+                    self._archive = self._archive[self.rng_GA.choice(self._archive.shape[0],
+                                                                     pop_size, replace=False)]
+                # _end_if_
+
+                # Adapt the parameters (arithmetic mean of the successful
+                # CR values and Lehmer mean of the successful F values).
+                if np.any(improved):
+                    mu_cr = (1.0 - self._c_adapt) * mu_cr + \
+                        self._c_adapt * float(np.mean(cr[improved]))
+
+                    mu_f = (1.0 - self._c_adapt) * mu_f + \
+                        self._c_adapt * float(np.sum(f_weight[improved] ** 2) /
+                                              np.sum(f_weight[improved]))
+                # _end_if_
+            # _end_if_
+
+            # REPLACE the targets.
+            for k in np.flatnonzero(success):
+                self.population[k] = trials[k]
+            # _end_for_
+
+            self._x_pop[success] = x_trial[success]
+            fitness[success] = f_trial[success]
+
+            # Increase the crossover counter.
+            self._crossx_op.inc_counter(int(success.sum()))
+
+            # Store the DE parameters.
+            self.stats["mu_F"].append(mu_f)
+            self.stats["mu_CR"].append(mu_cr)
+
+            # Update the mean/std in the dictionary.
+            avg_fitness_i, std_fitness_i = self.update_stats([p.fitness for p in
+                                                              self.population])
+            # Check for termination.
+            if found_solution:
+                # Log a warning message.
+                logger.warning("%s finished in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Log the information message.
+            if config.verbose and (i % print_interval) == 0:
+                logger.info(
+                    "Epoch: %5d -> Avg. Fitness = %.4f, Spread = %.4f",
+                    i + 1, avg_fitness_i, std_fitness_i
+                )
+            # _end_if_
+
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for the maximum function evaluations.
+            if config.f_max_eval is not None and\
+                    self.f_evals >= config.f_max_eval:
+                # Log a warning message.
+                logger.warning(
+                    "%s reached the maximum number of function evaluations: %d",
+                    self.__class__.__name__, config.f_max_eval
+                )
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for convergence.
+            if config.f_tol is not None and isclose(avg_fitness_i,
+                                                    avg_fitness_0,
+                                                    abs_tol=config.f_tol):
+                # Display a warning message.
+                logger.warning("%s converged in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Update the average value for the next iteration.
+            avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
+        # _end_for_
+
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
+        # Final time instant.
+        time_tf: float = time.perf_counter()
+
+        # Display the final average fitness value.
+        logger.info("Final: Avg. Fitness = %.4f", avg_fitness_0)
+
+        # Print final duration in seconds.
+        print(f"Elapsed time: {(time_tf - time_t0):.3f} seconds.")
+    # _end_def_
+
+# _end_class_
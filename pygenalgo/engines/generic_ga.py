@@ -1,20 +1,32 @@
 """ Generic GA module. """
+import os
+import json
+import time
+import asyncio
 from os import cpu_count
 from operator import attrgetter
 from dataclasses import dataclass
 from collections import defaultdict
-from typing import Callable, Optional
+from threading import Lock
+from typing import Callable, Iterator, Optional
+from concurrent.futures import (Executor, ThreadPoolExecutor, FIRST_COMPLETED, wait)
 
 from joblib import (Parallel, delayed)
+from joblib.externals.loky import (get_reusable_executor, ProcessPoolExecutor)
+from joblib.externals.loky.process_executor import BrokenProcessPool
 
 from numpy import all as np_all
+from numpy import asarray, flatnonzero
 from numpy.typing import NDArray
 from numpy.random import (default_rng, Generator)
-from numpy import (array, nanmean, nanstd, isfinite)
+from numpy import (array, ndarray, nanmean, nanstd, isfinite)
+from numpy import (load as np_load, savez, nan, isnan)
 
 from pygenalgo.engines import logger
 from pygenalgo.genome.chromosome import Chromosome
 from pygenalgo.utils.auxiliary import correct_chromosomes
+from pygenalgo.utils.termination import TerminationCriterion
+from pygenalgo.utils.utilities import (FitnessResult, unpack_fitness)
 
 from pygenalgo.operators.genetic_operator import GeneticOperator
 from pygenalgo.operators.mutation.mutate_operator import MutationOperator
@@ -91,7 +103,17 @@ class RunConfig:
     f_max_eval: Optional[int] = None
     '''
     Sets an upper limit of function evaluations. If this number is
-    exceeded the genetic algorithm will terminate.
+    exceeded the genetic algorithm will terminate. In the IslandModelGA
+    the budget is shared by all the islands (through a shared counter).
+    '''
+
+    as_completed: bool = False
+    '''
+    If enabled the fitness results are consumed in completion order and
+    the outstanding evaluations of the batch are cancelled as soon as a
+    solution is found, or the 'f_max_eval' budget is reached. It is not
+    supported with a batch evaluator (e.g. the SimulatorPool) or with the
+    fault tolerant evaluation (max_retries > 0).
     '''
 
     # Migration ONLY parameters.
@@ -108,6 +130,82 @@ class RunConfig:
     allow_migration == True. Otherwise, is ignored.
     '''
 
+    persistent_islands: bool = False
+    '''
+    If enabled each island lives in its own long-lived worker process for
+    the whole run, and the periods exchange only the migrants and the stats
+    (instead of the whole engine and the populations). This setting is used
+    only when the option allow_migration == True. Otherwise, is ignored.
+    '''
+
+    async_migration: bool = False
+    '''
+    If enabled each island evolves in its own worker for all the periods
+    and migrates through mailboxes (following the topology of the model)
+    without waiting for the other islands. This setting is used only when
+    the option allow_migration == True. Otherwise, is ignored.
+    '''
+
+    elastic_islands: Optional[str] = None
+    '''
+    If set, the cores of the converged islands are reused in the rest of the
+    migration periods: "workers" gives them to the active islands as the
+    fitness evaluation workers, and "restart" re-seeds the converged islands
+    with new random populations and the best chromosomes found so far. The
+    fraction of the busy cores is stored in stats["utilization"]. This setting
+    is used only with the (synchronous) migration. Otherwise, is ignored.
+    '''
+
+    island_jobs: Optional[int] = None
+    '''
+    The number of islands that evolve at the same time, each one in its own
+    process. If None (default) it is the number of islands, limited by the
+    CPUs of the engine. In the persistent and the asynchronous modes every
+    island has its own (long-lived) process, but only this number of them
+    evolve at the same time.
+    '''
+
+    eval_workers: Optional[int] = 1
+    '''
+    The number of fitness evaluation workers inside each island. If None the
+    CPUs of the engine are divided evenly among the island processes. Their
+    product (island processes x eval_workers) is limited to the CPUs of the
+    engine to avoid oversubscription. The fraction of the busy cores is stored
+    in stats["utilization"]. Used only by the IslandModelGA.
+    '''
+
+    eval_backend: str = "threading"
+    '''
+    The backend of the evaluation workers inside each island: "threading" for
+    fitness functions that release the GIL (e.g. numpy or external codes), or
+    "loky" for pure Python fitness functions (separate processes). The "loky"
+    backend is not supported with the persistent or the asynchronous islands,
+    because their (daemon) worker processes can not start other processes.
+    '''
+
+    # Checkpoint parameters.
+    checkpoint_path: Optional[str] = None
+    '''
+    If set, the full state of the engine is saved (atomically) in this
+    '.npz' file, every 'checkpoint_every' epochs and at the end of the
+    run. The run can be resumed with 'load_checkpoint()'.
+    '''
+
+    checkpoint_every: int = 1
+    '''
+    The number of epochs between two consecutive checkpoints. For the
+    IslandModelGA it is the number of migration periods instead.
+    '''
+
+    # Termination settings.
+    termination: Optional[TerminationCriterion] = None
+    '''
+    Optional termination criterion (or a combination of them with '|' and
+    '&'), e.g. WallClock(60.0) | BestFitnessStall(window=20). It is checked
+    once per epoch, in addition to 'epochs', 'f_max_eval' and 'f_tol'. For
+    the IslandModelGA it is checked after each synchronous migration period.
+    '''
+
     @staticmethod
     def _check_bool(name: str, var: bool) -> None:
         """
@@ -184,20 +282,199 @@ class RunConfig:
         self._check_bool("parallel", self.parallel)
         self._check_bool("correction", self.correction)
         self._check_bool("adapt_probs", self.adapt_probs)
+        self._check_bool("persistent_islands", self.persistent_islands)
+        self._check_bool("async_migration", self.async_migration)
+        self._check_bool("as_completed", self.as_completed)
         self._check_bool("allow_migration", self.allow_migration)
 
         # Check integer parameters.
         self._check_int_positive("epochs", self.epochs)
         self._check_int_positive("n_periods", self.n_periods)
         self._check_int_positive("f_max_eval", self.f_max_eval)
+        self._check_int_positive("checkpoint_every", self.checkpoint_every)
+        self._check_int_positive("island_jobs", self.island_jobs)
+        self._check_int_positive("eval_workers", self.eval_workers)
+
+        # Check the evaluation backend.
+        if self.eval_backend not in ("threading", "loky"):
+            raise ValueError(f"eval_backend must be 'threading' or 'loky', "
+                             f"got {self.eval_backend!r}.")
+        # _end_if_
+
+        # The daemon island workers can not start the loky processes.
+        if self.eval_backend == "loky" and self.allow_migration and \
+                (self.persistent_islands or self.async_migration):
+            raise ValueError("eval_backend 'loky' is not supported with the "
+                             "persistent or the asynchronous islands. "
+                             "Use 'threading'.")
+        # _end_if_
+
+        # Check the elastic scheduling.
+        if self.elastic_islands not in (None, "workers", "restart"):
+            raise ValueError(f"elastic_islands must be None, 'workers' or "
+                             f"'restart', got {self.elastic_islands!r}.")
+        # _end_if_
+
+        # Check the checkpoint path.
+        if self.checkpoint_path is not None and \
+                not isinstance(self.checkpoint_path, (str, os.PathLike)):
+            raise TypeError(f"checkpoint_path must be str, "
+                            f"got {type(self.checkpoint_path).__name__}.")
+        # _end_if_
+
+        # Check the termination criterion.
+        if self.termination is not None and \
+                not isinstance(self.termination, TerminationCriterion):
+            raise TypeError(f"termination must be TerminationCriterion, "
+                            f"got {type(self.termination).__name__}.")
+        # _end_if_
 
         # Check float parameters.
         self._check_float_non_negative("f_tol", self.f_tol)
     # _end_def_
 # _end_class_
 
+
+
+@dataclass(frozen=True)
+class EpochRecord:
+    """
+    Auxiliary dataclass with the lightweight snapshot of one epoch,
+    which is yielded by the run_iter() method of the GA engines.
+    """
+
+    epoch: int
+    '''
+    Current epoch (iteration) of the run, starting from zero.
+    '''
+
+    best: Optional[Fitness]
+    '''
+    Highest fitness value of the population (None if it is not available,
+    or if the fitness has multiple objectives).
+    '''
+
+    avg: Fitness
+    '''
+    Average fitness value of the population.
+    '''
+
+    std: Fitness
+    '''
+    Standard deviation of the fitness values of the population.
+    '''
+
+    f_evals: int
+    '''
+    Number of function evaluations since the start of the run.
+    '''
+
+    elapsed_time: float
+    '''
+    Time (in seconds) since the start of the run.
+    '''
+
+    epoch_time: float
+    '''
+    Time (in seconds) of the current epoch.
+    '''
+
+    population: Optional[tuple] = None
+    '''
+    Read-only view (tuple) of the population, if it has been requested.
+    '''
+# _end_class_
+
 # Public interface.
-__all__ = ["GenericGA", "RunConfig", "Fitness"]
+__all__ = ["GenericGA", "RunConfig", "EpochRecord", "Fitness"]
+
+# Reusable thread executors (one per number of workers).
+_THREAD_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+_THREAD_EXECUTORS_LOCK = Lock()
+
+
+def _get_thread_executor(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Gets the reusable thread executor with the given number of workers,
+    similar to the get_reusable_executor of loky (for the processes).
+    It is created once and shared by all the runs of the process.
+
+    :param max_workers: (int) the number of threads.
+
+    :return: the ThreadPoolExecutor.
+    """
+    with _THREAD_EXECUTORS_LOCK:
+        if max_workers not in _THREAD_EXECUTORS:
+            _THREAD_EXECUTORS[max_workers] = ThreadPoolExecutor(max_workers=max_workers)
+        # _end_if_
+
+        return _THREAD_EXECUTORS[max_workers]
+    # _end_with_
+# _end_def_
+
+
+class _RunningStats:
+    """
+    Auxiliary class with the running mean / std of the fitness values (Welford's
+    algorithm), updated with one value at a time. The tuple values (multiple
+    objectives) are updated element-wise.
+    """
+
+    # Object variables.
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self) -> None:
+        """
+        Construct an empty _RunningStats object.
+        """
+        self.n: int = 0
+        self.mean: NDArray | float = nan
+        self.m2: NDArray | float = 0.0
+    # _end_def_
+
+    def update(self, value: Fitness) -> None:
+        """
+        Adds one (fitness) value to the running statistics.
+
+        :param value: (Fitness) the new value.
+
+        :return: None.
+        """
+        # Convert the value to an array.
+        x = asarray(value, dtype=float)
+
+        # Update the counter.
+        self.n += 1
+
+        # The first value initializes the mean.
+        if self.n == 1:
+            self.mean = x
+            self.m2 = 0.0 * x
+        else:
+            delta = x - self.mean
+            self.mean = self.mean + delta / self.n
+            self.m2 = self.m2 + delta * (x - self.mean)
+        # _end_if_
+    # _end_def_
+
+    def values(self) -> tuple[Fitness, Fitness]:
+        """
+        Gets the current mean and standard deviation.
+
+        :return: the (mean, std) as floats, or as tuples for multiple objectives.
+        """
+        # The (population) standard deviation.
+        std = (asarray(self.m2) / max(self.n, 1)) ** 0.5
+
+        # Convert to the fitness type.
+        if asarray(self.mean).ndim:
+            return tuple(self.mean.tolist()), tuple(std.tolist())
+        # _end_if_
+
+        return float(self.mean), float(std)
+    # _end_def_
+
+# _end_class_
 
 
 class GenericGA:
@@ -221,11 +498,19 @@ class GenericGA:
 
     # Object variables.
     __slots__ = ("population", "fitness_func", "_select_op", "_crossx_op",
-                 "_mutate_op", "_stats", "_n_cpus", "_f_evals", "_iteration")
+                 "_mutate_op", "_stats", "_n_cpus", "_f_evals", "_iteration",
+                 "_feasible_func", "_infeasible_penalty", "_repair_func",
+                 "_max_retries", "_crash_penalty", "_fault_counters",
+                 "_resume_epoch", "_feasible_counts")
 
     def __init__(self, initial_pop: list[Chromosome], fit_func: Callable,
                  select_op: SelectionOperator, mutate_op: MutationOperator,
-                 crossx_op: CrossoverOperator, n_cpus: Optional[int] = None) -> None:
+                 crossx_op: CrossoverOperator, n_cpus: Optional[int] = None,
+                 feasible_func: Optional[Callable] = None,
+                 infeasible_penalty: Optional[Fitness] = None,
+                 repair_func: Optional[Callable] = None,
+                 max_retries: int = 0,
+                 crash_penalty: Optional[Fitness] = None) -> None:
         """
         Default constructor of GenericGA object.
 
@@ -240,12 +525,64 @@ class GenericGA:
         :param crossx_op: crossover operator (must inherit from class CrossoverOperator).
 
         :param n_cpus: Number of requested CPUs for the evolution process (Default=Max_CPU).
+
+        :param feasible_func: (optional) cheap constraint predicate that receives the whole
+                              batch (list of chromosomes) and returns a boolean array with
+                              True for the feasible ones. It runs before the fitness function.
+
+        :param infeasible_penalty: (optional) fitness value assigned to the infeasible
+                                   chromosomes, without calling the fitness function.
+
+        :param repair_func: (optional) callable that repairs (in place) an infeasible
+                            chromosome. Repaired chromosomes are evaluated as usual.
+
+        :param max_retries: number of times that the chromosomes affected by a crashed
+                            (loky) worker are re-submitted, each one in an isolated
+                            worker. Default is zero (i.e. no fault tolerance).
+
+        :param crash_penalty: fitness value assigned to the chromosomes that keep on
+                              crashing the workers, after all the retries. It must be
+                              set if max_retries > 0.
         """
         # Sanity check.
         if not callable(fit_func):
             raise TypeError(f"{self.__class__.__name__}: Fitness function is not callable.")
         # _end_if_
 
+        # Sanity check for the feasibility stage.
+        if feasible_func is not None:
+
+            # The predicate must be callable.
+            if not callable(feasible_func):
+                raise TypeError(f"{self.__class__.__name__}: "
+                                f"Feasibility function is not callable.")
+            # _end_if_
+
+            # Infeasible chromosomes must be handled somehow.
+            if infeasible_penalty is None and repair_func is None:
+                raise ValueError(f"{self.__class__.__name__}: Feasibility function "
+                                 f"requires either a penalty or a repair function.")
+            # _end_if_
+
+            # The repair function must be callable.
+            if repair_func is not None and not callable(repair_func):
+                raise TypeError(f"{self.__class__.__name__}: "
+                                f"Repair function is not callable.")
+            # _end_if_
+        # _end_if_
+
+        # Sanity check for the fault tolerance settings.
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Max retries must be a non-negative integer.")
+        # _end_if_
+
+        # Crashed chromosomes must be penalized.
+        if max_retries > 0 and crash_penalty is None:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Max retries requires a crash penalty value.")
+        # _end_if_
+
         # Copy the reference of the population.
         self.population: list[Chromosome] = initial_pop.copy()
 
@@ -261,6 +598,21 @@ class GenericGA:
         # Get Crossover Operator.
         self._crossx_op: CrossoverOperator = crossx_op
 
+        # Get the (optional) feasibility stage settings.
+        self._feasible_func: Optional[Callable] = feasible_func
+        self._infeasible_penalty: Optional[Fitness] = infeasible_penalty
+        self._repair_func: Optional[Callable] = repair_func
+
+        # Get the (optional) fault tolerance settings.
+        self._max_retries: int = max_retries
+        self._crash_penalty: Optional[Fitness] = crash_penalty
+
+        # Counters of the crashed workers.
+        self._fault_counters: dict = {"crashes": 0, "retries": 0, "penalized": 0}
+
+        # Counters of the feasible / checked chromosomes of the current epoch.
+        self._feasible_counts: list[int] = [0, 0]
+
         # Get the number of requested CPUs.
         if n_cpus is None:
             # This is the default option.
@@ -284,6 +636,9 @@ class GenericGA:
         # Set the iterations counter to zero.
         self._iteration: int = 0
 
+        # First epoch of a resumed run (set by load_checkpoint).
+        self._resume_epoch: Optional[int] = None
+
         # Log the object initialization.
         logger.debug("%s initialization complete.", self.__class__.__name__)
     # _end_def_
@@ -364,6 +719,17 @@ class GenericGA:
         return self._stats
     # _end_def_
 
+    @property
+    def fault_counters(self) -> dict:
+        """
+        Accessor method that returns the counters of the fault
+        tolerant evaluation (crashes, retries, penalized).
+
+        :return: the dictionary with the fault counters.
+        """
+        return self._fault_counters
+    # _end_def_
+
     @property
     def select_op(self) -> SelectionOperator:
         """
@@ -422,15 +788,25 @@ class GenericGA:
         # Reset f_eval counter.
         self._f_evals = 0
 
+        # Reset the fault counters.
+        for key in self._fault_counters:
+            self._fault_counters[key] = 0
+        # _end_for_
+
+        # Reset the feasibility counters.
+        self._feasible_counts = [0, 0]
+
         # Log the cleanup.
         logger.debug("%s cleared.", self.__class__.__name__)
     # _end_def_
 
-    def update_stats(self, fit_list: list[float],
+    def update_stats(self, fit_list: list[float] | NDArray,
                      other_stats: dict = None) -> tuple:
         """
         Update the input stats dictionary with the mean / std
-        values of the population fitness values.
+        values of the population fitness values. If the feasibility
+        stage is enabled, the feasibility rate of all the batches since
+        the previous call is also stored (so one value per epoch).
 
         :param fit_list: (list) fitness values of the population.
 
@@ -438,8 +814,14 @@ class GenericGA:
 
         :return: the mean and std of the fitness values.
         """
-        # Convert the fitness list in a numpy array.
-        arr: NDArray = array(fit_list, dtype=float)
+        # Convert the fitness list in a numpy array. Missing values
+        # (e.g. cancelled evaluations) are ignored.
+        if isinstance(fit_list, ndarray):
+            arr: NDArray = fit_list
+        else:
+            arr: NDArray = array([f for f in fit_list if f is not None],
+                                 dtype=float)
+        # _end_if_
 
         # Compute the mean value.
         avg_fitness: NDArray = nanmean(arr, axis=0, dtype=float)
@@ -458,6 +840,14 @@ class GenericGA:
                 # Store them in the self dictionary.
                 self._stats["avg"].append(avg_fitness)
                 self._stats["std"].append(std_fitness)
+            # _end_if_
+
+            # Store the feasibility rate of the epoch.
+            if self._feasible_counts[1]:
+                (other_stats or self._stats).setdefault("feasible", []).append(
+                    self._feasible_counts[0] / self._feasible_counts[1])
+                self._feasible_counts = [0, 0]
+            # _end_if_
         else:
             raise RuntimeError(f"{self.__class__.__name__}:"
                                f"Something went wrong at {self._iteration} "
@@ -637,14 +1027,373 @@ class GenericGA:
         return self.population[index].fitness
     # _end_def_
 
+    def filter_feasible(self, input_population: list[Chromosome]) -> list[Chromosome]:
+        """
+        Applies the (vectorized) feasibility predicate on the whole input batch,
+        before the expensive fitness function is called. Infeasible chromosomes
+        are either repaired (and returned for evaluation), or they are assigned
+        the penalty fitness value directly. The feasible chromosomes are counted
+        and the feasibility rate of the epoch (all its batches, including those
+        of the local search or the restarts) is stored in stats["feasible"] by
+        the update_stats method, once per epoch.
+
+        :param input_population: (list) The population of Chromosomes that we
+                                 want to check for feasibility.
+
+        :return: a list with the chromosomes that need to be evaluated.
+        """
+        # Get the feasibility mask in one call.
+        is_feasible: NDArray = asarray(self._feasible_func(input_population),
+                                       dtype=bool)
+        # Sanity check.
+        if is_feasible.shape != (len(input_population),):
+            raise RuntimeError(f"{self.__class__.__name__}: Feasibility function "
+                               f"returned mask with shape {is_feasible.shape}.")
+        # _end_if_
+
+        # Count the feasible chromosomes of the current epoch.
+        self._feasible_counts[0] += int(is_feasible.sum())
+        self._feasible_counts[1] += is_feasible.size
+
+        # Quick exit if everything is feasible.
+        if is_feasible.all():
+            return input_population
+        # _end_if_
+
+        # Get the positions of the infeasible chromosomes.
+        infeasible_idx: NDArray = flatnonzero(~is_feasible)
+
+        # Check if we have a repair function.
+        if self._repair_func is not None:
+
+            # Repair them in place.
+            for n in infeasible_idx:
+                self._repair_func(input_population[n])
+            # _end_for_
+
+            # All chromosomes will be evaluated.
+            return input_population
+        # _end_if_
+
+        # Assign the penalty fitness value.
+        for n in infeasible_idx:
+            input_population[n].fitness = self._infeasible_penalty
+        # _end_for_
+
+        # Return only the feasible chromosomes.
+        return [p for p, flag in zip(input_population, is_feasible) if flag]
+    # _end_def_
+
+    def evaluate_fault_tolerant(self, input_population: list[Chromosome]) -> list:
+        """
+        Evaluates the input chromosomes on the (reusable) loky process pool,
+        while recovering from crashed workers (e.g. a segfault inside native
+        code). When a worker dies the pool is broken, and every task that has
+        not finished yet fails, so it is not known which chromosome caused it.
+
+        Each chromosome is submitted at most '1 + max_retries' times:
+
+            1. the whole batch is submitted once to the shared pool,
+            2. the chromosomes of the failed tasks are re-submitted up to
+               'max_retries' times, in isolation (each one in its own single
+               worker process) so a crash affects only the responsible one,
+               with at most 'n_cpus' of them running at the same time,
+            3. the chromosomes that crash in all the retries get the crash
+               penalty value.
+
+        Every broken pool (or isolated worker) counts as one crash, and every
+        re-submission counts as one retry in the fault counters.
+
+        :param input_population: (list) The population of Chromosomes that
+                                 we want to evaluate their fitness.
+
+        :return: a list with the fitness results (in the same order).
+        """
+        # Get a local copy of the fitness function.
+        fit_func: Callable = self.fitness_func
+
+        # Preallocate the results list.
+        results: list = [None] * len(input_population)
+
+        # Local copy of the fault counters.
+        counters: dict = self._fault_counters
+
+        # Get the pool (a new one is started if the previous was broken).
+        executor = get_reusable_executor(max_workers=self._n_cpus)
+
+        # Submit the whole batch.
+        futures = {n: executor.submit(fit_func, p)
+                   for n, p in enumerate(input_population)}
+
+        # Holds the positions of the failed tasks.
+        pending: list[int] = []
+
+        # Collect the results.
+        for n, fut in futures.items():
+            try:
+                results[n] = fut.result()
+            except BrokenProcessPool:
+                pending.append(n)
+        # _end_for_
+
+        # Check if everything went well.
+        if not pending:
+            return results
+        # _end_if_
+
+        # Update the counters.
+        counters["crashes"] += 1
+
+        # Log the crash.
+        logger.warning("%s: worker crashed at epoch %d, %d chromosome(s) affected.",
+                       self.__class__.__name__, self._iteration, len(pending))
+
+        # Retry the failed chromosomes in isolation.
+        for _ in range(self._max_retries):
+
+            # Holds the positions that crashed in this retry.
+            failed: list[int] = []
+
+            # Run at most 'n_cpus' isolated workers at the same time.
+            for k in range(0, len(pending), self._n_cpus):
+
+                # Each chromosome gets its own worker process.
+                isolated = {n: ProcessPoolExecutor(max_workers=1)
+                            for n in pending[k:k + self._n_cpus]}
+
+                # Submit the chromosomes.
+                futures = {n: ex.submit(fit_func, input_population[n])
+                           for n, ex in isolated.items()}
+
+                # Update the counter.
+                counters["retries"] += len(futures)
+
+                # Collect the results.
+                for n, fut in futures.items():
+                    try:
+                        results[n] = fut.result()
+                    except BrokenProcessPool:
+                        # Update the counter.
+                        counters["crashes"] += 1
+                        failed.append(n)
+                    # _end_try_
+                # _end_for_
+
+                # Release the isolated workers.
+                for ex in isolated.values():
+                    ex.shutdown(wait=True)
+                # _end_for_
+            # _end_for_
+
+            # Only the crashed ones remain pending.
+            pending = failed
+
+            # Check if everything went well.
+            if not pending:
+                return results
+            # _end_if_
+        # _end_for_
+
+        # Assign the penalty value to the remaining ones.
+        for n in pending:
+            results[n] = FitnessResult(self._crash_penalty, False)
+        # _end_for_
+
+        # Update the counter.
+        counters["penalized"] += len(pending)
+
+        return results
+    # _end_def_
+
+    def evaluate_as_completed(self, input_population: list[Chromosome],
+                              parallel_mode: bool = False,
+                              backend: str = "threading",
+                              max_evals: Optional[int] = None) -> bool:
+        """
+        Evaluates the input chromosomes consuming the results in completion
+        order. Each result is attached to its chromosome (and counted in the
+        f_evals) as soon as it arrives, and it updates the running mean / std
+        of the batch, which are stored in stats["completed_avg"] and in
+        stats["completed_std"]. When a solution is found, or the total
+        budget of function evaluations is reached, the outstanding tasks are
+        cancelled. The cancelled chromosomes keep their previous fitness, or
+        if they have none they get the worst fitness of the batch (see the
+        method penalize_cancelled), so no engine has to handle None values.
+
+        The "threading" backend uses one reusable thread executor (shared by
+        all the calls), so the cancelled tasks that are already running keep
+        their thread until they finish.
+
+        :param input_population: (list) The population of Chromosomes that
+                                 we want to evaluate their fitness.
+
+        :param parallel_mode: (bool) Enables parallel computation of the
+                              fitness function.
+
+        :param backend: (str) "threading" or "loky" (process) executor.
+
+        :param max_evals: (int) total budget of function evaluations.
+
+        :return: the found solution flag.
+        """
+        # Get a local copy of the fitness function.
+        fit_func: Callable = self.fitness_func
+
+        # Get the remaining budget of function evaluations.
+        budget: float = float("inf") if max_evals is None else max_evals - self._f_evals
+
+        # Counts the completed evaluations.
+        n_done: int = 0
+
+        # Running statistics of the completed evaluations.
+        running = _RunningStats()
+
+        # Flag to indicate if a solution has been found.
+        found_solution: bool = False
+
+        # Serial mode is trivially 'as completed'.
+        if not parallel_mode:
+
+            for p in input_population:
+                # Check for early termination.
+                if found_solution or n_done >= budget:
+                    break
+                # _end_if_
+
+                # Evaluate the chromosome.
+                p.fitness, is_found = unpack_fitness(fit_func(p))
+
+                # Update the counters and the running statistics.
+                self._f_evals += 1
+                n_done += 1
+                running.update(p.fitness)
+
+                # Update the "found solution".
+                found_solution |= is_found
+            # _end_for_
+        else:
+
+            # Select the executor according to the backend.
+            if backend == "loky":
+                executor = get_reusable_executor(max_workers=self._n_cpus)
+            else:
+                executor = _get_thread_executor(self._n_cpus)
+            # _end_if_
+
+            # Submit all the chromosomes.
+            pending: dict = {executor.submit(fit_func, p): p
+                             for p in input_population}
+
+            try:
+                # Consume the results as they complete.
+                while pending and not found_solution and n_done < budget:
+
+                    # Wait for at least one result.
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                    for fut in done:
+                        # Check for early termination.
+                        if found_solution or n_done >= budget:
+                            break
+                        # _end_if_
+
+                        # Get the chromosome of the task.
+                        p = pending.pop(fut)
+
+                        # Attach the fitness to the chromosome.
+                        p.fitness, is_found = unpack_fitness(fut.result())
+
+                        # Update the counters and the running statistics.
+                        self._f_evals += 1
+                        n_done += 1
+                        running.update(p.fitness)
+
+                        # Update the "found solution".
+                        found_solution |= is_found
+                    # _end_for_
+                # _end_while_
+            finally:
+                # Cancel all the outstanding tasks (even
+                # if a task has raised an exception).
+                for fut in pending:
+                    fut.cancel()
+                # _end_for_
+            # _end_try_
+        # _end_if_
+
+        # Store the number of the cancelled evaluations.
+        self._stats["cancelled"].append(len(input_population) - n_done)
+
+        # Store the running statistics of the completed evaluations.
+        if running.n:
+            avg_done, std_done = running.values()
+
+            self._stats["completed_avg"].append(avg_done)
+            self._stats["completed_std"].append(std_done)
+        # _end_if_
+
+        # Assign a fitness value to the cancelled chromosomes.
+        self.penalize_cancelled(input_population)
+
+        return found_solution
+    # _end_def_
+
+    def penalize_cancelled(self, input_population: list[Chromosome]) -> int:
+        """
+        Assigns the worst fitness value of the batch (the minimum value,
+        or the minimum of each objective) to the chromosomes that have no
+        fitness after a cancelled evaluation. If none of the batch has a
+        fitness, the worst value of the current population is used instead.
+
+        :param input_population: (list) The evaluated batch of Chromosomes.
+
+        :return: the number of the penalized chromosomes.
+        """
+        # Get the chromosomes without a fitness value.
+        missing = [p for p in input_population if p.fitness is None]
+
+        # Quick exit.
+        if not missing:
+            return 0
+        # _end_if_
+
+        # Get the available fitness values.
+        values = [p.fitness for p in input_population if p.fitness is not None] or \
+                 [p.fitness for p in self.population if p.fitness is not None]
+
+        # Nothing to compare with.
+        if not values:
+            return 0
+        # _end_if_
+
+        # Get the worst fitness value.
+        if isinstance(values[0], tuple):
+            worst: Fitness = tuple(min(v) for v in zip(*values))
+        else:
+            worst: Fitness = min(values)
+        # _end_if_
+
+        # Assign the worst value.
+        for p in missing:
+            p.fitness = worst
+        # _end_for_
+
+        return len(missing)
+    # _end_def_
+
     def evaluate_fitness(self, input_population: list[Chromosome],
                          parallel_mode: bool = False,
-                         backend: str = "threading") -> tuple[list[Fitness], bool]:
+                         backend: str = "threading",
+                         as_completed: bool = False,
+                         max_evals: Optional[int] = None) -> tuple[list[Fitness], bool]:
         """
         Evaluate all the chromosomes of the input list with the custom
         fitness function. The parallel_mode is optional. Moreover, the
         default backend is "threading", but in the IslandModelGA it is
-        better to select "loky".
+        better to select "loky". If 'max_retries' > 0, the parallel mode
+        always uses the fault tolerant loky process pool. If the fitness
+        function provides an 'evaluate_batch' method (e.g. SimulatorPool)
+        the whole batch is passed to it directly.
 
         :param input_population: (list) The population of Chromosomes
                                  that we want to evaluate their fitness.
@@ -654,22 +1403,69 @@ class GenericGA:
 
         :param backend: (str) Backend for the parallel Joblib framework.
 
+        :param as_completed: (bool) Consumes the results in completion order
+                             and stops early (see evaluate_as_completed).
+
+        :param max_evals: (int) total budget of function evaluations (used
+                          only with as_completed).
+
         :return: a list with the fitness values and the found solution flag.
         """
         # Get a local copy of the fitness function.
         fit_func: Callable = self.fitness_func
 
+        # Check the feasibility of the batch first.
+        if self._feasible_func is None:
+            eval_population = input_population
+        else:
+            eval_population = self.filter_feasible(input_population)
+        # _end_if_
+
+        # Check for the 'as completed' mode.
+        if as_completed:
+
+            # Sanity check.
+            if hasattr(fit_func, "evaluate_batch") or \
+                    (parallel_mode and self._max_retries > 0):
+                raise ValueError(f"{self.__class__.__name__}: The as_completed mode "
+                                 f"is not supported with a batch evaluator or "
+                                 f"with max_retries > 0.")
+            # _end_if_
+
+            # Evaluate with early cancellation.
+            found_solution = self.evaluate_as_completed(eval_population, parallel_mode,
+                                                        backend, max_evals)
+            # Return the fitness values.
+            return [p.fitness for p in input_population], found_solution
+        # _end_if_
+
+        # Check for a batch evaluator (e.g. the SimulatorPool),
+        # which takes care of the parallel execution by itself.
+        batch_func: Optional[Callable] = getattr(fit_func, "evaluate_batch", None)
+
         # Check the 'parallel_mode' flag.
-        if parallel_mode:
+        if batch_func is not None:
+
+            # Evaluate the whole batch in one call.
+            fitness_i = batch_func(eval_population)
+
+        elif parallel_mode and self._max_retries > 0:
+
+            # Evaluate the chromosomes with the crash recovery.
+            # NOTE: A crash can only be recovered in a separate
+            # process, so this always uses the loky process pool.
+            fitness_i = self.evaluate_fault_tolerant(eval_population)
+
+        elif parallel_mode:
 
             # Evaluate the chromosomes in parallel mode.
             fitness_i = Parallel(n_jobs=self._n_cpus, backend=backend)(
-                delayed(fit_func)(p) for p in input_population
+                delayed(fit_func)(p) for p in eval_population
             )
         else:
 
             # Evaluate the chromosomes in serial mode.
-            fitness_i = [fit_func(p) for p in input_population]
+            fitness_i = [fit_func(p) for p in eval_population]
         # _end_if_
 
         # Get the size of the population.
@@ -683,20 +1479,35 @@ class GenericGA:
 
         # Update all chromosomes with their fitness and
         # check if a solution has been found.
-        for n, (p, fit_result) in enumerate(zip(input_population, fitness_i)):
-            # Attach the fitness to each chromosome.
-            p.fitness = fit_result["f_value"]
+        for n, (p, fit_result) in enumerate(zip(eval_population, fitness_i)):
+            # Fast path for the FitnessResult objects.
+            if type(fit_result) is FitnessResult:
+                f_value = fit_result.f_value
+                is_found = fit_result.solution_is_found
+            else:
+                # Dictionaries, tuples or direct values.
+                f_value, is_found = unpack_fitness(fit_result)
+            # _end_if_
+
+            # Attach the (normalized) fitness to each chromosome.
+            p.fitness = f_value
 
             # Collect the fitness in a separate list.
-            fitness_values[n] = fit_result["f_value"]
+            fitness_values[n] = p.fitness
 
             # Update the "found solution".
-            found_solution |= fit_result["solution_is_found"]
+            found_solution |= is_found
         # _end_for_
 
         # Update the counter of function evaluations.
         self._f_evals += p_size
 
+        # If some chromosomes were penalized collect
+        # the fitness values of the whole population.
+        if eval_population is not input_population:
+            fitness_values = [p.fitness for p in input_population]
+        # _end_if_
+
         # Return the fitness values.
         return fitness_values, found_solution
     # _end_def_
@@ -734,6 +1545,363 @@ class GenericGA:
         return has_been_corrected
     # _end_def_
 
+    def start_run(self) -> int:
+        """
+        Prepares the engine for a new run. If a checkpoint has been loaded
+        the state is kept as it is and the run continues from the epoch
+        after the checkpoint. Otherwise, everything is cleared.
+
+        :return: the first epoch of the run.
+        """
+        # Start a new run.
+        if self._resume_epoch is None:
+            # Make sure everything is cleared.
+            self.clear_all()
+            return 0
+        # _end_if_
+
+        # Continue from the checkpoint (only once).
+        first_epoch, self._resume_epoch = self._resume_epoch, None
+
+        # Log the resume.
+        logger.info("%s resumes from epoch %d.",
+                    self.__class__.__name__, first_epoch)
+        return first_epoch
+    # _end_def_
+
+    def _checkpoint_operators(self) -> dict:
+        """
+        Collects all the genetic operators of the engine (including those
+        inside the meta operators) with a unique name.
+
+        :return: a dictionary {name: operator}.
+        """
+        # Main genetic operators.
+        operators = {"select": self._select_op,
+                     "crossx": self._crossx_op,
+                     "mutate": self._mutate_op}
+
+        # Add the operators of the meta operators.
+        for name, op in list(operators.items()):
+            if isinstance(op.items, tuple) and \
+                    all(isinstance(x, GeneticOperator) for x in op.items):
+                for n, x in enumerate(op.items):
+                    operators[f"{name}.{n}"] = x
+        # _end_for_
+
+        return operators
+    # _end_def_
+
+    def _genome_arrays(self, chromosomes: list[Chromosome]) -> dict:
+        """
+        Converts the genome values of the input chromosomes to a flat array.
+        If the genes have values of different types (e.g. int and float) the
+        common array type would change them, so the type of each gene is also
+        stored (in the 'dtypes' entry).
+
+        :param chromosomes: (list) the chromosomes to convert.
+
+        :return: a dictionary with the 'values' (and the 'dtypes') arrays.
+        """
+        # Genome values of all the chromosomes (flattened).
+        values: list = [g.value for p in chromosomes for g in p.genome]
+        genome: NDArray = array(values)
+
+        # Types of the individual values.
+        dtypes: list = [asarray(v).dtype for v in values]
+
+        # Only numeric (or string) values can be stored without pickle.
+        for dt in [genome.dtype, *dtypes]:
+            if dt.kind not in "biufU":
+                raise TypeError(f"{self.__class__.__name__}: Genome values of "
+                                f"type '{dt}' can not be checkpointed.")
+            # _end_if_
+        # _end_for_
+
+        # Store the types only for the mixed genomes.
+        if any(dt.kind != genome.dtype.kind for dt in dtypes):
+            return {"values": genome, "dtypes": array([dt.str for dt in dtypes])}
+        # _end_if_
+
+        return {"values": genome}
+    # _end_def_
+
+    @staticmethod
+    def _genome_values(values: NDArray, dtypes: Optional[NDArray] = None) -> list:
+        """
+        Converts the array of a checkpoint back to the list of the genome
+        values, restoring the type of each gene (if the types are given).
+
+        :param values: (NDArray) the genome values.
+
+        :param dtypes: (NDArray) the types of the genes (or None).
+
+        :return: the list of the genome values.
+        """
+        # Homogeneous genomes.
+        if dtypes is None:
+            return values.tolist()
+        # _end_if_
+
+        # Mixed genomes.
+        genome: list = []
+
+        for v, dt in zip(values.tolist(), dtypes.tolist()):
+            # The strings "True" / "False" are not cast correctly to bool.
+            if dt == "|b1" and isinstance(v, str):
+                genome.append(v == "True")
+            else:
+                genome.append(asarray(v).astype(dt).item())
+            # _end_if_
+        # _end_for_
+
+        return genome
+    # _end_def_
+
+    def _checkpoint_state(self) -> dict:
+        """
+        Collects the state of the engine in a dictionary of numpy arrays
+        (no pickled objects). Derived engines can extend this dictionary
+        with their own variables.
+
+        :return: a dictionary with the state of the engine.
+        """
+        # Genome values (and types) of all the chromosomes.
+        genome: dict = self._genome_arrays(self.population)
+
+        # Fitness values (missing values are NaN).
+        fitness: list = [nan if p.fitness is None else p.fitness
+                         for p in self.population]
+
+        # Number of objectives.
+        n_obj = next((len(f) for f in fitness if isinstance(f, tuple)), 0)
+
+        # Expand the missing values to tuples.
+        if n_obj:
+            fitness = [f if isinstance(f, tuple) else n_obj * (nan,)
+                       for f in fitness]
+        # _end_if_
+
+        # Stats values with their (JSON encoded) keys.
+        stats_keys: list = []
+        stats_arrays: dict = {}
+
+        for key, value in self._stats.items():
+            # Nested dictionaries (e.g. per island).
+            if isinstance(value, dict):
+                items = [([key, k], v) for k, v in value.items()]
+            else:
+                items = [([key], value)]
+            # _end_if_
+
+            for path, v in items:
+                stats_arrays[f"stats_{len(stats_keys)}"] = asarray(v, dtype=float)
+                stats_keys.append(path)
+        # _end_for_
+
+        # Genetic operators.
+        operators = self._checkpoint_operators()
+
+        state = {"engine": array(self.__class__.__name__),
+                 "genome": genome["values"],
+                 "genome_sizes": array([len(p) for p in self.population], dtype=int),
+                 "gene_valid": array([g.is_valid for p in self.population
+                                      for g in p.genome], dtype=bool),
+                 "valid": array([p.valid for p in self.population], dtype=bool),
+                 "fitness": array(fitness, dtype=float),
+                 "f_evals": array(self._f_evals),
+                 "iteration": array(self._iteration),
+                 "fault_counters": array([self._fault_counters[k] for k in
+                                          ("crashes", "retries", "penalized")]),
+                 "op_names": array(list(operators)),
+                 "op_probability": array([op.probability for op in operators.values()]),
+                 "op_counter": array([op.counter for op in operators.values()]),
+                 "rng_GA": array(json.dumps(self.rng_GA.bit_generator.state)),
+                 "rng_operators": array(json.dumps(GeneticOperator._rng.bit_generator.state)),
+                 "stats_keys": array(json.dumps(stats_keys)),
+                 **stats_arrays}
+
+        # Store the types of the mixed genomes.
+        if "dtypes" in genome:
+            state["genome_dtypes"] = genome["dtypes"]
+        # _end_if_
+
+        return state
+    # _end_def_
+
+    def _restore_state(self, data) -> None:
+        """
+        Restores the state of the engine from the arrays of a checkpoint.
+        The genome values are copied (in place) in the genes of the current
+        population, so the engine should be created with the same settings
+        (population size and chromosome lengths) as the one that was saved.
+
+        :param data: the loaded arrays (NpzFile or dictionary).
+
+        :return: None.
+        """
+        # Check the engine type.
+        if str(data["engine"]) != self.__class__.__name__:
+            raise ValueError(f"{self.__class__.__name__}: Checkpoint was saved "
+                             f"by {str(data['engine'])}.")
+        # _end_if_
+
+        # Check the population.
+        if data["genome_sizes"].tolist() != [len(p) for p in self.population]:
+            raise ValueError(f"{self.__class__.__name__}: Checkpoint population "
+                             f"does not match the current population.")
+        # _end_if_
+
+        # Copy the gene values and flags.
+        genes = (g for p in self.population for g in p.genome)
+
+        values = self._genome_values(data["genome"], data["genome_dtypes"]
+                                     if "genome_dtypes" in data else None)
+
+        for gene, value, flag in zip(genes, values, data["gene_valid"].tolist()):
+            gene.value = value
+            gene.is_valid = flag
+        # _end_for_
+
+        # Copy the fitness values and the flags.
+        for p, f, flag in zip(self.population, data["fitness"],
+                              data["valid"].tolist()):
+            # Missing values are restored as None.
+            if isnan(f).any():
+                p.invalidate_fitness()
+            else:
+                p.fitness = f if f.ndim else float(f)
+            # _end_if_
+
+            p.valid = flag
+        # _end_for_
+
+        # Restore the counters.
+        self._f_evals = int(data["f_evals"])
+        self.iteration = int(data["iteration"])
+
+        for k, v in zip(("crashes", "retries", "penalized"),
+                        data["fault_counters"].tolist()):
+            self._fault_counters[k] = v
+        # _end_for_
+
+        # Restore the operators.
+        operators = self._checkpoint_operators()
+
+        for name, prob, count in zip(data["op_names"].tolist(),
+                                     data["op_probability"].tolist(),
+                                     data["op_counter"].tolist()):
+            # Skip the unknown operators.
+            if name not in operators:
+                logger.warning("%s: Unknown operator '%s' in checkpoint.",
+                               self.__class__.__name__, name)
+                continue
+            # _end_if_
+
+            op = operators[name]
+            op.probability = prob
+            op.reset_counter()
+            op.inc_counter(count)
+        # _end_for_
+
+        # Restore the random number generators (of the engine
+        # and the one that is shared by all genetic operators).
+        self.rng_GA.bit_generator.state = json.loads(str(data["rng_GA"]))
+        GeneticOperator._rng.bit_generator.state = json.loads(str(data["rng_operators"]))
+
+        # Restore the stats.
+        self._stats.clear()
+
+        for n, path in enumerate(json.loads(str(data["stats_keys"]))):
+            # Convert the array back to a list.
+            values = data[f"stats_{n}"]
+            values = values.tolist() if values.ndim == 1 else list(values)
+
+            if len(path) == 1:
+                self._stats[path[0]] = values
+            else:
+                # JSON converts the integer keys to strings.
+                key = int(path[0]) if isinstance(path[0], str) and \
+                    path[0].isdigit() else path[0]
+                self._stats.setdefault(key, {})[path[1]] = values
+            # _end_if_
+        # _end_for_
+    # _end_def_
+
+    def save_checkpoint(self, path: str) -> None:
+        """
+        Saves the full state of the engine in a (uncompressed) '.npz' file.
+        This includes the population (genome values and fitness), the stats,
+        the counters, the genetic operators (probabilities and counters) and
+        the states of the random generators (engine and genetic operators).
+
+        The file is written first in a temporary file, which then replaces
+        the target file atomically. So an interrupted write never corrupts
+        the previous checkpoint.
+
+        :param path: (str) the path of the checkpoint file.
+
+        :return: None.
+        """
+        # Collect the state.
+        state: dict = self._checkpoint_state()
+
+        # Temporary file in the same directory.
+        tmp_path = f"{os.fspath(path)}.tmp"
+
+        # Write the arrays.
+        with open(tmp_path, "wb") as f_out:
+            savez(f_out, **state)
+
+            # Make sure the data are on the disk.
+            f_out.flush()
+            os.fsync(f_out.fileno())
+        # _end_with_
+
+        # Replace the old checkpoint atomically.
+        os.replace(tmp_path, path)
+
+        # Log the checkpoint.
+        logger.debug("%s checkpoint saved in %s.", self.__class__.__name__, path)
+    # _end_def_
+
+    def load_checkpoint(self, path: str) -> None:
+        """
+        Loads the state of the engine from a checkpoint file. The next call
+        of run() will continue from the epoch after the checkpoint (instead
+        of starting from scratch).
+
+        :param path: (str) the path of the checkpoint file.
+
+        :return: None.
+        """
+        # Load the arrays (without pickled objects).
+        with np_load(path, allow_pickle=False) as data:
+            self._restore_state(data)
+        # _end_with_
+
+        # The run continues after the last saved epoch.
+        self._resume_epoch = self._iteration + 1 if self._stats else None
+    # _end_def_
+
+    def periodic_checkpoint(self, config: RunConfig, final: bool = False) -> None:
+        """
+        Saves a checkpoint if it is enabled in the configuration and the
+        current epoch (iteration) completes a checkpoint interval.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param final: (bool) if True the checkpoint is saved regardless
+                      of the interval (i.e. at the end of the run).
+
+        :return: None.
+        """
+        if config.checkpoint_path is not None and \
+                (final or (self._iteration + 1) % config.checkpoint_every == 0):
+            self.save_checkpoint(config.checkpoint_path)
+        # _end_if_
+    # _end_def_
+
     def print_operator_stats(self) -> None:
         """
         Print the genetic operators stats.
@@ -765,15 +1933,183 @@ class GenericGA:
 
     # _end_def_
 
-    def run(self, config: Optional[RunConfig] = None) -> None:
+    def epoch_record(self, epoch: int, time_t0: float, time_i: float,
+                     population_view: bool = False) -> EpochRecord:
+        """
+        Creates the snapshot of the current epoch from the last
+        entries of the stats.
+
+        :param epoch: (int) the current epoch.
+
+        :param time_t0: (float) the time instant of the start of the run.
+
+        :param time_i: (float) the time instant of the start of the epoch.
+
+        :param population_view: (bool) if True the record includes a
+                                read-only view of the population.
+
+        :return: the EpochRecord of the current epoch.
+        """
+        # Get the current time instant.
+        time_now: float = time.perf_counter()
+
+        # Get the best chromosome of the population.
+        best = self.best_chromosome()
+
+        # Get the lists of the mean / std values (without
+        # adding new keys in the stats).
+        avg_list = self._stats.get("avg")
+        std_list = self._stats.get("std")
+
+        return EpochRecord(epoch=epoch,
+                           best=None if best is None or isinstance(best.fitness, tuple)
+                           else best.fitness,
+                           avg=avg_list[-1] if avg_list else nan,
+                           std=std_list[-1] if std_list else nan,
+                           f_evals=self._f_evals,
+                           elapsed_time=time_now - time_t0,
+                           epoch_time=time_now - time_i,
+                           population=tuple(self.population) if population_view else None)
+    # _end_def_
+
+    def check_termination(self, config: RunConfig, record: EpochRecord) -> bool:
+        """
+        Checks the termination criterion of the configuration
+        (if any) at the end of an epoch.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the run should stop.
+        """
+        # Check the criterion.
+        if config.termination is not None and config.termination(self, record):
+            # Log a warning message.
+            logger.warning("%s stopped in %d iterations by: %s",
+                           self.__class__.__name__, record.epoch + 1,
+                           config.termination.reason)
+            return True
+        # _end_if_
+
+        return False
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
         """
-        Main method of the Generic GA class that implements
-        the evolutionary routine.
+        Main method of the Generic GA class that implements the evolutionary
+        routine as a generator, which yields an EpochRecord at the end of each
+        epoch. Closing the generator early stops the run (without the final
+        checkpoint).
+
+        :param config: (RunConfig) the configuration params.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords.
         """
         raise NotImplementedError(f"{self.__class__.__name__}: "
                                   f"You should implement this method!")
     # _end_def_
 
+    async def run_async(self, config: Optional[RunConfig] = None,
+                        executor: Optional[Executor] = None,
+                        population_view: bool = False) -> Optional[EpochRecord]:
+        """
+        Runs the evolutionary routine inside an asyncio event loop. Each
+        epoch of run_iter() (including its batched fitness evaluation) is
+        executed in the executor, so the loop is free between the epochs
+        and many engines can run concurrently in the same process.
+
+        If the task is cancelled, the current epoch is completed (it cannot
+        be interrupted), the run stops and the CancelledError is raised
+        again. The engine keeps the partial result (population, stats and
+        f_evals) of the last completed epoch, and the run can be resumed
+        from the last periodic checkpoint (if enabled).
+
+        NOTE: The random generators are shared by the engines of the same
+        class, so concurrent runs are not reproducible with a seed.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param executor: (Executor) to run the epochs. If None the default
+                         executor of the event loop is used.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: the EpochRecord of the last epoch (or None).
+        """
+        # Initialize the configuration parameters.
+        config = config or RunConfig()
+
+        # Get the running event loop.
+        loop = asyncio.get_running_loop()
+
+        # Create the generator of the epochs.
+        epochs = self.run_iter(config, population_view)
+
+        # The last record of the run.
+        record: Optional[EpochRecord] = None
+
+        # The future of the current epoch.
+        step: Optional[asyncio.Future] = None
+
+        try:
+            while True:
+                # Run the next epoch in the executor.
+                step = loop.run_in_executor(executor, next, epochs, None)
+
+                # Shield the epoch from the cancellation of the task.
+                next_record = await asyncio.shield(step)
+
+                # Check for the end of the run.
+                if next_record is None:
+                    break
+                # _end_if_
+
+                record = next_record
+            # _end_while_
+
+        except asyncio.CancelledError:
+            # Wait for the current epoch to finish.
+            if step is not None and not step.done():
+                await asyncio.wait([step])
+            # _end_if_
+
+            # Stop the run.
+            epochs.close()
+
+            # Log a warning message.
+            logger.warning("%s was cancelled after %d function evaluations.",
+                           self.__class__.__name__, self._f_evals)
+            raise
+        finally:
+            # Make sure the generator is closed.
+            if step is None or step.done():
+                epochs.close()
+            # _end_if_
+        # _end_try_
+
+        return record
+    # _end_def_
+
+    def run(self, config: Optional[RunConfig] = None) -> None:
+        """
+        Runs the evolutionary routine until the end, without
+        keeping the per-epoch records (only the stats).
+
+        :param config: (RunConfig) the configuration params.
+
+        :return: None.
+        """
+        for _ in self.run_iter(config):
+            pass
+        # _end_for_
+    # _end_def_
+
     def __call__(self, config: Optional[RunConfig] = None) -> None:
         """
         This method is only a wrapper of the "run" method.
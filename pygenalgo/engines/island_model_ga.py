@@ -1,13 +1,32 @@
 """ Island model GA module. """
 import time
+import weakref
+import traceback
+from queue import Empty
+from copy import copy
 from math import isclose
+from struct import (pack_into, unpack_from)
+from itertools import islice
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from multiprocessing.shared_memory import SharedMemory
 from operator import attrgetter
 from collections import defaultdict
-from typing import (Optional, Callable)
+from dataclasses import replace
+from typing import (Optional, Callable, Iterator)
 
 # Third party code.
-from numpy import nanmean
+from numpy import (nanmean, array, sqrt)
 from joblib import (Parallel, delayed)
+from joblib.parallel import LokyBackend
+
+# Newer joblib versions do not vendor cloudpickle
+# (it is installed as a dependency of loky).
+try:
+    from joblib.externals import cloudpickle
+except ImportError:
+    import cloudpickle
+# _end_try_
 
 # Custom PyGenaAlgo code.
 from pygenalgo.engines import logger
@@ -15,12 +34,881 @@ from pygenalgo.genome.chromosome import Chromosome
 from pygenalgo.utils.auxiliary import (SubPopulation,
                                        average_hamming_distance)
 # Custom PyGenaAlgo code.
-from pygenalgo.engines.generic_ga import GenericGA, RunConfig
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
 from pygenalgo.operators.migration.meta_migration import MetaMigration
 from pygenalgo.operators.migration.migration_operator import MigrationOperator
+from pygenalgo.operators.migration.topology_migration import TopologyMigration
+from pygenalgo.operators.migration.topology import (Topology, RingTopology)
+
+# Public interface.
+__all__ = ["IslandModelGA", "RunConfig"]
+
+
+class _MigrantBuffer:
+    """
+    Description:
+
+        Stands in for the population of an island that lives in a persistent
+        worker process. It holds only the best chromosome of the island (the
+        emigrant) and records the chromosomes that the migration operator puts
+        in the island (the immigrants), so that only these are sent back to the
+        worker. It supports the list operations of the migration operators:
+        len(), iteration (max) and item assignment.
+    """
+
+    # Object variables.
+    __slots__ = ("_best", "_size", "_incoming")
+
+    def __init__(self, best: Chromosome, size: int) -> None:
+        """
+        Construct a buffer for an island of 'size' chromosomes.
+
+        :param best: (Chromosome) the best chromosome of the island.
+
+        :param size: (int) the population size of the island.
+        """
+        self._best = best
+        self._size = size
+        self._incoming: dict = {}
+    # _end_def_
+
+    @property
+    def incoming(self) -> dict:
+        """
+        Accessor of the immigrants {position: chromosome}.
+
+        :return: the dictionary of the immigrants.
+        """
+        return self._incoming
+    # _end_def_
+
+    def __len__(self) -> int:
+        return self._size
+    # _end_def_
+
+    def __iter__(self):
+        return iter((self._best,))
+    # _end_def_
+
+    def __getitem__(self, index: int) -> Chromosome:
+        return self._incoming.get(index, self._best)
+    # _end_def_
+
+    def __setitem__(self, index: int, item: Chromosome) -> None:
+        self._incoming[int(index)] = item
+    # _end_def_
+
+# _end_class_
+
+
+# Locks of the shared counters (by the name of their memory block),
+# registered in each worker process when the worker is created.
+_COUNTER_LOCKS: dict = {}
+
+
+def _register_counter_lock(name: str, lock) -> None:
+    """
+    Registers the lock of a shared counter in the current (worker) process.
+    The locks can only be inherited by the new processes, so they are passed
+    when the workers are created (and not with the pickled counters).
+
+    :param name: (str) the name of the shared memory block of the counter.
+
+    :param lock: the (process shared) lock of the counter.
+
+    :return: None.
+    """
+    _COUNTER_LOCKS[name] = lock
+# _end_def_
+
+
+class _SharedCounter:
+    """
+    Description:
+
+        Counts the function evaluations of all the islands in a block of shared
+        memory, with one (int64) slot per island and one (the last) for the main
+        process. Each slot has a single writer, so the counts need no locking and
+        the total is the sum of the slots. If there is a budget, the evaluations
+        are reserved atomically (under a process lock) before they are performed,
+        so all the islands together never exceed it. The counter is pickled by
+        the name of the shared memory block, so it can be sent to any worker
+        that has been created with its lock (see the 'initargs').
+    """
+
+    # Object variables.
+    __slots__ = ("_shm", "_n_slots", "_limit", "_lock", "_finalizer", "__weakref__")
+
+    def __init__(self, n_islands: int, limit: Optional[int] = None,
+                 base: int = 0) -> None:
+        """
+        Construct a shared counter for 'n_islands' islands.
+
+        :param n_islands: (int) the number of islands.
+
+        :param limit: (int) the global budget of function evaluations.
+
+        :param base: (int) the evaluations that are already performed.
+        """
+        # One slot per island, plus the main process.
+        self._n_slots: int = n_islands + 1
+
+        # Create the shared memory block.
+        self._shm = SharedMemory(create=True, size=8 * self._n_slots)
+
+        # Initialize the counts.
+        pack_into(f"{self._n_slots}q", self._shm.buf, 0,
+                  *([0] * n_islands), int(base))
+
+        # The budget of function evaluations.
+        self._limit: Optional[int] = limit
+
+        # The lock is needed only for the reservations of the budget.
+        self._lock = None if limit is None else get_context("spawn").Lock()
+
+        # Release the resources, when the counter is no longer used.
+        self._finalizer = weakref.finalize(self, _SharedCounter._cleanup, self._shm)
+    # _end_def_
+
+    @staticmethod
+    def _cleanup(shm: SharedMemory) -> None:
+        """
+        Unlinks the shared memory block.
+
+        :return: None.
+        """
+        shm.close()
+        shm.unlink()
+    # _end_def_
+
+    def __getstate__(self) -> tuple:
+        """
+        The shared memory block is pickled by its name. The lock can't be
+        pickled, so the workers get it (by name) from their registry.
+        """
+        return self._shm.name, self._n_slots, self._limit
+    # _end_def_
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        This method works in tandem with the __getstate__() to unpickle the
+        counter. It attaches to the existing shared memory block and gets
+        the lock that was registered when the worker was created.
+        """
+        name, self._n_slots, self._limit = state
+
+        # Get the registered lock of the counter.
+        self._lock = _COUNTER_LOCKS.get(name)
+
+        # Sanity check.
+        if self._limit is not None and self._lock is None:
+            raise RuntimeError(f"{self.__class__.__name__}: The worker was "
+                               f"created without the lock of the counter.")
+        # _end_if_
+
+        # Attach to the existing shared memory block.
+        self._shm = SharedMemory(name=name)
+
+        # Only the creator of the block can release it.
+        self._finalizer = None
+    # _end_def_
+
+    @property
+    def initargs(self) -> tuple:
+        """
+        Accessor of the arguments of the '_register_counter_lock', which
+        must be called in each worker process when it is created.
+
+        :return: a tuple (name, lock).
+        """
+        return self._shm.name, self._lock
+    # _end_def_
+
+    def parallel(self, n_jobs: int) -> Parallel:
+        """
+        Creates a loky Parallel object, whose workers can use the counter
+        (i.e. they register its lock when they start).
+
+        :param n_jobs: (int) the number of the worker processes.
+
+        :return: the Parallel object.
+        """
+        # Without a budget the workers do not need the lock.
+        if self._lock is None:
+            return Parallel(n_jobs=n_jobs, backend="loky")
+        # _end_if_
+
+        return Parallel(n_jobs=n_jobs,
+                        backend=LokyBackend(initializer=_register_counter_lock,
+                                            initargs=self.initargs))
+    # _end_def_
+
+    @property
+    def used(self) -> int:
+        """
+        Accessor of the total number of function evaluations.
+
+        :return: the sum of the counts of all the slots.
+        """
+        return sum(unpack_from(f"{self._n_slots}q", self._shm.buf, 0))
+    # _end_def_
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Checks if the budget of function evaluations is exhausted.
+
+        :return: True if there is a budget and it has been reached.
+        """
+        return self._limit is not None and self.used >= self._limit
+    # _end_def_
+
+    def _add(self, slot: int, n: int) -> None:
+        """
+        Adds 'n' evaluations in the given slot (single writer).
+
+        :return: None.
+        """
+        # Get the position of the slot (-1 is the main process).
+        offset = 8 * (slot % self._n_slots)
+
+        pack_into("q", self._shm.buf, offset,
+                  unpack_from("q", self._shm.buf, offset)[0] + n)
+    # _end_def_
+
+    def reserve(self, slot: int, n: int) -> int:
+        """
+        Reserves (atomically) up to 'n' evaluations from the budget.
+
+        :param slot: (int) the island id (or -1 for the main process).
+
+        :param n: (int) the requested number of evaluations.
+
+        :return: the number of granted evaluations.
+        """
+        # Without a budget everything is granted.
+        if self._lock is None:
+            self._add(slot, n)
+            return n
+        # _end_if_
+
+        with self._lock:
+            # Grant only the remaining evaluations.
+            n_granted = max(0, min(n, self._limit - self.used))
+
+            self._add(slot, n_granted)
+        # _end_with_
+
+        return n_granted
+    # _end_def_
+
+    def release(self, slot: int, n: int) -> None:
+        """
+        Returns 'n' reserved (but not performed) evaluations.
+
+        :param slot: (int) the island id (or -1 for the main process).
+
+        :param n: (int) the number of unused evaluations.
+
+        :return: None.
+        """
+        if n:
+            self._add(slot, -n)
+        # _end_if_
+    # _end_def_
+
+    def close(self) -> None:
+        """
+        Releases the shared memory (only the creator of the counter).
+
+        :return: None.
+        """
+        if self._finalizer is not None:
+            self._finalizer()
+        # _end_if_
+    # _end_def_
+
+# _end_class_
+
+
+def _insert_migrant(island: SubPopulation, idx: int, values: list,
+                    fitness) -> None:
+    """
+    Inserts a migrant (genome values and fitness) in the island,
+    using the replaced chromosome as template.
+
+    :param island: (SubPopulation) the island.
+
+    :param idx: (int) the position of the replaced chromosome.
+
+    :param values: (list) the genome values of the migrant.
+
+    :param fitness: the fitness of the migrant.
+
+    :return: None.
+    """
+    # Clone the replaced chromosome.
+    chromosome = island.population[idx].clone()
+
+    # Copy the genome values and the fitness.
+    for gene, value in zip(chromosome.genome, values):
+        gene.value = value
+    # _end_for_
+
+    chromosome.fitness = fitness
+    island.population[idx] = chromosome
+# _end_def_
+
+
+def _run_async_periods(engine, island: SubPopulation, mailboxes: dict,
+                       kwargs: dict) -> tuple:
+    """
+    Evolves an island for all its (local) periods without waiting for the
+    other islands. At the end of each period the best chromosome is pushed
+    in the mailboxes of the target islands and the immigrants that have
+    arrived in the own mailbox (if any) are pulled without blocking.
+
+    :param engine: (IslandModelGA) the engine copy of the worker.
+
+    :param island: (SubPopulation) the island.
+
+    :param mailboxes: (dict) the mailbox (queue) of each island.
+
+    :param kwargs: (dict) the evolution parameters, along with the
+                   'periods' (epochs of each period) and the 'targets'.
+
+    :return: a tuple (island, has_converged, local_stats, n_immigrants).
+    """
+    # Extract the schedule and the targets.
+    periods, targets = kwargs.pop("periods"), kwargs.pop("targets")
+
+    # The epochs are given by the schedule.
+    kwargs.pop("epochs", None)
+
+    # Get the own mailbox.
+    mailbox = mailboxes[island.id]
+
+    # Define local dictionary to hold the statistics.
+    local_stats: dict = {
+        "avg": [], "std": [], "prob_crossx": [], "prob_mutate": []
+    }
+
+    # Convergence flag and the total number of epochs.
+    has_converged = (False, sum(periods))
+
+    # Counters.
+    n_epochs_done, n_immigrants = 0, 0
+
+    for n_epochs in periods:
+        # Evolve the island for the current period.
+        island, converged_i, stats_i, _ = engine._evolve_population(island,
+                                                                    epochs=n_epochs,
+                                                                    **kwargs)
+        # Accumulate the statistics.
+        for key, values in stats_i.items():
+            local_stats[key].extend(values)
+        # _end_for_
+
+        # Continue with the current genetic probabilities.
+        kwargs["prob_crossx"] = kwargs["prob_mutate"] = None
+
+        # Check for convergence.
+        if converged_i[0]:
+            has_converged = (True, n_epochs_done + converged_i[1])
+            break
+        # _end_if_
+
+        n_epochs_done += n_epochs
+
+        # Push the best chromosome to the targets.
+        best = max((p for p in island.population if p.fitness is not None),
+                   key=attrgetter("fitness"))
+
+        for j in targets:
+            mailboxes[j].put((best.values(), best.fitness))
+        # _end_for_
+
+        # Pull the immigrants that have arrived (without waiting).
+        while True:
+            try:
+                values, fitness = mailbox.get_nowait()
+            except Empty:
+                break
+            # _end_try_
+
+            # Perform the migration with a predefined probability.
+            if engine.migrate_op.is_operator_applicable():
+                # Select randomly one individual chromosome.
+                idx = engine.rng_GA.integers(0, len(island), dtype=int)
+
+                # Replace it with the immigrant.
+                _insert_migrant(island, idx, values, fitness)
+
+                n_immigrants += 1
+            # _end_if_
+        # _end_while_
+    # _end_for_
+
+    return island, has_converged, local_stats, n_immigrants
+# _end_def_
+
+def _island_worker(conn, payload: bytes, mailboxes: dict,
+                   counter_lock: Optional[tuple] = None) -> None:
+    """
+    Main loop of a persistent island worker process. The engine and the
+    island are received once (payload). Then, for every period it inserts
+    the immigrants, evolves the island and sends back only the best
+    chromosome (genome values and fitness) and the local stats.
+
+    :param conn: the (worker side) connection of the pipe.
+
+    :param payload: (bytes) the cloudpickled engine and island.
+
+    :param mailboxes: (dict) the mailbox (queue) of each island, for
+                      the asynchronous migration.
+
+    :param counter_lock: (tuple) the name and the lock of the shared
+                         counter of the function evaluations (if any).
+
+    :return: None.
+    """
+    # Register the lock of the shared counter (before its unpickling).
+    if counter_lock is not None:
+        _register_counter_lock(*counter_lock)
+    # _end_if_
+
+    # Unpack the engine and the island.
+    engine, island = cloudpickle.loads(payload)
+
+    # Do not wait for the unread migrants when the worker exits.
+    for mailbox in mailboxes.values():
+        mailbox.cancel_join_thread()
+    # _end_for_
+
+    # Key to compare the chromosomes.
+    key_fitness = attrgetter("fitness")
+
+    try:
+        while True:
+            # Wait for the next command.
+            command, args = conn.recv()
+
+            # Stop the worker.
+            if command == "stop":
+                break
+            # _end_if_
+
+            # Unpack the arguments.
+            migrants, kwargs = args
+
+            # Insert the immigrants.
+            for idx, values, fitness in migrants:
+                _insert_migrant(island, idx, values, fitness)
+            # _end_for_
+
+            if command == "evolve":
+                # Evolve the island.
+                island, has_converged, local_stats, elapsed_time = \
+                    engine._evolve_population(island, **kwargs)
+
+                # Find the best chromosome (the emigrant).
+                best = max((p for p in island.population if p.fitness is not None),
+                           key=key_fitness)
+
+                # The converged islands send their population.
+                population = cloudpickle.dumps(island.population) \
+                    if has_converged[0] else None
+
+                conn.send(("ok", (best.values(), best.fitness, len(island),
+                                  has_converged, local_stats, elapsed_time,
+                                  population)))
+
+            elif command == "evolve_async":
+                # Evolve the island for all the periods.
+                island, has_converged, local_stats, n_immigrants = \
+                    _run_async_periods(engine, island, mailboxes, kwargs)
+
+                conn.send(("ok", (cloudpickle.dumps(island.population),
+                                  has_converged, local_stats, n_immigrants)))
+
+            elif command == "reset":
+                # Replace the whole population.
+                island.population = cloudpickle.loads(kwargs["population"])
+
+                conn.send(("ok", None))
+
+            elif command == "gather":
+                # Send the whole population.
+                conn.send(("ok", cloudpickle.dumps(island.population)))
+            # _end_if_
+        # _end_while_
+
+    except Exception:
+        # Send the error back to the main process.
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        conn.close()
+    # _end_try_
+# _end_def_
+
+
+class _IslandWorkers:
+    """
+    Description:
+
+        Keeps one long-lived worker process per island for the whole run.
+        The engine and the islands are sent once, at the start. After that
+        each period exchanges only the migrants and the local stats, so the
+        serialization costs scale with the number of migrants, rather than
+        with the population size times the number of periods.
+    """
+
+    # Object variables.
+    __slots__ = ("_engine", "_islands", "_counter", "_workers", "_mailboxes")
+
+    def __init__(self, engine: "IslandModelGA", islands: list[SubPopulation],
+                 counter: Optional[_SharedCounter] = None) -> None:
+        """
+        Construct the workers of the input islands.
+
+        :param engine: (IslandModelGA) the engine that evolves the islands.
+
+        :param islands: (list) of the islands to evolve.
+
+        :param counter: (_SharedCounter) the shared counter of the evaluations,
+                        whose lock is passed to the workers when they start.
+        """
+        self._engine = engine
+        self._islands = islands
+        self._counter = counter
+
+        # Process, connection and template chromosome of each island (by id).
+        self._workers: dict = {}
+
+        # Mailbox (queue) of each island (by id).
+        self._mailboxes: dict = {}
+    # _end_def_
+
+    def __enter__(self):
+        """
+        Starts the worker processes (one per island).
+        """
+        # Use the 'spawn' method, which is safe on all the OSs.
+        context = get_context("spawn")
+
+        # Create the mailboxes of the islands.
+        self._mailboxes = {island.id: context.Queue() for island in self._islands}
+
+        for island in self._islands:
+            # Send only the population of the island with the engine.
+            engine = copy(self._engine)
+            engine.population = island.population
+
+            # Create the pipe of the island.
+            parent_conn, child_conn = context.Pipe()
+
+            # Start the worker.
+            process = context.Process(target=_island_worker, daemon=True,
+                                      args=(child_conn,
+                                            cloudpickle.dumps((engine, island)),
+                                            self._mailboxes,
+                                            None if self._counter is None
+                                            else self._counter.initargs))
+            process.start()
+            child_conn.close()
+
+            # Keep a template chromosome to rebuild the emigrants.
+            self._workers[island.id] = (process, parent_conn,
+                                          island.population[0].clone())
+        # _end_for_
+
+        return self
+    # _end_def_
+
+    def __exit__(self, *args) -> None:
+        """
+        Stops all the worker processes.
+        """
+        for process, conn, _ in self._workers.values():
+            # Send the stop command (if the worker is still alive).
+            try:
+                conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+            # _end_try_
+
+            process.join(timeout=5.0)
+
+            # Make sure it is terminated.
+            if process.is_alive():
+                process.terminate()
+            # _end_if_
+
+            conn.close()
+        # _end_for_
+
+        # Close the mailboxes.
+        for mailbox in self._mailboxes.values():
+            mailbox.cancel_join_thread()
+            mailbox.close()
+        # _end_for_
+
+        self._workers.clear()
+        self._mailboxes.clear()
+    # _end_def_
+
+    def _receive(self, island_id: int):
+        """
+        Receives the reply of an island worker.
+
+        :param island_id: (int) the id of the island.
+
+        :return: the payload of the reply.
+        """
+        # Get the connection of the island.
+        _, conn, _ = self._workers[island_id]
+
+        try:
+            status, payload = conn.recv()
+        except EOFError:
+            raise RuntimeError(f"{self.__class__.__name__}: Worker of "
+                               f"island {island_id} died.") from None
+        # _end_try_
+
+        # Check for errors in the worker.
+        if status == "error":
+            raise RuntimeError(f"{self.__class__.__name__}: Worker of island "
+                               f"{island_id} failed:\n{payload}")
+        # _end_if_
+
+        return payload
+    # _end_def_
+
+    def _dispatch(self, commands: list[tuple], max_jobs: Optional[int] = None) -> dict:
+        """
+        Sends the commands to the island workers and collects their replies.
+        At most 'max_jobs' workers run at the same time: the next command is
+        sent as soon as a running worker replies (the rest wait idle).
+
+        :param commands: (list) of tuples (island id, command).
+
+        :param max_jobs: (int) the maximum number of the running workers.
+                         If None all the commands are sent at once.
+
+        :return: a dictionary with the reply of each island (by id).
+        """
+        # Get the commands that wait to be sent.
+        waiting = iter(commands)
+
+        # Connections of the running workers (to their island id).
+        running: dict = {}
+
+        # Replies of the islands.
+        replies: dict = {}
+
+        # Start the first workers.
+        for island_id, command in islice(waiting, max_jobs or len(commands)):
+            conn = self._workers[island_id][1]
+            conn.send(command)
+            running[conn] = island_id
+        # _end_for_
+
+        while running:
+            # Wait for (any of) the running workers.
+            for conn in wait(list(running)):
+                # Get the reply of the island.
+                island_id = running.pop(conn)
+                replies[island_id] = self._receive(island_id)
+
+                # Start the next worker (if any).
+                for next_id, command in islice(waiting, 1):
+                    next_conn = self._workers[next_id][1]
+                    next_conn.send(command)
+                    running[next_conn] = next_id
+                # _end_for_
+            # _end_for_
+        # _end_while_
+
+        return replies
+    # _end_def_
+
+    @staticmethod
+    def _migrants(island: SubPopulation) -> list:
+        """
+        Extracts the immigrants of an island (after a migration).
+
+        :param island: (SubPopulation) the island.
+
+        :return: a list with the (position, genome values, fitness)
+                 of the immigrants.
+        """
+        # Only the buffers can hold immigrants.
+        if not isinstance(island.population, _MigrantBuffer):
+            return []
+        # _end_if_
+
+        # Get the immigrants.
+        incoming = island.population.incoming
+
+        migrants = [(idx, p.values(), p.fitness) for idx, p in incoming.items()]
+
+        # They are sent only once.
+        incoming.clear()
+
+        return migrants
+    # _end_def_
+
+    def evolve(self, islands: list[SubPopulation], genetic_probs: dict,
+               parameters: dict, max_jobs: Optional[int] = None) -> list:
+        """
+        Evolves all the input islands in parallel for one period.
+
+        :param islands: (list) of the active islands. After a migration
+                        their population holds the immigrants.
+
+        :param genetic_probs: (dict) crossover / mutation probabilities.
+
+        :param parameters: (dict) the common parameters of the evolution.
+
+        :param max_jobs: (int) the number of islands that evolve at the
+                         same time (None for all).
+
+        :return: a list of tuples (island, has_converged, local_stats,
+                 elapsed_time), as the '_evolve_population' method. The
+                 island population is a buffer with the best chromosome,
+                 or the whole population if the island has converged.
+        """
+        # Send the immigrants and evolve the islands in the workers.
+        replies = self._dispatch(
+            [(island.id, ("evolve", (self._migrants(island),
+                                     {"prob_crossx": genetic_probs[island.id]["crossx"],
+                                      "prob_mutate": genetic_probs[island.id]["mutate"],
+                                      **parameters})))
+             for island in islands], max_jobs)
+
+        # Collect the results.
+        results = []
+
+        for island in islands:
+            # Get the reply of the worker.
+            values, fitness, size, has_converged, local_stats, elapsed_time, \
+                population = replies[island.id]
+
+            if population is None:
+                # Rebuild the best chromosome from the template.
+                best = self._workers[island.id][2].clone()
+
+                for gene, value in zip(best.genome, values):
+                    gene.value = value
+                # _end_for_
+
+                best.fitness = fitness
+
+                population = _MigrantBuffer(best, size)
+            else:
+                population = cloudpickle.loads(population)
+            # _end_if_
 
-# Public interface.
-__all__ = ["IslandModelGA", "RunConfig"]
+            results.append((SubPopulation(island.id, population),
+                            has_converged, local_stats, elapsed_time))
+        # _end_for_
+
+        return results
+    # _end_def_
+
+    def evolve_async(self, islands: list[SubPopulation], genetic_probs: dict,
+                     parameters: dict, periods: list[int],
+                     topology: Topology, max_jobs: Optional[int] = None) -> list:
+        """
+        Evolves all the input islands for all the periods, without any
+        synchronization among them. The migrants are exchanged through
+        the mailboxes of the islands, following the topology. If only
+        'max_jobs' islands evolve at the same time, the islands that
+        start later find the migrants of the earlier ones in their
+        mailboxes.
+
+        :param islands: (list) of the active islands.
+
+        :param genetic_probs: (dict) crossover / mutation probabilities.
+
+        :param parameters: (dict) the common parameters of the evolution.
+
+        :param periods: (list) the epochs of each (local) period.
+
+        :param topology: (Topology) the graph among the islands.
+
+        :param max_jobs: (int) the number of islands that evolve at the
+                         same time (None for all).
+
+        :return: a list of tuples (island, has_converged, local_stats,
+                 n_immigrants).
+        """
+        # Evolve the islands in the workers.
+        replies = self._dispatch(
+            [(island.id, ("evolve_async", (self._migrants(island),
+                                           {**parameters, "periods": periods,
+                                            "targets": topology.targets(island.id),
+                                            "prob_crossx": genetic_probs[island.id]["crossx"],
+                                            "prob_mutate": genetic_probs[island.id]["mutate"]})))
+             for island in islands], max_jobs)
+
+        # Collect the results.
+        results = []
+
+        for island in islands:
+            # Get the reply of the worker.
+            population, has_converged, local_stats, n_immigrants = replies[island.id]
+
+            results.append((SubPopulation(island.id, cloudpickle.loads(population)),
+                            has_converged, local_stats, n_immigrants))
+        # _end_for_
+
+        return results
+    # _end_def_
+
+    def reset(self, island: SubPopulation) -> SubPopulation:
+        """
+        Replaces the whole population of an island in its worker
+        (e.g. after a restart).
+
+        :param island: (SubPopulation) the island with the new population.
+
+        :return: the island, where the population is replaced by a buffer
+                 with its best chromosome (for the migration).
+        """
+        # Send the new population.
+        self._workers[island.id][1].send(
+            ("reset", ([], {"population": cloudpickle.dumps(island.population)})))
+
+        # Wait for the worker.
+        self._receive(island.id)
+
+        # Find the best chromosome.
+        best = max((p for p in island.population if p.fitness is not None),
+                   key=attrgetter("fitness"))
+
+        return SubPopulation(island.id, _MigrantBuffer(best, len(island)))
+    # _end_def_
+
+    def gather(self, islands: list[SubPopulation]) -> list[SubPopulation]:
+        """
+        Collects the whole populations of the input islands
+        (after inserting their immigrants, if any).
+
+        :param islands: (list) of the active islands.
+
+        :return: a list of new islands with their populations.
+        """
+        # Send the requests first, so the workers reply in parallel.
+        for island in islands:
+            self._workers[island.id][1].send(("gather", (self._migrants(island), None)))
+        # _end_for_
+
+        return [SubPopulation(island.id, cloudpickle.loads(self._receive(island.id)))
+                for island in islands]
+    # _end_def_
+
+# _end_class_
 
 
 class IslandModelGA(GenericGA):
@@ -33,7 +921,7 @@ class IslandModelGA(GenericGA):
     """
 
     # Object variables (specific for the IslandModel).
-    __slots__ = ("_num_islands", "_migrate_op")
+    __slots__ = ("_num_islands", "_migrate_op", "_island_state")
 
     def __init__(self, num_islands: int,
                  migrate_op: MigrationOperator, **kwargs) -> None:
@@ -66,6 +954,17 @@ class IslandModelGA(GenericGA):
 
         # Get Migration Operator.
         self._migrate_op: MigrationOperator = migrate_op
+
+        # Check the topology of the migration (if any).
+        if isinstance(migrate_op, TopologyMigration) and \
+                migrate_op.topology.n_islands != self._num_islands:
+            raise ValueError(f"{self.__class__.__name__}: Topology has "
+                             f"{migrate_op.topology.n_islands} islands, "
+                             f"but the model has {self._num_islands}.")
+        # _end_if_
+
+        # Island assignments of the last checkpoint.
+        self._island_state: Optional[dict] = None
     # _end_def_
 
     @property
@@ -89,14 +988,209 @@ class IslandModelGA(GenericGA):
         return self._migrate_op
     # _end_def_
 
+    @property
+    def topology(self) -> Topology:
+        """
+        Accessor method that returns the topology of the asynchronous
+        migration. This is the topology of a TopologyMigration operator,
+        otherwise a (clockwise) ring of all the islands.
+
+        :return: the Topology.
+        """
+        if isinstance(self._migrate_op, TopologyMigration):
+            return self._migrate_op.topology
+        # _end_if_
+
+        return RingTopology(self._num_islands)
+    # _end_def_
+
+    def _checkpoint_state(self) -> dict:
+        """
+        Extends the checkpoint state with the island of each chromosome,
+        the active (not converged) islands and their genetic probabilities.
+
+        :return: a dictionary with the state of the engine.
+        """
+        # Get the state of the parent class.
+        state = super()._checkpoint_state()
+
+        # Add the islands state.
+        if self._island_state is not None:
+            state.update(self._island_state)
+        # _end_if_
+
+        return state
+    # _end_def_
+
+    def _restore_state(self, data) -> None:
+        """
+        Restores the checkpoint state, including the islands.
+
+        :param data: the loaded arrays (NpzFile or dictionary).
+
+        :return: None.
+        """
+        # Restore the state of the parent class.
+        super()._restore_state(data)
+
+        # Restore the islands state.
+        self._island_state = None
+
+        if "island_ids" in data:
+            # Sanity check.
+            if len(data["island_active"]) != self._num_islands:
+                raise ValueError(f"{self.__class__.__name__}: Checkpoint was "
+                                 f"saved with {len(data['island_active'])} islands.")
+            # _end_if_
+
+            self._island_state = {key: data[key] for key in
+                                  ("island_ids", "island_active", "island_probs")}
+        # _end_if_
+    # _end_def_
+
+    def _checkpoint_islands(self, config: RunConfig, period: int,
+                            active_islands: list[SubPopulation],
+                            finished_islands: list[SubPopulation],
+                            genetic_probs: dict, final: bool = False,
+                            workers=None) -> None:
+        """
+        Gathers the islands in the population of the engine and saves
+        a checkpoint (if enabled) at the end of a migration period.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param period: (int) the current (completed) migration period.
+
+        :param active_islands: (list) of the still evolving islands.
+
+        :param finished_islands: (list) of the converged islands.
+
+        :param genetic_probs: (dict) crossover / mutation probabilities
+                              of each island.
+
+        :param final: (bool) if True the checkpoint is saved regardless
+                      of the interval.
+
+        :param workers: the pool of workers. If the islands live in persistent
+                        workers, their populations are collected from them.
+
+        :return: None.
+        """
+        # Quick exit.
+        if config.checkpoint_path is None or not \
+                (final or (period + 1) % config.checkpoint_every == 0):
+            return
+        # _end_if_
+
+        # Collect the populations from the persistent workers.
+        if isinstance(workers, _IslandWorkers):
+            active_islands = workers.gather(active_islands)
+        # _end_if_
+
+        # Sort the islands by their id.
+        islands = sorted(active_islands + finished_islands, key=attrgetter("id"))
+
+        # Ids of the active islands.
+        active_ids = {isl.id for isl in active_islands}
+
+        # Update the iteration (in periods).
+        self.iteration = period
+
+        # Gather all the islands in the population.
+        self.population = [p for isl in islands for p in isl.population]
+
+        # Store the islands state.
+        self._island_state = {
+            "island_ids": array([isl.id for isl in islands
+                                 for _ in isl.population], dtype=int),
+            "island_active": array([isl.id in active_ids for isl in islands],
+                                   dtype=bool),
+            "island_probs": array([[genetic_probs[isl.id]["crossx"],
+                                    genetic_probs[isl.id]["mutate"]]
+                                   for isl in islands], dtype=float)
+        }
+
+        # Save the checkpoint.
+        self.periodic_checkpoint(config, final=final)
+    # _end_def_
+
+    def execution_plan(self, n_islands: int, config: RunConfig) -> tuple[int, int]:
+        """
+        Divides the CPUs of the engine between the island processes and the
+        fitness evaluation workers inside each island, so that their product
+        does not exceed the available CPUs (no oversubscription).
+
+        :param n_islands: (int) the number of the active islands.
+
+        :param config: (RunConfig) the configuration params.
+
+        :return: a tuple (island_jobs, eval_workers).
+        """
+        # Number of islands that evolve at the same time.
+        island_jobs: int = max(1, min(n_islands, config.island_jobs or self._n_cpus,
+                                      self._n_cpus))
+
+        # Maximum number of evaluation workers per island.
+        max_workers: int = max(1, self._n_cpus // island_jobs)
+
+        # Use all the free cores, or the requested workers.
+        if config.eval_workers is None or config.elastic_islands == "workers":
+            eval_workers = max_workers
+        else:
+            eval_workers = min(config.eval_workers, max_workers)
+        # _end_if_
+
+        return island_jobs, eval_workers
+    # _end_def_
+
+    def _log_utilization(self, n_islands: int, island_jobs: int,
+                         eval_workers: int, verbose: bool = True) -> None:
+        """
+        Stores (and logs) the fraction of the busy cores of the engine.
+
+        :param n_islands: (int) the number of the active islands.
+
+        :param island_jobs: (int) the number of the island processes.
+
+        :param eval_workers: (int) the evaluation workers of each island.
+
+        :param verbose: (bool) if True it will log the plan.
+
+        :return: None.
+        """
+        # Fraction of the busy cores.
+        utilization = min(1.0, min(n_islands, island_jobs) *
+                          eval_workers / self._n_cpus)
+
+        # Store it in the stats.
+        self.stats["utilization"].append(utilization)
+
+        # Log the execution plan.
+        if verbose:
+            logger.info("Execution plan: %s island processes x %s evaluation "
+                        "workers (%.1f%% of %s CPUs).", island_jobs, eval_workers,
+                        100.0 * utilization, self._n_cpus)
+        # _end_if_
+    # _end_def_
+
     def _evolve_population(self, island: SubPopulation, epochs: int, shuffle: bool,
                            correction: bool, elitism: bool, f_tol: float, adapt_probs: bool,
                            prob_crossx: Optional[float] = None,
-                           prob_mutate: Optional[float] = None) -> tuple:
+                           prob_mutate: Optional[float] = None,
+                           n_eval_workers: int = 1,
+                           eval_backend: str = "threading",
+                           counter: Optional[_SharedCounter] = None) -> tuple:
         """
         This is a helper method to be used inside the Parallel delayed method.
         It is responsible for running the evolution of a single population (island).
 
+        If 'n_eval_workers' > 1 the fitness of the island is evaluated in parallel
+        (with the 'eval_backend'), using its share of the cores of the engine.
+
+        If a shared 'counter' is given, the evaluations of each epoch are counted
+        (and reserved from the global budget) in it. The island stops as soon as
+        the budget is exhausted, by any island.
+
         :return: a tuple (island, has_converged, local_stats, elapsed_time)
         """
         # Get the BitGenerator used by default_rng.
@@ -122,6 +1216,11 @@ class IslandModelGA(GenericGA):
         # Initialize this auxiliary parameter to a large number.
         avg_fitness_0: float = 1.0e+100
 
+        # Set the evaluation workers of the island.
+        if n_eval_workers > 1:
+            self._n_cpus = n_eval_workers
+        # _end_if_
+
         # Check if initial probabilities have been given.
         if prob_crossx is not None and prob_mutate is not None:
             self.crossx_op.probability = prob_crossx
@@ -148,8 +1247,40 @@ class IslandModelGA(GenericGA):
             # CROSSOVER/MUTATE to produce offsprings.
             self.crossover_mutate(population_i)
 
+            # Number of the offsprings that can be evaluated.
+            n_granted: int = pop_size
+
+            # Reserve the evaluations from the global budget.
+            if counter is not None:
+                n_granted = counter.reserve(island.id, pop_size)
+
+                # Stop if the budget is exhausted.
+                if n_granted == 0:
+                    break
+                # _end_if_
+
+                # Keep the (evaluated) parents in the rest of the positions.
+                if n_granted < pop_size:
+                    population_i[n_granted:] = island.population[n_granted:]
+                # _end_if_
+            # _end_if_
+
+            # Track the evaluations of the epoch.
+            f_evals_0 = self._f_evals
+
             # EVALUATE the i-th population.
-            fit_list_i, found_solution = self.evaluate_fitness(population_i)
+            fit_list_i, found_solution = self.evaluate_fitness(population_i[:n_granted],
+                                                               n_eval_workers > 1,
+                                                               backend=eval_backend)
+            # Return the unused evaluations (e.g. infeasible offsprings).
+            if counter is not None:
+                counter.release(island.id, n_granted - (self._f_evals - f_evals_0))
+
+                # Get the fitness of the whole population.
+                if n_granted < pop_size:
+                    fit_list_i = [p.fitness for p in population_i]
+                # _end_if_
+            # _end_if_
 
             # Check for termination.
             if found_solution:
@@ -231,69 +1362,310 @@ class IslandModelGA(GenericGA):
         return island, has_converged, local_stats, elapsed_time
     # _end_def_
 
-    def run(self, config: Optional[RunConfig] = None) -> None:
+    def _restart_island(self, island: SubPopulation, archive: list[Chromosome],
+                        workers=None,
+                        counter: Optional[_SharedCounter] = None) -> Optional[SubPopulation]:
+        """
+        Restarts a converged island with a new random population (each gene
+        gets a random value from its own function), where the first part is
+        seeded with the best chromosomes of the archive. The island keeps its
+        id, so its statistics continue in the same lists.
+
+        :param island: (SubPopulation) the converged island.
+
+        :param archive: (list) the best chromosomes found so far.
+
+        :param workers: the pool of workers. If the islands live in persistent
+                        workers, the new population is sent to its worker.
+
+        :param counter: (_SharedCounter) the shared counter of the evaluations.
+
+        :return: the restarted island, or None if the budget of the function
+                 evaluations does not allow the evaluation of a new population.
+        """
+        # Number of seeds (about 10% of the island).
+        n_seeds: int = min(len(archive), max(1, len(island.population) // 10))
+
+        # Reserve the evaluations of the new chromosomes.
+        if counter is not None:
+            # Number of the new chromosomes.
+            n_new = len(island.population) - n_seeds
+
+            # Get the granted evaluations.
+            n_granted = counter.reserve(-1, n_new)
+
+            # Restart only if the whole population can be evaluated.
+            if n_granted < n_new:
+                counter.release(-1, n_granted)
+                return None
+            # _end_if_
+        # _end_if_
+
+        # Create the random population.
+        population: list[Chromosome] = []
+
+        for p in island.population:
+            # Copy the chromosome.
+            p_new = p.clone()
+
+            # Randomize all its genes.
+            for gene in p_new.genome:
+                gene.random()
+            # _end_for_
+
+            p_new.invalidate_fitness()
+            population.append(p_new)
+        # _end_for_
+
+        # Seed the population with the best of the archive.
+        for k, p_best in enumerate(sorted(archive, key=attrgetter("fitness"),
+                                          reverse=True)[:n_seeds]):
+            population[k] = p_best.clone()
+        # _end_for_
+
+        # Evaluate only the new random chromosomes.
+        self.evaluate_fitness(population[n_seeds:], parallel_mode=True,
+                              backend="loky")
+
+        # Update the stats of the island.
+        self.update_stats([p.fitness for p in population], self.stats[island.id])
+
+        # Log the restart.
+        logger.info("Island population %s restarted with %d seeds.",
+                    island.id, n_seeds)
+
+        # Create the new island.
+        new_island = SubPopulation(island.id, population)
+
+        # Send the population to the persistent worker.
+        if isinstance(workers, _IslandWorkers):
+            return workers.reset(new_island)
+        # _end_if_
+
+        return new_island
+    # _end_def_
+
+    def _evolve_async(self, config: RunConfig, active_islands: list[SubPopulation],
+                      finished_islands: list[SubPopulation], genetic_probs: dict,
+                      parameters: dict, periods: list[int],
+                      island_jobs: Optional[int] = None) -> list[SubPopulation]:
+        """
+        Evolves the islands in persistent workers, where each island migrates
+        at the end of its own periods through the mailboxes (asynchronously),
+        so the fast islands do not wait for the slow ones.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param active_islands: (list) of the still evolving islands.
+
+        :param finished_islands: (list) of the converged islands. The islands
+                                 that converge are appended to this list.
+
+        :param genetic_probs: (dict) crossover / mutation probabilities
+                              of each island.
+
+        :param parameters: (dict) the common parameters of the evolution.
+
+        :param periods: (list) the epochs of each (local) period.
+
+        :param island_jobs: (int) the number of islands that evolve at
+                            the same time (None for all).
+
+        :return: the list of the islands that have not converged.
+        """
+        # Islands that have not converged.
+        still_active: list[SubPopulation] = []
+
+        # Total number of accepted immigrants.
+        total_immigrants: int = 0
+
+        # Each island runs for all the periods in its own worker.
+        with _IslandWorkers(self, active_islands,
+                            counter=parameters["counter"]) as workers:
+            results = workers.evolve_async(active_islands, genetic_probs,
+                                           parameters, periods, self.topology,
+                                           max_jobs=island_jobs)
+        # _end_with_
+
+        for island, has_converged, local_stats, n_immigrants in results:
+
+            # Check if the island has converged.
+            if has_converged[0]:
+                # Move the island in the converged list.
+                finished_islands.append(island)
+
+                # Check for verbosity.
+                if config.verbose:
+                    logger.warning("Island population %s finished in %s iterations.",
+                                   island.id, has_converged[1])
+                # _end_if_
+            else:
+                still_active.append(island)
+            # _end_if_
+
+            # Update statistics.
+            self.stats[island.id]["avg"].extend(local_stats["avg"])
+            self.stats[island.id]["std"].extend(local_stats["std"])
+
+            # Check if we were adapting the probabilities.
+            if config.adapt_probs:
+
+                # Update the values (for the checkpoint).
+                if len(local_stats["prob_crossx"]) > 0:
+                    genetic_probs[island.id]["crossx"] = local_stats["prob_crossx"][-1]
+                    genetic_probs[island.id]["mutate"] = local_stats["prob_mutate"][-1]
+                # _end_if_
+
+                # Store the updated crossover and mutation values.
+                self.stats[island.id]["prob_crossx"].extend(local_stats["prob_crossx"])
+                self.stats[island.id]["prob_mutate"].extend(local_stats["prob_mutate"])
+            # _end_if_
+
+            total_immigrants += n_immigrants
+        # _end_for_
+
+        # Count the accepted immigrants.
+        self._migrate_op.inc_counter(total_immigrants)
+
+        # Log the information message.
+        logger.info("Asynchronous migration accepted %d immigrants.",
+                    total_immigrants)
+
+        return still_active
+    # _end_def_
+
+    def epoch_record(self, epoch: int, time_t0: float, time_i: float,
+                     population_view: bool = False) -> EpochRecord:
+        """
+        Creates the snapshot of the current epoch, with the mean / std
+        of the fitness values of all the islands together (pooled from
+        the last stats of each island). With persistent islands the main
+        population holds only the best chromosome of each active island.
+
+        :param epoch: (int) the current epoch.
+
+        :param time_t0: (float) the time instant of the start of the run.
+
+        :param time_i: (float) the time instant of the start of the period.
+
+        :param population_view: (bool) if True the record includes a
+                                read-only view of the population.
+
+        :return: the EpochRecord of the current epoch.
+        """
+        # Get the last mean / std values of all the islands.
+        island_stats = array([(value["avg"][-1], value["std"][-1])
+                              for value in self.stats.values()
+                              if isinstance(value, dict) and value.get("avg")],
+                             dtype=float).reshape(-1, 2)
+
+        # Pool the mean / std values (islands of equal size).
+        avg_fitness = nanmean(island_stats[:, 0])
+        std_fitness = sqrt(nanmean(island_stats[:, 1] ** 2 +
+                                   (island_stats[:, 0] - avg_fitness) ** 2))
+
+        # Get the record (the stats are kept per island).
+        record = super().epoch_record(epoch, time_t0, time_i, population_view)
+
+        return replace(record, avg=float(avg_fitness), std=float(std_fitness))
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
         """
         Main method of the IslandModelGA class that implements
-        the evolutionary routine.
+        the evolutionary routine. With synchronous migration a record
+        is yielded at the end of each period (with the last epoch of
+        the period), otherwise only one record at the end of the run.
 
         :param config: (RunConfig) the configuration params.
 
-        :return: None.
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population (of all the islands).
+
+        :return: an iterator of the EpochRecords.
         """
         # Initialize the configuration parameters.
         config = config or RunConfig()
 
-        # Reset stats dictionary.
-        self.stats.clear()
-
-        # Initial random split of the total population
-        # in (active) subpopulations. Active here means
-        # 'still evolving'.
-        active_population: list[SubPopulation] = [
-            SubPopulation(i, self.population[i::self._num_islands])
-            for i in range(self._num_islands)
-        ]
-
-        # Initial evaluation of the subpopulations.
-        for pop_n in active_population:
-
-            # Initialize the statistics dictionary.
-            self.stats[pop_n.id]: dict = {
-                "avg": [], "std": [], "prob_crossx": [], "prob_mutate": []
-            }
-
-            # Initial evaluation of the population.
-            fit_list_0, _ = self.evaluate_fitness(pop_n.population,
-                                                  parallel_mode=True,
-                                                  backend="loky")
-            # Compute the initial mean/std values
-            # and update the stats[pop_n.id].
-            _, _ = self.update_stats(fit_list_0, self.stats[pop_n.id])
-
-            # Store the initial crossover and mutation probabilities.
-            self.stats[pop_n.id]["prob_crossx"].append(self.crossx_op.probability)
-            self.stats[pop_n.id]["prob_mutate"].append(self.mutate_op.probability)
-        # _end_for_
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_period: int = self.start_run()
+
+        # Active (still evolving) and converged islands.
+        active_population: list[SubPopulation] = []
+        finished_islands: list[SubPopulation] = []
+
+        # Resume is possible only when evolving in migration periods.
+        if first_period and (self._island_state is None or
+                             not config.allow_migration):
+            # Log a warning message.
+            logger.warning("%s can resume only with migration. "
+                           "Starting a new run.", self.__class__.__name__)
+
+            # Make sure everything is cleared.
+            self.clear_all()
+            first_period = 0
+        # _end_if_
+
+        # Start a new run.
+        if first_period == 0:
+            # Initial random split of the total population
+            # in (active) subpopulations. Active here means
+            # 'still evolving'.
+            active_population = [
+                SubPopulation(i, self.population[i::self._num_islands])
+                for i in range(self._num_islands)
+            ]
+
+            # Initial evaluation of the subpopulations.
+            for pop_n in active_population:
+
+                # Initialize the statistics dictionary.
+                self.stats[pop_n.id]: dict = {
+                    "avg": [], "std": [], "prob_crossx": [], "prob_mutate": []
+                }
+
+                # Initial evaluation of the population.
+                fit_list_0, _ = self.evaluate_fitness(pop_n.population,
+                                                      parallel_mode=True,
+                                                      backend="loky")
+                # Compute the initial mean/std values
+                # and update the stats[pop_n.id].
+                _, _ = self.update_stats(fit_list_0, self.stats[pop_n.id])
+
+                # Store the initial crossover and mutation probabilities.
+                self.stats[pop_n.id]["prob_crossx"].append(self.crossx_op.probability)
+                self.stats[pop_n.id]["prob_mutate"].append(self.mutate_op.probability)
+            # _end_for_
+        else:
+            # Restore the islands from the checkpoint.
+            island_ids = self._island_state["island_ids"].tolist()
+
+            for k, is_active in enumerate(self._island_state["island_active"]):
+                # Get the chromosomes of the k-th island.
+                island = SubPopulation(k, [p for p, j in zip(self.population,
+                                                             island_ids) if j == k])
+                # Put the island in the right list.
+                if is_active:
+                    active_population.append(island)
+                else:
+                    finished_islands.append(island)
+            # _end_for_
+        # _end_if_
 
         # Set the predefined value.
         new_epochs: int = config.epochs
 
-        # Check if we have set a maximum number on function
-        # evaluations and re-adjust the number of epochs.
-        if config.f_max_eval is not None:
-
-            # First remove the counts from the initial evaluation
-            # of the population.
-            total_f_counts = int(config.f_max_eval) - self.f_evals
+        # Shared counter of the function evaluations of all the islands.
+        counter = _SharedCounter(self._num_islands, config.f_max_eval,
+                                 base=self._f_evals)
 
-            # Assuming each epoch performs N function evaluations.
-            new_epochs = int(total_f_counts / len(self.population))
+        # Check if we have set a maximum number on function evaluations.
+        if config.f_max_eval is not None:
 
-            # Display a warning message.
-            logger.warning(
-                "The 'f_max_eval' parameter has been set to: %s. "
-                "The 'epochs' value has been re-adjusted to: %s\n",
-                config.f_max_eval, new_epochs)
+            # Display an information message.
+            logger.info("The budget of %s function evaluations is shared "
+                        "by all the islands.", config.f_max_eval)
         # _end_if_
 
         # Display an information message.
@@ -314,7 +1686,9 @@ class IslandModelGA(GenericGA):
             "shuffle": config.shuffle,
             "elitism": config.elitism,
             "correction": config.correction,
-            "adapt_probs": config.adapt_probs
+            "adapt_probs": config.adapt_probs,
+            "eval_backend": config.eval_backend,
+            "counter": counter
         }
 
         # Initial time instant.
@@ -328,13 +1702,21 @@ class IslandModelGA(GenericGA):
             genetic_probs = defaultdict(dict)
 
             # Initial assignment of the genetic probabilities.
-            for pop_n in active_population:
+            for pop_n in active_population + finished_islands:
 
                 # Use the values of the object operators itself.
                 genetic_probs[pop_n.id]["crossx"] = self.crossx_op.probability
                 genetic_probs[pop_n.id]["mutate"] = self.mutate_op.probability
             # _end_for_
 
+            # Continue with the probabilities of the checkpoint.
+            if first_period:
+                for k, (p_crossx, p_mutate) in enumerate(self._island_state["island_probs"]):
+                    genetic_probs[k]["crossx"] = float(p_crossx)
+                    genetic_probs[k]["mutate"] = float(p_mutate)
+                # _end_for_
+            # _end_if_
+
             # Make sure 'n_periods' is integer.
             n_periods = int(config.n_periods)
 
@@ -344,130 +1726,267 @@ class IslandModelGA(GenericGA):
             # Compute the remainder epochs (if any).
             rem_epochs = int(new_epochs % n_periods)
 
-            # Type hint the work_parallel to avoid warnings.
-            work_parallel: Parallel
+            # Evolve the islands without synchronization among them.
+            if config.async_migration:
+                # Epochs of each (local) period.
+                periods = [n_epochs] * (n_periods - first_period)
 
-            # Reuse the pool of workers.
-            with Parallel(n_jobs=self.n_cpus, backend="loky") as work_parallel:
+                # The remainder epochs are added in the last period.
+                if periods:
+                    periods[-1] += rem_epochs
+                # _end_if_
 
-                # Break the total 'epochs' in n_periods.
-                for i in range(n_periods):
-
-                    # Check if we want information on to be logged.
-                    if config.verbose:
-                        logger.info("Current period %s / %s:", i + 1, n_periods)
-                    # _end_if_
+                # Each island has its own process, but only 'island_jobs'
+                # of them evolve at the same time.
+                island_jobs, common_parameters["n_eval_workers"] = self.execution_plan(
+                    len(active_population), config)
 
-                    # If the remainder epochs is not zero, add them in the
-                    # last iteration to complete the total number of epochs.
-                    if rem_epochs and i == n_periods-1:
+                # Store the fraction of the busy cores.
+                self._log_utilization(len(active_population), island_jobs,
+                                      common_parameters["n_eval_workers"])
 
-                        # Update the n_epochs ONLY in the last period.
-                        n_epochs += rem_epochs
-                    # _end_if_
+                active_population = self._evolve_async(config, active_population,
+                                                       finished_islands, genetic_probs,
+                                                       common_parameters, periods,
+                                                       island_jobs=island_jobs)
+            else:
+                # Type hint the work_parallel to avoid warnings.
+                work_parallel: Parallel | _IslandWorkers
 
-                    # Update epochs to 'n_epochs'.
-                    common_parameters["epochs"] = n_epochs
+                # Best chromosomes of the converged islands.
+                archive: list[Chromosome] = []
 
-                    # Evolve the subpopulations in parallel for 'n_epochs'.
-                    results_i = work_parallel(
-                        delayed(fn_evolve)(island=pop_i,
-                                           prob_crossx=genetic_probs[pop_i.id]["crossx"],
-                                           prob_mutate=genetic_probs[pop_i.id]["mutate"],
-                                           **common_parameters)
-                        for pop_i in active_population
-                    )
+                # Number of islands that evolve at the same time.
+                island_jobs, _ = self.execution_plan(len(active_population), config)
 
-                    # Empty the list of active populations.
-                    active_population = []
+                # Reuse the pool of workers, or keep each island
+                # in its own (persistent) worker for the whole run.
+                with (_IslandWorkers(self, active_population, counter=counter)
+                      if config.persistent_islands
+                      else counter.parallel(island_jobs)) as work_parallel:
 
-                    # Process the results if the i-th period.
-                    for res in results_i:
+                    # Break the total 'epochs' in n_periods.
+                    for i in range(first_period, n_periods):
 
-                        # Extract the results.
-                        island, has_converged, local_stats, _ = res
+                        # Initial time instant of the period.
+                        time_i: float = time.perf_counter()
 
-                        # Check if we want information on the screen.
+                        # Check if we want information on to be logged.
                         if config.verbose:
+                            logger.info("Current period %s / %s:", i + 1, n_periods)
+                        # _end_if_
 
-                            # Find the current highest fitness.
-                            best_fitness = max(
-                                (p.fitness for p in island.population
-                                 if p.fitness is not None)
-                            )
+                        # If the remainder epochs is not zero, add them in the
+                        # last iteration to complete the total number of epochs.
+                        if rem_epochs and i == n_periods-1:
 
-                            # Log an update of the progress.
-                            logger.info(
-                                "Best Fitness in island %s is:= %.5f",
-                                island.id, best_fitness
+                            # Update the n_epochs ONLY in the last period.
+                            n_epochs += rem_epochs
+                        # _end_if_
+
+                        # Update epochs to 'n_epochs'.
+                        common_parameters["epochs"] = n_epochs
+
+                        # Divide the cores among the active islands (the
+                        # cores of the converged islands are reused by the
+                        # active islands as fitness evaluation workers).
+                        period_jobs, common_parameters["n_eval_workers"] = \
+                            self.execution_plan(len(active_population), config)
+
+                        # Store the fraction of the busy cores.
+                        self._log_utilization(len(active_population), period_jobs,
+                                              common_parameters["n_eval_workers"],
+                                              verbose=config.verbose)
+
+                        # Evolve the subpopulations in parallel for 'n_epochs'.
+                        if config.persistent_islands:
+                            results_i = work_parallel.evolve(active_population,
+                                                             genetic_probs,
+                                                             common_parameters,
+                                                             max_jobs=period_jobs)
+                        else:
+                            results_i = work_parallel(
+                                delayed(fn_evolve)(island=pop_i,
+                                                   prob_crossx=genetic_probs[pop_i.id]["crossx"],
+                                                   prob_mutate=genetic_probs[pop_i.id]["mutate"],
+                                                   **common_parameters)
+                                for pop_i in active_population
                             )
                         # _end_if_
 
-                        # First check if the island has converged.
-                        if has_converged[0]:
-                            # Copy the population in the final list.
-                            final_population.extend(island.population)
+                        # Empty the list of active populations.
+                        active_population = []
+
+                        # Converged islands that will restart.
+                        restart_islands: list[SubPopulation] = []
 
-                            # Check for verbosity.
+                        # Process the results if the i-th period.
+                        for res in results_i:
+
+                            # Extract the results.
+                            island, has_converged, local_stats, _ = res
+
+                            # Check if we want information on the screen.
                             if config.verbose:
-                                # Compute the total number of iterations.
-                                itr = int(i*n_epochs + has_converged[1])
 
-                                # Log a warning message to the screen.
-                                logger.warning(
-                                    "Island population %s finished in %s iterations.",
-                                    island.id, itr
+                                # Find the current highest fitness.
+                                best_fitness = max(
+                                    (p.fitness for p in island.population
+                                     if p.fitness is not None)
+                                )
+
+                                # Log an update of the progress.
+                                logger.info(
+                                    "Best Fitness in island %s is:= %.5f",
+                                    island.id, best_fitness
                                 )
                             # _end_if_
-                        else:
-                            # Add the island population to the new active list.
-                            active_population.append(island)
-                        # _end_if_
 
-                        # Update statistics.
-                        self.stats[island.id]["avg"].extend(local_stats["avg"])
-                        self.stats[island.id]["std"].extend(local_stats["std"])
+                            # Check if the converged island can restart
+                            # (only if there are remaining periods).
+                            if has_converged[0] and i < n_periods - 1 and \
+                                    config.elastic_islands == "restart":
+                                # Keep its best chromosome in the archive.
+                                archive.append(max(island.population,
+                                                   key=attrgetter("fitness")))
+                                restart_islands.append(island)
+
+                            # First check if the island has converged.
+                            elif has_converged[0]:
+                                # Move the island in the converged list.
+                                finished_islands.append(island)
+
+                                # Check for verbosity.
+                                if config.verbose:
+                                    # Compute the total number of iterations.
+                                    itr = int(i*n_epochs + has_converged[1])
+
+                                    # Log a warning message to the screen.
+                                    logger.warning(
+                                        "Island population %s finished in %s iterations.",
+                                        island.id, itr
+                                    )
+                                # _end_if_
+                            else:
+                                # Add the island population to the new active list.
+                                active_population.append(island)
+                            # _end_if_
+
+                            # Update statistics.
+                            self.stats[island.id]["avg"].extend(local_stats["avg"])
+                            self.stats[island.id]["std"].extend(local_stats["std"])
+
+                            # Check if we were adapting the probabilities.
+                            if config.adapt_probs:
+
+                                # Make sure there is at least one entry
+                                # to avoid "index out of bound" errors.
+                                if len(local_stats["prob_crossx"]) > 0:
+
+                                    # Update the values for the next interval.
+                                    genetic_probs[island.id]["crossx"] = local_stats["prob_crossx"][-1]
+                                    genetic_probs[island.id]["mutate"] = local_stats["prob_mutate"][-1]
+                                # _end_if_
+
+                                # Store the updated crossover and mutation values.
+                                self.stats[island.id]["prob_crossx"].extend(local_stats["prob_crossx"])
+                                self.stats[island.id]["prob_mutate"].extend(local_stats["prob_mutate"])
+                            # _end_if_
+
+                        # _end_for_
+
+                        # Update the total number of function evaluations.
+                        self._f_evals = counter.used
+
+                        # Update the population with all the islands.
+                        self.population = [p for island in finished_islands + restart_islands +
+                                           active_population for p in island.population]
 
-                        # Check if we were adapting the probabilities.
-                        if config.adapt_probs:
+                        # Yield the record of the period (with its last epoch).
+                        record = self.epoch_record(new_epochs - 1 if i == n_periods - 1 else
+                                                   (i + 1) * n_epochs - 1, time_t0, time_i,
+                                                   population_view)
+                        yield record
 
-                            # Make sure there is at least one entry
-                            # to avoid "index out of bound" errors.
-                            if len(local_stats["prob_crossx"]) > 0:
+                        # Stop all the islands if the termination criterion is met.
+                        if self.check_termination(config, record):
+                            finished_islands.extend(restart_islands)
+                            break
+                        # _end_if_
+
+                        # Stop all the islands if the budget is exhausted.
+                        if counter.exhausted:
+                            finished_islands.extend(restart_islands)
+
+                            logger.warning("%s finished after %s function evaluations.",
+                                           self.__class__.__name__, self._f_evals)
+                            break
+                        # _end_if_
 
-                                # Update the values for the next interval.
-                                genetic_probs[island.id]["crossx"] = local_stats["prob_crossx"][-1]
-                                genetic_probs[island.id]["mutate"] = local_stats["prob_mutate"][-1]
+                        # Restart the converged islands (with new random
+                        # populations, seeded from the archive).
+                        for island in restart_islands:
+                            new_island = self._restart_island(island, archive,
+                                                              workers=work_parallel,
+                                                              counter=counter)
+                            # Without budget the island remains converged.
+                            if new_island is None:
+                                finished_islands.append(island)
+                            else:
+                                active_population.append(new_island)
                             # _end_if_
+                        # _end_for_
 
-                            # Store the updated crossover and mutation values.
-                            self.stats[island.id]["prob_crossx"].extend(local_stats["prob_crossx"])
-                            self.stats[island.id]["prob_mutate"].extend(local_stats["prob_mutate"])
+                        # Check for early termination.
+                        if len(active_population) == 0:
+                            logger.warning("No active islands found.")
+                            break
                         # _end_if_
 
+                        # Here we call the migration policy.
+                        self._migrate_op(active_population)
+
+                        # Save a checkpoint (if enabled).
+                        self._checkpoint_islands(config, i, active_population,
+                                                 finished_islands, genetic_probs,
+                                                 workers=work_parallel)
                     # _end_for_
 
-                    # Check for early termination.
-                    if len(active_population) == 0:
-                        logger.warning("No active islands found.")
-                        break
+                    # Collect the populations from the persistent workers.
+                    if config.persistent_islands:
+                        active_population = work_parallel.gather(active_population)
                     # _end_if_
 
-                    # Here we call the migration policy.
-                    self._migrate_op(active_population)
-                # _end_for_
+                # _end_parallel_with_
+            # _end_if_
 
-            # _end_parallel_with_
+            # Update the total number of function evaluations.
+            self._f_evals = counter.used
 
-            # Get the rest of the populations that have not yet converged.
-            for pop_n in active_population:
+            # Save the final checkpoint (if enabled).
+            self._checkpoint_islands(config, max(first_period, n_periods - 1),
+                                     active_population, finished_islands,
+                                     genetic_probs, final=True)
+
+            # Get the converged populations first and then
+            # the rest of the populations that have not yet
+            # converged.
+            for pop_n in finished_islands + active_population:
                 final_population.extend(pop_n.population)
             # _end_for_
 
         else:
 
+            # Divide the cores between the islands and the evaluation workers.
+            island_jobs, common_parameters["n_eval_workers"] = self.execution_plan(
+                len(active_population), config)
+
+            # Store the fraction of the busy cores.
+            self._log_utilization(len(active_population), island_jobs,
+                                  common_parameters["n_eval_workers"])
+
             # Evolve the subpopulations in parallel for 'epoch' iterations.
-            results = Parallel(n_jobs=self.n_cpus, backend="loky")(
+            results = counter.parallel(island_jobs)(
                 delayed(fn_evolve)(island=pop_n, **common_parameters)
                 for pop_n in active_population
             )
@@ -504,10 +2023,19 @@ class IslandModelGA(GenericGA):
         # Update the population in the class.
         self.population = final_population
 
-        # Make a final fitness evaluation (to ensure consistency).
-        fit_list_final, _ = self.evaluate_fitness(self.population,
-                                                  parallel_mode=True,
-                                                  backend="loky")
+        # Update the total number of function evaluations.
+        self._f_evals = counter.used
+        counter.close()
+
+        # Make a final fitness evaluation (to ensure consistency),
+        # unless it would exceed the budget of function evaluations.
+        if config.f_max_eval is None:
+            fit_list_final, _ = self.evaluate_fitness(self.population,
+                                                      parallel_mode=True,
+                                                      backend="loky")
+        else:
+            fit_list_final = [p.fitness for p in self.population]
+        # _end_if_
         # Compute the mean value.
         avg_fitness_final = nanmean(fit_list_final, dtype=float)
 
@@ -519,6 +2047,11 @@ class IslandModelGA(GenericGA):
 
         # Print final duration in seconds.
         print(f"Elapsed time: {(time_tf - time_t0):.3f} seconds.")
+
+        # Without synchronous periods, yield only the final record.
+        if not config.allow_migration or config.async_migration:
+            yield self.epoch_record(new_epochs - 1, time_t0, time_t0, population_view)
+        # _end_if_
     # _end_def_
 
     def print_migration_stats(self) -> None:
@@ -1,14 +1,19 @@
 """ Multi-Objective GA model module. """
+import json
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
 # Third party numpy.
 from numpy.typing import NDArray
-from numpy import (isclose, array2string)
+from numpy import (isclose, array2string, array, asarray, where)
+from numpy.random import (default_rng, Generator, SeedSequence)
 
 # Custom PyGenaAlgo code.
 from pygenalgo.engines import logger
-from pygenalgo.engines.generic_ga import GenericGA, RunConfig
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
+from pygenalgo.utils.hypervolume import hypervolume
+from pygenalgo.utils.pareto_archive import ParetoArchive
 from pygenalgo.utils.auxiliary import average_hamming_distance
 
 # Supported selection operators.
@@ -41,55 +46,317 @@ class MultiObjectiveGA(GenericGA):
         which specializes in multi-objective optimization problems. The fitness
         in these problems is not a float but a tuple of floats (one for each of
         the objective values).
+
+        The hypervolume of the population (with respect to a reference point)
+        is recorded at every epoch in stats["hypervolume"].
+
+        Optionally, an external ParetoArchive keeps the non-dominated solutions
+        found during the run. It is updated only with the newly evaluated
+        chromosomes of each epoch.
+    """
+
+    rng_HV: Generator = default_rng()
+    """
+    Random Number Generator of the (Monte Carlo) hypervolume estimates. It is
+    separate from the 'rng_GA', so the estimates do not change the evolution.
     """
 
-    def __init__(self, **kwargs) -> None:
+    # Object variables (specific for the MultiObjectiveGA).
+    __slots__ = ("_ref_point", "_auto_ref", "_archive")
+
+    def __init__(self, ref_point=None, archive: Optional[ParetoArchive] = None,
+                 **kwargs) -> None:
         """
         Default constructor of MultiObjectiveGA object.
+
+        :param ref_point: reference point of the hypervolume, in the fitness
+                          space (i.e. maximization of all the objectives). If
+                          it is None, it is set at the start of each run from
+                          the worst fitness values of the initial population.
+
+        :param archive: (ParetoArchive) external archive of non-dominated
+                        solutions. It is cleared at the start of each run.
         """
         # Call the super constructor with the input parameters.
         super().__init__(**kwargs)
 
+        # Store the reference point (if any).
+        self._ref_point = None if ref_point is None else asarray(ref_point,
+                                                                 dtype=float)
+        # Flag to set the reference point at the start of each run.
+        self._auto_ref = ref_point is None
+
+        # Check the archive.
+        if archive is not None and not isinstance(archive, ParetoArchive):
+            raise TypeError(f"{self.__class__.__name__}: "
+                            f"Archive must be a ParetoArchive.")
+        # _end_if_
+
+        # Store the external archive (if any).
+        self._archive = archive
+
         # Here we check if the select operator is supported.
         if not isinstance(self._select_op, (ParetoFrontSelector,
                                             ParetoTournamentSelector)):
             raise ValueError(f"The select_op: {self._select_op.__class__.__name__} "
-                             f"is not supported in MultiObjectiveGA.")
+                             f"is not supported in {self.__class__.__name__}.")
+    # _end_def_
+
+    @property
+    def ref_point(self) -> Optional[NDArray]:
+        """
+        Accessor method that returns the reference point of the hypervolume.
+
+        :return: the reference point (or None if not set yet).
+        """
+        return self._ref_point
+    # _end_def_
+
+    @property
+    def archive(self) -> Optional[ParetoArchive]:
+        """
+        Accessor method that returns the external archive.
+
+        :return: the ParetoArchive (or None).
+        """
+        return self._archive
+    # _end_def_
+
+    @classmethod
+    def set_seed(cls, new_seed=None) -> None:
+        """
+        Sets a new seed for the random number generators. The generator
+        of the hypervolume gets an independent stream of the same seed.
+
+        :param new_seed: New seed value (default=None).
+
+        :return: None.
+        """
+        # Re-initialize the class variable of the parent class.
+        super().set_seed(new_seed)
+
+        # Re-initialize the hypervolume generator.
+        cls.rng_HV = default_rng(SeedSequence(new_seed).spawn(1)[0])
+    # _end_def_
+
+    def clear_all(self) -> None:
+        """
+        Clears all the internal variables, including the reference
+        point if it was not set by the user and the archive.
+
+        :return: None.
+        """
+        # Call the super method.
+        super().clear_all()
+
+        # Empty the archive.
+        if self._archive is not None:
+            self._archive.clear()
+        # _end_if_
+
+        # Reset the reference point.
+        if self._auto_ref:
+            self._ref_point = None
+        # _end_if_
     # _end_def_
 
-    def run(self, config: Optional[RunConfig] = None) -> None:
+    def update_hypervolume(self, fit_list: list) -> float:
+        """
+        Computes the hypervolume of the input fitness values and stores
+        it in the stats dictionary. If the reference point is not set,
+        it is placed 10% (of the range) below the worst fitness values.
+
+        :param fit_list: (list) fitness values of the population.
+
+        :return: the hypervolume (float).
+        """
+        # Convert the fitness list in a numpy array. Missing values
+        # (e.g. cancelled evaluations) are ignored.
+        arr: NDArray = array([f for f in fit_list if f is not None],
+                             dtype=float)
+
+        # Set the reference point (once per run).
+        if self._ref_point is None:
+            # Get the worst / best values.
+            f_min, f_max = arr.min(axis=0), arr.max(axis=0)
+
+            # Keep a margin from the worst values.
+            self._ref_point = f_min - where(f_max > f_min,
+                                            0.1 * (f_max - f_min), 1.0)
+        # _end_if_
+
+        # Compute the hypervolume (maximization).
+        hv_value: float = hypervolume(arr, self._ref_point, mode="max",
+                                      rng=self.rng_HV)
+        # Store it in the dictionary.
+        self._stats["hypervolume"].append(hv_value)
+
+        return hv_value
+    # _end_def_
+
+    def update_archive(self, input_population: list[Chromosome]) -> None:
+        """
+        Inserts the (newly evaluated) chromosomes in the external archive
+        (if any) and stores its size in the stats dictionary.
+
+        :param input_population: (list) of evaluated chromosomes.
+
+        :return: None.
+        """
+        if self._archive is not None:
+            # Insert the chromosomes.
+            self._archive.update_population(input_population)
+
+            # Store the size of the archive.
+            self._stats["archive_size"].append(len(self._archive))
+        # _end_if_
+    # _end_def_
+
+    def _checkpoint_state(self) -> dict:
+        """
+        Extends the checkpoint state with the reference point
+        and the solutions of the external archive (if any).
+
+        :return: a dictionary with the state of the engine.
+        """
+        # Get the state of the parent class.
+        state = super()._checkpoint_state()
+
+        # Store the reference point.
+        if self._ref_point is not None:
+            state["ref_point"] = self._ref_point
+        # _end_if_
+
+        # Store the state of the hypervolume generator.
+        state["rng_HV"] = array(json.dumps(self.rng_HV.bit_generator.state))
+
+        # Store the archive solutions.
+        if self._archive is not None:
+            fitness, items = self._archive.solutions()
+
+            # Genome values (and types) of the solutions.
+            genome = self._genome_arrays(items)
+
+            state["archive_fitness"] = fitness
+            state["archive_genome"] = genome["values"]
+
+            if "dtypes" in genome:
+                state["archive_genome_dtypes"] = genome["dtypes"]
+            # _end_if_
+        # _end_if_
+
+        return state
+    # _end_def_
+
+    def _restore_state(self, data) -> None:
+        """
+        Restores the checkpoint state, including the reference
+        point and the solutions of the external archive (if any).
+
+        :param data: the loaded arrays (NpzFile or dictionary).
+
+        :return: None.
+        """
+        # Restore the state of the parent class.
+        super()._restore_state(data)
+
+        # Restore the reference point.
+        if "ref_point" in data:
+            self._ref_point = asarray(data["ref_point"], dtype=float)
+        # _end_if_
+
+        # Restore the state of the hypervolume generator.
+        if "rng_HV" in data:
+            self.rng_HV.bit_generator.state = json.loads(str(data["rng_HV"]))
+        # _end_if_
+
+        # Restore the archive solutions.
+        if self._archive is not None:
+            # Empty the archive.
+            self._archive.clear()
+
+            if "archive_fitness" in data:
+                # Chromosome length.
+                n_genes = len(self.population[0])
+
+                # Genome values of the archive.
+                genome = self._genome_values(data["archive_genome"],
+                                             data["archive_genome_dtypes"]
+                                             if "archive_genome_dtypes" in data else None)
+
+                for k, f_value in enumerate(data["archive_fitness"]):
+                    # Use the population as template.
+                    item = self.population[0].clone()
+
+                    # Copy the genome values.
+                    for gene, value in zip(item.genome,
+                                           genome[k*n_genes:(k+1)*n_genes]):
+                        gene.value = value
+                    # _end_for_
+
+                    # Copy the fitness.
+                    item.fitness = tuple(f_value.tolist())
+
+                    # Insert the solution in the archive.
+                    self._archive.update(f_value, item, truncate=False)
+                # _end_for_
+        # _end_if_
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
         """
         Main method of the MultiObjectiveGA class that implements
         the evolutionary routine.
 
         :param config: (RunConfig) the configuration params.
 
-        :return: None.
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
         """
         # Initialize the configuration parameters.
         config = config or RunConfig()
 
-        # Make sure everything is cleared.
-        self.clear_all()
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
 
         # Get the size of the population.
         pop_size: int = len(self.population)
 
-        # Get the fitness values before optimization.
-        fit_list_0, found_solution = self.evaluate_fitness(self.population,
-                                                           config.parallel)
-        # Initial termination check.
-        if found_solution:
-            # Display the message for the user.
-            logger.info("Optimization Finished!")
-            return
+        # Start a new run.
+        if first_epoch == 0:
+            # Get the fitness values before optimization.
+            fit_list_0, found_solution = self.evaluate_fitness(self.population,
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # Initial termination check.
+            if found_solution:
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
+
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(fit_list_0)
+
+            # Update the hypervolume in the dictionary.
+            hv_value = self.update_hypervolume(fit_list_0)
+
+            # Insert the initial population in the archive.
+            self.update_archive(self.population)
 
-        # Update the average statistics in the dictionary.
-        avg_fitness_0, _ = self.update_stats(fit_list_0)
+            # Store the initial crossover and mutation probabilities.
+            self.stats["prob_crossx"].append(self.crossx_op.probability)
+            self.stats["prob_mutate"].append(self.mutate_op.probability)
+        else:
+            # Continue from the last average of the checkpoint.
+            avg_fitness_0 = self.stats["avg"][-1]
 
-        # Store the initial crossover and mutation probabilities.
-        self.stats["prob_crossx"].append(self.crossx_op.probability)
-        self.stats["prob_mutate"].append(self.mutate_op.probability)
+            # Continue from the last hypervolume of the checkpoint.
+            hv_value = self.stats["hypervolume"][-1]
+        # _end_if_
 
         # Local variable to display information on the screen.
         # To avoid cluttering the screen we print info only 10
@@ -97,14 +364,17 @@ class MultiObjectiveGA(GenericGA):
         print_interval: int = config.epochs // 10 if config.epochs > 10 else 2
 
         # Display an information message.
-        logger.info("Initial Avg. Fitness = %s",
-                    _to_str(avg_fitness_0))
+        logger.info("Initial Avg. Fitness = %s, Hypervolume = %.5g",
+                    _to_str(avg_fitness_0), hv_value)
 
         # Initial time instant.
         time_t0: float = time.perf_counter()
 
         # Repeat 'epoch' times.
-        for i in range(config.epochs):
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
 
             # Update current iteration.
             self.iteration = i
@@ -122,7 +392,9 @@ class MultiObjectiveGA(GenericGA):
 
             # Calculate the new fitness values.
             fit_list_i, found_solution = self.evaluate_fitness(population_i,
-                                                               config.parallel)
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
             # Check for termination.
             if found_solution:
                 # Log a warning message.
@@ -135,6 +407,15 @@ class MultiObjectiveGA(GenericGA):
                 # Final update the mean/std in the dictionary.
                 avg_fitness_0, _ = self.update_stats(fit_list_i)
 
+                # Final update of the hypervolume.
+                hv_value = self.update_hypervolume(fit_list_i)
+
+                # Final update of the archive.
+                self.update_archive(population_i)
+
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
                 # Exit.
                 break
             # _end_if_
@@ -145,6 +426,9 @@ class MultiObjectiveGA(GenericGA):
                 fit_list_i = [p.fitness for p in population_i]
             # _end_if_
 
+            # Insert the new offsprings in the archive.
+            self.update_archive(population_i)
+
             # Check if 'elitism' is enabled.
             if config.elitism:
                 # Get the reference of the best chromosome
@@ -171,17 +455,33 @@ class MultiObjectiveGA(GenericGA):
             # Update the mean / std in the dictionary.
             avg_fitness_i, std_fitness_i = self.update_stats(fit_list_i)
 
+            # Update the hypervolume in the dictionary.
+            hv_value = self.update_hypervolume(fit_list_i)
+
             # Log the information message.
             if config.verbose and (i % print_interval) == 0:
                 logger.info(
-                    "Epoch: %5d -> Avg. Fitness = %s, Spread = %s",
-                    i+1, _to_str(avg_fitness_i), _to_str(std_fitness_i)
+                    "Epoch: %5d -> Avg. Fitness = %s, Spread = %s, Hypervolume = %.5g",
+                    i+1, _to_str(avg_fitness_i), _to_str(std_fitness_i), hv_value
                 )
             # _end_if_
 
             # Update the old population with the current.
             self.population = population_i
 
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
             # Check for the maximum function evaluations.
             if config.f_max_eval is not None and\
                     self.f_evals >= config.f_max_eval:
@@ -227,14 +527,21 @@ class MultiObjectiveGA(GenericGA):
 
             # Update the average value for the next iteration.
             avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
         # _end_for_
 
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
         # Final time instant.
         time_tf: float = time.perf_counter()
 
         # Display the final average fitness value.
         logger.info(
-            "Final Avg. Fitness = %s", _to_str(avg_fitness_0)
+            "Final Avg. Fitness = %s, Hypervolume = %.5g",
+            _to_str(avg_fitness_0), hv_value
         )
 
         # Print final duration in seconds.
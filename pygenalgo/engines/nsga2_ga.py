@@ -0,0 +1,322 @@
+""" NSGA-II model module. """
+import time
+from typing import Iterator, Optional
+
+# Third party numpy.
+import numpy as np
+from numpy.typing import NDArray
+
+# Custom PyGenaAlgo code.
+from pygenalgo.engines import logger
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
+from pygenalgo.engines.multi_objective_ga import _to_str
+from pygenalgo.utils.auxiliary import average_hamming_distance
+from pygenalgo.utils.utilities import (non_dominated_sort, crowding_distance)
+
+# Supported selection operators.
+from pygenalgo.operators.selection.crowded_tournament_selector import CrowdedTournamentSelector
+from pygenalgo.operators.selection.pareto_tournament_selector import ParetoTournamentSelector
+
+# Public interface.
+__all__ = ["NSGA2GA", "RunConfig"]
+
+
+class NSGA2GA(GenericGA):
+    """
+    Description:
+
+        NSGA2GA model implements the Non-dominated Sorting Genetic Algorithm II
+        (Deb et al. 2002) for multi-objective optimization problems. At every
+        epoch the offsprings are merged with their parents and the new population
+        is formed by the best non-dominated fronts ((mu + lambda) environmental
+        selection). The last front that does not fit entirely is truncated using
+        the crowding distance, to preserve the diversity along the front.
+
+        Since the environmental selection is elitist by construction, the
+        'elitism' flag of the RunConfig is not used here.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Default constructor of NSGA2GA object.
+        """
+        # Call the super constructor with the input parameters.
+        super().__init__(**kwargs)
+
+        # Here we check if the select operator is supported.
+        if not isinstance(self._select_op, (CrowdedTournamentSelector,
+                                            ParetoTournamentSelector)):
+            raise ValueError(f"The select_op: {self._select_op.__class__.__name__} "
+                             f"is not supported in NSGA2GA.")
+    # _end_def_
+
+    def environmental_selection(self, input_population: list[Chromosome],
+                                n_survivors: int) -> list[Chromosome]:
+        """
+        Selects the 'n_survivors' best chromosomes from the input population,
+        based on their non-domination rank and crowding distance.
+
+        :param input_population: (list) of evaluated chromosomes (typically
+                                 the parents together with the offsprings).
+
+        :param n_survivors: (int) number of chromosomes to keep.
+
+        :return: (list) with the surviving chromosomes, sorted by front.
+        """
+        # Build a 2D array from the fitness tuples.
+        fitness_array: NDArray = np.array([
+            p.fitness for p in input_population
+        ], dtype=float).reshape(len(input_population), -1)
+
+        # Indices of the surviving chromosomes.
+        survivors: list[NDArray] = []
+
+        # Number of free slots.
+        n_free: int = n_survivors
+
+        # Fill the new population front by front.
+        for front in non_dominated_sort(fitness_array):
+
+            # If the whole front fits, keep it.
+            if front.size <= n_free:
+                survivors.append(front)
+                n_free -= front.size
+            else:
+                # Keep the least crowded part of the last front.
+                crowd: NDArray = crowding_distance(fitness_array[front])
+                survivors.append(front[np.argsort(-crowd, kind="stable")[:n_free]])
+                n_free = 0
+            # _end_if_
+
+            # Stop when the population is full.
+            if n_free == 0:
+                break
+        # _end_for_
+
+        # Store the size of the first front.
+        self.stats["front_size"].append(survivors[0].size)
+
+        return [input_population[int(k)] for k in np.concatenate(survivors)]
+    # _end_def_
+
+    def pareto_front(self) -> list[Chromosome]:
+        """
+        Auxiliary method that returns the chromosomes of the current
+        population that lie on the first (non-dominated) front.
+
+        :return: (list) with the Pareto optimal chromosomes.
+        """
+        # Build a 2D array from the fitness tuples.
+        fitness_array: NDArray = np.array([
+            p.fitness for p in self.population
+        ], dtype=float).reshape(len(self.population), -1)
+
+        return [self.population[int(k)]
+                for k in non_dominated_sort(fitness_array)[0]]
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
+        """
+        Main method of the NSGA2GA class that implements
+        the evolutionary routine.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
+        """
+        # Initialize the configuration parameters.
+        config = config or RunConfig()
+
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
+
+        # Get the size of the population.
+        pop_size: int = len(self.population)
+
+        # Start a new run.
+        if first_epoch == 0:
+            # Get the fitness values before optimization.
+            fit_list_0, found_solution = self.evaluate_fitness(self.population,
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # Initial termination check.
+            if found_solution:
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
+
+            # Sort the initial population by front.
+            self.population = self.environmental_selection(self.population, pop_size)
+
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(fit_list_0)
+
+            # Store the initial crossover and mutation probabilities.
+            self.stats["prob_crossx"].append(self.crossx_op.probability)
+            self.stats["prob_mutate"].append(self.mutate_op.probability)
+        else:
+            # Continue from the last average of the checkpoint.
+            avg_fitness_0 = self.stats["avg"][-1]
+        # _end_if_
+
+        # Local variable to display information on the screen.
+        # To avoid cluttering the screen we print info only 10
+        # times regardless of the total number of epochs.
+        print_interval: int = config.epochs // 10 if config.epochs > 10 else 2
+
+        # Display an information message.
+        logger.info("Initial Avg. Fitness = %s",
+                    _to_str(avg_fitness_0))
+
+        # Initial time instant.
+        time_t0: float = time.perf_counter()
+
+        # Repeat 'epoch' times.
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
+
+            # Update current iteration.
+            self.iteration = i
+
+            # SELECT the parents.
+            offsprings = self.select_op(self.population)
+
+            # Shuffle the selected parents.
+            if config.shuffle:
+                self.rng_GA.shuffle(offsprings)
+            # _end_def_
+
+            # CROSSOVER/MUTATE to produce offsprings.
+            self.crossover_mutate(offsprings)
+
+            # Calculate the new fitness values.
+            _, found_solution = self.evaluate_fitness(offsprings,
+                                                      config.parallel,
+                                                      as_completed=config.as_completed,
+                                                      max_evals=config.f_max_eval)
+            # Check if 'corrections' are enabled.
+            if config.correction:
+                self.correct_genome(offsprings)
+            # _end_if_
+
+            # Cancelled evaluations (as completed mode) cannot be ranked.
+            offsprings = [p for p in offsprings if p.fitness is not None]
+
+            # (mu + lambda) ENVIRONMENTAL SELECTION of the new population.
+            self.population = self.environmental_selection(self.population + offsprings,
+                                                           pop_size)
+            # Update the mean / std in the dictionary.
+            avg_fitness_i, std_fitness_i = self.update_stats(self.population_fitness())
+
+            # Check for termination.
+            if found_solution:
+                # Log a warning message.
+                logger.warning("%s finished in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Log the information message.
+            if config.verbose and (i % print_interval) == 0:
+                logger.info(
+                    "Epoch: %5d -> Avg. Fitness = %s, Spread = %s, Front size = %d",
+                    i+1, _to_str(avg_fitness_i), _to_str(std_fitness_i),
+                    self.stats["front_size"][-1]
+                )
+            # _end_if_
+
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for the maximum function evaluations.
+            if config.f_max_eval is not None and\
+                    self.f_evals >= config.f_max_eval:
+                # Log a warning message.
+                logger.warning(
+                    "%s reached the maximum number of function evaluations: %d",
+                    self.__class__.__name__, config.f_max_eval
+                )
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for convergence (in all the objectives).
+            if config.f_tol is not None and all(np.isclose(avg_fitness_i,
+                                                           avg_fitness_0,
+                                                           atol=config.f_tol)):
+                # Display a warning message.
+                logger.warning("%s converged in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check the adaptive flag.
+            if config.adapt_probs:
+                # Compute the current average Hamming distance.
+                avg_distance = average_hamming_distance(self.population)
+
+                # Update the genetic probabilities.
+                if self.adapt_probabilities(threshold=avg_distance):
+                    # Store the updated crossover and mutation probabilities.
+                    self.stats["prob_crossx"].append(self.crossx_op.probability)
+                    self.stats["prob_mutate"].append(self.mutate_op.probability)
+            # _end_if_
+
+            # Update the average value for the next iteration.
+            avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
+        # _end_for_
+
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
+        # Final time instant.
+        time_tf: float = time.perf_counter()
+
+        # Display the final average fitness value.
+        logger.info(
+            "Final Avg. Fitness = %s", _to_str(avg_fitness_0)
+        )
+
+        # Print final duration in seconds.
+        print(f"Elapsed time: {(time_tf - time_t0):.3f} seconds.")
+    # _end_def_
+
+# _end_class_
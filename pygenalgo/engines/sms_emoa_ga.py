@@ -0,0 +1,309 @@
+""" SMS-EMOA model module. """
+import time
+from typing import Iterator, Optional
+
+# Third party numpy.
+import numpy as np
+from numpy.typing import NDArray
+
+# Custom PyGenaAlgo code.
+from pygenalgo.engines import logger
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.generic_ga import RunConfig, EpochRecord
+from pygenalgo.engines.multi_objective_ga import MultiObjectiveGA, _to_str
+from pygenalgo.utils.auxiliary import average_hamming_distance
+from pygenalgo.utils.utilities import non_dominated_ranks
+from pygenalgo.utils.hypervolume import hypervolume_contributions
+
+# Public interface.
+__all__ = ["SMSEMOAGA", "RunConfig"]
+
+
+class SMSEMOAGA(MultiObjectiveGA):
+    """
+    Description:
+
+        SMSEMOAGA model implements the S-metric selection evolutionary multi-
+        objective algorithm (Beume, Naujoks and Emmerich 2007). It is a steady
+        state (mu + 1) algorithm: every new offspring is evaluated and added to
+        the population, and then the chromosome with the smallest exclusive
+        hypervolume contribution, on the worst non-dominated front, is removed.
+
+        An epoch consists of as many steady state steps as the population size,
+        so the number of function evaluations per epoch is the same as in the
+        other engines. The offsprings are evaluated one at a time, hence the
+        'parallel' and 'as_completed' flags of the RunConfig are not used. The
+        selection is elitist by construction, so the 'elitism' flag is not used
+        either.
+    """
+
+    def s_metric_selection(self, input_population: list[Chromosome]) -> list[Chromosome]:
+        """
+        Removes one chromosome from the input population. This is the one with
+        the smallest hypervolume contribution on the worst non-dominated front.
+        The reference point of the contributions is placed one unit below the
+        worst values of the front, so that the boundary points are preferred.
+
+        :param input_population: (list) of evaluated chromosomes.
+
+        :return: (list) with the surviving chromosomes.
+        """
+        # Build a 2D array from the fitness tuples.
+        fitness_array: NDArray = np.array([
+            p.fitness for p in input_population
+        ], dtype=float).reshape(len(input_population), -1)
+
+        # Get the rank of each chromosome.
+        ranks: NDArray = non_dominated_ranks(fitness_array)
+
+        # Chromosomes on the worst front.
+        worst: NDArray = np.flatnonzero(ranks == ranks.max())
+
+        # Break the ties with the hypervolume contributions.
+        if worst.size > 1:
+            # Get the fitness of the worst front.
+            front: NDArray = fitness_array[worst]
+
+            # Remove the least contributing chromosome.
+            worst = worst[np.argmin(hypervolume_contributions(front,
+                                                              front.min(axis=0) - 1.0))]
+        else:
+            worst = worst[0]
+        # _end_if_
+
+        return input_population[:worst] + input_population[worst + 1:]
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
+        """
+        Main method of the SMSEMOAGA class that implements
+        the evolutionary routine.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
+        """
+        # Initialize the configuration parameters.
+        config = config or RunConfig()
+
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
+
+        # Get the size of the population.
+        pop_size: int = len(self.population)
+
+        # Start a new run.
+        if first_epoch == 0:
+            # Get the fitness values before optimization.
+            fit_list_0, found_solution = self.evaluate_fitness(self.population)
+
+            # Initial termination check.
+            if found_solution:
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
+
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(fit_list_0)
+
+            # Update the hypervolume in the dictionary.
+            hv_value = self.update_hypervolume(fit_list_0)
+
+            # Insert the initial population in the archive.
+            self.update_archive(self.population)
+
+            # Store the initial crossover and mutation probabilities.
+            self.stats["prob_crossx"].append(self.crossx_op.probability)
+            self.stats["prob_mutate"].append(self.mutate_op.probability)
+        else:
+            # Continue from the last average of the checkpoint.
+            avg_fitness_0 = self.stats["avg"][-1]
+
+            # Continue from the last hypervolume of the checkpoint.
+            hv_value = self.stats["hypervolume"][-1]
+        # _end_if_
+
+        # Local variable to display information on the screen.
+        # To avoid cluttering the screen we print info only 10
+        # times regardless of the total number of epochs.
+        print_interval: int = config.epochs // 10 if config.epochs > 10 else 2
+
+        # Display an information message.
+        logger.info("Initial Avg. Fitness = %s, Hypervolume = %.5g",
+                    _to_str(avg_fitness_0), hv_value)
+
+        # Initial time instant.
+        time_t0: float = time.perf_counter()
+
+        # Repeat 'epoch' times.
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
+
+            # Update current iteration.
+            self.iteration = i
+
+            # SELECT the mating pool of this epoch.
+            mating_pool = self.select_op(self.population)
+
+            # Shuffle the selected parents.
+            if config.shuffle:
+                self.rng_GA.shuffle(mating_pool)
+            # _end_def_
+
+            # Offsprings of this epoch.
+            offsprings: list[Chromosome] = []
+
+            # Steady state steps.
+            for j in range(pop_size):
+
+                # Get the next pair of parents.
+                parent1 = mating_pool[(2 * j) % pop_size]
+                parent2 = mating_pool[(2 * j + 1) % pop_size]
+
+                # CROSSOVER/MUTATE to produce one offspring.
+                offspring, _ = self.crossx_op(parent1, parent2)
+                self.mutate_op(offspring)
+
+                # Calculate the new fitness value.
+                _, found_solution = self.evaluate_fitness([offspring])
+
+                # Check if 'corrections' are enabled.
+                if config.correction:
+                    self.correct_genome([offspring])
+                # _end_if_
+
+                # Keep the offspring for the archive.
+                offsprings.append(offspring)
+
+                # S-METRIC SELECTION of the new population.
+                self.population = self.s_metric_selection(self.population +
+                                                          [offspring])
+                # Check for termination.
+                if found_solution or (config.f_max_eval is not None and
+                                      self.f_evals >= config.f_max_eval):
+                    break
+                # _end_if_
+            # _end_for_
+
+            # Insert the new offsprings in the archive.
+            self.update_archive(offsprings)
+
+            # Get the fitness of the new population.
+            fit_list_i = self.population_fitness()
+
+            # Update the mean / std in the dictionary.
+            avg_fitness_i, std_fitness_i = self.update_stats(fit_list_i)
+
+            # Update the hypervolume in the dictionary.
+            hv_value = self.update_hypervolume(fit_list_i)
+
+            # Check for termination.
+            if found_solution:
+                # Log a warning message.
+                logger.warning("%s finished in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Log the information message.
+            if config.verbose and (i % print_interval) == 0:
+                logger.info(
+                    "Epoch: %5d -> Avg. Fitness = %s, Spread = %s, Hypervolume = %.5g",
+                    i+1, _to_str(avg_fitness_i), _to_str(std_fitness_i), hv_value
+                )
+            # _end_if_
+
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for the maximum function evaluations.
+            if config.f_max_eval is not None and\
+                    self.f_evals >= config.f_max_eval:
+                # Log a warning message.
+                logger.warning(
+                    "%s reached the maximum number of function evaluations: %d",
+                    self.__class__.__name__, config.f_max_eval
+                )
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for convergence (in all the objectives).
+            if config.f_tol is not None and all(np.isclose(avg_fitness_i,
+                                                           avg_fitness_0,
+                                                           atol=config.f_tol)):
+                # Display a warning message.
+                logger.warning("%s converged in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check the adaptive flag.
+            if config.adapt_probs:
+                # Compute the current average Hamming distance.
+                avg_distance = average_hamming_distance(self.population)
+
+                # Update the genetic probabilities.
+                if self.adapt_probabilities(threshold=avg_distance):
+                    # Store the updated crossover and mutation probabilities.
+                    self.stats["prob_crossx"].append(self.crossx_op.probability)
+                    self.stats["prob_mutate"].append(self.mutate_op.probability)
+            # _end_if_
+
+            # Update the average value for the next iteration.
+            avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
+        # _end_for_
+
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
+        # Final time instant.
+        time_tf: float = time.perf_counter()
+
+        # Display the final average fitness value.
+        logger.info(
+            "Final Avg. Fitness = %s, Hypervolume = %.5g",
+            _to_str(avg_fitness_0), hv_value
+        )
+
+        # Print final duration in seconds.
+        print(f"Elapsed time: {(time_tf - time_t0):.3f} seconds.")
+    # _end_def_
+
+# _end_class_
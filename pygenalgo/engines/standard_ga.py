@@ -1,12 +1,15 @@
 """ Standard GA model module. """
 import time
 from math import isclose
-from typing import Optional
+from numpy import (nanmean, array)
+from typing import Iterator, Optional
 
 # Custom PyGenaAlgo code.
 from pygenalgo.engines import logger
-from pygenalgo.engines.generic_ga import GenericGA, RunConfig
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
 from pygenalgo.utils.auxiliary import average_hamming_distance
+from pygenalgo.utils.local_search import LocalSearch
+from pygenalgo.utils.restart_strategy import RestartStrategy
 
 # Public interface.
 __all__ = ["StandardGA", "RunConfig"]
@@ -19,49 +22,217 @@ class StandardGA(GenericGA):
         StandardGA model provides a basic implementation of the "GenericGA",
         which at each iteration (epoch) replaces the whole population using
         the genetic operators (crossover and mutation).
+
+        Optionally, a LocalSearch stage improves the best offsprings of each
+        epoch, after their evaluation (memetic algorithm).
+
+        Optionally, a RestartStrategy replaces the population with a new (and
+        possibly larger) one, seeded with the elites, when the search stagnates
+        or converges, instead of ending the run.
     """
 
-    def __init__(self, **kwargs) -> None:
+    # Object variables (specific for the StandardGA).
+    __slots__ = ("_local_search", "_restart")
+
+    def __init__(self, local_search: Optional[LocalSearch] = None,
+                 restart: Optional[RestartStrategy] = None, **kwargs) -> None:
         """
         Default constructor of StandardGA object.
+
+        :param local_search: (optional) LocalSearch stage, applied to the top-k
+                             offsprings of each epoch. Its evaluations are counted
+                             in the f_evals (within the f_max_eval of the run) and
+                             the number of improved offsprings is stored in
+                             stats["local_search"].
+
+        :param restart: (optional) RestartStrategy of the run. The restarts share
+                        the epochs and the f_max_eval of the run. The best fitness
+                        of each epoch is stored in stats["best"] and the epochs of
+                        the restarts in stats["restarts"].
         """
         # Call the super constructor with all the input parameters.
         super().__init__(**kwargs)
+
+        # Sanity check.
+        if local_search is not None and not isinstance(local_search, LocalSearch):
+            raise TypeError(f"{self.__class__.__name__}: "
+                            f"Local search must be a LocalSearch object.")
+        # _end_if_
+
+        # Sanity check.
+        if restart is not None and not isinstance(restart, RestartStrategy):
+            raise TypeError(f"{self.__class__.__name__}: "
+                            f"Restart must be a RestartStrategy object.")
+        # _end_if_
+
+        # Get the local search stage.
+        self._local_search: Optional[LocalSearch] = local_search
+
+        # Get the restart strategy.
+        self._restart: Optional[RestartStrategy] = restart
+    # _end_def_
+
+    def restart_population(self, config: RunConfig) -> tuple[float, bool]:
+        """
+        Replaces the current population with a new one from the restart
+        strategy. Only the new (random) chromosomes are evaluated, since
+        the elites keep their fitness values.
+
+        :param config: (RunConfig) the configuration params.
+
+        :return: the average fitness of the new population and a flag if
+                 the solution was found.
+        """
+        # Create the new population.
+        new_population = self._restart.new_population(self.population)
+
+        # Evaluate only the new chromosomes.
+        _, found_solution = self.evaluate_fitness([p for p in new_population
+                                                   if p.fitness is None],
+                                                  config.parallel,
+                                                  as_completed=config.as_completed,
+                                                  max_evals=config.f_max_eval)
+        # Replace the population.
+        self.population = new_population
+
+        # Store the position of the restart in the history of the best fitness.
+        self.stats["restarts"].append(len(self.stats["best"]))
+
+        # Return the new average fitness (the stats are not updated).
+        return float(nanmean([p.fitness for p in new_population
+                              if p.fitness is not None])), found_solution
+    # _end_def_
+
+    def _checkpoint_state(self) -> dict:
+        """
+        Extends the checkpoint state with the elite archive
+        of the restart strategy (if any).
+
+        :return: a dictionary with the state of the engine.
+        """
+        # Get the state of the parent class.
+        state = super()._checkpoint_state()
+
+        # Store the elite archive.
+        if self._restart is not None and self._restart.archive:
+            # Genome values (and types) of the elites.
+            genome = self._genome_arrays(self._restart.archive)
+
+            state["restart_fitness"] = array([p.fitness for p in self._restart.archive],
+                                             dtype=float)
+            state["restart_genome"] = genome["values"]
+
+            if "dtypes" in genome:
+                state["restart_genome_dtypes"] = genome["dtypes"]
+            # _end_if_
+        # _end_if_
+
+        return state
+    # _end_def_
+
+    def _restore_state(self, data) -> None:
+        """
+        Restores the checkpoint state, including the elite archive of the
+        restart strategy (if any). After a growing restart the checkpoint
+        has more chromosomes than the current population, so the population
+        is resized (with copies) before the values are restored.
+
+        :param data: the loaded arrays (NpzFile or dictionary).
+
+        :return: None.
+        """
+        # Get the population sizes.
+        pop_size, new_size = len(self.population), len(data["genome_sizes"])
+
+        # Resize the population (the values are restored next).
+        if new_size != pop_size:
+            self.population = [self.population[k] if k < pop_size else
+                               self.population[k % pop_size].clone()
+                               for k in range(new_size)]
+        # _end_if_
+
+        # Restore the state of the parent class.
+        super()._restore_state(data)
+
+        # Restore the elite archive.
+        if self._restart is not None:
+            # Empty the archive.
+            self._restart.reset()
+
+            if "restart_fitness" in data:
+                # Chromosome length.
+                n_genes = len(self.population[0])
+
+                # Genome values of the archive.
+                genome = self._genome_values(data["restart_genome"],
+                                             data["restart_genome_dtypes"]
+                                             if "restart_genome_dtypes" in data else None)
+
+                for k, f_value in enumerate(data["restart_fitness"].tolist()):
+                    # Use the population as template.
+                    item = self.population[0].clone()
+
+                    # Copy the genome values.
+                    for gene, value in zip(item.genome,
+                                           genome[k*n_genes:(k+1)*n_genes]):
+                        gene.value = value
+                    # _end_for_
+
+                    # Copy the fitness.
+                    item.fitness = f_value
+
+                    # Insert the elite in the archive.
+                    self._restart.archive.append(item)
+                # _end_for_
+            # _end_if_
+        # _end_if_
     # _end_def_
 
-    def run(self, config: Optional[RunConfig] = None) -> None:
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
         """
         Main method of the StandardGA class that implements
         the evolutionary routine.
 
         :param config: (RunConfig) the configuration params.
 
-        :return: None.
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
         """
         # Initialize the configuration parameters.
         config = config or RunConfig()
 
-        # Make sure everything is cleared.
-        self.clear_all()
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
 
         # Get the size of the population.
         pop_size: int = len(self.population)
 
-        # Get the fitness values before optimization.
-        fit_list_0, found_solution = self.evaluate_fitness(self.population,
-                                                           config.parallel)
-        # Initial termination check.
-        if found_solution:
-            # Display the message for the user.
-            logger.info("Optimization Finished!")
-            return
+        # Start a new run.
+        if first_epoch == 0:
+            # Get the fitness values before optimization.
+            fit_list_0, found_solution = self.evaluate_fitness(self.population,
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # Initial termination check.
+            if found_solution:
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
 
-        # Update the average statistics in the dictionary.
-        avg_fitness_0, _ = self.update_stats(fit_list_0)
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(fit_list_0)
 
-        # Store the initial crossover and mutation probabilities.
-        self.stats["prob_crossx"].append(self.crossx_op.probability)
-        self.stats["prob_mutate"].append(self.mutate_op.probability)
+            # Store the initial crossover and mutation probabilities.
+            self.stats["prob_crossx"].append(self.crossx_op.probability)
+            self.stats["prob_mutate"].append(self.mutate_op.probability)
+        else:
+            # Continue from the last average of the checkpoint.
+            avg_fitness_0 = self.stats["avg"][-1]
+        # _end_if_
 
         # Local variable to display information on the screen.
         # To avoid cluttering the screen we print info only 10
@@ -74,8 +245,16 @@ class StandardGA(GenericGA):
         # Initial time instant.
         time_t0: float = time.perf_counter()
 
+        # Clear the elite archive of a new run.
+        if self._restart is not None and first_epoch == 0:
+            self._restart.reset()
+        # _end_if_
+
         # Repeat 'epoch' times.
-        for i in range(config.epochs):
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
 
             # Update current iteration.
             self.iteration = i
@@ -93,7 +272,29 @@ class StandardGA(GenericGA):
 
             # Calculate the new fitness values.
             fit_list_i, found_solution = self.evaluate_fitness(population_i,
-                                                               config.parallel)
+                                                               config.parallel,
+                                                               as_completed=config.as_completed,
+                                                               max_evals=config.f_max_eval)
+            # Improve the best offsprings with the local search.
+            if self._local_search is not None and not found_solution:
+                # Run the local search with the same evaluation settings,
+                # within the remaining budget of function evaluations.
+                n_improved, found_solution = self._local_search(
+                    population_i,
+                    lambda batch: self.evaluate_fitness(batch, config.parallel,
+                                                        as_completed=config.as_completed,
+                                                        max_evals=config.f_max_eval),
+                    max_evals=None if config.f_max_eval is None else
+                    config.f_max_eval - self.f_evals
+                )
+
+                # Store the number of the improved offsprings.
+                self.stats["local_search"].append(n_improved)
+
+                # Update the fitness list to ensure consistency.
+                fit_list_i = [p.fitness for p in population_i]
+            # _end_if_
+
             # Check for termination.
             if found_solution:
                 # Log a warning message.
@@ -106,6 +307,9 @@ class StandardGA(GenericGA):
                 # Final update the mean/std in the dictionary.
                 avg_fitness_0, _ = self.update_stats(fit_list_i)
 
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
                 # Exit.
                 break
             # _end_if_
@@ -155,6 +359,19 @@ class StandardGA(GenericGA):
             # Update the old population with current.
             self.population = population_i
 
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
             # Check for the maximum function evaluations.
             if config.f_max_eval is not None and\
                     self.f_evals >= config.f_max_eval:
@@ -172,9 +389,61 @@ class StandardGA(GenericGA):
             # _end_if_
 
             # Check for convergence.
-            if config.f_tol is not None and isclose(avg_fitness_i,
-                                                    avg_fitness_0,
-                                                    abs_tol=config.f_tol):
+            has_converged: bool = config.f_tol is not None and isclose(avg_fitness_i,
+                                                                       avg_fitness_0,
+                                                                       abs_tol=config.f_tol)
+            # Check for stagnation (restart instead of ending the run).
+            if self._restart is not None:
+                # Store the best fitness of the epoch.
+                self.stats["best"].append(self.best_chromosome().fitness)
+
+                # Get the elapsed time of the run.
+                elapsed_time: float = time.perf_counter() - time_t0
+
+                # Check the time budget.
+                if self._restart.time_is_up(elapsed_time):
+                    # Log a warning message.
+                    logger.warning("%s reached the time budget: %.3f seconds.",
+                                   self.__class__.__name__, self._restart.max_time)
+                    # Final update the mean value.
+                    avg_fitness_0 = avg_fitness_i
+
+                    # Exit.
+                    break
+                # _end_if_
+
+                # Get the best fitness since the last restart.
+                restarts = self.stats["restarts"]
+                best_history = self.stats["best"][restarts[-1] if restarts else 0:]
+
+                if (has_converged or self._restart.is_stagnant(best_history, population_i)) and \
+                        self._restart.allows_restart(len(restarts), elapsed_time):
+                    # Restart with the new population.
+                    avg_fitness_i, found_solution = self.restart_population(config)
+
+                    # Update the size of the population.
+                    pop_size = len(self.population)
+
+                    # Log the information message.
+                    logger.info("%s restarted in epoch %d with %d chromosomes.",
+                                self.__class__.__name__, i + 1, pop_size)
+                    # Check for termination (or the end of the budget).
+                    if found_solution or (config.f_max_eval is not None and
+                                           self.f_evals >= config.f_max_eval):
+                        # Final update the mean value.
+                        avg_fitness_0 = avg_fitness_i
+
+                        # Exit.
+                        break
+                    # _end_if_
+
+                    # Continue with the new population.
+                    population_i = self.population
+                    has_converged = False
+                # _end_if_
+            # _end_if_
+
+            if has_converged:
                 # Display a warning message.
                 logger.warning("%s converged in %d iterations.",
                                self.__class__.__name__, i + 1)
@@ -200,8 +469,14 @@ class StandardGA(GenericGA):
 
             # Update the average value for the next iteration.
             avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
         # _end_for_
 
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
         # Final time instant.
         time_tf: float = time.perf_counter()
 
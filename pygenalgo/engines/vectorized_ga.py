@@ -0,0 +1,562 @@
+""" Vectorized (real-coded) GA model module. """
+import time
+from math import isclose
+from dataclasses import replace
+from typing import Iterator, Optional
+
+# Third party numpy.
+import numpy as np
+from numpy.typing import NDArray
+
+# Custom PyGenaAlgo code.
+from pygenalgo.engines import logger
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.utilities import unpack_fitness
+from pygenalgo.engines.generic_ga import GenericGA, RunConfig, EpochRecord
+from pygenalgo.operators import kernels
+
+# Supported genetic operators.
+from pygenalgo.operators.selection.tournament_selector import TournamentSelector
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+from pygenalgo.operators.selection.stochastic_universal_selector import StochasticUniversalSelector
+from pygenalgo.operators.crossover.blend_crossover import BlendCrossover
+from pygenalgo.operators.crossover.simulated_binary_crossover import SimulatedBinaryCrossover
+from pygenalgo.operators.mutation.gaussian_mutator import GaussianMutator
+from pygenalgo.operators.mutation.polynomial_mutator import PolynomialMutator
+
+# Public interface.
+__all__ = ["VectorizedGA", "RunConfig"]
+
+
+class VectorizedGA(GenericGA):
+    """
+    Description:
+
+        VectorizedGA model provides the same evolutionary routine with the StandardGA,
+        but for real-coded problems it keeps the whole population as a (N, D) array of
+        floats. The selection, crossover and mutation steps are batched numpy kernels,
+        which use the settings of the (supported) operator objects. The fitness function
+        is called ONCE per epoch, with the whole (N, D) array, and it should return the
+        (N,) array of fitness values (optionally along with the solution found flag).
+
+        NOTE: The settings of the GenericGA that work on lists of Chromosomes are not
+        supported: the feasibility stage (feasible_func / repair_func), the fault
+        tolerance (max_retries) and the parallel or the as_completed evaluation of
+        the RunConfig. The constraints can be handled inside the batched fitness
+        function (e.g. with a penalty on the infeasible rows).
+    """
+
+    # Supported operators.
+    _SELECT_OPS = (TournamentSelector, LinearRankSelector, StochasticUniversalSelector)
+    _CROSSX_OPS = (SimulatedBinaryCrossover, BlendCrossover)
+    _MUTATE_OPS = (GaussianMutator, PolynomialMutator)
+
+    # Object variables (specific for the VectorizedGA).
+    __slots__ = ("_x_pop", "_f_pop", "_genes_func")
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Default constructor of VectorizedGA object.
+        """
+        # Call the super constructor with all the input parameters.
+        super().__init__(**kwargs)
+
+        # The fitness function is called with the whole array.
+        if self._feasible_func is not None or self._max_retries > 0:
+            raise ValueError(f"The feasibility stage and the fault tolerance "
+                             f"are not supported in {self.__class__.__name__}.")
+        # _end_if_
+
+        # Check if the genetic operators are supported.
+        for op, supported in ((self._select_op, VectorizedGA._SELECT_OPS),
+                              (self._crossx_op, VectorizedGA._CROSSX_OPS),
+                              (self._mutate_op, VectorizedGA._MUTATE_OPS)):
+            if not isinstance(op, supported):
+                raise ValueError(f"The operator: {op.__class__.__name__} "
+                                 f"is not supported in {self.__class__.__name__}.")
+        # _end_for_
+
+        # Convert the population to a 2-D array.
+        self._x_pop: NDArray = np.array([p.values() for p in self.population],
+                                        dtype=float)
+        # Sanity check.
+        if self._x_pop.ndim != 2:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Chromosomes must have equal length of real genes.")
+        # _end_if_
+
+        # Get the fitness values (if any).
+        self._f_pop: NDArray = np.array([np.nan if p.fitness is None else p.fitness
+                                         for p in self.population], dtype=float)
+
+        # Keep the random functions of the genes, to
+        # convert the arrays back to Chromosomes.
+        self._genes_func: list = [g.func for g in self.population[0].genome]
+    # _end_def_
+
+    @property
+    def x_population(self) -> NDArray:
+        """
+        Accessor method that returns the (N, D) population array.
+
+        :return: the population array.
+        """
+        return self._x_pop
+    # _end_def_
+
+    @property
+    def f_population(self) -> NDArray:
+        """
+        Accessor method that returns the (N,) fitness array.
+
+        :return: the fitness array.
+        """
+        return self._f_pop
+    # _end_def_
+
+    def evaluate_batch(self, x_pop: NDArray) -> tuple[NDArray, bool]:
+        """
+        Evaluate the whole (N, D) population array with a single call
+        of the fitness function.
+
+        :param x_pop: (N, D) array with the real-coded population.
+
+        :return: the (N,) array with the fitness values and the found
+                 solution flag.
+        """
+        # Unpack the output of the fitness function.
+        f_value, found_solution = unpack_fitness(self.fitness_func(x_pop))
+
+        # Make sure we have a flat array of floats.
+        f_array: NDArray = np.asarray(f_value, dtype=float).reshape(-1)
+
+        # Sanity check.
+        if f_array.size != x_pop.shape[0]:
+            raise RuntimeError(f"{self.__class__.__name__}: Fitness function "
+                               f"returned {f_array.size} values for {x_pop.shape[0]} "
+                               f"individuals.")
+        # _end_if_
+
+        # Update the counter of function evaluations.
+        self._f_evals += x_pop.shape[0]
+
+        return f_array, bool(np.any(found_solution))
+    # _end_def_
+
+    def select_batch(self, f_pop: NDArray) -> NDArray:
+        """
+        Select the indices of the parents using the batched
+        version of the selection operator.
+
+        :param f_pop: (N,) array with the fitness values.
+
+        :return: (N,) array with the indices of the parents.
+        """
+        # Local copy of the selection operator.
+        op = self._select_op
+
+        # Get the population size.
+        pop_size: int = f_pop.size
+
+        # Call the right kernel.
+        if isinstance(op, TournamentSelector):
+            index = kernels.tournament_select(op.rng, f_pop, min(op.items, pop_size),
+                                              pop_size)
+        elif isinstance(op, LinearRankSelector):
+            index = kernels.linear_rank_select(op.rng, f_pop, op.items, pop_size)
+        else:
+            index = kernels.stochastic_universal_select(op.rng, f_pop, pop_size)
+        # _end_if_
+
+        # Increase the selection counter.
+        op.inc_counter()
+
+        return index
+    # _end_def_
+
+    def crossover_mutate_batch(self, x_pop: NDArray) -> NDArray:
+        """
+        Applies the batched crossover to consecutive pairs of rows and then
+        the batched mutation to the whole array.
+
+        :param x_pop: (N, D) array with the selected parents.
+
+        :return: (N, D) array with the new offsprings.
+        """
+        # Local copies of the operators.
+        crossx_op = self._crossx_op
+        mutate_op = self._mutate_op
+
+        # Get the population size.
+        pop_size: int = x_pop.shape[0]
+
+        # Number of pairs (an odd individual is only mutated).
+        n_pairs: int = pop_size // 2
+
+        # Make sure we do not change the input.
+        x_new: NDArray = x_pop.copy()
+
+        # Select the pairs that will be crossed over.
+        pairs: NDArray = np.flatnonzero(crossx_op.probability >
+                                        crossx_op.rng.random(n_pairs))
+        if pairs.size:
+            # Positions of the two parents.
+            i1, i2 = 2 * pairs, 2 * pairs + 1
+
+            # Extract the operator parameters.
+            param, x_lower, x_upper = crossx_op.items
+
+            # Call the right kernel.
+            if isinstance(crossx_op, SimulatedBinaryCrossover):
+                x_new[i1], x_new[i2] = kernels.sbx_crossover(crossx_op.rng, x_pop[i1],
+                                                             x_pop[i2], param,
+                                                             x_lower, x_upper)
+            else:
+                x_new[i1], x_new[i2] = kernels.blend_crossover(crossx_op.rng, x_pop[i1],
+                                                               x_pop[i2], param,
+                                                               x_lower, x_upper)
+            # _end_if_
+
+            # Increase the crossover counter.
+            crossx_op.inc_counter(pairs.size)
+        # _end_if_
+
+        # Select the rows that will be mutated.
+        rows: NDArray = np.flatnonzero(mutate_op.probability >
+                                       mutate_op.rng.random(pop_size))
+        if rows.size:
+            # Extract the operator parameters.
+            param, x_lower, x_upper = mutate_op.items
+
+            # Call the right kernel.
+            if isinstance(mutate_op, GaussianMutator):
+                kernels.gaussian_mutation(mutate_op.rng, x_new, rows, param,
+                                          x_lower, x_upper)
+            else:
+                kernels.polynomial_mutation(mutate_op.rng, x_new, rows, param,
+                                            x_lower, x_upper)
+            # _end_if_
+
+            # Increase the mutation counter.
+            mutate_op.inc_counter(rows.size)
+        # _end_if_
+
+        return x_new
+    # _end_def_
+
+    def update_population(self) -> None:
+        """
+        Converts the population arrays back to a list of Chromosomes
+        (with their fitness values) in the 'population' field.
+
+        :return: None.
+        """
+        # Local copy of the gene functions.
+        genes_func: list = self._genes_func
+
+        # Create the new Chromosomes.
+        self.population = [
+            Chromosome([Gene(v, fn) for v, fn in zip(row, genes_func)],
+                       fitness=None if np.isnan(f) else f)
+            for row, f in zip(self._x_pop.tolist(), self._f_pop.tolist())
+        ]
+    # _end_def_
+
+    def _checkpoint_state(self) -> dict:
+        """
+        Extends the checkpoint state with the population arrays.
+
+        :return: a dictionary with the state of the engine.
+        """
+        # Update the list of Chromosomes (for the parent class).
+        self.update_population()
+
+        # Get the state of the parent class.
+        state = super()._checkpoint_state()
+
+        # Store the population arrays.
+        state["x_pop"] = self._x_pop
+        state["f_pop"] = self._f_pop
+
+        return state
+    # _end_def_
+
+    def _restore_state(self, data) -> None:
+        """
+        Restores the checkpoint state, including the population arrays.
+
+        :param data: the loaded arrays (NpzFile or dictionary).
+
+        :return: None.
+        """
+        # Restore the state of the parent class.
+        super()._restore_state(data)
+
+        # Restore the population arrays.
+        self._x_pop = np.array(data["x_pop"], dtype=float)
+        self._f_pop = np.array(data["f_pop"], dtype=float)
+    # _end_def_
+
+    def epoch_record(self, epoch: int, time_t0: float, time_i: float,
+                     population_view: bool = False) -> EpochRecord:
+        """
+        Creates the snapshot of the current epoch. The best fitness is taken
+        from the population arrays and the list of Chromosomes is updated
+        only if the population view is requested.
+
+        :param epoch: (int) the current epoch.
+
+        :param time_t0: (float) the time instant of the start of the run.
+
+        :param time_i: (float) the time instant of the start of the epoch.
+
+        :param population_view: (bool) if True the record includes a
+                                read-only view of the population.
+
+        :return: the EpochRecord of the current epoch.
+        """
+        # Update the list of Chromosomes.
+        if population_view:
+            self.update_population()
+        # _end_if_
+
+        # Get the record from the stats.
+        record = super().epoch_record(epoch, time_t0, time_i, population_view)
+
+        # Replace the best fitness with the one of the arrays.
+        return replace(record, best=float(np.nanmax(self._f_pop)))
+    # _end_def_
+
+    def run_iter(self, config: Optional[RunConfig] = None,
+                 population_view: bool = False) -> Iterator[EpochRecord]:
+        """
+        Main method of the VectorizedGA class that implements
+        the evolutionary routine.
+
+        :param config: (RunConfig) the configuration params.
+
+        :param population_view: (bool) if True the records include a read-only
+                                view of the population.
+
+        :return: an iterator of the EpochRecords (one per epoch).
+        """
+        # Initialize the configuration parameters.
+        config = config or RunConfig()
+
+        # The batch is evaluated with a single call.
+        if config.parallel or config.as_completed:
+            raise ValueError(f"The parallel and the as_completed evaluations "
+                             f"are not supported in {self.__class__.__name__}.")
+        # _end_if_
+
+        # Prepare a new run (or resume from a loaded checkpoint).
+        first_epoch: int = self.start_run()
+
+        # Local copy of the population array.
+        x_pop: NDArray = self._x_pop
+
+        # Get the size of the population.
+        pop_size: int = x_pop.shape[0]
+
+        # Start a new run.
+        if first_epoch == 0:
+            # Get the fitness values before optimization.
+            f_pop, found_solution = self.evaluate_batch(x_pop)
+
+            # Initial termination check.
+            if found_solution:
+                # Store the fitness and update the population.
+                self._f_pop = f_pop
+                self.update_population()
+
+                # Display the message for the user.
+                logger.info("Optimization Finished!")
+                return
+            # _end_if_
+
+            # Update the average statistics in the dictionary.
+            avg_fitness_0, _ = self.update_stats(f_pop)
+
+            # Store the initial crossover and mutation probabilities.
+            self.stats["prob_crossx"].append(self.crossx_op.probability)
+            self.stats["prob_mutate"].append(self.mutate_op.probability)
+        else:
+            # Continue from the arrays of the checkpoint.
+            f_pop: NDArray = self._f_pop
+            avg_fitness_0 = self.stats["avg"][-1]
+        # _end_if_
+
+        # Local variable to display information on the screen.
+        # To avoid cluttering the screen we print info only 10
+        # times regardless of the total number of epochs.
+        print_interval: int = config.epochs // 10 if config.epochs > 10 else 2
+
+        # Display an information message.
+        logger.info("Initial Avg. Fitness = %.4f", avg_fitness_0)
+
+        # Initial time instant.
+        time_t0: float = time.perf_counter()
+
+        # Repeat 'epoch' times.
+        for i in range(first_epoch, config.epochs):
+
+            # Initial time instant of the epoch.
+            time_i: float = time.perf_counter()
+
+            # Update current iteration.
+            self.iteration = i
+
+            # SELECT the parents (indices).
+            index = self.select_batch(f_pop)
+
+            # Shuffle the selected parents.
+            if config.shuffle:
+                self.rng_GA.shuffle(index)
+            # _end_if_
+
+            # CROSSOVER/MUTATE to produce offsprings.
+            x_pop_i = self.crossover_mutate_batch(x_pop[index])
+
+            # Calculate the new fitness values.
+            f_pop_i, found_solution = self.evaluate_batch(x_pop_i)
+
+            # Check for termination.
+            if found_solution:
+                # Log a warning message.
+                logger.warning("%s finished in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Update the old population with the current.
+                x_pop, f_pop = x_pop_i, f_pop_i
+
+                # Final update the mean/std in the dictionary.
+                avg_fitness_0, _ = self.update_stats(f_pop_i)
+
+                # Store the current arrays (for the record).
+                self._x_pop, self._f_pop = x_pop, f_pop
+
+                # Yield the record of the epoch.
+                yield self.epoch_record(i, time_t0, time_i, population_view)
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check if 'elitism' is enabled.
+            if config.elitism:
+                # Get the position of the best from the previous generation.
+                best_idx: int = int(np.argmax(f_pop))
+
+                # Check if it already exists in the current generation.
+                if not np.any(np.all(x_pop_i == x_pop[best_idx], axis=1)):
+
+                    # Select a position at random.
+                    locus: int = self.rng_GA.integers(pop_size, dtype=int)
+
+                    # Replace it with the previous best.
+                    x_pop_i[locus] = x_pop[best_idx]
+                    f_pop_i[locus] = f_pop[best_idx]
+                # _end_if_
+            # _end_if_
+
+            # Update the mean/std in the dictionary.
+            avg_fitness_i, std_fitness_i = self.update_stats(f_pop_i)
+
+            # Log the information message.
+            if config.verbose and (i % print_interval) == 0:
+                logger.info(
+                    "Epoch: %5d -> Avg. Fitness = %.4f, Spread = %.4f",
+                    i + 1, avg_fitness_i, std_fitness_i
+                )
+            # _end_if_
+
+            # Update the old population with current.
+            x_pop, f_pop = x_pop_i, f_pop_i
+
+            # Store the current arrays (for the record).
+            self._x_pop, self._f_pop = x_pop, f_pop
+
+            # Yield the record of the epoch.
+            record = self.epoch_record(i, time_t0, time_i, population_view)
+            yield record
+
+            # Check the termination criterion.
+            if self.check_termination(config, record):
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for the maximum function evaluations.
+            if config.f_max_eval is not None and\
+                    self.f_evals >= config.f_max_eval:
+                # Log a warning message.
+                logger.warning(
+                    "%s reached the maximum number of function evaluations: %d",
+                    self.__class__.__name__, config.f_max_eval
+                )
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check for convergence.
+            if config.f_tol is not None and isclose(avg_fitness_i,
+                                                    avg_fitness_0,
+                                                    abs_tol=config.f_tol):
+                # Display a warning message.
+                logger.warning("%s converged in %d iterations.",
+                               self.__class__.__name__, i + 1)
+
+                # Final update the mean value.
+                avg_fitness_0 = avg_fitness_i
+
+                # Exit.
+                break
+            # _end_if_
+
+            # Check the adaptive flag.
+            if config.adapt_probs:
+                # Compute the current average Hamming distance.
+                avg_distance = kernels.hamming_distance_batch(x_pop)
+
+                # Update the genetic probabilities.
+                if self.adapt_probabilities(threshold=avg_distance):
+                    # Store the updated crossover and mutation probabilities.
+                    self.stats["prob_crossx"].append(self.crossx_op.probability)
+                    self.stats["prob_mutate"].append(self.mutate_op.probability)
+            # _end_if_
+
+            # Update the average value for the next iteration.
+            avg_fitness_0 = avg_fitness_i
+
+            # Save a checkpoint (if enabled).
+            self.periodic_checkpoint(config)
+        # _end_for_
+
+        # Store the final arrays.
+        self._x_pop, self._f_pop = x_pop, f_pop
+
+        # Save the final checkpoint (if enabled).
+        self.periodic_checkpoint(config, final=True)
+
+        # Final time instant.
+        time_tf: float = time.perf_counter()
+
+        # Update the list of Chromosomes.
+        self.update_population()
+
+        # Display the final average fitness value.
+        logger.info("Final: Avg. Fitness = %.4f", avg_fitness_0)
+
+        # Print final duration in seconds.
+        print(f"Elapsed time: {(time_tf - time_t0):.3f} seconds.")
+    # _end_def_
+
+# _end_class_
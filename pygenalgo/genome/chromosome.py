@@ -73,8 +73,13 @@ class Chromosome:
         :return: float | tuple[float, ...]
         """
 
-        # First check if it is scalar
+        # Fast path: already a Python float
         # (most frequent case).
+        if type(value) is float:
+            return value
+        # _end_if_
+
+        # Then check if it is scalar.
         if isinstance(value, (int, float)):
             return float(value)
         # _end_if_
@@ -82,8 +87,14 @@ class Chromosome:
         # Then check is it is tuple
         # (used in multi-objective).
         if isinstance(value, tuple):
-            # Ensure everything is cast to float.
-            t = tuple(float(x) for x in value)
+            # Fast path: the tuple holds already Python floats
+            # (e.g. it was produced by the cost_function).
+            if all(type(x) is float for x in value):
+                t = value
+            else:
+                # Ensure everything is cast to float.
+                t = tuple(map(float, value))
+            # _end_if_
 
             # Avoid single element tuples.
             return t[0] if len(t) == 1 else t
@@ -96,8 +107,9 @@ class Chromosome:
             if value.ndim != 1:
                 raise TypeError("Fitness numpy array must be 1D.")
 
-            # Convert everything to tuple[float, ...].
-            t = tuple(float(x) for x in value.tolist())
+            # Convert everything to tuple[float, ...]
+            # in a single (C-level) call.
+            t = tuple(value.astype(float, copy=False).tolist())
 
             # Avoid single element tuples.
             return t[0] if len(t) == 1 else t
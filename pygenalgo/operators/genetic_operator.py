@@ -162,16 +162,20 @@ class GeneticOperator:
             self._counter = 0
     # _end_def_
 
-    def inc_counter(self) -> None:
+    def inc_counter(self, value: int = 1) -> None:
         """
-        Increase the counter value by one. This is applied
-        after each application of the genetic operator.
+        Increase the counter value by one (default). This is
+        applied after each application of the genetic operator.
+        Batched (vectorized) applications can increase it by
+        'value' in one call.
+
+        :param value: (int) the increment of the counter.
 
         :return: None.
         """
         # Protect operator counter.
         with self._lock:
-            self._counter += 1
+            self._counter += value
     # _end_def_
 
     @property
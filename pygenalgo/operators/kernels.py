@@ -0,0 +1,358 @@
+"""
+Description:
+
+    Includes batched (numpy vectorized) versions of the genetic operators, for
+    real-coded populations that are stored as 2-D arrays of shape (N, D), where
+    'N' is the number of individuals and 'D' the number of genes. Each kernel
+    operates on the whole population at once, instead of the per chromosome
+    (or per pair) Python loops of the operator classes.
+
+    Selection kernels return the indices of the selected parents, whilst the
+    crossover and mutation kernels return new arrays with the offsprings.
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+import numpy as np
+from numpy.typing import NDArray
+from numpy.random import Generator
+
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+
+# Public interface.
+__all__ = ["tournament_select", "linear_rank_select", "stochastic_universal_select",
+           "sbx_crossover", "blend_crossover", "gaussian_mutation",
+           "polynomial_mutation", "hamming_distance_batch"]
+
+
+def tournament_select(rng: Generator, fitness: NDArray,
+                      k: int, n_select: int) -> NDArray:
+    """
+    Batched tournament selection. The contestants of each tournament
+    are drawn (with replacement) in one call and the winners are the
+    ones with the highest fitness.
+
+    :param rng: random number generator.
+
+    :param fitness: (N,) array with the fitness values.
+
+    :param k: number of contestants in each tournament.
+
+    :param n_select: number of individuals to select.
+
+    :return: (n_select,) array with the indices of the winners.
+    """
+    # Draw all the contestants: (n_select, k).
+    contestants: NDArray = rng.integers(fitness.size, size=(n_select, k))
+
+    # Find the position of the best in each row.
+    best: NDArray = np.argmax(fitness[contestants], axis=1)
+
+    # Return the indices of the winners.
+    return contestants[np.arange(n_select), best]
+# _end_def_
+
+def linear_rank_select(rng: Generator, fitness: NDArray,
+                       eta: float, n_select: int) -> NDArray:
+    """
+    Batched linear rank selection. It uses the same (cached) rank
+    probabilities with the LinearRankSelector.
+
+    :param rng: random number generator.
+
+    :param fitness: (N,) array with the fitness values.
+
+    :param eta: (float) selection pressure in [1, 2].
+
+    :param n_select: number of individuals to select.
+
+    :return: (n_select,) array with the selected indices.
+    """
+    # Get the size of the population.
+    pop_size: int = fitness.size
+
+    # Rank probabilities in ascending order.
+    probs = LinearRankSelector.probabilities(pop_size, eta)
+
+    # Indices that sort the fitness in ascending order.
+    order: NDArray = np.argsort(fitness, kind="stable")
+
+    # Select the ranks and map them back to the indices.
+    return order[rng.choice(pop_size, size=n_select, p=probs)]
+# _end_def_
+
+def stochastic_universal_select(rng: Generator, fitness: NDArray,
+                                n_select: int) -> NDArray:
+    """
+    Batched stochastic universal sampling (SUS). Non-positive fitness
+    values are shifted up, so that the minimum becomes one (same rule
+    as the 'shift_up' mode of the ensure_positive_fitness function).
+
+    :param rng: random number generator.
+
+    :param fitness: (N,) array with the fitness values.
+
+    :param n_select: number of individuals to select.
+
+    :return: (n_select,) array with the selected indices.
+    """
+    # Ensure positive fitness values.
+    if np.any(fitness <= 0.0):
+        fitness = fitness + np.abs(fitness.min()) + 1.0
+    # _end_if_
+
+    # Compute the cumulative sum of the fitness values.
+    cum_sum: NDArray = np.cumsum(fitness)
+
+    # Distance between the pointers.
+    dist_p: float = cum_sum[-1] / n_select
+
+    # Equally spaced pointers, from a random start.
+    pointers: NDArray = dist_p * (rng.random() + np.arange(n_select))
+
+    # Find the positions with a binary search.
+    return np.minimum(np.searchsorted(cum_sum, pointers, side="left"),
+                      fitness.size - 1)
+# _end_def_
+
+def sbx_crossover(rng: Generator, x1: NDArray, x2: NDArray, eta: float,
+                  x_lower: NDArray, x_upper: NDArray) -> tuple[NDArray, NDArray]:
+    """
+    Batched simulated binary crossover (SBX) of the parents rows x1[i], x2[i].
+    It follows the bounded formulation of the SimulatedBinaryCrossover class.
+
+    :param rng: random number generator.
+
+    :param x1: (M, D) array with the first parents.
+
+    :param x2: (M, D) array with the second parents.
+
+    :param eta: (float) distribution index.
+
+    :param x_lower: (D,) lower limit values for the genes.
+
+    :param x_upper: (D,) upper limit values for the genes.
+
+    :return: two (M, D) arrays with the offsprings.
+    """
+    # Ensure lo <= hi for consistency.
+    lo: NDArray = np.minimum(x1, x2)
+    hi: NDArray = np.maximum(x1, x2)
+
+    # Keep track of the swapped entries.
+    swapped: NDArray = x1 > x2
+
+    # Difference between the two gene values.
+    diff: NDArray = hi - lo
+
+    # Skip the (almost) identical values (scale aware).
+    valid: NDArray = diff > 1.0e-15 * np.maximum(1.0, np.maximum(np.abs(lo),
+                                                                 np.abs(hi)))
+    # Avoid divisions by zero.
+    safe_diff: NDArray = np.where(valid, diff, 1.0)
+
+    # Distance factors to lower and upper bounds.
+    beta1: NDArray = 1.0 + (2.0 * (lo - x_lower) / safe_diff)
+    beta2: NDArray = 1.0 + (2.0 * (x_upper - hi) / safe_diff)
+
+    # Precompute repeated variables once.
+    eta_1: float = eta + 1.0
+    inv_eta_1: float = 1.0 / eta_1
+
+    # Separate alpha values for balancing distributions.
+    alpha1: NDArray = 2.0 - beta1 ** -eta_1
+    alpha2: NDArray = 2.0 - beta2 ** -eta_1
+
+    # One random number to generate BOTH children.
+    rand: NDArray = rng.random(x1.shape)
+
+    # Sample beta_q1 / beta_q2 (alpha values are in [1, 2)).
+    beta_q1: NDArray = np.where(rand <= 1.0 / alpha1,
+                                (rand * alpha1) ** inv_eta_1,
+                                (1.0 / (2.0 - rand * alpha1)) ** inv_eta_1)
+    beta_q2: NDArray = np.where(rand <= 1.0 / alpha2,
+                                (rand * alpha2) ** inv_eta_1,
+                                (1.0 / (2.0 - rand * alpha2)) ** inv_eta_1)
+
+    # Compute the new values (with safe clipping).
+    c1: NDArray = np.clip(0.5 * (lo + hi - beta_q1 * diff), x_lower, x_upper)
+    c2: NDArray = np.clip(0.5 * (lo + hi + beta_q2 * diff), x_lower, x_upper)
+
+    # Return the offsprings (respecting the swaps).
+    return (np.where(valid, np.where(swapped, c2, c1), x1),
+            np.where(valid, np.where(swapped, c1, c2), x2))
+# _end_def_
+
+def blend_crossover(rng: Generator, x1: NDArray, x2: NDArray, alpha: float,
+                    x_lower: NDArray, x_upper: NDArray) -> tuple[NDArray, NDArray]:
+    """
+    Batched blend-a crossover (BLX-a) of the parents rows x1[i], x2[i].
+
+    :param rng: random number generator.
+
+    :param x1: (M, D) array with the first parents.
+
+    :param x2: (M, D) array with the second parents.
+
+    :param alpha: (float) extension parameter in [0, 1].
+
+    :param x_lower: (D,) lower limit values for the genes.
+
+    :param x_upper: (D,) upper limit values for the genes.
+
+    :return: two (M, D) arrays with the offsprings.
+    """
+    # Get the min / max values.
+    lo: NDArray = np.minimum(x1, x2)
+    hi: NDArray = np.maximum(x1, x2)
+
+    # Offset distance scaled with alpha.
+    offset: NDArray = alpha * (hi - lo)
+
+    # Extended lower limit and range.
+    start: NDArray = lo - offset
+    span: NDArray = (hi - lo) + 2.0 * offset
+
+    # Two uniform random numbers per gene.
+    rand: NDArray = rng.random((2,) + x1.shape)
+
+    # Return the offsprings within limits.
+    return (np.clip(start + span * rand[0], x_lower, x_upper),
+            np.clip(start + span * rand[1], x_lower, x_upper))
+# _end_def_
+
+def gaussian_mutation(rng: Generator, x: NDArray, rows: NDArray, sigma: NDArray,
+                      x_lower: NDArray, x_upper: NDArray) -> None:
+    """
+    Batched Gaussian mutation. For each selected row, a random gene is
+    perturbed with N(0, sigma) noise (in place).
+
+    :param rng: random number generator.
+
+    :param x: (N, D) population array (modified in place).
+
+    :param rows: (M,) indices of the rows to mutate.
+
+    :param sigma: (D,) or scalar standard deviation.
+
+    :param x_lower: (D,) lower limit values for the genes.
+
+    :param x_upper: (D,) upper limit values for the genes.
+
+    :return: None.
+    """
+    # Select a random gene position per row.
+    cols: NDArray = rng.integers(x.shape[1], size=rows.size)
+
+    # Broadcast sigma to all the gene positions.
+    sigma = np.broadcast_to(sigma, x_lower.shape)
+
+    # Sample the new values.
+    new_values: NDArray = rng.normal(loc=x[rows, cols], scale=sigma[cols])
+
+    # Ensure they stay within limits.
+    x[rows, cols] = np.clip(new_values, x_lower[cols], x_upper[cols])
+# _end_def_
+
+def polynomial_mutation(rng: Generator, x: NDArray, rows: NDArray, eta: float,
+                        x_lower: NDArray, x_upper: NDArray) -> None:
+    """
+    Batched polynomial mutation (PM-eta). For each selected row, a random
+    gene is perturbed with a polynomial distribution (in place).
+
+    :param rng: random number generator.
+
+    :param x: (N, D) population array (modified in place).
+
+    :param rows: (M,) indices of the rows to mutate.
+
+    :param eta: (float) distribution index.
+
+    :param x_lower: (D,) lower limit values for the genes.
+
+    :param x_upper: (D,) upper limit values for the genes.
+
+    :return: None.
+    """
+    # Select a random gene position per row.
+    cols: NDArray = rng.integers(x.shape[1], size=rows.size)
+
+    # Local bounds lookups.
+    xl: NDArray = x_lower[cols]
+    xu: NDArray = x_upper[cols]
+
+    # Old values and bound spans.
+    old_values: NDArray = x[rows, cols]
+    bound_span: NDArray = xu - xl
+
+    # Normalized distances to the bounds.
+    delta1: NDArray = (old_values - xl) / bound_span
+    delta2: NDArray = (xu - old_values) / bound_span
+
+    # Uniform random numbers in [0, 1).
+    rand_u: NDArray = rng.random(rows.size)
+
+    # Mutation power value.
+    m_power: float = 1.0 / (eta + 1.0)
+
+    # Compute both branches of the perturbation factor.
+    val_lo: NDArray = 2.0 * rand_u + (1.0 - 2.0 * rand_u) * (1.0 - delta1) ** (eta + 1.0)
+    val_hi: NDArray = (2.0 * (1.0 - rand_u) +
+                       2.0 * (rand_u - 0.5) * (1.0 - delta2) ** (eta + 1.0))
+
+    # Select the right branch.
+    delta_q: NDArray = np.where(rand_u <= 0.5,
+                                val_lo ** m_power - 1.0,
+                                1.0 - val_hi ** m_power)
+
+    # Update the values (within limits).
+    x[rows, cols] = np.clip(old_values + delta_q * bound_span, xl, xu)
+# _end_def_
+
+def hamming_distance_batch(x: NDArray) -> float:
+    """
+    Computes the normalized average Hamming distance of the rows of
+    a population array, i.e. the fraction of the unique row pairs
+    (and gene positions) that hold different values.
+
+    :param x: (N, D) population array.
+
+    :return: (float) the normalized average Hamming distance.
+    """
+    # Get the dimensions.
+    n_rows, n_cols = x.shape
+
+    # Sanity check.
+    if n_rows < 2:
+        return 0.0
+    # _end_if_
+
+    # Sort each column so that equal values are adjacent.
+    x_sorted: NDArray = np.sort(x, axis=0)
+
+    # Mark the start of a new run of equal values.
+    new_run: NDArray = np.ones((n_rows, n_cols), dtype=bool)
+    new_run[1:] = x_sorted[1:] != x_sorted[:-1]
+
+    # Count the equal pairs, column by column.
+    equal_pairs: int = 0
+    for j in range(n_cols):
+        # Lengths of the runs of equal values.
+        counts = np.diff(np.append(np.flatnonzero(new_run[:, j]), n_rows))
+
+        # Update the equal pairs.
+        equal_pairs += int(np.sum(counts * (counts - 1) // 2))
+    # _end_for_
+
+    # Total pairs of all the gene positions.
+    total_pairs: int = n_cols * n_rows * (n_rows - 1) // 2
+
+    # Return the fraction of different pairs.
+    return (total_pairs - equal_pairs) / total_pairs
+# _end_def_
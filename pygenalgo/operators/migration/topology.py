@@ -0,0 +1,263 @@
+""" Island topologies module. """
+from typing import Optional
+
+from numpy.random import default_rng
+
+
+class Topology:
+    """
+    Description:
+
+        Provides the base class of the island topologies. A topology is a
+        directed graph among the islands of an IslandModelGA: each island
+        sends its emigrants to its 'targets' and receives immigrants from
+        its 'sources'. The adjacency lists are computed once (at the
+        construction), so the migration only looks them up.
+    """
+
+    # Object variables.
+    __slots__ = ("_targets", "_sources")
+
+    def __init__(self, targets: list[list[int]]) -> None:
+        """
+        Construct a topology from the adjacency lists.
+
+        :param targets: (list) where targets[i] holds the islands that
+                        receive the emigrants of the i-th island.
+        """
+        # Get the number of islands.
+        n_islands: int = len(targets)
+
+        # Sanity check.
+        if n_islands < 1:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Topology needs at least one island.")
+        # _end_if_
+
+        # Store the (unique) targets, without self loops.
+        self._targets: tuple = tuple(
+            tuple(sorted({int(j) for j in targets_i if int(j) != i}))
+            for i, targets_i in enumerate(targets)
+        )
+
+        # Sanity check.
+        if any(j < 0 or j >= n_islands for targets_i in self._targets
+               for j in targets_i):
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Island index out of range.")
+        # _end_if_
+
+        # Invert the adjacency lists.
+        sources: list = [[] for _ in range(n_islands)]
+
+        for i, targets_i in enumerate(self._targets):
+            for j in targets_i:
+                sources[j].append(i)
+        # _end_for_
+
+        self._sources: tuple = tuple(tuple(s) for s in sources)
+    # _end_def_
+
+    @property
+    def n_islands(self) -> int:
+        """
+        Accessor of the number of islands.
+
+        :return: the number of islands in the topology.
+        """
+        return len(self._targets)
+    # _end_def_
+
+    def targets(self, island_id: int) -> tuple[int, ...]:
+        """
+        Get the islands that receive the emigrants of the input island.
+
+        :param island_id: (int) the id of the island.
+
+        :return: a tuple with the ids of the target islands.
+        """
+        return self._targets[island_id]
+    # _end_def_
+
+    def sources(self, island_id: int) -> tuple[int, ...]:
+        """
+        Get the islands that send emigrants to the input island.
+
+        :param island_id: (int) the id of the island.
+
+        :return: a tuple with the ids of the source islands.
+        """
+        return self._sources[island_id]
+    # _end_def_
+
+    def __repr__(self) -> str:
+        """
+        Repr operator is called when a string representation
+        is needed that can be evaluated.
+
+        :return: Topology(n_islands).
+        """
+        return f"{self.__class__.__name__}({self.n_islands})"
+    # _end_def_
+
+# _end_class_
+
+
+class RingTopology(Topology):
+    """
+    Description:
+
+        Ring of islands. Each island sends its emigrants to the next one
+        (clockwise), or to both neighbours if it is bidirectional.
+    """
+
+    def __init__(self, n_islands: int, bidirectional: bool = False) -> None:
+        """
+        Construct a ring topology.
+
+        :param n_islands: (int) number of islands.
+
+        :param bidirectional: (bool) if True the emigrants are sent to
+                              both the next and the previous island.
+        """
+        # Sanity check.
+        if n_islands < 1:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Number of islands should be positive.")
+        # _end_if_
+
+        # Call the super constructor with the adjacency lists.
+        super().__init__([[(i + 1) % n_islands, (i - 1) % n_islands]
+                          if bidirectional else [(i + 1) % n_islands]
+                          for i in range(n_islands)])
+    # _end_def_
+
+# _end_class_
+
+
+class TorusTopology(Topology):
+    """
+    Description:
+
+        Two dimensional grid of islands, with wrap around edges. Each island
+        exchanges emigrants with its four (von Neumann) neighbours.
+    """
+
+    def __init__(self, n_rows: int, n_cols: int) -> None:
+        """
+        Construct a torus topology of 'n_rows x n_cols' islands. The
+        island (r, c) has the id: r * n_cols + c.
+
+        :param n_rows: (int) number of rows of the grid.
+
+        :param n_cols: (int) number of columns of the grid.
+        """
+        # Sanity check.
+        if n_rows < 1 or n_cols < 1:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Grid dimensions should be positive.")
+        # _end_if_
+
+        # Call the super constructor with the adjacency lists.
+        super().__init__([[((r - 1) % n_rows) * n_cols + c,
+                           ((r + 1) % n_rows) * n_cols + c,
+                           r * n_cols + (c - 1) % n_cols,
+                           r * n_cols + (c + 1) % n_cols]
+                          for r in range(n_rows) for c in range(n_cols)])
+    # _end_def_
+
+# _end_class_
+
+
+class HypercubeTopology(Topology):
+    """
+    Description:
+
+        Hypercube of 2^dim islands. Each island exchanges emigrants with the
+        islands whose ids differ in exactly one bit (dim neighbours), so any
+        two islands are at most 'dim' hops apart.
+    """
+
+    def __init__(self, dim: int) -> None:
+        """
+        Construct a hypercube topology.
+
+        :param dim: (int) dimension of the hypercube (2^dim islands).
+        """
+        # Sanity check.
+        if dim < 0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Dimension should be non-negative.")
+        # _end_if_
+
+        # Call the super constructor with the adjacency lists.
+        super().__init__([[i ^ (1 << b) for b in range(dim)]
+                          for i in range(1 << dim)])
+    # _end_def_
+
+# _end_class_
+
+
+class RandomRegularTopology(Topology):
+    """
+    Description:
+
+        Random k-regular (undirected) graph of islands. Each island exchanges
+        emigrants with exactly k randomly chosen islands. The graph is drawn
+        with the pairing (configuration) model, rejecting the draws with self
+        loops or multiple edges.
+    """
+
+    def __init__(self, n_islands: int, k: int, seed: Optional[int] = None,
+                 max_tries: int = 1000) -> None:
+        """
+        Construct a random k-regular topology.
+
+        :param n_islands: (int) number of islands.
+
+        :param k: (int) the degree of each island.
+
+        :param seed: (int) seed of the random generator.
+
+        :param max_tries: (int) maximum number of draws of the graph.
+        """
+        # Sanity check.
+        if not 0 <= k < n_islands or (k * n_islands) % 2:
+            raise ValueError(f"{self.__class__.__name__}: Cannot create a "
+                             f"{k}-regular graph with {n_islands} islands.")
+        # _end_if_
+
+        # Random number generator.
+        rng = default_rng(seed)
+
+        for _ in range(max_tries):
+            # Each island has 'k' stubs. Pair them at random.
+            stubs = rng.permutation(k * n_islands) % n_islands
+
+            # Get the edges.
+            edges = {(int(min(a, b)), int(max(a, b)))
+                     for a, b in zip(stubs[0::2], stubs[1::2])}
+
+            # Accept only simple graphs.
+            if len(edges) == (k * n_islands) // 2 and \
+                    all(a != b for a, b in edges):
+                break
+            # _end_if_
+        else:
+            raise RuntimeError(f"{self.__class__.__name__}: Failed to create "
+                               f"a {k}-regular graph in {max_tries} tries.")
+        # _end_for_
+
+        # Get the adjacency lists.
+        targets: list = [[] for _ in range(n_islands)]
+
+        for a, b in edges:
+            targets[a].append(b)
+            targets[b].append(a)
+        # _end_for_
+
+        # Call the super constructor with the adjacency lists.
+        super().__init__(targets)
+    # _end_def_
+
+# _end_class_
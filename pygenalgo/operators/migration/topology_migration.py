@@ -0,0 +1,108 @@
+""" Topology migration module. """
+from operator import attrgetter
+
+# Custom code imports.
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.auxiliary import SubPopulation
+from pygenalgo.operators.migration.topology import Topology
+from pygenalgo.operators.migration.migration_operator import MigrationOperator
+
+
+class TopologyMigration(MigrationOperator):
+    """
+    Description:
+
+        Topology Migration sends the best chromosome of each island to all its
+        target islands in the given topology (ring, torus, hypercube, etc.).
+        Each copy replaces a randomly selected chromosome of the target.
+
+        The same topology is used by the IslandModelGA in the asynchronous
+        migration mode, where the islands exchange the migrants through
+        mailboxes without waiting for each other.
+    """
+
+    def __init__(self, topology: Topology, migration_probability: float = 0.95) -> None:
+        """
+        Construct a 'TopologyMigration' object with a given topology.
+
+        :param topology: (Topology) the graph among the islands.
+
+        :param migration_probability: (float) in [0, 1].
+        """
+        # Call the super constructor with the provided initial value.
+        super().__init__(migration_probability=migration_probability)
+
+        # Check the topology.
+        if not isinstance(topology, Topology):
+            raise TypeError(f"{self.__class__.__name__}: "
+                            f"Topology must be a Topology object.")
+        # _end_if_
+
+        # Store the topology in the items (so it is
+        # included in the pickled state of the object).
+        self._items: Topology = topology
+    # _end_def_
+
+    @property
+    def topology(self) -> Topology:
+        """
+        Accessor (getter) of the topology.
+
+        :return: the Topology.
+        """
+        return self._items
+    # _end_def_
+
+    def migrate(self, islands: list[SubPopulation]) -> None:
+        """
+        Perform the migration operation on the list of SubPopulations.
+        The islands that are not in the list (e.g. converged) are skipped.
+
+        :param islands: list[SubPopulation].
+
+        :return: None.
+        """
+        # Perform the migration only if we have more than one
+        # active populations.
+        if len(islands) > 1:
+            # Define the key.
+            key_sort = attrgetter("fitness")
+
+            # Map the islands by id.
+            active: dict = {island_i.id: island_i for island_i in islands}
+
+            # First find the best individual chromosome
+            # FROM EACH island.
+            best_chromosomes: dict[int, Chromosome] = {
+                island_i.id: max(island_i.population, key=key_sort)
+                for island_i in islands
+            }
+
+            # Go through all the islands.
+            for island_i in islands:
+
+                # Send the best chromosome to the targets.
+                for j in self._items.targets(island_i.id):
+
+                    # Perform the migration with a predefined probability.
+                    if j in active and self.is_operator_applicable():
+
+                        # Get the population size of the target island.
+                        pop_size: int = len(active[j].population)
+
+                        # Select randomly one individual chromosome.
+                        idx: int = self.rng.integers(0, pop_size, dtype=int)
+
+                        # Replace it with the best one of the source.
+                        active[j].population[idx] = best_chromosomes[island_i.id].clone()
+                    # _end_if_
+
+                # _end_for_
+
+            # _end_for_
+
+            # Increase the migration counter.
+            self.inc_counter()
+    # _end_def_
+
+# _end_class_
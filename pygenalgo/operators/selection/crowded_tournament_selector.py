@@ -0,0 +1,98 @@
+""" Crowded tournament selector module. """
+# Third party imports.
+import numpy as np
+from numpy.typing import NDArray
+
+# Custom code imports.
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.operators.genetic_operator import increase_counter
+from pygenalgo.operators.selection.select_operator import SelectionOperator
+from pygenalgo.utils.utilities import (non_dominated_sort, crowding_distance)
+
+
+def rank_and_crowding(fitness_array: NDArray) -> tuple[NDArray, NDArray]:
+    """
+    Computes the non-domination rank and the crowding distance of each
+    point of the input fitness array (maximization convention).
+
+    :param fitness_array: array of fitness values with shape (N, D).
+
+    :return: the rank and crowding distance arrays, both with shape (N,).
+    """
+    # Preallocate the output arrays.
+    rank: NDArray = np.empty(fitness_array.shape[0], dtype=int)
+    crowd: NDArray = np.empty(fitness_array.shape[0], dtype=float)
+
+    # The crowding distance is computed within each front.
+    for i, front in enumerate(non_dominated_sort(fitness_array)):
+        rank[front] = i
+        crowd[front] = crowding_distance(fitness_array[front])
+    # _end_for_
+
+    return rank, crowd
+# _end_def_
+
+
+class CrowdedTournamentSelector(SelectionOperator):
+    """
+    Description:
+        The binary tournament of NSGA-II. Two individuals are drawn at random
+        and the one with the lower non-domination rank wins. If both lie on
+        the same front, the one with the larger crowding distance (i.e. from
+        the less crowded region of the front) is selected.
+    """
+
+    def __init__(self, select_probability: float = 1.0) -> None:
+        """
+        Construct a 'CrowdedTournamentSelector' object with a
+        given probability value.
+
+        :param select_probability: (float) in [0, 1].
+        """
+        # Call the super constructor with the provided initial value.
+        super().__init__(selection_probability=select_probability)
+    # _end_def_
+
+    @increase_counter
+    def select(self, population: list[Chromosome]) -> list[Chromosome]:
+        """
+        Select the individuals from the population that will be passed
+        on to the next genetic operations of crossover and mutation to
+        form the new population of solutions.
+
+        :param population: a list of chromosomes to select the parents from.
+
+        :return: the selected parents population (as list of chromosomes).
+        """
+        # Total size of the population.
+        n_size: int = len(population)
+
+        # Sanity check.
+        if n_size < 2:
+            return list(population)
+        # _end_if_
+
+        # Build a 2D array from the fitness
+        # tuples (optimization objectives).
+        fitness_array: NDArray = np.array([
+            p.fitness for p in population
+        ], dtype=float).reshape(n_size, -1)
+
+        # Get the rank and crowding distance of each individual.
+        rank, crowd = rank_and_crowding(fitness_array)
+
+        # Draw two distinct contestants for each tournament.
+        idx_a: NDArray = self.rng.integers(n_size, size=n_size)
+        idx_b: NDArray = (idx_a + self.rng.integers(1, n_size, size=n_size)) % n_size
+
+        # The lower rank wins. On equal ranks the larger crowding distance wins.
+        a_wins: NDArray = (rank[idx_a] < rank[idx_b]) | \
+                          ((rank[idx_a] == rank[idx_b]) & (crowd[idx_a] >= crowd[idx_b]))
+
+        return [
+            # Ensure 'k' is used as integer.
+            population[int(k)] for k in np.where(a_wins, idx_a, idx_b)
+        ]
+    # _end_def_
+
+# _end_class_
@@ -19,6 +19,7 @@ from itertools import zip_longest
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.utilities import unpack_fitness
 
 # Public interface.
 __all__ = ["average_hamming_distance", "correct_chromosomes",
@@ -267,7 +268,7 @@ def correct_chromosomes(input_population: list[Chromosome],
             results = fit_func(chromosome)
 
             # Assign the new fitness value.
-            chromosome.fitness = results["f_value"]
+            chromosome.fitness, _ = unpack_fitness(results)
 
             # Increase counter by one.
             f_eval_counter += 1
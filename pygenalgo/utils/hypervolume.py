@@ -0,0 +1,364 @@
+"""
+Description:
+
+    Includes functions that compute the hypervolume indicator (S-metric) of
+    a set of points, i.e. the volume of the objective space that is dominated
+    by the points and bounded by a reference point. The larger the value the
+    better the approximation of the Pareto front. It is computed with:
+
+        - exact sweeps for two and three objectives,
+        - the WFG algorithm for more objectives (exact),
+        - Monte Carlo sampling for large fronts in many objectives.
+
+    The exclusive contribution of each point (the hypervolume that is lost
+    if the point is removed) is also provided, for the S-metric selection.
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from numpy.random import (default_rng, Generator)
+
+from pygenalgo.utils.utilities import np_pareto_front_index
+
+# Public interface.
+__all__ = ["hypervolume", "hypervolume_contributions"]
+
+
+def _to_boxes(points: NDArray, ref_point: NDArray, mode: str) -> NDArray:
+    """
+    Translates the input points, so that the reference point is at the
+    origin and every point is the upper corner of a box anchored there.
+    Points that do not strictly dominate the reference point are clipped
+    to zero (i.e. they contribute nothing).
+
+    :param points: array of points with shape (N, D).
+
+    :param ref_point: reference point with shape (D,).
+
+    :param mode: "max" (maximize all objective) or
+                 "min" (minimize all objective).
+
+    :return: array of box corners with shape (N, D).
+    """
+    # Sanity check.
+    if points.ndim != 2:
+        raise RuntimeError("Points must be a 2-D array.")
+    # _end_if_
+
+    # Sanity check.
+    if mode not in ("max", "min"):
+        raise ValueError("Mode must be either 'max' or 'min'.")
+    # _end_if_
+
+    # Sanity check.
+    if ref_point.shape != (points.shape[1],):
+        raise ValueError("Reference point does not match the objectives.")
+    # _end_if_
+
+    # Distance from the reference point.
+    boxes = points - ref_point if mode == "max" else ref_point - points
+
+    # Points that do not dominate the reference point have zero volume.
+    boxes[np.any(boxes <= 0.0, axis=1)] = 0.0
+
+    return boxes
+# _end_def_
+
+def _volume_2d(boxes: NDArray) -> float:
+    """
+    Computes the volume of the union of boxes in 2-D with a sweep.
+
+    :param boxes: array of box corners with shape (N, 2).
+
+    :return: the hypervolume (float).
+    """
+    # Sort in descending f1.
+    order = np.argsort(-boxes[:, 0], kind="stable")
+
+    # Running maximum of f2.
+    f2_max = np.maximum.accumulate(boxes[order, 1])
+
+    # Each point adds a stripe of width f1, for its
+    # increase of the maximum f2 (zero if dominated).
+    return float(np.sum(boxes[order, 0] * np.diff(f2_max, prepend=0.0)))
+# _end_def_
+
+def _volume_3d(boxes: NDArray) -> float:
+    """
+    Computes the volume of the union of boxes in 3-D, by sweeping
+    along f3 and adding the 2-D area of every slice.
+
+    :param boxes: array of box corners with shape (N, 3).
+
+    :return: the hypervolume (float).
+    """
+    # Sort in descending f3.
+    boxes = boxes[np.argsort(-boxes[:, 2], kind="stable")]
+
+    # Order of the points in descending f1 (for the 2-D sweeps).
+    order = np.argsort(-boxes[:, 0], kind="stable")
+    f1_sorted = boxes[order, 0]
+
+    # Heights of the slices between successive f3 values.
+    heights = boxes[:, 2] - np.append(boxes[1:, 2], 0.0)
+
+    # Mask of the points that are active in the current slice.
+    active = np.zeros(boxes.shape[0], dtype=bool)
+
+    # Total volume.
+    volume: float = 0.0
+
+    for k, height in enumerate(heights):
+
+        # The k-th point becomes active.
+        active[order == k] = True
+
+        # Skip the empty slices.
+        if height <= 0.0:
+            continue
+        # _end_if_
+
+        # Area of the active points (inactive ones have zero f2).
+        f2_max = np.maximum.accumulate(np.where(active, boxes[order, 1], 0.0))
+        volume += height * float(np.sum(f1_sorted * np.diff(f2_max, prepend=0.0)))
+    # _end_for_
+
+    return volume
+# _end_def_
+
+def _non_dominated(boxes: NDArray) -> NDArray:
+    """
+    Removes the dominated (and the zero volume) boxes.
+
+    :param boxes: array of box corners with shape (N, D).
+
+    :return: array of non-dominated box corners.
+    """
+    # Remove the boxes with zero volume.
+    boxes = boxes[np.all(boxes > 0.0, axis=1)]
+
+    # Sanity check.
+    if boxes.shape[0] <= 1:
+        return boxes
+    # _end_if_
+
+    # Keep only the (unique) points on the front.
+    return boxes[np_pareto_front_index(boxes, rel_eps=0.0)]
+# _end_def_
+
+def _volume_wfg(boxes: NDArray) -> float:
+    """
+    Computes the volume of the union of boxes, with the WFG algorithm
+    (While, Bradstreet and Barone 2012). The volume is the sum of the
+    exclusive volumes of the points, where the exclusive volume of each
+    point is its box minus the volume of the following points "limited"
+    by it. The exact sweeps are used as soon as there are three or fewer
+    objectives.
+
+    :param boxes: array of non-dominated box corners with shape (N, D).
+
+    :return: the hypervolume (float).
+    """
+    # Get the dimensions of the boxes.
+    n_points, n_dims = boxes.shape
+
+    # Trivial cases.
+    if n_points == 0:
+        return 0.0
+
+    if n_points == 1:
+        return float(np.prod(boxes[0]))
+
+    if n_dims == 2:
+        return _volume_2d(boxes)
+
+    if n_dims == 3:
+        return _volume_3d(boxes)
+    # _end_if_
+
+    # Sort in descending last objective, which
+    # keeps the limited sets small (WFG heuristic).
+    boxes = boxes[np.argsort(-boxes[:, -1], kind="stable")]
+
+    # Total volume.
+    volume: float = 0.0
+
+    for k in range(n_points):
+
+        # Limit the following points to the k-th box.
+        limited = _non_dominated(np.minimum(boxes[k], boxes[k+1:]))
+
+        # Add the exclusive volume of the k-th point.
+        volume += float(np.prod(boxes[k])) - _volume_wfg(limited)
+    # _end_for_
+
+    return volume
+# _end_def_
+
+def _volume_monte_carlo(boxes: NDArray, n_samples: int,
+                        rng: Generator) -> float:
+    """
+    Estimates the volume of the union of boxes, by sampling uniformly
+    in the bounding box and counting the dominated samples.
+
+    :param boxes: array of non-dominated box corners with shape (N, D).
+
+    :param n_samples: number of random samples.
+
+    :param rng: random number generator.
+
+    :return: the estimated hypervolume (float).
+    """
+    # Bounding box of the union.
+    upper = boxes.max(axis=0)
+
+    # Number of samples per block (about 50MB of comparisons).
+    n_block = max(1, 50_000_000 // boxes.size)
+
+    # Number of dominated samples.
+    n_hits: int = 0
+
+    for i in range(0, n_samples, n_block):
+
+        # Draw the samples uniformly in the bounding box.
+        samples = rng.uniform(0.0, upper, size=(min(n_block, n_samples - i),
+                                                boxes.shape[1]))
+
+        # A sample is dominated if it lies inside at least one box.
+        n_hits += int(np.sum(np.any(np.all(samples[:, None, :] <= boxes[None, :, :],
+                                           axis=-1), axis=1)))
+    # _end_for_
+
+    return float(np.prod(upper)) * n_hits / n_samples
+# _end_def_
+
+def hypervolume(points: NDArray, ref_point: NDArray, mode: str = "max",
+                method: str = "auto", n_samples: int = 100_000,
+                rng: Optional[Generator] = None) -> float:
+    """
+    Computes the hypervolume of the input points, with respect
+    to the reference point.
+
+    :param points: array of points with shape (N, D).
+
+    :param ref_point: reference point with shape (D,). It should be
+                      dominated by all the points of interest. The
+                      points that do not dominate it are ignored.
+
+    :param mode: "max" (maximize all objective) or
+                 "min" (minimize all objective).
+
+    :param method: "exact" (sweeps or WFG), "monte_carlo" or "auto".
+                   The "auto" uses the exact method for up to three
+                   objectives, or for fronts up to 50 points.
+
+    :param n_samples: number of samples of the Monte Carlo method.
+
+    :param rng: random number generator of the Monte Carlo method.
+
+    :return: the hypervolume (float).
+    """
+    # Sanity check.
+    if method not in ("auto", "exact", "monte_carlo"):
+        raise ValueError("Method must be 'auto', 'exact' or 'monte_carlo'.")
+    # _end_if_
+
+    # Translate the points to boxes.
+    boxes = _non_dominated(_to_boxes(np.asarray(points, dtype=float),
+                                     np.asarray(ref_point, dtype=float), mode))
+
+    # Select the method.
+    if method == "auto":
+        method = "exact" if (boxes.shape[1] <= 3 or
+                             boxes.shape[0] <= 50) else "monte_carlo"
+    # _end_if_
+
+    # Monte Carlo estimation.
+    if method == "monte_carlo" and boxes.shape[0] > 0:
+        return _volume_monte_carlo(boxes, n_samples, rng or default_rng())
+    # _end_if_
+
+    return _volume_wfg(boxes)
+# _end_def_
+
+def hypervolume_contributions(points: NDArray, ref_point: NDArray,
+                              mode: str = "max") -> NDArray:
+    """
+    Computes the exclusive hypervolume contribution of each point, i.e.
+    the hypervolume that is lost if the point is removed from the set.
+    Dominated and duplicate points have zero contribution.
+
+    :param points: array of points with shape (N, D).
+
+    :param ref_point: reference point with shape (D,).
+
+    :param mode: "max" (maximize all objective) or
+                 "min" (minimize all objective).
+
+    :return: array with the contributions, with shape (N,).
+    """
+    # Translate the points to boxes.
+    boxes = _to_boxes(np.asarray(points, dtype=float),
+                      np.asarray(ref_point, dtype=float), mode)
+
+    # Get the dimensions of the boxes.
+    n_points, n_dims = boxes.shape
+
+    # Output array.
+    contrib: NDArray = np.zeros(n_points, dtype=float)
+
+    # Only the unique points on the front contribute.
+    positive = np.flatnonzero(np.all(boxes > 0.0, axis=1))
+
+    # Sanity check.
+    if positive.size == 0:
+        return contrib
+    # _end_if_
+
+    # Points on the front.
+    front = positive[np_pareto_front_index(boxes[positive], rel_eps=0.0,
+                                           exclude_duplicates=False)]
+
+    # Duplicate points do not contribute exclusively.
+    _, inverse, counts = np.unique(boxes[front], axis=0,
+                                   return_inverse=True,
+                                   return_counts=True)
+    single = counts[inverse.ravel()] == 1
+
+    # In 2-D, if there are no dominated points, the exclusive
+    # volume of each point is the rectangle between its two
+    # neighbours on the front.
+    if n_dims == 2 and front.size == positive.size:
+        # Sort in descending f1 (hence ascending f2).
+        order = np.argsort(-boxes[front, 0], kind="stable")
+        f1, f2 = boxes[front[order], 0], boxes[front[order], 1]
+
+        # Get the neighbours (the origin is the boundary).
+        f1_next = np.append(f1[1:], 0.0)
+        f2_prev = np.insert(f2[:-1], 0, 0.0)
+
+        # Store the contributions.
+        contrib[front[order]] = (f1 - f1_next) * (f2 - f2_prev) * single[order]
+        return contrib
+    # _end_if_
+
+    # Total volume of the points.
+    total = _volume_wfg(_non_dominated(boxes))
+
+    # Otherwise leave one out.
+    for k in front[single]:
+        contrib[k] = total - _volume_wfg(_non_dominated(np.delete(boxes, k, axis=0)))
+    # _end_for_
+
+    return contrib
+# _end_def_
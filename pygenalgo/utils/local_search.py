@@ -0,0 +1,480 @@
+"""
+Description:
+
+    Includes a local search stage for memetic (hybrid) genetic algorithms.
+    After the evaluation of each generation, the best individuals (elites)
+    are improved with a few steps of a derivative free local search:
+
+        - coordinate search (probes +/- step along each gene),
+        - pattern search (Hooke and Jeeves: the coordinate probes plus
+          an extrapolation along the last successful move),
+        - Nelder-Mead simplex search.
+
+    The probe points of all the elites are evaluated together in batches
+    (with the evaluation function of the engine, so in parallel if it is
+    enabled, and counted in its function evaluations), within a budget of
+    evaluations per call. The improvements are written back to the elites
+    either in the genome and the fitness (Lamarckian) or only in the fitness
+    (Baldwinian).
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+from typing import (Optional, Callable)
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pygenalgo.genome.chromosome import Chromosome
+
+# Public interface.
+__all__ = ["LocalSearch"]
+
+
+class LocalSearch:
+    """
+    Description:
+        Local search stage that improves the top-k individuals of a
+        (real-coded) population. It is called by the engine with the
+        population and its evaluation function.
+    """
+
+    # Supported methods.
+    _METHODS = ("coordinate", "pattern", "nelder_mead")
+
+    # Object variables.
+    __slots__ = ("_method", "_top_k", "_budget", "_step", "_shrink",
+                 "_min_step", "_lamarckian", "_bounds")
+
+    def __init__(self, method: str = "pattern", top_k: int = 1, budget: int = 50,
+                 step: float = 0.1, shrink: float = 0.5, min_step: float = 1.0e-8,
+                 lamarckian: bool = True, bounds: Optional[tuple] = None) -> None:
+        """
+        Construct a LocalSearch object.
+
+        :param method: (str) "coordinate", "pattern" or "nelder_mead".
+
+        :param top_k: (int) number of the best individuals to improve.
+
+        :param budget: (int) maximum number of function evaluations per call.
+
+        :param step: (float) the initial step size (or simplex size).
+
+        :param shrink: (float) in (0, 1). The step is multiplied with it
+                       when no probe improves the individual.
+
+        :param min_step: (float) the search of an individual stops when
+                         its step is smaller than this value.
+
+        :param lamarckian: (bool) if True the improved genome is written back
+                           to the population, else only its fitness (Baldwinian).
+
+        :param bounds: (optional) tuple (lower, upper) with the bounds of the
+                       genes (scalars or arrays). The probes are clipped.
+        """
+        # Sanity check.
+        if method not in LocalSearch._METHODS:
+            raise ValueError(f"{self.__class__.__name__}: Unknown method {method!r}. "
+                             f"Use one of {LocalSearch._METHODS}.")
+        # _end_if_
+
+        # Sanity check.
+        if int(top_k) < 1 or int(budget) < 1:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Top-k and budget must be positive.")
+        # _end_if_
+
+        # Sanity check.
+        if step <= 0.0 or not 0.0 < shrink < 1.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Step must be positive and shrink in (0, 1).")
+        # _end_if_
+
+        self._method: str = method
+        self._top_k: int = int(top_k)
+        self._budget: int = int(budget)
+        self._step: float = float(step)
+        self._shrink: float = float(shrink)
+        self._min_step: float = float(min_step)
+        self._lamarckian: bool = bool(lamarckian)
+        self._bounds: Optional[tuple] = None if bounds is None else \
+            tuple(np.asarray(b, dtype=float) for b in bounds)
+    # _end_def_
+
+    @property
+    def budget(self) -> int:
+        """
+        Accessor of the evaluation budget (per call).
+
+        :return: the maximum number of function evaluations.
+        """
+        return self._budget
+    # _end_def_
+
+    @property
+    def lamarckian(self) -> bool:
+        """
+        Accessor of the write-back mode.
+
+        :return: True for Lamarckian, False for Baldwinian.
+        """
+        return self._lamarckian
+    # _end_def_
+
+    def __call__(self, population: list[Chromosome], evaluate: Callable,
+                 max_evals: Optional[int] = None) -> tuple[int, bool]:
+        """
+        Improves (in place) the top-k individuals of the population.
+
+        :param population: (list) of evaluated Chromosomes with real genes.
+
+        :param evaluate: (callable) that evaluates a list of Chromosomes and
+                         returns their fitness list and the found solution flag
+                         (e.g. the 'evaluate_fitness' method of the engine).
+
+        :param max_evals: (int) the remaining function evaluations of the run
+                          (e.g. of its f_max_eval). The budget of the call is
+                          limited to it, so the search stops when it is used up.
+
+        :return: the number of improved individuals and the found solution flag.
+        """
+        # Get the budget of the call.
+        budget: int = self._budget if max_evals is None else \
+            min(self._budget, int(max_evals))
+
+        # Check the budget of the run.
+        if budget <= 0:
+            return 0, False
+        # _end_if_
+
+        # Get the elites (only the evaluated individuals).
+        scores = np.array([-np.inf if p.fitness is None else p.fitness
+                           for p in population], dtype=float)
+        elites = np.argsort(-scores, kind="stable")[:self._top_k]
+        elites = elites[np.isfinite(scores[elites])]
+
+        # Sanity check.
+        if elites.size == 0:
+            return 0, False
+        # _end_if_
+
+        # Search state.
+        state = _SearchState(population, elites, scores[elites], evaluate,
+                             budget, self._bounds)
+
+        # Run the search.
+        if self._method == "nelder_mead":
+            self._nelder_mead(state)
+        else:
+            self._coordinate(state, pattern=self._method == "pattern")
+        # _end_if_
+
+        # Write back the improvements.
+        improved = np.flatnonzero(state.f_best > scores[elites])
+
+        for k in improved:
+            if self._lamarckian:
+                population[elites[k]] = state.best[k]
+            else:
+                population[elites[k]].fitness = float(state.f_best[k])
+            # _end_if_
+        # _end_for_
+
+        return improved.size, state.found
+    # _end_def_
+
+    def _coordinate(self, state: "_SearchState", pattern: bool) -> None:
+        """
+        Coordinate (or pattern) search. At each iteration the active elites
+        probe +/- step along each gene (and along their last move, for the
+        pattern search). The best probe is accepted if it improves, else
+        the step shrinks.
+
+        :param state: the search state.
+
+        :param pattern: (bool) if True add the pattern (extrapolation) probes.
+
+        :return: None.
+        """
+        # Get the dimensions.
+        n_elites, n_genes = state.x.shape
+
+        # Unit moves along each gene (positive and negative).
+        moves = np.vstack((np.eye(n_genes), -np.eye(n_genes)))
+
+        # Step size and last move of each elite.
+        step = np.full(n_elites, self._step)
+        last_move = np.zeros_like(state.x)
+
+        while not state.found:
+            # Elites that are still searching.
+            active = np.flatnonzero(step >= self._min_step)
+
+            # Number of probes of each elite.
+            n_probes = moves.shape[0] + int(pattern)
+
+            # Keep only the elites that fit in the budget.
+            active = active[:state.budget // n_probes]
+
+            if active.size == 0:
+                break
+            # _end_if_
+
+            # Coordinate probes: (A, 2D, D).
+            probes = state.x[active, None, :] + step[active, None, None] * moves[None]
+
+            # Pattern probes (extrapolate the last move).
+            if pattern:
+                probes = np.concatenate((probes, (state.x[active] + last_move[active])[:, None, :]),
+                                        axis=1)
+            # _end_if_
+
+            # Evaluate all the probes.
+            owners = np.repeat(active, n_probes)
+            f_probes, chromosomes = state.evaluate(owners, probes.reshape(-1, n_genes))
+
+            # Best probe of each active elite.
+            f_probes = f_probes.reshape(active.size, n_probes)
+            best = np.argmax(f_probes, axis=1)
+
+            for a, k in enumerate(active):
+                # Accept the improvement.
+                if f_probes[a, best[a]] > state.f_best[k]:
+                    last_move[k] = probes[a, best[a]] - state.x[k]
+                    state.accept(k, probes[a, best[a]], f_probes[a, best[a]],
+                                 chromosomes[a * n_probes + best[a]])
+                else:
+                    # Shrink the step and forget the pattern.
+                    step[k] *= self._shrink
+                    last_move[k] = 0.0
+                # _end_if_
+            # _end_for_
+        # _end_while_
+    # _end_def_
+
+    def _nelder_mead(self, state: "_SearchState") -> None:
+        """
+        Nelder-Mead simplex search (maximization). Each elite has its own
+        simplex and each stage (reflection, expansion, contraction, shrink)
+        is evaluated as one batch for all the elites that need it.
+
+        :param state: the search state.
+
+        :return: None.
+        """
+        # Get the dimensions.
+        n_elites, n_genes = state.x.shape
+
+        # Check the budget for the initial simplexes.
+        n_init: int = min(n_elites, state.budget // n_genes)
+
+        if n_init == 0:
+            return
+        # _end_if_
+
+        # Elites that are searching.
+        active = np.arange(n_init)
+
+        # Initial simplexes: (A, D+1, D).
+        simplex = np.repeat(state.x[active, None, :], n_genes + 1, axis=1)
+        simplex[:, 1:, :] += self._step * np.eye(n_genes)[None]
+
+        # Evaluate the new vertices.
+        f_simplex = np.empty((n_init, n_genes + 1))
+        f_simplex[:, 0] = state.f_best[active]
+
+        f_new, _ = state.evaluate(np.repeat(active, n_genes),
+                                  simplex[:, 1:, :].reshape(-1, n_genes), keep=True)
+        f_simplex[:, 1:] = f_new.reshape(n_init, n_genes)
+
+        while not state.found:
+            # Stop the collapsed simplexes.
+            size = np.max(np.abs(simplex - simplex[:, :1, :]), axis=(1, 2))
+            running = np.flatnonzero(size >= self._min_step)
+
+            # One probe (at least) for each simplex.
+            running = running[:state.budget]
+
+            if running.size == 0:
+                break
+            # _end_if_
+
+            # Sort the vertices in descending fitness.
+            order = np.argsort(-f_simplex[running], axis=1, kind="stable")
+            simplex[running] = np.take_along_axis(simplex[running], order[:, :, None], axis=1)
+            f_simplex[running] = np.take_along_axis(f_simplex[running], order, axis=1)
+
+            # Centroid of all the vertices but the worst.
+            centroid = simplex[running, :-1, :].mean(axis=1)
+            worst = simplex[running, -1, :]
+
+            # REFLECTION.
+            x_r = 2.0 * centroid - worst
+            f_r, _ = state.evaluate(active[running], x_r, keep=True)
+
+            # Outcomes of the reflection.
+            is_best = f_r > f_simplex[running, 0]
+            is_good = ~is_best & (f_r > f_simplex[running, -2])
+            is_bad = ~is_best & ~is_good
+
+            # Accept the good reflections.
+            simplex[running[is_good], -1] = x_r[is_good]
+            f_simplex[running[is_good], -1] = f_r[is_good]
+
+            # EXPANSION (of the best reflections).
+            sel = np.flatnonzero(is_best)[:state.budget]
+            if sel.size:
+                x_e = 3.0 * centroid[sel] - 2.0 * worst[sel]
+                f_e, _ = state.evaluate(active[running[sel]], x_e, keep=True)
+
+                # Keep the best of the reflection and the expansion.
+                use_e = f_e > f_r[sel]
+                simplex[running[sel], -1] = np.where(use_e[:, None], x_e, x_r[sel])
+                f_simplex[running[sel], -1] = np.where(use_e, f_e, f_r[sel])
+            # _end_if_
+
+            # CONTRACTION (inside) of the bad reflections.
+            sel = np.flatnonzero(is_bad)[:state.budget]
+            if sel.size:
+                x_c = 0.5 * (centroid[sel] + worst[sel])
+                f_c, _ = state.evaluate(active[running[sel]], x_c, keep=True)
+
+                # Accept the contractions that improve the worst vertex.
+                ok = f_c > f_simplex[running[sel], -1]
+                simplex[running[sel[ok]], -1] = x_c[ok]
+                f_simplex[running[sel[ok]], -1] = f_c[ok]
+
+                # SHRINK the rest towards their best vertex.
+                for j in running[sel[~ok]]:
+                    # Check the budget.
+                    if state.budget < n_genes:
+                        return
+                    # _end_if_
+
+                    simplex[j, 1:] = 0.5 * (simplex[j, 1:] + simplex[j, :1])
+                    f_new, _ = state.evaluate(np.full(n_genes, active[j]),
+                                              simplex[j, 1:], keep=True)
+                    f_simplex[j, 1:] = f_new
+                # _end_for_
+            # _end_if_
+        # _end_while_
+    # _end_def_
+
+# _end_class_
+
+
+class _SearchState:
+    """
+    Description:
+        Keeps the current best point (and its Chromosome) of each elite,
+        the remaining budget and creates / evaluates the probe points.
+    """
+
+    __slots__ = ("templates", "x", "f_best", "best", "budget",
+                 "found", "_evaluate", "_bounds")
+
+    def __init__(self, population: list[Chromosome], elites: NDArray,
+                 f_elites: NDArray, evaluate: Callable, budget: int,
+                 bounds: Optional[tuple]) -> None:
+        """
+        Construct the state of the search.
+
+        :param population: (list) of Chromosomes.
+
+        :param elites: (K,) array with the indices of the elites.
+
+        :param f_elites: (K,) array with their fitness values.
+
+        :param evaluate: (callable) the evaluation function.
+
+        :param budget: (int) the number of function evaluations.
+
+        :param bounds: (optional) tuple (lower, upper) of the genes.
+        """
+        self.templates: list[Chromosome] = [population[i] for i in elites]
+        self.x: NDArray = np.array([p.values() for p in self.templates], dtype=float)
+        self.f_best: NDArray = np.array(f_elites, dtype=float)
+        self.best: list[Chromosome] = list(self.templates)
+        self.budget: int = budget
+        self.found: bool = False
+        self._evaluate: Callable = evaluate
+        self._bounds: Optional[tuple] = bounds
+    # _end_def_
+
+    def evaluate(self, owners: NDArray, points: NDArray,
+                 keep: bool = False) -> tuple[NDArray, list[Chromosome]]:
+        """
+        Evaluates the probe points (as clones of their elites) in one batch.
+
+        :param owners: (M,) array with the elite of each point.
+
+        :param points: (M, D) array with the probe points. They are
+                       clipped (in place) in the bounds.
+
+        :param keep: (bool) if True, the probes that improve their
+                     elites are accepted directly.
+
+        :return: the (M,) fitness array and the probe Chromosomes.
+        """
+        # Clip the points in the bounds.
+        if self._bounds is not None:
+            np.clip(points, self._bounds[0], self._bounds[1], out=points)
+        # _end_if_
+
+        # Create the probe Chromosomes.
+        probes: list[Chromosome] = []
+
+        for k, row in zip(owners, points.tolist()):
+            # Copy the elite.
+            child = self.templates[k].clone()
+
+            # Set the new values.
+            for gene, value in zip(child.genome, row):
+                gene.value = value
+            # _end_for_
+
+            child.invalidate_fitness()
+            probes.append(child)
+        # _end_for_
+
+        # Evaluate the batch.
+        fit_list, found = self._evaluate(probes)
+
+        # Update the budget and the flag.
+        self.budget -= len(probes)
+        self.found = self.found or found
+
+        # Convert to an array.
+        f_probes = np.array([-np.inf if f is None else f for f in fit_list],
+                            dtype=float)
+
+        # Accept directly the improvements.
+        if keep:
+            for m, k in enumerate(owners):
+                if f_probes[m] > self.f_best[k]:
+                    self.accept(k, points[m], f_probes[m], probes[m])
+            # _end_for_
+        # _end_if_
+
+        return f_probes, probes
+    # _end_def_
+
+    def accept(self, k: int, point: NDArray, fitness: float,
+               chromosome: Chromosome) -> None:
+        """
+        Accept a new best point for the k-th elite.
+
+        :return: None.
+        """
+        self.x[k] = point
+        self.f_best[k] = fitness
+        self.best[k] = chromosome
+    # _end_def_
+
+# _end_class_
@@ -0,0 +1,565 @@
+"""
+Description:
+
+    Includes an external archive of non-dominated solutions, that can be
+    used to keep track of the best solutions found during a multi-objective
+    optimization run (even if they are later lost from the population).
+
+    The archive is indexed with an ND-tree (Jaszkiewicz and Lust 2018). Each
+    node of the tree keeps the ideal and nadir points of its subtree, so that
+    whole subtrees can be skipped (or accepted, or discarded) with only two
+    comparisons. This makes the dominance checks on insertion sub-linear in
+    the size of the archive (on average).
+
+    If the archive exceeds its maximum size it is truncated by removing the
+    solutions with the smallest crowding distance (one at a time).
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.utilities import crowding_distance
+
+# Public interface.
+__all__ = ["ParetoArchive"]
+
+
+class _NDNode:
+    """
+    Description:
+        Node of the ND-tree. A leaf stores the points (and their items),
+        while an internal node stores its children. Both keep the ideal
+        (best) and nadir (worst) values of all the points in the subtree
+        (maximization convention). After removals these bounds are kept
+        as they are, since loose bounds are still valid.
+    """
+
+    __slots__ = ("points", "items", "children", "ideal", "nadir")
+
+    def __init__(self, points: NDArray, items: list) -> None:
+        """
+        Construct a leaf node with the given points.
+
+        :param points: array of points with shape (N, D).
+
+        :param items: list with the items of the points.
+        """
+        self.points = points
+        self.items = items
+        self.children: Optional[list] = None
+        self.ideal: NDArray = points.max(axis=0)
+        self.nadir: NDArray = points.min(axis=0)
+    # _end_def_
+
+    @property
+    def is_leaf(self) -> bool:
+        """
+        Check if the node is a leaf.
+
+        :return: True if the node has no children.
+        """
+        return self.children is None
+    # _end_def_
+
+    @property
+    def is_empty(self) -> bool:
+        """
+        Check if the subtree of the node has no points.
+
+        :return: True if the node is empty.
+        """
+        if self.is_leaf:
+            return self.points.shape[0] == 0
+        return not self.children
+    # _end_def_
+
+    def midpoint(self) -> NDArray:
+        """
+        Get the middle point of the bounds of the node.
+
+        :return: the midpoint (ideal + nadir) / 2.
+        """
+        return 0.5 * (self.ideal + self.nadir)
+    # _end_def_
+
+# _end_class_
+
+
+class ParetoArchive:
+    """
+    Description:
+        External archive of mutually non-dominated solutions (maximization
+        convention), indexed by an ND-tree. New solutions are inserted only
+        if they are not (weakly) dominated by the archive, and the solutions
+        they dominate are removed.
+    """
+
+    __slots__ = ("_root", "_size", "_max_size", "_max_leaf", "_n_children")
+
+    def __init__(self, max_size: Optional[int] = None, max_leaf: int = 20,
+                 n_children: Optional[int] = None) -> None:
+        """
+        Construct a 'ParetoArchive' object.
+
+        :param max_size: (int) maximum number of solutions. If it is None
+                         the archive is unbounded.
+
+        :param max_leaf: (int) maximum number of points in a leaf node,
+                         before it is split.
+
+        :param n_children: (int) number of children when a leaf is split.
+                           If it is None it is set to number of objectives
+                           plus one.
+        """
+        # Check the maximum size.
+        if max_size is not None and (not isinstance(max_size, int) or max_size <= 1):
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Max size must be an integer greater than one.")
+        # _end_if_
+
+        # Check the leaf size.
+        if not isinstance(max_leaf, int) or max_leaf <= 1:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Max leaf must be an integer greater than one.")
+        # _end_if_
+
+        # Check the number of children.
+        if n_children is not None and (not isinstance(n_children, int) or n_children <= 1):
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Number of children must be an integer greater than one.")
+        # _end_if_
+
+        # Root of the ND-tree.
+        self._root: Optional[_NDNode] = None
+
+        # Number of stored solutions.
+        self._size: int = 0
+
+        # Store the parameters.
+        self._max_size = max_size
+        self._max_leaf = max_leaf
+        self._n_children = n_children
+    # _end_def_
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """
+        Accessor method that returns the maximum size of the archive.
+
+        :return: the maximum size (or None if unbounded).
+        """
+        return self._max_size
+    # _end_def_
+
+    def __len__(self) -> int:
+        """
+        Get the number of stored solutions.
+
+        :return: the size of the archive.
+        """
+        return self._size
+    # _end_def_
+
+    def clear(self) -> None:
+        """
+        Removes all the solutions from the archive.
+
+        :return: None.
+        """
+        self._root = None
+        self._size = 0
+    # _end_def_
+
+    def _collect(self, node: _NDNode, points: list, items: list) -> None:
+        """
+        Collects recursively all the points (and items) of a subtree.
+
+        :param node: the root of the subtree.
+
+        :param points: (list) output list of point arrays.
+
+        :param items: (list) output list of items.
+
+        :return: None.
+        """
+        if node.is_leaf:
+            points.append(node.points)
+            items.extend(node.items)
+        else:
+            for child in node.children:
+                self._collect(child, points, items)
+        # _end_if_
+    # _end_def_
+
+    def solutions(self) -> tuple[NDArray, list]:
+        """
+        Get all the solutions that are stored in the archive.
+
+        :return: the array of fitness values with shape (N, D) and the
+                 list of the corresponding items.
+        """
+        # Sanity check.
+        if self._root is None:
+            return np.empty((0, 0), dtype=float), []
+        # _end_if_
+
+        # Output lists.
+        points, items = [], []
+
+        # Collect all the points.
+        self._collect(self._root, points, items)
+
+        return np.vstack(points), items
+    # _end_def_
+
+    def _update_node(self, node: _NDNode, y: NDArray) -> tuple[bool, int]:
+        """
+        Checks recursively if the new point is dominated by any point of
+        the subtree and removes the points that are dominated by it. Since
+        the archive is mutually non-dominated only one of the two can occur.
+
+        :param node: the root of the subtree.
+
+        :param y: the new point with shape (D,).
+
+        :return: (False, 0) if the point is rejected, else True with the
+                 number of removed points.
+        """
+        # Every point in the node is no worse than 'y'.
+        if np.all(node.nadir >= y):
+            return False, 0
+        # _end_if_
+
+        # The point 'y' is no worse than every point in the node.
+        if np.all(y >= node.ideal):
+            # Get the number of the removed points.
+            n_removed = self._count(node)
+
+            # Empty the whole subtree.
+            node.points = node.points[:0] if node.is_leaf else np.empty((0, y.size))
+            node.items = []
+            node.children = None
+            return True, n_removed
+        # _end_if_
+
+        # The point is incomparable to the whole subtree.
+        if not (np.all(y >= node.nadir) or np.all(node.ideal >= y)):
+            return True, 0
+        # _end_if_
+
+        # Check the points of the leaf one by one.
+        if node.is_leaf:
+            # Check if any of the points is no worse than 'y'.
+            if np.any(np.all(node.points >= y, axis=1)):
+                return False, 0
+            # _end_if_
+
+            # Find the points dominated by 'y'.
+            dominated = np.all(y >= node.points, axis=1)
+
+            # Remove them.
+            if dominated.any():
+                node.points = node.points[~dominated]
+                node.items = [x for x, d in zip(node.items, dominated) if not d]
+            # _end_if_
+
+            return True, int(dominated.sum())
+        # _end_if_
+
+        # Number of removed points.
+        n_removed: int = 0
+
+        # Check the children recursively.
+        for child in node.children:
+            accepted, n_child = self._update_node(child, y)
+
+            # Stop if the point is rejected.
+            if not accepted:
+                return False, 0
+            # _end_if_
+
+            n_removed += n_child
+        # _end_for_
+
+        # Discard the empty children.
+        if n_removed:
+            node.children = [c for c in node.children if not c.is_empty]
+        # _end_if_
+
+        return True, n_removed
+    # _end_def_
+
+    def _count(self, node: _NDNode) -> int:
+        """
+        Counts recursively the points of a subtree.
+
+        :param node: the root of the subtree.
+
+        :return: the number of points.
+        """
+        if node.is_leaf:
+            return node.points.shape[0]
+        return sum(self._count(child) for child in node.children)
+    # _end_def_
+
+    def _split(self, node: _NDNode) -> None:
+        """
+        Splits a leaf node into children. The seeds of the children are
+        chosen one at a time as the points that are farthest from the
+        seeds chosen so far (starting from the point with the largest
+        average distance to the others) and the rest of the points are
+        assigned to the closest seed.
+
+        :param node: the leaf node to split.
+
+        :return: None.
+        """
+        # Get the points of the leaf.
+        points = node.points
+
+        # Number of children.
+        n_children = min(self._n_children or points.shape[1] + 1,
+                         points.shape[0])
+
+        # Pairwise distances of the points.
+        dist = np.linalg.norm(points[:, None, :] - points[None, :, :], axis=-1)
+
+        # First seed with the largest average distance.
+        seeds = [int(np.argmax(dist.mean(axis=1)))]
+
+        # Next seeds as far as possible from the previous.
+        while len(seeds) < n_children:
+            seeds.append(int(np.argmax(dist[seeds].min(axis=0))))
+        # _end_while_
+
+        # Assign each point to the closest seed.
+        labels = np.argmin(dist[seeds], axis=0)
+
+        # Create the children.
+        node.children = [
+            _NDNode(points[labels == k],
+                    [x for x, l in zip(node.items, labels) if l == k])
+            for k in range(n_children)
+        ]
+
+        # Clear the points of the (now internal) node.
+        node.points = None
+        node.items = None
+    # _end_def_
+
+    def _insert(self, node: _NDNode, y: NDArray, item) -> None:
+        """
+        Inserts the new point in the subtree, following the child with
+        the closest midpoint down to a leaf.
+
+        :param node: the root of the subtree.
+
+        :param y: the new point with shape (D,).
+
+        :param item: the item of the new point.
+
+        :return: None.
+        """
+        while True:
+            # Update the bounds of the node.
+            np.maximum(node.ideal, y, out=node.ideal)
+            np.minimum(node.nadir, y, out=node.nadir)
+
+            # Add the point to the leaf.
+            if node.is_leaf:
+                node.points = np.vstack([node.points, y])
+                node.items.append(item)
+
+                # Split the leaf if it is full.
+                if node.points.shape[0] > self._max_leaf:
+                    self._split(node)
+                # _end_if_
+
+                return
+            # _end_if_
+
+            # Follow the closest child.
+            node = min(node.children,
+                       key=lambda c: float(np.sum((c.midpoint() - y) ** 2)))
+        # _end_while_
+    # _end_def_
+
+    def _remove(self, node: _NDNode, y: NDArray) -> bool:
+        """
+        Removes recursively the (unique) point that is equal to 'y'.
+
+        :param node: the root of the subtree.
+
+        :param y: the point to remove with shape (D,).
+
+        :return: True if the point was found and removed.
+        """
+        # The point cannot be in this subtree.
+        if np.any(y > node.ideal) or np.any(y < node.nadir):
+            return False
+        # _end_if_
+
+        # Look for the point in the leaf.
+        if node.is_leaf:
+            found = np.flatnonzero(np.all(node.points == y, axis=1))
+
+            # Remove it (if found).
+            if found.size:
+                node.points = np.delete(node.points, found[0], axis=0)
+                del node.items[found[0]]
+                return True
+            # _end_if_
+
+            return False
+        # _end_if_
+
+        # Look for the point in the children.
+        for i, child in enumerate(node.children):
+            if self._remove(child, y):
+                # Discard the child if it is empty.
+                if child.is_empty:
+                    del node.children[i]
+                # _end_if_
+
+                return True
+            # _end_if_
+        # _end_for_
+
+        return False
+    # _end_def_
+
+    def _truncate(self) -> None:
+        """
+        Removes the most crowded solutions, one at a time, until the
+        archive does not exceed its maximum size.
+
+        :return: None.
+        """
+        while self._max_size is not None and self._size > self._max_size:
+            # Get the current solutions.
+            points, _ = self.solutions()
+
+            # Remove the one with the smallest crowding distance.
+            self._remove(self._root, points[np.argmin(crowding_distance(points))])
+            self._size -= 1
+        # _end_while_
+    # _end_def_
+
+    def update(self, fitness, item=None, truncate: bool = True) -> bool:
+        """
+        Inserts a new solution in the archive, if it is not (weakly)
+        dominated by any of the stored solutions. The solutions that
+        are dominated by the new one are removed.
+
+        :param fitness: the fitness value(s) of the new solution.
+
+        :param item: (optional) an object to be stored with the solution.
+
+        :param truncate: (bool) if True the archive is truncated after the
+                         insertion, if it exceeds its maximum size.
+
+        :return: True if the solution was inserted.
+        """
+        # Make sure the fitness is an array of floats.
+        y: NDArray = np.array(fitness, dtype=float).ravel()
+
+        # Create the root with the first point.
+        if self._root is None or self._root.is_empty:
+            self._root = _NDNode(y[None, :], [item])
+            self._size = 1
+            return True
+        # _end_if_
+
+        # Sanity check.
+        if y.size != self._root.ideal.size:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Fitness has {y.size} objectives, expected "
+                             f"{self._root.ideal.size}.")
+        # _end_if_
+
+        # Check the dominance (and remove the dominated points).
+        accepted, n_removed = self._update_node(self._root, y)
+
+        # Exit if the solution is rejected.
+        if not accepted:
+            return False
+        # _end_if_
+
+        # Update the size.
+        self._size -= n_removed
+
+        # Restart from a new root if the archive was emptied.
+        if self._root.is_empty:
+            self._root = _NDNode(y[None, :], [item])
+            self._size = 1
+            return True
+        # _end_if_
+
+        # Insert the new point.
+        self._insert(self._root, y, item)
+        self._size += 1
+
+        # Check the size.
+        if truncate:
+            self._truncate()
+        # _end_if_
+
+        return True
+    # _end_def_
+
+    def update_population(self, population: list[Chromosome]) -> int:
+        """
+        Inserts the (evaluated) chromosomes of a population in the archive.
+        A copy of each accepted chromosome is stored as the item, so that
+        later changes to the population do not affect the archive. The
+        truncation (if needed) is done once, at the end.
+
+        :param population: (list) of chromosomes.
+
+        :return: (int) the number of inserted chromosomes.
+        """
+        # Number of inserted chromosomes.
+        n_inserted: int = 0
+
+        for p in population:
+
+            # Skip the missing values (e.g. cancelled evaluations).
+            if p.fitness is None:
+                continue
+            # _end_if_
+
+            # Insert the chromosome (without truncation).
+            if self.update(p.fitness, p.clone(), truncate=False):
+                n_inserted += 1
+            # _end_if_
+        # _end_for_
+
+        # Truncate once.
+        self._truncate()
+
+        return n_inserted
+    # _end_def_
+
+    def __repr__(self) -> str:
+        """
+        Repr operator is called when a string representation
+        is needed that can be evaluated.
+
+        :return: ParetoArchive(max_size, max_leaf, n_children).
+        """
+        return (f"{self.__class__.__name__}(max_size={self._max_size}, "
+                f"max_leaf={self._max_leaf}, n_children={self._n_children})")
+    # _end_def_
+
+# _end_class_
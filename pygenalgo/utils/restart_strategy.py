@@ -0,0 +1,219 @@
+"""
+Description:
+
+    Includes a restart strategy for the genetic algorithms. When the search
+    stagnates (the best fitness has not improved in the last 'window' epochs,
+    or the population has lost its diversity), the population is replaced by
+    a new random one, optionally larger (IPOP-style growth), which is seeded
+    with the best chromosomes found in all the previous restarts (the elite
+    archive). All the restarts share the same budget of epochs and function
+    evaluations of the run, and (optionally) a time budget.
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+from math import ceil
+from operator import attrgetter
+from typing import Optional
+
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.auxiliary import average_hamming_distance
+
+# Public interface.
+__all__ = ["RestartStrategy"]
+
+
+class RestartStrategy:
+    """
+    Description:
+        Detects the stagnation of a run and creates the restarted populations.
+    """
+
+    # Object variables.
+    __slots__ = ("_window", "_tol", "_min_diversity", "_pop_growth", "_max_pop_size",
+                 "_n_elites", "_max_restarts", "_max_time", "_archive")
+
+    def __init__(self, window: int = 20, tol: float = 0.0,
+                 min_diversity: Optional[float] = None, pop_growth: float = 2.0,
+                 max_pop_size: Optional[int] = None, n_elites: int = 1,
+                 max_restarts: Optional[int] = None,
+                 max_time: Optional[float] = None) -> None:
+        """
+        Construct a RestartStrategy object.
+
+        :param window: (int) number of epochs without improvement of the
+                       best fitness (more than 'tol') to declare stagnation.
+
+        :param tol: (float) the minimum improvement of the best fitness.
+
+        :param min_diversity: (float) if set, the stagnation is also declared
+                              when the (normalized) average Hamming distance of
+                              the population drops below this value.
+
+        :param pop_growth: (float) the population size is multiplied with this
+                           factor at each restart (1.0 keeps the same size).
+
+        :param max_pop_size: (int) upper limit of the population size.
+
+        :param n_elites: (int) number of the best chromosomes in the archive,
+                         which are copied in each restarted population.
+
+        :param max_restarts: (int) maximum number of restarts (None: no limit).
+
+        :param max_time: (float) time budget of the run (in seconds). No more
+                         restarts take place and the run stops when it ends.
+        """
+        # Sanity check.
+        if int(window) < 1 or int(n_elites) < 0:
+            raise ValueError(f"{self.__class__.__name__}: Window must be "
+                             f"positive and elites non-negative.")
+        # _end_if_
+
+        # Sanity check.
+        if pop_growth < 1.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Population growth must be at least 1.0.")
+        # _end_if_
+
+        self._window: int = int(window)
+        self._tol: float = float(tol)
+        self._min_diversity: Optional[float] = min_diversity
+        self._pop_growth: float = float(pop_growth)
+        self._max_pop_size: Optional[int] = max_pop_size
+        self._n_elites: int = int(n_elites)
+        self._max_restarts: Optional[int] = max_restarts
+        self._max_time: Optional[float] = max_time
+
+        # The best chromosomes of all the restarts.
+        self._archive: list[Chromosome] = []
+    # _end_def_
+
+    @property
+    def archive(self) -> list[Chromosome]:
+        """
+        Accessor of the elite archive.
+
+        :return: the list of the best chromosomes (in descending fitness).
+        """
+        return self._archive
+    # _end_def_
+
+    @property
+    def max_time(self) -> Optional[float]:
+        """
+        Accessor of the time budget.
+
+        :return: the time budget in seconds (or None).
+        """
+        return self._max_time
+    # _end_def_
+
+    def reset(self) -> None:
+        """
+        Clears the elite archive (at the start of a new run).
+
+        :return: None.
+        """
+        self._archive.clear()
+    # _end_def_
+
+    def is_stagnant(self, best_history: list[float],
+                    population: list[Chromosome]) -> bool:
+        """
+        Checks if the current search has stagnated.
+
+        :param best_history: (list) the best fitness of each epoch, since
+                             the last restart.
+
+        :param population: (list) the current population.
+
+        :return: True if the search has stagnated.
+        """
+        # Check the improvement of the best fitness in the window.
+        if len(best_history) > self._window and \
+                max(best_history[-self._window:]) <= \
+                best_history[-self._window - 1] + self._tol:
+            return True
+        # _end_if_
+
+        # Check the diversity of the population.
+        return self._min_diversity is not None and \
+            average_hamming_distance(population) < self._min_diversity
+    # _end_def_
+
+    def allows_restart(self, n_restarts: int, elapsed_time: float) -> bool:
+        """
+        Checks the limits of the restarts.
+
+        :param n_restarts: (int) the number of restarts so far.
+
+        :param elapsed_time: (float) the elapsed time of the run (in seconds).
+
+        :return: True if one more restart is allowed.
+        """
+        return (self._max_restarts is None or n_restarts < self._max_restarts) and \
+            not self.time_is_up(elapsed_time)
+    # _end_def_
+
+    def time_is_up(self, elapsed_time: float) -> bool:
+        """
+        Checks the time budget.
+
+        :param elapsed_time: (float) the elapsed time of the run (in seconds).
+
+        :return: True if the time budget is exhausted.
+        """
+        return self._max_time is not None and elapsed_time >= self._max_time
+    # _end_def_
+
+    def new_population(self, population: list[Chromosome]) -> list[Chromosome]:
+        """
+        Updates the elite archive with the input population and creates the
+        new (possibly larger) random population, seeded with the elites. The
+        elites keep their fitness values; the rest of the chromosomes must be
+        evaluated.
+
+        :param population: (list) the stagnated population.
+
+        :return: the new population.
+        """
+        # Update the archive with the best chromosomes.
+        self._archive = sorted(self._archive +
+                               [p for p in population if p.fitness is not None],
+                               key=attrgetter("fitness"), reverse=True)[:self._n_elites]
+
+        # Get the size of the new population.
+        pop_size: int = len(population)
+        new_size: int = int(ceil(pop_size * self._pop_growth))
+
+        if self._max_pop_size is not None:
+            new_size = max(pop_size, min(new_size, int(self._max_pop_size)))
+        # _end_if_
+
+        # Copy the elites.
+        new_population: list[Chromosome] = [p.clone() for p in self._archive]
+
+        # Fill the rest with random chromosomes.
+        for k in range(len(new_population), new_size):
+            # Copy the structure of a chromosome.
+            p_new = population[k % pop_size].clone()
+
+            # Randomize all its genes.
+            for gene in p_new.genome:
+                gene.random()
+            # _end_for_
+
+            p_new.invalidate_fitness()
+            new_population.append(p_new)
+        # _end_for_
+
+        return new_population
+    # _end_def_
+
+# _end_class_
@@ -0,0 +1,522 @@
+"""
+Description:
+
+    Includes a pool of persistent (long-lived) external simulator processes,
+    that can be used as a fitness function in all the GA engines. Instead of
+    paying the start-up cost of a new process for every chromosome, the pool
+    keeps 'n_procs' subprocesses alive and talks to them through their pipes
+    using a simple line protocol:
+
+        - request:  one line with the encoded genome (default: gene values
+                    separated by white spaces),
+        - response: one line with the objective value(s) (default: floats
+                    separated by white spaces).
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+import subprocess
+from threading import Thread, Lock
+from queue import Queue, Empty
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence
+
+from pygenalgo.engines import logger
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.utilities import (FitnessResult, unpack_fitness,
+                                       _to_fitness)
+
+# Public interface.
+__all__ = ["SimulatorPool"]
+
+
+def _default_encoder(individual: Chromosome) -> str:
+    """
+    Encodes the genome of a chromosome in a single line
+    with the gene values separated by white spaces.
+
+    :param individual: (Chromosome) to encode.
+
+    :return: (str) the encoded line.
+    """
+    return " ".join(str(v) for v in individual.values())
+# _end_def_
+
+def _default_decoder(line: str):
+    """
+    Decodes a response line with one or more float values
+    separated by white spaces.
+
+    :param line: (str) the response of the simulator.
+
+    :return: float or tuple[float, ...].
+    """
+    # Convert all the tokens to floats.
+    values = tuple(float(x) for x in line.split())
+
+    # Avoid single element tuples.
+    return values[0] if len(values) == 1 else values
+# _end_def_
+
+
+class _SimulatorProcess:
+    """
+    Description:
+
+        Wraps a single external simulator subprocess. A reader thread pushes the
+        lines of the simulator's stdout in a queue, so that each request can be
+        waited with a timeout (this works on every OS, unlike select on pipes).
+    """
+
+    # Object variables.
+    __slots__ = ("_command", "_proc", "_lines")
+
+    def __init__(self, command: Sequence[str]) -> None:
+        """
+        Initialize (and start) a simulator process.
+
+        :param command: the command (list of str) that starts the simulator.
+        """
+        # Store the command.
+        self._command: list[str] = list(command)
+
+        # Place holders.
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: Optional[Queue] = None
+
+        # Start the process.
+        self.start()
+    # _end_def_
+
+    @staticmethod
+    def _read_lines(stream, lines: Queue) -> None:
+        """
+        Reads continuously the output stream of the process and
+        puts each line in the queue. 'None' is used to signal the
+        end of the stream (e.g. when the process has died).
+
+        :param stream: stdout of the process.
+
+        :param lines: (Queue) to store the lines.
+
+        :return: None.
+        """
+        for line in stream:
+            lines.put(line)
+        # _end_for_
+
+        # Signal the end of the stream.
+        lines.put(None)
+    # _end_def_
+
+    def start(self) -> None:
+        """
+        Starts the subprocess along with its reader thread.
+
+        :return: None.
+        """
+        # Open the process with text pipes (line buffered).
+        self._proc = subprocess.Popen(self._command, stdin=subprocess.PIPE,
+                                      stdout=subprocess.PIPE, text=True,
+                                      bufsize=1)
+        # Create a new queue for the output lines.
+        self._lines = Queue()
+
+        # Start the reader (daemon) thread.
+        Thread(target=self._read_lines, args=(self._proc.stdout, self._lines),
+               daemon=True).start()
+    # _end_def_
+
+    def stop(self) -> None:
+        """
+        Stops (kills if needed) the subprocess.
+
+        :return: None.
+        """
+        # Check if the process exists.
+        if self._proc is None:
+            return
+        # _end_if_
+
+        # Closing the stdin asks the simulator to exit.
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        # _end_try_
+
+        # Give it a moment to exit, otherwise kill it.
+        try:
+            self._proc.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        # _end_try_
+
+        # Reset the reference.
+        self._proc = None
+    # _end_def_
+
+    def restart(self) -> None:
+        """
+        Kills the current subprocess and starts a new one.
+
+        :return: None.
+        """
+        # Kill immediately the (possibly hung) process.
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+        # _end_if_
+
+        # Start a new one.
+        self.start()
+    # _end_def_
+
+    def request(self, line: str, timeout: Optional[float] = None) -> str:
+        """
+        Sends one line to the simulator and waits for its response.
+
+        :param line: (str) the encoded genome (without new line).
+
+        :param timeout: (float) maximum waiting time in seconds.
+
+        :return: (str) the response line.
+        """
+        # Send the request.
+        self._proc.stdin.write(line + "\n")
+        self._proc.stdin.flush()
+
+        # Wait for the response.
+        try:
+            response = self._lines.get(timeout=timeout)
+        except Empty as e:
+            raise TimeoutError(f"Simulator did not respond in {timeout} seconds.") from e
+        # _end_try_
+
+        # Check if the process has died.
+        if response is None:
+            raise EOFError(f"Simulator exited with code {self._proc.poll()}.")
+        # _end_if_
+
+        return response
+    # _end_def_
+
+# _end_class_
+
+
+class SimulatorPool:
+    """
+    Description:
+
+        Keeps 'n_procs' long-lived external simulator processes and multiplexes
+        the chromosomes of a whole generation across them. It can be passed as
+        the fitness function (fit_func) of any GA engine. The engines detect
+        the 'evaluate_batch' method and send to it the whole batch at once.
+
+        Hung simulators (no response after 'timeout' seconds) and killed ones
+        are restarted and the request is retried 'max_retries' times, before
+        the 'penalty' value is assigned to the chromosome.
+    """
+
+    # Object variables.
+    __slots__ = ("_command", "_n_procs", "_encoder", "_decoder", "_minimize",
+                 "_timeout", "_max_retries", "_penalty", "_idle", "_procs",
+                 "_executor", "_lock", "_counters", "_counters_lock")
+
+    def __init__(self, command: Sequence[str], n_procs: int = 1,
+                 encoder: Optional[Callable] = None,
+                 decoder: Optional[Callable] = None,
+                 minimize: bool = False,
+                 timeout: Optional[float] = None,
+                 max_retries: int = 1,
+                 penalty: Optional[float | tuple] = None) -> None:
+        """
+        Initialize a SimulatorPool object. The processes are started
+        lazily, on the first evaluation.
+
+        :param command: the command (list of str) that starts one simulator.
+
+        :param n_procs: (int) number of simulator processes.
+
+        :param encoder: callable that converts a chromosome to a single line.
+
+        :param decoder: callable that converts a response line to the fitness
+                        value, or to the tuple (fitness value, solution_found).
+
+        :param minimize: (bool) if True the sign of the fitness is reversed.
+
+        :param timeout: (float) maximum time (in seconds) to wait for a response.
+
+        :param max_retries: (int) number of retries after a failed request.
+
+        :param penalty: fitness value for the chromosomes that keep on failing.
+                        If it is None an error is raised instead.
+        """
+        # Sanity check.
+        if not command:
+            raise ValueError(f"{self.__class__.__name__}: Command is empty.")
+        # _end_if_
+
+        # Sanity check.
+        if not isinstance(n_procs, int) or n_procs <= 0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Number of processes must be a positive integer.")
+        # _end_if_
+
+        # Sanity check.
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Max retries must be a non-negative integer.")
+        # _end_if_
+
+        # Store the settings.
+        self._command: list[str] = list(command)
+        self._n_procs: int = n_procs
+        self._encoder: Callable = encoder or _default_encoder
+        self._decoder: Callable = decoder or _default_decoder
+        self._minimize: bool = minimize
+        self._timeout: Optional[float] = timeout
+        self._max_retries: int = max_retries
+        self._penalty: Optional[float | tuple] = penalty
+
+        # Runtime variables (created lazily).
+        self._idle: Optional[Queue] = None
+        self._procs: list[_SimulatorProcess] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Lock for the lazy start.
+        self._lock: Lock = Lock()
+
+        # Counters of the failed requests (with their own lock, so the
+        # running requests never wait for the start-up or the shut-down).
+        self._counters: dict = {"timeouts": 0, "crashes": 0, "penalized": 0}
+        self._counters_lock: Lock = Lock()
+    # _end_def_
+
+    @property
+    def n_procs(self) -> int:
+        """
+        Accessor method that returns the number of processes.
+
+        :return: the number of simulator processes.
+        """
+        return self._n_procs
+    # _end_def_
+
+    @property
+    def counters(self) -> dict:
+        """
+        Accessor method that returns the counters of the failed
+        requests (timeouts, crashes, penalized).
+
+        :return: the dictionary with the counters.
+        """
+        return self._counters
+    # _end_def_
+
+    def start(self) -> None:
+        """
+        Starts all the simulator processes (if not already running).
+
+        :return: None.
+        """
+        with self._lock:
+            # Check if the pool is already running.
+            if self._procs:
+                return
+            # _end_if_
+
+            # Start all the processes.
+            self._procs = [_SimulatorProcess(self._command)
+                           for _ in range(self._n_procs)]
+
+            # All the processes are initially idle.
+            self._idle = Queue()
+            for proc in self._procs:
+                self._idle.put(proc)
+            # _end_for_
+
+            # Thread pool that drives the requests.
+            self._executor = ThreadPoolExecutor(max_workers=self._n_procs)
+        # _end_with_
+
+        # Log the start-up.
+        logger.debug("%s started %d processes.", self.__class__.__name__,
+                     self._n_procs)
+    # _end_def_
+
+    def close(self) -> None:
+        """
+        Stops all the simulator processes.
+
+        :return: None.
+        """
+        with self._lock:
+            # Shut down the thread pool.
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            # _end_if_
+
+            # Stop all the processes.
+            for proc in self._procs:
+                proc.stop()
+            # _end_for_
+
+            # Clear the list.
+            self._procs = []
+            self._idle = None
+        # _end_with_
+    # _end_def_
+
+    def _count(self, key: str) -> None:
+        """
+        Increase (thread safe) the counter 'key' by one.
+
+        :param key: (str) name of the counter.
+
+        :return: None.
+        """
+        with self._counters_lock:
+            self._counters[key] += 1
+    # _end_def_
+
+    def _evaluate(self, individual: Chromosome) -> FitnessResult:
+        """
+        Evaluates a single chromosome on the first idle simulator.
+
+        :param individual: (Chromosome) to evaluate.
+
+        :return: the FitnessResult.
+        """
+        # Encode the genome once.
+        line: str = self._encoder(individual)
+
+        # Wait for an idle simulator.
+        proc: _SimulatorProcess = self._idle.get()
+
+        try:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    # Send the genome and decode the response.
+                    f_value, is_found = unpack_fitness(
+                        self._decoder(proc.request(line, self._timeout))
+                    )
+
+                    # Return the normalized result.
+                    return FitnessResult(_to_fitness(f_value, self._minimize),
+                                         is_found)
+                except TimeoutError:
+                    self._count("timeouts")
+                except (EOFError, OSError):
+                    self._count("crashes")
+                # _end_try_
+
+                # Log the failure.
+                logger.warning("%s: simulator failed (attempt %d), restarting it.",
+                               self.__class__.__name__, attempt + 1)
+
+                # Start a fresh process.
+                proc.restart()
+            # _end_for_
+        finally:
+            # Release the simulator.
+            self._idle.put(proc)
+        # _end_try_
+
+        # Check if we have a penalty value.
+        if self._penalty is None:
+            raise RuntimeError(f"{self.__class__.__name__}: "
+                               f"Failed to evaluate chromosome: {line}.")
+        # _end_if_
+
+        # Update the counter.
+        self._count("penalized")
+
+        # Return the penalty value.
+        return FitnessResult(_to_fitness(self._penalty), False)
+    # _end_def_
+
+    def evaluate_batch(self, population: list[Chromosome]) -> list[FitnessResult]:
+        """
+        Evaluates a whole batch of chromosomes, by multiplexing them
+        across all the simulator processes.
+
+        :param population: (list) of chromosomes to evaluate.
+
+        :return: a list with the FitnessResults (in the same order).
+        """
+        # Make sure the processes are running.
+        self.start()
+
+        # Distribute the requests to the simulators.
+        return list(self._executor.map(self._evaluate, population))
+    # _end_def_
+
+    def __call__(self, individual: Chromosome) -> FitnessResult:
+        """
+        Evaluates a single chromosome (thread safe).
+
+        :param individual: (Chromosome) to evaluate.
+
+        :return: the FitnessResult.
+        """
+        # Make sure the processes are running.
+        self.start()
+
+        return self._evaluate(individual)
+    # _end_def_
+
+    def __enter__(self):
+        """
+        Starts the pool in a 'with' statement.
+        """
+        self.start()
+        return self
+    # _end_def_
+
+    def __exit__(self, *args) -> None:
+        """
+        Closes the pool at the end of a 'with' statement.
+        """
+        self.close()
+    # _end_def_
+
+    def __getstate__(self) -> dict:
+        """
+        The running processes, threads and locks can't be pickled (e.g. when
+        the engine is sent to the loky workers). Only the settings are kept
+        and the processes will be started lazily in the new process.
+        """
+        return {
+            attr: getattr(self, attr) for attr in self.__slots__
+            if attr not in ("_idle", "_procs", "_executor", "_lock", "_counters_lock")
+        }
+    # _end_def_
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        This method works in tandem with the __getstate__() to unpickle the
+        object. The runtime variables are reset to their initial values.
+        """
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        # _end_for_
+
+        # Reset the runtime variables.
+        self._idle = None
+        self._procs = []
+        self._executor = None
+        self._lock = Lock()
+        self._counters_lock = Lock()
+    # _end_def_
+
+# _end_class_
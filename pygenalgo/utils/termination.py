@@ -0,0 +1,558 @@
+"""
+Description:
+
+    Includes composable termination criteria for the GA engines. Each engine
+    checks the criterion of the RunConfig once per epoch, with the engine and
+    the EpochRecord of the epoch (see GenericGA.run_iter()), so the checks
+    cost only a few comparisons. The available criteria are:
+
+        - WallClock: time budget of the run (in seconds),
+        - EvaluationBudget: maximum number of function evaluations,
+        - TargetFitness: the best fitness reaches a target value,
+        - BestFitnessStall: no improvement of the best fitness in a window,
+        - HypervolumeStall: no improvement of the hypervolume in a window,
+        - DiversityCollapse: the average Hamming distance of the population
+          drops below a threshold.
+
+    The criteria are combined with the operators '|' (any of them) and '&'
+    (all of them), e.g. WallClock(60.0) | BestFitnessStall(window=20).
+
+Author:
+    Michail D. Vrettas, PhD
+
+Email:
+    michail.vrettas@gmail.com
+
+Metadata:
+    License: GPL-3
+"""
+from math import isfinite
+from typing import Optional
+
+from pygenalgo.utils.auxiliary import average_hamming_distance
+
+# Public interface.
+__all__ = ["TerminationCriterion", "AnyOf", "AllOf", "WallClock", "EvaluationBudget",
+           "TargetFitness", "BestFitnessStall", "HypervolumeStall", "DiversityCollapse"]
+
+
+class TerminationCriterion:
+    """
+    Description:
+        Base class of the termination criteria. The derived classes
+        implement the 'is_met' method.
+    """
+
+    # Object variables.
+    __slots__ = ("_reason",)
+
+    def __init__(self) -> None:
+        """
+        Construct a TerminationCriterion object.
+        """
+        # The description of the last met criterion.
+        self._reason: Optional[str] = None
+    # _end_def_
+
+    @property
+    def reason(self) -> Optional[str]:
+        """
+        Accessor of the reason of the termination.
+
+        :return: the description of the met criterion (or None).
+        """
+        return self._reason
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the criterion at the end of an epoch.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the run should stop.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__}: "
+                                  f"You should implement this method!")
+    # _end_def_
+
+    def __call__(self, engine, record) -> bool:
+        """
+        Checks the criterion and keeps the reason of the termination.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the run should stop.
+        """
+        # Check the criterion.
+        is_met: bool = self.is_met(engine, record)
+
+        # Store the reason.
+        self._reason = str(self) if is_met else None
+
+        return is_met
+    # _end_def_
+
+    def __or__(self, other: "TerminationCriterion") -> "AnyOf":
+        """
+        Combines two criteria: the run stops when any of them is met.
+        """
+        return AnyOf(self, other)
+    # _end_def_
+
+    def __and__(self, other: "TerminationCriterion") -> "AllOf":
+        """
+        Combines two criteria: the run stops when all of them are met.
+        """
+        return AllOf(self, other)
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return self.__class__.__name__
+    # _end_def_
+
+# _end_class_
+
+
+class AnyOf(TerminationCriterion):
+    """
+    Description:
+        Composite criterion that is met when any of its criteria is met.
+        All the criteria are checked (to keep their windows up to date).
+    """
+
+    # Object variables.
+    __slots__ = ("_criteria",)
+
+    def __init__(self, *criteria: TerminationCriterion) -> None:
+        """
+        Construct an AnyOf object.
+
+        :param criteria: (TerminationCriterion) the combined criteria.
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        # Sanity check.
+        if not criteria or not all(isinstance(c, TerminationCriterion)
+                                   for c in criteria):
+            raise TypeError(f"{self.__class__.__name__}: "
+                            f"Criteria must be TerminationCriterion objects.")
+        # _end_if_
+
+        self._criteria: tuple[TerminationCriterion, ...] = criteria
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks all the criteria.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if any of the criteria is met.
+        """
+        # Check all the criteria.
+        met = [c for c in self._criteria if c(engine, record)]
+
+        # Store the reason of the first one.
+        self._reason = met[0].reason if met else None
+
+        return bool(met)
+    # _end_def_
+
+    def __call__(self, engine, record) -> bool:
+        """
+        Checks the criteria (the reason is set by the met criterion).
+        """
+        return self.is_met(engine, record)
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return " | ".join(str(c) for c in self._criteria)
+    # _end_def_
+
+# _end_class_
+
+
+class AllOf(AnyOf):
+    """
+    Description:
+        Composite criterion that is met when all of its criteria are met.
+    """
+
+    # Object variables.
+    __slots__ = ()
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks all the criteria.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if all the criteria are met.
+        """
+        # Check all the criteria.
+        is_met: bool = all([c(engine, record) for c in self._criteria])
+
+        # Store the description.
+        self._reason = str(self) if is_met else None
+
+        return is_met
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return " & ".join(str(c) for c in self._criteria)
+    # _end_def_
+
+# _end_class_
+
+
+class WallClock(TerminationCriterion):
+    """
+    Description:
+        Stops the run when the elapsed time exceeds the time budget.
+    """
+
+    # Object variables.
+    __slots__ = ("_max_time",)
+
+    def __init__(self, max_time: float) -> None:
+        """
+        Construct a WallClock object.
+
+        :param max_time: (float) the time budget in seconds.
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        # Sanity check.
+        if not max_time > 0.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Time budget must be positive.")
+        # _end_if_
+
+        self._max_time: float = float(max_time)
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the elapsed time of the run.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the time budget is exhausted.
+        """
+        return record.elapsed_time >= self._max_time
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return f"{self.__class__.__name__}({self._max_time} s)"
+    # _end_def_
+
+# _end_class_
+
+
+class EvaluationBudget(TerminationCriterion):
+    """
+    Description:
+        Stops the run when the function evaluations exceed the budget.
+    """
+
+    # Object variables.
+    __slots__ = ("_max_evals",)
+
+    def __init__(self, max_evals: int) -> None:
+        """
+        Construct an EvaluationBudget object.
+
+        :param max_evals: (int) the budget of function evaluations.
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        # Sanity check.
+        if int(max_evals) < 1:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Budget must be positive.")
+        # _end_if_
+
+        self._max_evals: int = int(max_evals)
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the function evaluations of the run.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the budget is exhausted.
+        """
+        return record.f_evals >= self._max_evals
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return f"{self.__class__.__name__}({self._max_evals})"
+    # _end_def_
+
+# _end_class_
+
+
+class TargetFitness(TerminationCriterion):
+    """
+    Description:
+        Stops the run when the best fitness reaches the target value.
+    """
+
+    # Object variables.
+    __slots__ = ("_target",)
+
+    def __init__(self, target: float) -> None:
+        """
+        Construct a TargetFitness object.
+
+        :param target: (float) the target fitness value (maximization).
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        self._target: float = float(target)
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the best fitness of the epoch.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the target is reached.
+        """
+        return record.best is not None and record.best >= self._target
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return f"{self.__class__.__name__}({self._target})"
+    # _end_def_
+
+# _end_class_
+
+
+class BestFitnessStall(TerminationCriterion):
+    """
+    Description:
+        Stops the run when the best fitness has not improved (more than
+        'tol') in the last 'window' epochs. The history is cleared when
+        the epochs start again (a new run).
+    """
+
+    # Object variables.
+    __slots__ = ("_window", "_tol", "_history", "_last_epoch")
+
+    def __init__(self, window: int = 20, tol: float = 0.0) -> None:
+        """
+        Construct a BestFitnessStall object.
+
+        :param window: (int) number of epochs without improvement.
+
+        :param tol: (float) the minimum improvement of the best fitness.
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        # Sanity check.
+        if int(window) < 1 or tol < 0.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Window must be positive and tol non-negative.")
+        # _end_if_
+
+        self._window: int = int(window)
+        self._tol: float = float(tol)
+
+        # History of the best fitness.
+        self._history: list[float] = []
+        self._last_epoch: int = -1
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the improvement of the best fitness in the window.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the best fitness has stalled.
+        """
+        # Clear the history of a previous run.
+        if record.epoch <= self._last_epoch:
+            self._history.clear()
+        # _end_if_
+
+        self._last_epoch = record.epoch
+
+        # Skip the records without a (single) best fitness.
+        if record.best is None or not isfinite(record.best):
+            return False
+        # _end_if_
+
+        # Keep only the last 'window + 1' values.
+        self._history.append(record.best)
+        del self._history[:-self._window - 1]
+
+        return len(self._history) > self._window and \
+            max(self._history[1:]) <= self._history[0] + self._tol
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return f"{self.__class__.__name__}({self._window} epochs)"
+    # _end_def_
+
+# _end_class_
+
+
+class HypervolumeStall(TerminationCriterion):
+    """
+    Description:
+        Stops the run when the hypervolume (of the multi-objective engines,
+        in stats["hypervolume"]) has not improved (more than 'tol') in the
+        last 'window' epochs.
+    """
+
+    # Object variables.
+    __slots__ = ("_window", "_tol")
+
+    def __init__(self, window: int = 20, tol: float = 0.0) -> None:
+        """
+        Construct a HypervolumeStall object.
+
+        :param window: (int) number of epochs without improvement.
+
+        :param tol: (float) the minimum improvement of the hypervolume.
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        # Sanity check.
+        if int(window) < 1 or tol < 0.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Window must be positive and tol non-negative.")
+        # _end_if_
+
+        self._window: int = int(window)
+        self._tol: float = float(tol)
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the improvement of the hypervolume in the window.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the hypervolume has stalled.
+        """
+        # Get the hypervolume history (if any).
+        history: list = engine.stats.get("hypervolume", [])
+
+        return len(history) > self._window and \
+            max(history[-self._window:]) <= history[-self._window - 1] + self._tol
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return f"{self.__class__.__name__}({self._window} epochs)"
+    # _end_def_
+
+# _end_class_
+
+
+class DiversityCollapse(TerminationCriterion):
+    """
+    Description:
+        Stops the run when the (normalized) average Hamming distance of the
+        population drops below a threshold. It uses the population view of
+        the record if it exists, otherwise the population of the engine.
+    """
+
+    # Object variables.
+    __slots__ = ("_min_distance",)
+
+    def __init__(self, min_distance: float = 0.01) -> None:
+        """
+        Construct a DiversityCollapse object.
+
+        :param min_distance: (float) the threshold in [0, 1].
+        """
+        # Call the super constructor.
+        super().__init__()
+
+        # Sanity check.
+        if not 0.0 <= min_distance <= 1.0:
+            raise ValueError(f"{self.__class__.__name__}: "
+                             f"Distance must be in [0, 1].")
+        # _end_if_
+
+        self._min_distance: float = float(min_distance)
+    # _end_def_
+
+    def is_met(self, engine, record) -> bool:
+        """
+        Checks the diversity of the population.
+
+        :param engine: (GenericGA) the engine of the run.
+
+        :param record: (EpochRecord) the record of the epoch.
+
+        :return: True if the diversity has collapsed.
+        """
+        # Get the population of the epoch.
+        population = record.population or engine.population
+
+        return average_hamming_distance(list(population)) < self._min_distance
+    # _end_def_
+
+    def __str__(self) -> str:
+        """
+        Description of the criterion.
+        """
+        return f"{self.__class__.__name__}({self._min_distance})"
+    # _end_def_
+
+# _end_class_
@@ -15,6 +15,8 @@ Metadata:
 
 from typing import Callable, Union
 from functools import wraps, partial
+from math import isqrt
+from bisect import bisect_left, bisect_right
 
 import numpy as np
 from numpy.typing import NDArray
@@ -22,7 +24,9 @@ from numpy.random import Generator
 
 # Public interface.
 __all__ = ["cost_function", "np_cdist", "two_indices_fast",
-           "np_pareto_front", "clamp",  "np_pareto_front_index"]
+           "np_pareto_front", "clamp",  "np_pareto_front_index",
+           "FitnessResult", "unpack_fitness", "non_dominated_sort",
+           "non_dominated_ranks", "crowding_distance"]
 
 # Declare a union type.
 Number = Union[int, float]
@@ -73,63 +77,184 @@ def _dominance_batch(sample_points: NDArray, eps_arr: NDArray) -> NDArray:
     return ~np.any(strictly_better, axis=0)
 # _end_def_
 
-def _dominance_loop(sample_points: NDArray, eps_arr: NDArray) -> NDArray:
+def _dominated_by(candidates: NDArray, sample_points: NDArray,
+                  eps_arr: NDArray) -> NDArray:
     """
-    Identify Pareto-optimal points using an epsilon-dominance rule
-    (maximization convention) by comparing all point pairs in loops.
+    Checks which sample points are epsilon-dominated by at least one of
+    the candidate points (maximization convention).
+
+    The comparisons are accumulated one objective at a time, so that only
+    a few boolean (M, B) arrays are allocated, instead of the (M, B, D)
+    difference of the all-pairs broadcast.
+
+    :param candidates: Array of shape (M, D) with the dominating candidates.
+    :param sample_points: Array of shape (B, D) containing objective values.
+    :param eps_arr: Array of shape (D) containing per-objective tolerances.
+
+    :return: Boolean array of shape (B), True for the dominated points.
+    """
+    # Shape of the pairwise comparisons.
+    shape = (candidates.shape[0], sample_points.shape[0])
+
+    # 'no_worse[i, j]' is True if 'i' is no worse than 'j' in every
+    # objective and 'better[i, j]' if it is better in at least one.
+    no_worse: NDArray = np.ones(shape, dtype=bool)
+    better: NDArray = np.zeros(shape, dtype=bool)
+
+    for d, eps in enumerate(eps_arr):
+        no_worse &= candidates[:, d, None] >= sample_points[None, :, d] - eps
+        better |= candidates[:, d, None] > sample_points[None, :, d] + eps
+    # _end_for_
+
+    return np.any(no_worse & better, axis=0)
+# _end_def_
+
+def _dominance_blocked(sample_points: NDArray, max_bytes: int) -> NDArray:
+    """
+    Identify (exactly) Pareto-optimal points, with a tiled comparison of
+    blocks of points against the current front (maximization convention).
+
+    The points are presorted in descending sum of objectives, so a point
+    can only be dominated by the points before it and the front can only
+    grow. Each block is compared against the front, tile by tile, and the
+    dominated points are dropped from the block as soon as they are found.
+    A tile is skipped if it is worse than the remaining block points in at
+    least one objective (hence it cannot dominate any of them).
 
     Complexity:
-        - time:   O(N^2 * D)
-        - memory: O(D)
+        - time:   O(N * F * D), for F points on the Pareto front
+        - memory: O(N * D + max_bytes)
 
     :param sample_points: Array of shape (N, D) containing objective values.
-    :param eps_arr: Array of shape (D) containing per-objective tolerances.
+    :param max_bytes: Memory ceiling for the pairwise comparisons.
 
     :return: Boolean array of shape (N), True for Pareto-optimal points.
     """
-    # Get the number of sample points.
-    n_points = sample_points.shape[0]
+    # Get the dimensions of the sample points.
+    n_points, n_dims = sample_points.shape
 
-    # For the loop branch eps [1, n_dims].
-    eps_loop: NDArray = eps_arr[None, :]
+    # Every pairwise comparison needs about four bytes, so
+    # the blocks and the tiles are (up to) 'n_block' points.
+    n_block = max(1, isqrt(max_bytes // 4))
 
-    # Initialize all sample points as Pareto optimal.
-    is_pareto: NDArray = np.ones(n_points, dtype=bool)
+    # Sort in descending sum and break the ties lexicographically,
+    # so that dominating points always come first.
+    order: NDArray = np.lexsort(tuple(-sample_points[:, ::-1].T) +
+                                (-sample_points.sum(axis=1),))
+    sorted_points: NDArray = sample_points[order]
 
-    # Check all pairs once, bidirectionally.
-    for i in range(n_points):
+    # Exact dominance (no tolerance).
+    eps_zero: NDArray = np.zeros(n_dims, dtype=float)
 
-        # If i-th point is already dominated.
-        if not is_pareto[i]:
-            # Skip.
-            continue
+    # The front is stored in the first 'n_front' rows.
+    front: NDArray = np.empty_like(sorted_points)
+    n_front: int = 0
 
-        # Compare i against all later points (j > i).
-        for j in range(i + 1, n_points):
+    # Initialize all sample points as dominated.
+    is_pareto: NDArray = np.zeros(n_points, dtype=bool)
 
-            # If j is already dominated.
-            if not is_pareto[j]:
-                # Skip.
-                continue
+    for i in range(0, n_points, n_block):
+
+        # Get the block of points.
+        block = sorted_points[i:i+n_block]
 
-            # Compute difference once (reuse for both checks).
-            diff: NDArray = sample_points[i] - sample_points[j]
+        # Indices (in the block) of the not yet dominated points.
+        alive = np.arange(block.shape[0])
 
-            # Check if i dominates j.
-            i_dominates_j: NDArray = (np.all(diff >= -eps_loop) &
-                                      np.any(diff > eps_loop))
+        # Compare the block against the front, tile by tile.
+        for j in range(0, n_front, n_block):
 
-            # Check if j dominates i (reverse the comparison).
-            j_dominates_i: NDArray = (np.all(-diff >= -eps_loop) &
-                                      np.any(-diff > eps_loop))
-            if i_dominates_j:
-                # Flag for skipping.
-                is_pareto[j] = False
+            # Get the tile of the front.
+            tile = front[j:min(j + n_block, n_front)]
+
+            # Skip the tile if it cannot dominate any point.
+            if np.any(tile.max(axis=0) < block[alive].min(axis=0)):
+                continue
+            # _end_if_
 
-            elif j_dominates_i:
-                # Flag for skipping.
-                is_pareto[i] = False
+            # Drop the dominated points early.
+            alive = alive[~_dominated_by(tile, block[alive], eps_zero)]
+
+            # Stop if the whole block is dominated.
+            if alive.size == 0:
                 break
+        # _end_for_
+
+        # Compare the remaining points with each other.
+        if alive.size > 1:
+            alive = alive[~_dominated_by(block[alive], block[alive], eps_zero)]
+        # _end_if_
+
+        # Append the survivors to the front.
+        front[n_front:n_front + alive.size] = block[alive]
+        n_front += alive.size
+
+        # Update the pareto points mask.
+        is_pareto[order[i + alive]] = True
+    # _end_for_
+
+    return is_pareto
+# _end_def_
+
+def _dominance_by_front(sample_points: NDArray, front_points: NDArray,
+                        eps_arr: NDArray, max_bytes: int) -> NDArray:
+    """
+    Identify Pareto-optimal points using an epsilon-dominance rule
+    (maximization convention), by comparing all the sample points
+    only against the points of the (exact) first front.
+
+    This is sufficient because any point that epsilon-dominates a
+    sample point is itself (exactly) dominated by a point of the
+    first front, which then epsilon-dominates the sample point too.
+
+    Complexity:
+        - time:   O(N * F * D), for F points on the first front
+        - memory: O(B * F), with B chosen to stay below max_bytes
+
+    :param sample_points: Array of shape (N, D) containing objective values.
+    :param front_points: Array of shape (F, D) with the first front.
+    :param eps_arr: Array of shape (D) containing per-objective tolerances.
+    :param max_bytes: Memory ceiling for the pairwise comparisons.
+
+    :return: Boolean array of shape (N), True for Pareto-optimal points.
+    """
+    # Get the number of points.
+    n_points, n_front = sample_points.shape[0], front_points.shape[0]
+
+    # In 2-D the front is a monotone staircase.
+    if sample_points.shape[1] == 2:
+
+        # Sort the front in descending f1 (hence ascending f2).
+        order = np.argsort(-front_points[:, 0])
+        neg_f1, f2 = -front_points[order, 0], front_points[order, 1]
+
+        # Get the sample point values.
+        x1, x2 = sample_points[:, 0], sample_points[:, 1]
+
+        # The front points that are no worse than (x - eps) form the range
+        # [j_lo, j_hi), while those that are better than (x + eps) in f1 or
+        # f2 are the ranges [0, k_1) and [k_2, n_front) respectively.
+        j_hi = np.searchsorted(neg_f1, eps_arr[0] - x1, side="right")
+        j_lo = np.searchsorted(f2, x2 - eps_arr[1], side="left")
+        k_1 = np.searchsorted(neg_f1, -eps_arr[0] - x1, side="left")
+        k_2 = np.searchsorted(f2, x2 + eps_arr[1], side="right")
+
+        # A point is dominated if the ranges overlap.
+        return ~((j_lo < np.minimum(j_hi, k_1)) |
+                 (np.maximum(j_lo, k_2) < j_hi))
+    # _end_if_
+
+    # Number of sample points per block (about
+    # four bytes for every pairwise comparison).
+    n_block = max(1, max_bytes // (4 * max(1, n_front)))
+
+    # Initialize all sample points as Pareto optimal.
+    is_pareto: NDArray = np.ones(n_points, dtype=bool)
+
+    for i in range(0, n_points, n_block):
+        is_pareto[i:i+n_block] = ~_dominated_by(front_points,
+                                                sample_points[i:i+n_block],
+                                                eps_arr)
     # _end_for_
 
     return is_pareto
@@ -138,7 +263,8 @@ def _dominance_loop(sample_points: NDArray, eps_arr: NDArray) -> NDArray:
 def np_pareto_front_index(points: NDArray,
                           mode: str = "max",
                           rel_eps: float = 1.0e-6,
-                          exclude_duplicates: bool = True) -> NDArray:
+                          exclude_duplicates: bool = True,
+                          max_bytes: int = 500_000_000) -> NDArray:
     """
     Fast (numpy - vectorized) function that calculates
     the Pareto optimal front from a given input points
@@ -158,6 +284,15 @@ def np_pareto_front_index(points: NDArray,
     :param exclude_duplicates: whether to exclude duplicate
                                points.
 
+    :param max_bytes: memory ceiling (in bytes) for the
+                      pairwise dominance comparisons.
+
+    NOTE: For up to three objectives the first front is
+    found with an O(N*log(N)) sweep. For more objectives
+    it is found with an all-pairs broadcast, if it fits
+    in 'max_bytes', or else with a blocked comparison.
+    The tolerance is checked only against its points.
+
     :return: array of indexes (from the points that lie on
              the Pareto front).
     """
@@ -171,6 +306,11 @@ def np_pareto_front_index(points: NDArray,
         raise ValueError("Mode must be either 'max' or 'min'.")
     # _end_if_
 
+    # Sanity check.
+    if not isinstance(max_bytes, int) or max_bytes <= 0:
+        raise ValueError("Max bytes must be a positive integer.")
+    # _end_if_
+
     # Normalize to a single convention. Here we
     # maximize in all objectives function values.
     x_points = points if mode == "max" else -points
@@ -199,18 +339,33 @@ def np_pareto_front_index(points: NDArray,
     memory_bytes: int = (n_points * n_points * n_dims *
                          sample_points.dtype.itemsize)
 
-    # Compare it against ~500MB.
-    if memory_bytes <= 500_000_000:
+    # The all-pairs broadcast is faster for a few points and is
+    # used for many objectives, as long as it fits in memory.
+    if memory_bytes <= max_bytes and (n_points <= 32 or n_dims > 3):
         # Return the pareto front indices (batch mode).
         return sample_indices[_dominance_batch(sample_points, eps_arr)]
+    # _end_if_
 
-    # Safeguard with loop mode.
-    return sample_indices[_dominance_loop(sample_points, eps_arr)]
+    # For up to three objectives the exact first front is found with
+    # a sweep, and only its points are used in the dominance check.
+    if n_dims <= 3:
+        # Get the first front.
+        is_front = non_dominated_ranks(sample_points) == 0
+    else:
+        # Get the first front (blocked mode).
+        is_front = _dominance_blocked(sample_points, max_bytes)
+    # _end_if_
+
+    # Return the pareto front indices.
+    return sample_indices[_dominance_by_front(sample_points,
+                                              sample_points[is_front],
+                                              eps_arr, max_bytes)]
 # _end_def_
 
 def np_pareto_front(points: NDArray, mode: str = "max",
                     rel_eps: float = 1.0e-6,
-                    exclude_duplicates: bool = True) -> NDArray:
+                    exclude_duplicates: bool = True,
+                    max_bytes: int = 500_000_000) -> NDArray:
     """
     Fast (numpy - vectorized) function that calculates
     the Pareto optimal front points from a given input
@@ -229,20 +384,465 @@ def np_pareto_front(points: NDArray, mode: str = "max",
     :param exclude_duplicates: whether to exclude duplicate
                                points.
 
-    NOTE: Its memory complexity grows quadratically
-    with the number of points in the NDArray: O(N^2)!
+    :param max_bytes: memory ceiling (in bytes) for the
+                      pairwise dominance comparisons.
 
     :return: array of points that lie on the Pareto front.
     """
 
     # Get the indices of the points that lie on the pareto front.
     idx = np_pareto_front_index(points, mode=mode, rel_eps=rel_eps,
-                                exclude_duplicates=exclude_duplicates)
+                                exclude_duplicates=exclude_duplicates,
+                                max_bytes=max_bytes)
 
     # Return the actual points.
     return points[idx]
 # _end_def_
 
+def _ranks_matrix(x_points: NDArray) -> NDArray:
+    """
+    Computes the non-domination rank of each point, following the "fast
+    non-dominated sorting" of NSGA-II (Deb et al. 2002), for any number
+    of objectives (maximization convention).
+
+    Complexity:
+        - time:   O(N^2 * D)
+        - memory: O(N^2)
+
+    The dominance matrix is computed with vectorized (C-optimized) code, one
+    objective at a time, so the memory never exceeds a few (N, N) arrays.
+
+    :param x_points: array of points with shape (N, D).
+
+    :return: array of ranks with shape (N,).
+    """
+    # Get the number of points.
+    n_points = x_points.shape[0]
+
+    # Accumulate the pairwise comparisons one objective at a time:
+    # 'no_worse[i, j]' is True if 'i' is no worse than 'j' in every
+    # objective and 'better[i, j]' if it is better in at least one.
+    no_worse: NDArray = np.ones((n_points, n_points), dtype=bool)
+    better: NDArray = np.zeros((n_points, n_points), dtype=bool)
+
+    for column in x_points.T:
+        no_worse &= column[:, None] >= column[None, :]
+        better |= column[:, None] > column[None, :]
+    # _end_for_
+
+    # Dominance matrix: dominates[i, j] is True if 'i' dominates 'j'.
+    dominates: NDArray = no_worse & better
+
+    # Number of points that dominate each point.
+    n_dominated: NDArray = dominates.sum(axis=0)
+
+    # Mask of the points that have not been assigned a rank yet.
+    remaining: NDArray = np.ones(n_points, dtype=bool)
+
+    # Output array of ranks.
+    ranks: NDArray = np.empty(n_points, dtype=int)
+
+    # Current rank.
+    k: int = 0
+
+    # Peel the fronts one at a time.
+    while remaining.any():
+
+        # The current front has no (remaining) dominating points.
+        front = np.flatnonzero(remaining & (n_dominated == 0))
+
+        # Assign the rank.
+        ranks[front] = k
+        k += 1
+
+        # Remove the front from the remaining points.
+        remaining[front] = False
+
+        # Discount the domination from the current front.
+        n_dominated -= dominates[front].sum(axis=0)
+    # _end_while_
+
+    return ranks
+# _end_def_
+
+def _ranks_sweep_2d(sorted_points: NDArray) -> NDArray:
+    """
+    Computes the non-domination rank of unique 2-D points, that are sorted
+    in descending lexicographic order (maximization convention).
+
+    Since every point is preceded by all the points that can dominate it,
+    a point is dominated by a front if and only if the front's last point
+    (the one with the largest f2) is no worse in f2. These values decrease
+    with the rank, so the front of each point is found with a bisection.
+
+    Complexity:
+        - time:   O(N * log(N))
+        - memory: O(N)
+
+    :param sorted_points: array of unique points with shape (N, 2).
+
+    :return: array of ranks with shape (N,).
+    """
+    # Negative f2 of the last point in each front (ascending).
+    neg_last: list[float] = []
+
+    # Output array of ranks.
+    ranks: NDArray = np.empty(sorted_points.shape[0], dtype=int)
+
+    for i, f2 in enumerate((-sorted_points[:, 1]).tolist()):
+
+        # First front that does not dominate the point.
+        k = bisect_right(neg_last, f2)
+
+        # Open a new front or update the last point of the front.
+        if k == len(neg_last):
+            neg_last.append(f2)
+        else:
+            neg_last[k] = f2
+        # _end_if_
+
+        ranks[i] = k
+    # _end_for_
+
+    return ranks
+# _end_def_
+
+def _ranks_sweep_3d(sorted_points: NDArray) -> NDArray:
+    """
+    Computes the non-domination rank of unique 3-D points, that are sorted
+    in descending lexicographic order (maximization convention).
+
+    This is the efficient non-dominated sort with binary search (ENS-BS).
+    Every front keeps the 2-D "staircase" of its maximal (f2, f3) values,
+    sorted in ascending f2 (hence descending f3), so that checking if the
+    front dominates a point is a single bisection.
+
+    Complexity:
+        - time:   O(N * log(N) * log(K)), for K fronts (amortized)
+        - memory: O(N)
+
+    :param sorted_points: array of unique points with shape (N, 3).
+
+    :return: array of ranks with shape (N,).
+    """
+    # Staircases (f2 ascending, f3 descending) of each front.
+    fronts_f2: list[list[float]] = []
+    fronts_f3: list[list[float]] = []
+
+    # Output array of ranks.
+    ranks: NDArray = np.empty(sorted_points.shape[0], dtype=int)
+
+    for i, (f2, f3) in enumerate(sorted_points[:, 1:].tolist()):
+
+        # Binary search for the first front that does not dominate the point.
+        lo, hi = 0, len(fronts_f2)
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+
+            # Points with larger f2 start at 'j'. The first of them
+            # has the largest f3 (due to the staircase ordering).
+            s2, s3 = fronts_f2[mid], fronts_f3[mid]
+            j = bisect_left(s2, f2)
+
+            if j < len(s2) and s3[j] >= f3:
+                lo = mid + 1
+            else:
+                hi = mid
+        # _end_while_
+
+        # Open a new front.
+        if lo == len(fronts_f2):
+            fronts_f2.append([f2])
+            fronts_f3.append([f3])
+        else:
+            s2, s3 = fronts_f2[lo], fronts_f3[lo]
+
+            # Replace the staircase points that are covered by the new one.
+            j = k = bisect_left(s2, f2)
+
+            if k < len(s2) and s2[k] == f2:
+                k += 1
+            # _end_if_
+
+            while j > 0 and s3[j-1] <= f3:
+                j -= 1
+            # _end_while_
+
+            s2[j:k] = [f2]
+            s3[j:k] = [f3]
+        # _end_if_
+
+        ranks[i] = lo
+    # _end_for_
+
+    return ranks
+# _end_def_
+
+def non_dominated_ranks(points: NDArray, mode: str = "max") -> NDArray:
+    """
+    Computes the non-domination rank of each point. Rank zero is given to
+    the Pareto optimal points, rank one to the points that are dominated
+    only by rank zero points, and so on. Duplicate points share the same
+    rank.
+
+    For two and three objectives a sweep-based algorithm is used, which is
+    O(N*log(N)) in time and O(N) in memory. Otherwise, it falls back to the
+    "fast non-dominated sorting" of NSGA-II, which is O(N^2) in memory.
+
+    :param points: array of points with shape (N, D).
+
+    :param mode: "max" (maximize all objective) or
+                 "min" (minimize all objective).
+
+    :return: array of ranks with shape (N,).
+    """
+    # Sanity check.
+    if points.ndim != 2:
+        raise RuntimeError("Points must be a 2-D array.")
+    # _end_if_
+
+    # Sanity check.
+    if mode not in ("max", "min"):
+        raise ValueError("Mode must be either 'max' or 'min'.")
+    # _end_if_
+
+    # Normalize to a single convention (maximization).
+    x_points = points if mode == "max" else -points
+
+    # Get the number of objectives.
+    n_dims = x_points.shape[1]
+
+    # Use the quadratic method for more objectives.
+    if n_dims > 3 or x_points.shape[0] == 0:
+        return _ranks_matrix(x_points)
+    # _end_if_
+
+    # Unique points in ascending lexicographic order.
+    unique_points, inverse = np.unique(x_points, axis=0, return_inverse=True)
+
+    # Reverse to descending lexicographic order.
+    unique_points = unique_points[::-1]
+    inverse = unique_points.shape[0] - 1 - inverse.ravel()
+
+    # Select the sweep for the number of objectives.
+    if n_dims == 1:
+        # Every unique value is a front on its own.
+        ranks = np.arange(unique_points.shape[0])
+    elif n_dims == 2:
+        ranks = _ranks_sweep_2d(unique_points)
+    else:
+        ranks = _ranks_sweep_3d(unique_points)
+    # _end_if_
+
+    # Map the ranks back to the original points.
+    return ranks[inverse]
+# _end_def_
+
+def non_dominated_sort(points: NDArray, mode: str = "max") -> list[NDArray]:
+    """
+    Sorts the input points into successive non-dominated fronts (ranks).
+    The first front contains the Pareto optimal points, the second front
+    the points that are only dominated by the first one, and so on.
+
+    :param points: array of points with shape (N, D).
+
+    :param mode: "max" (maximize all objective) or
+                 "min" (minimize all objective).
+
+    :return: list of index arrays, one for each front (rank 0, 1, ...).
+    """
+    # Get the rank of each point.
+    ranks = non_dominated_ranks(points, mode=mode)
+
+    # Sanity check.
+    if ranks.size == 0:
+        return []
+    # _end_if_
+
+    # Group the indices by rank.
+    order = np.argsort(ranks, kind="stable")
+
+    return np.split(order, np.cumsum(np.bincount(ranks))[:-1])
+# _end_def_
+
+def crowding_distance(points: NDArray) -> NDArray:
+    """
+    Computes the crowding distance of each point, as the sum (over all
+    objectives) of the normalized distances between its two neighbours.
+    The boundary points in each objective are given infinite distance,
+    so that they are always preferred.
+
+    :param points: array of points with shape (N, D), typically one
+                   front from the output of non_dominated_sort().
+
+    :return: array with the crowding distances, with shape (N,).
+    """
+    # Get the dimensions of the points.
+    n_points, n_dims = points.shape
+
+    # With two points or fewer everything is a boundary.
+    if n_points <= 2:
+        return np.full(n_points, np.inf, dtype=float)
+    # _end_if_
+
+    # Sort each objective independently: (N, D).
+    order: NDArray = np.argsort(points, axis=0, kind="stable")
+    sorted_points: NDArray = np.take_along_axis(points, order, axis=0)
+
+    # Range of values in each objective. Constant
+    # objectives do not contribute to the distance.
+    f_range: NDArray = sorted_points[-1] - sorted_points[0]
+    f_range[f_range == 0.0] = np.inf
+
+    # Distance between the two neighbours of each interior point.
+    gaps: NDArray = np.empty((n_points, n_dims), dtype=float)
+    gaps[1:-1] = (sorted_points[2:] - sorted_points[:-2]) / f_range
+    gaps[[0, -1]] = np.inf
+
+    # Scatter the gaps back to the original positions and sum them.
+    distance: NDArray = np.zeros((n_points, n_dims), dtype=float)
+    np.put_along_axis(distance, order, gaps, axis=0)
+
+    return distance.sum(axis=1)
+# _end_def_
+
+class FitnessResult:
+    """
+    Lightweight container for the output of a fitness function evaluation.
+    It replaces the per-call dictionary {"f_value": ..., "solution_is_found": ...}
+    with a slotted object, that is cheaper to create, to pickle (when sent back
+    from the parallel workers) and to unpack inside the GA engines.
+
+    NOTE: For backwards compatibility it still supports the dictionary access
+    style, i.e. result["f_value"] and result["solution_is_found"].
+    """
+
+    # Object variables.
+    __slots__ = ("f_value", "solution_is_found")
+
+    def __init__(self, f_value, solution_is_found: bool = False) -> None:
+        """
+        Initialize a FitnessResult object.
+
+        :param f_value: the (already normalized) fitness value. This is either
+                        a float or a tuple of floats (multi-objective).
+
+        :param solution_is_found: (bool) flag that signals the termination.
+        """
+        # Store the fitness value.
+        self.f_value = f_value
+
+        # Store the termination flag.
+        self.solution_is_found = bool(solution_is_found)
+    # _end_def_
+
+    def __getitem__(self, key: str):
+        """
+        Provides the (legacy) dictionary access to the fields.
+
+        :param key: (str) either "f_value" or "solution_is_found".
+
+        :return: the value of the requested field.
+        """
+        if key in FitnessResult.__slots__:
+            return getattr(self, key)
+
+        raise KeyError(key)
+    # _end_def_
+
+    def __iter__(self):
+        """
+        Allows direct unpacking: f_value, found = result.
+        """
+        yield self.f_value
+        yield self.solution_is_found
+    # _end_def_
+
+    def __repr__(self) -> str:
+        """
+        A string representation of the fitness result.
+
+        :return: FitnessResult(f_value, solution_is_found).
+        """
+        return (f"{self.__class__.__name__}(f_value={self.f_value}, "
+                f"solution_is_found={self.solution_is_found})")
+    # _end_def_
+
+# _end_class_
+
+def _to_fitness(f_value, minimize: bool = False):
+    """
+    Converts the raw output of an objective function into a plain Python
+    float, or a tuple of floats, flipping the sign if we minimize. It is
+    done once (inside the worker) so that the Chromosome fitness setter
+    can later accept the value without element by element conversions.
+
+    :param f_value: scalar, tuple of scalars or 1-D numpy array.
+
+    :param minimize: (bool) if True it reverses the sign of the values.
+
+    :return: float | tuple[float, ...].
+    """
+    # Numpy arrays are negated in one go and
+    # converted to Python floats with tolist().
+    if isinstance(f_value, np.ndarray):
+        # Ensure float type before the conversion.
+        f_array = np.asarray(f_value, dtype=float)
+
+        # Get a tuple of Python floats.
+        return tuple((-f_array if minimize else f_array).tolist())
+    # _end_if_
+
+    # Multi-objective functions return a tuple
+    # with all the objective function values.
+    if isinstance(f_value, tuple):
+
+        if minimize:
+            # Reverse the sign of the objectives.
+            return tuple(-float(fx) for fx in f_value)
+
+        return tuple(float(fx) for fx in f_value)
+    # _end_if_
+
+    # Standard (scalar) case.
+    return -float(f_value) if minimize else float(f_value)
+# _end_def_
+
+def unpack_fitness(result) -> tuple:
+    """
+    Unpacks the output of a fitness function into the pair (f_value,
+    solution_is_found). It supports (in order of preference):
+
+        1) FitnessResult objects (fast path),
+        2) legacy dictionaries {"f_value": ..., "solution_is_found": ...},
+        3) direct (f_value, bool) tuples,
+        4) direct float, tuple of floats or 1-D numpy arrays.
+
+    :param result: the output of the fitness function.
+
+    :return: a tuple with the fitness value and the found solution flag.
+    """
+    # Fast path (most frequent case).
+    if type(result) is FitnessResult:
+        return result.f_value, result.solution_is_found
+    # _end_if_
+
+    # Legacy dictionary output.
+    if isinstance(result, dict):
+        return result["f_value"], result["solution_is_found"]
+    # _end_if_
+
+    # Direct (value, flag) output.
+    if isinstance(result, tuple) and len(result) == 2 and\
+            isinstance(result[1], (bool, np.bool_)):
+        return result[0], bool(result[1])
+    # _end_if_
+
+    # Direct return of the value only.
+    return result, False
+# _end_def_
+
 def cost_function(func: Callable = None, minimize: bool = False):
     """
     Decorator for the function that we want to optimize.
@@ -263,7 +863,7 @@ def cost_function(func: Callable = None, minimize: bool = False):
     # _end_if_
 
     @wraps(func)
-    def function_wrapper(*args, **kwargs) -> dict:
+    def function_wrapper(*args, **kwargs) -> FitnessResult:
         """
         Internal function wrapper.
 
@@ -271,7 +871,7 @@ def cost_function(func: Callable = None, minimize: bool = False):
 
         :param kwargs: function keywords arguments.
 
-        :return: a dictionary with two key-values.
+        :return: a FitnessResult with the two values.
         """
 
         # Run the function we want to optimize.
@@ -290,21 +890,9 @@ def cost_function(func: Callable = None, minimize: bool = False):
             f_value, solution_is_found = result, False
         # _end_if_
 
-        # Multi-objective functions return a tuple
-        # with all the objective function values.
-        if isinstance(f_value, tuple):
-
-            if minimize:
-                # Reverse the sign of the objectives.
-                f_value = tuple(-fx for fx in f_value)
-
-            return {"f_value": f_value,
-                    "solution_is_found": solution_is_found}
-        # _end_if_
-
-        # Standard return statement.
-        return {"f_value": -f_value if minimize else f_value,
-                "solution_is_found": solution_is_found}
+        # Return the normalized fitness value.
+        return FitnessResult(_to_fitness(f_value, minimize),
+                             solution_is_found)
     # _end_def_
 
     return function_wrapper
@@ -0,0 +1,40 @@
+""" Shared fixtures of the tests. """
+import numpy as np
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+
+
+def random_population(size: int, n_genes: int, lower: float = 0.0, upper: float = 1.0,
+                      seed: int = 0, binary: bool = False) -> list[Chromosome]:
+    """
+    Creates a random population from a seeded generator. The random
+    function of each gene draws new values from the same generator.
+
+    :param size: (int) the number of the chromosomes.
+
+    :param n_genes: (int) the number of the genes of each chromosome.
+
+    :param lower: (float) the lower limit of the (real) gene values.
+
+    :param upper: (float) the upper limit of the (real) gene values.
+
+    :param seed: (int) the seed of the random generator.
+
+    :param binary: (bool) if True the genes are 0/1 integers (the limits
+                   are not used).
+
+    :return: the list of the chromosomes.
+    """
+    rng = np.random.default_rng(seed)
+
+    if binary:
+        return [Chromosome([Gene(int(b), lambda: int(rng.integers(0, 2)))
+                            for b in rng.integers(0, 2, n_genes)])
+                for _ in range(size)]
+    # _end_if_
+
+    return [Chromosome([Gene(float(v), lambda: float(rng.uniform(lower, upper)))
+                        for v in rng.uniform(lower, upper, n_genes)])
+            for _ in range(size)]
+# _end_def_
@@ -3,7 +3,8 @@ import numpy as np
 from pygenalgo.genome.gene import Gene
 from pygenalgo.genome.chromosome import Chromosome
 
-from pygenalgo.utils.utilities import cost_function, clamp
+from pygenalgo.utils.utilities import (cost_function, clamp,
+                                       FitnessResult, unpack_fitness)
 from pygenalgo.utils.auxiliary import (unique_pairs,
                                        correct_chromosomes,
                                        average_hamming_distance)
@@ -68,6 +69,48 @@ class TestAuxiliary(unittest.TestCase):
         # _end_for_
     # _end_def_
 
+    def test_cost_function(self):
+        """
+        Tests the cost_function decorator returns a FitnessResult
+        with normalized (Python float) values.
+
+        :return: None.
+        """
+
+        @cost_function(minimize=True)
+        def fit_scalar(x):
+            return x, True
+        # _end_def_
+
+        @cost_function
+        def fit_array(x):
+            return np.array([x, 2*x])
+        # _end_def_
+
+        # Scalar (minimization) case.
+        res_1 = fit_scalar(2)
+        self.assertIsInstance(res_1, FitnessResult)
+        self.assertEqual(type(res_1.f_value), float)
+        self.assertEqual(res_1.f_value, -2.0)
+        self.assertTrue(res_1.solution_is_found)
+
+        # The legacy dictionary access still works.
+        self.assertEqual(res_1["f_value"], -2.0)
+        self.assertTrue(res_1["solution_is_found"])
+
+        # Multi-objective (numpy array) case.
+        res_2 = fit_array(1)
+        self.assertEqual(res_2.f_value, (1.0, 2.0))
+        self.assertFalse(res_2.solution_is_found)
+
+        # Unpack all the supported return types.
+        self.assertEqual(unpack_fitness(res_2), ((1.0, 2.0), False))
+        self.assertEqual(unpack_fitness({"f_value": 1.0,
+                                         "solution_is_found": True}), (1.0, True))
+        self.assertEqual(unpack_fitness((3.0, True)), (3.0, True))
+        self.assertEqual(unpack_fitness(5.0), (5.0, False))
+    # _end_def_
+
     def test_apply_corrections(self):
         """
         Tests the apply_corrections method, creating a dummy
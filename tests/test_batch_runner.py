@@ -0,0 +1,129 @@
+import os
+import unittest
+import tempfile
+
+import numpy as np
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.standard_ga import StandardGA, RunConfig
+from pygenalgo.engines.batch_runner import BatchRunner, RunSpec
+from pygenalgo.operators.mutation.random_mutator import RandomMutator
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+
+
+def _random_bit() -> int:
+    return int(np.random.randint(0, 2))
+# _end_def_
+
+
+def _make_ga() -> StandardGA:
+    """
+    Creates a OneMax StandardGA with a random (global numpy) population.
+    """
+    population = [Chromosome([Gene(_random_bit(), _random_bit) for _ in range(10)])
+                  for _ in range(12)]
+
+    return StandardGA(initial_pop=population, fit_func=lambda x: float(sum(x.values())),
+                      select_op=LinearRankSelector(), mutate_op=RandomMutator(),
+                      crossx_op=UniformCrossover())
+# _end_def_
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestBatchRunner - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestBatchRunner - FINISH -", end='\n\n')
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test the validation of the input parameters.
+
+        :return: None.
+        """
+        with self.assertRaises(TypeError):
+            _ = BatchRunner([])
+
+        with self.assertRaises(TypeError):
+            _ = BatchRunner([_make_ga])
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test the grid, the compact arrays and the per-run seeding.
+
+        :return: None.
+        """
+        configs = {"short": RunConfig(epochs=5), "long": RunConfig(epochs=10)}
+
+        runner = BatchRunner.grid({"onemax": _make_ga}, configs, seeds=[1, 2, 1], n_jobs=2)
+
+        self.assertEqual(6, len(runner.specs))
+
+        result = runner.run()
+
+        # One row per run, padded with NaN (initial + 'epochs' entries).
+        self.assertEqual((6, 11), result.avg.shape)
+        self.assertEqual((6, 11), result.std.shape)
+        self.assertTrue(np.all(np.isnan(result.avg[:3, 6:])))
+        self.assertFalse(np.any(np.isnan(result.avg[3:])))
+
+        self.assertEqual([0, 1, 2], result.select("onemax/short").tolist())
+        self.assertTrue(np.all(result.f_evals > 0))
+
+        # The same seed gives the same run, regardless of the worker.
+        np.testing.assert_array_equal(result.avg[0], result.avg[2])
+        self.assertEqual(result.best[3], result.best[5])
+
+        # The same runs in a single process.
+        serial = BatchRunner(runner.specs, n_jobs=1).run()
+        np.testing.assert_array_equal(result.avg, serial.avg)
+    # _end_def_
+
+    def test_resume(self):
+        """
+        Test that the completed runs are loaded instead of executed.
+
+        :return: None.
+        """
+        specs = [RunSpec(factory=_make_ga, config=RunConfig(epochs=5), seed=s)
+                 for s in range(3)]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = BatchRunner(specs, n_jobs=1, path=tmp_dir).run()
+
+            self.assertEqual(["run_00000.npz", "run_00001.npz", "run_00002.npz"],
+                             sorted(os.listdir(tmp_dir)))
+
+            # Interrupted batch: the second run is missing.
+            os.remove(os.path.join(tmp_dir, "run_00001.npz"))
+
+            # Mark the completed runs (they must not be executed again).
+            mtime = os.path.getmtime(os.path.join(tmp_dir, "run_00000.npz"))
+
+            resumed = BatchRunner(specs, n_jobs=1, path=tmp_dir).run()
+
+            self.assertEqual(mtime, os.path.getmtime(os.path.join(tmp_dir, "run_00000.npz")))
+            np.testing.assert_array_equal(result.avg, resumed.avg)
+            np.testing.assert_array_equal(result.f_evals, resumed.f_evals)
+
+            # The directory of a different batch.
+            with self.assertRaises(ValueError):
+                BatchRunner([RunSpec(factory=_make_ga, seed=10)], path=tmp_dir).run()
+            # _end_with_
+        # _end_with_
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
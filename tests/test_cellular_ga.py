@@ -0,0 +1,126 @@
+import unittest
+
+import numpy as np
+
+from tests import random_population
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.cellular_ga import CellularGA, RunConfig
+from pygenalgo.operators.mutation.flip_mutator import FlipMutator
+from pygenalgo.operators.selection.tournament_selector import TournamentSelector
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+
+
+def _one_max(individual: Chromosome) -> float:
+    """
+    Dummy fitness function that counts the ones of the genome.
+    """
+    return float(sum(individual.values()))
+# _end_def_
+
+
+class TestCellularGA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestCellularGA - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestCellularGA - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object (of grid 6x5) with default settings.
+
+        :return: None.
+        """
+        self.ga = CellularGA(grid_shape=(6, 5),
+                             initial_pop=random_population(30, 20, seed=3, binary=True),
+                             fit_func=_one_max, select_op=TournamentSelector(),
+                             mutate_op=FlipMutator(0.05), crossx_op=UniformCrossover())
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test the validation of the input parameters.
+
+        :return: None.
+        """
+        # Test population.
+        population = random_population(30, 20, seed=3, binary=True)
+
+        with self.assertRaises(ValueError):
+            _ = CellularGA(grid_shape=(6, 5), initial_pop=population, fit_func=_one_max,
+                           select_op=TournamentSelector(), mutate_op=FlipMutator(),
+                           crossx_op=UniformCrossover(), neighborhood="hexagonal")
+
+        with self.assertRaises(ValueError):
+            _ = CellularGA(grid_shape=(6, 5), initial_pop=population, fit_func=_one_max,
+                           select_op=TournamentSelector(), mutate_op=FlipMutator(),
+                           crossx_op=UniformCrossover(), update="random")
+
+        with self.assertRaises(ValueError):
+            _ = CellularGA(grid_shape=(6, 5), initial_pop=population, fit_func=_one_max,
+                           select_op=TournamentSelector(), mutate_op=FlipMutator(),
+                           crossx_op=UniformCrossover(), update="asynchronous",
+                           block_rows=7)
+
+        with self.assertRaises(ValueError):
+            _ = CellularGA(grid_shape=(4, 4), initial_pop=population, fit_func=_one_max,
+                           select_op=TournamentSelector(), mutate_op=FlipMutator(),
+                           crossx_op=UniformCrossover())
+    # _end_def_
+
+    def test_neighbors(self):
+        """
+        Test the (precomputed) neighbours on the torus.
+
+        :return: None.
+        """
+        self.assertEqual((30, 4), self.ga.neighbors.shape)
+
+        # The cell (0, 0) wraps around to the last row and column
+        # (in the order: up, down, left, right).
+        self.assertEqual([25, 5, 4, 1], self.ga.neighbors[0].tolist())
+
+        moore_ga = CellularGA(grid_shape=(6, 5), neighborhood="moore",
+                              initial_pop=random_population(30, 20, seed=3, binary=True),
+                              fit_func=_one_max, select_op=TournamentSelector(),
+                              mutate_op=FlipMutator(0.05), crossx_op=UniformCrossover())
+
+        self.assertEqual((30, 8), moore_ga.neighbors.shape)
+
+        # No cell is a neighbour of itself.
+        self.assertFalse(np.any(moore_ga.neighbors == np.arange(30)[:, None]))
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test that both updates (with elitism) do not lose the best fitness.
+
+        :return: None.
+        """
+        for update in ("synchronous", "asynchronous"):
+            ga = CellularGA(grid_shape=(6, 5), update=update, block_rows=2,
+                            initial_pop=random_population(30, 20, seed=3, binary=True),
+                            fit_func=_one_max, select_op=TournamentSelector(),
+                            mutate_op=FlipMutator(0.05), crossx_op=UniformCrossover())
+
+            ga.run(RunConfig(epochs=20))
+
+            self.assertEqual(30, len(ga.population))
+            self.assertEqual(20, len(ga.stats["avg"]) - 1)
+
+            # The replacement keeps the cell if the offspring is worse.
+            self.assertTrue(np.all(np.diff(ga.stats["avg"]) >= 0.0))
+            self.assertEqual(30 * 21, ga.f_evals)
+        # _end_for_
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.operators.selection.crowded_tournament_selector import CrowdedTournamentSelector
+
+
+class TestCrowdedTournamentSelector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestCrowdedTournamentSelector - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestCrowdedTournamentSelector - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object with default settings.
+
+        :return: None.
+        """
+        self.select_op = CrowdedTournamentSelector()
+    # _end_def_
+
+    @staticmethod
+    def _population(fitness: list[tuple]) -> list[Chromosome]:
+        """
+        Creates a population with the given fitness tuples.
+
+        :return: the list of chromosomes.
+        """
+        return [Chromosome([Gene(k, lambda: 0)], fitness=f)
+                for k, f in enumerate(fitness)]
+    # _end_def_
+
+    def test_select_rank(self):
+        """
+        Test that the lower non-domination rank wins.
+
+        :return: None.
+        """
+        # The first chromosome dominates the second one.
+        population = self._population([(5.0, 5.0), (1.0, 0.0)])
+
+        # With two contestants the best is always selected.
+        for _ in range(10):
+            selected = self.select_op(population)
+            self.assertEqual(2, len(selected))
+            self.assertTrue(all(p is population[0] for p in selected))
+        # _end_for_
+    # _end_def_
+
+    def test_select_crowding(self):
+        """
+        Test that on the same front the larger crowding distance wins.
+
+        :return: None.
+        """
+        # All the points lie on the same front. The middle one
+        # has finite crowding distance, the extremes infinite.
+        population = self._population([(0.0, 2.0), (1.0, 1.0), (2.0, 0.0)])
+
+        for _ in range(20):
+            selected = self.select_op(population)
+            self.assertEqual(3, len(selected))
+            self.assertFalse(population[1] in selected)
+        # _end_for_
+
+        # The selection counter is increased once per call.
+        self.assertEqual(20, self.select_op.counter)
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import unittest
+
+import numpy as np
+
+from tests import random_population
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.differential_evolution_ga import (DifferentialEvolutionGA,
+                                                         RunConfig)
+
+
+def _sphere(individual: Chromosome) -> float:
+    """
+    Dummy fitness function (maximum at x = 1).
+    """
+    return -float(np.sum((np.array(individual.values()) - 1.0) ** 2))
+# _end_def_
+
+
+def _is_positive(population: list[Chromosome]) -> list[bool]:
+    """
+    Dummy feasibility function (all the genes must be non-negative).
+    """
+    return [min(p.values()) >= 0.0 for p in population]
+# _end_def_
+
+
+def _repair_positive(individual: Chromosome) -> None:
+    """
+    Dummy repair function (in place) that sets the negative genes to zero.
+    """
+    for gene in individual.genome:
+        gene.value = max(gene.value, 0.0)
+    # _end_for_
+# _end_def_
+
+
+class TestDifferentialEvolutionGA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestDifferentialEvolutionGA - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestDifferentialEvolutionGA - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates a random population of 20 real-coded chromosomes.
+
+        :return: None.
+        """
+        self.population = random_population(20, 4, -5.0, 5.0, seed=5)
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test the validation of the input parameters.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            _ = DifferentialEvolutionGA(strategy="rand/2/exp",
+                                        initial_pop=self.population, fit_func=_sphere)
+
+        with self.assertRaises(ValueError):
+            _ = DifferentialEvolutionGA(f_weight=0.0,
+                                        initial_pop=self.population, fit_func=_sphere)
+
+        with self.assertRaises(ValueError):
+            _ = DifferentialEvolutionGA(initial_pop=self.population[:3], fit_func=_sphere)
+    # _end_def_
+
+    def test_random_indices(self):
+        """
+        Test that the random indices avoid the excluded ones.
+
+        :return: None.
+        """
+        ga = DifferentialEvolutionGA(initial_pop=self.population, fit_func=_sphere)
+
+        # Exclude the row index and a second index.
+        exclude = np.column_stack((np.arange(20), (np.arange(20) + 1) % 20))
+
+        for _ in range(10):
+            index = ga._random_indices(20, exclude)
+
+            self.assertFalse(np.any(index[:, None] == exclude))
+        # _end_for_
+    # _end_def_
+
+    def test_binomial_crossover(self):
+        """
+        Test that each trial vector takes at least one gene from its mutant
+        and that the bounds are respected.
+
+        :return: None.
+        """
+        ga = DifferentialEvolutionGA(bounds=(-5.0, 5.0), initial_pop=self.population,
+                                     fit_func=_sphere)
+
+        # The mutant vectors are outside the bounds.
+        x_mutant = np.full(ga.x_population.shape, 100.0)
+
+        x_trial = ga.binomial_crossover(x_mutant, np.zeros(20))
+
+        # Exactly one gene changes (CR = 0).
+        self.assertTrue(np.all(np.sum(x_trial != ga.x_population, axis=1) == 1))
+
+        # And it is repaired inside the bounds.
+        self.assertTrue(np.all(x_trial <= 5.0))
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test that all the strategies improve the initial population.
+
+        :return: None.
+        """
+        for strategy in ("rand/1/bin", "best/1/bin", "current-to-pbest/1/bin"):
+            ga = DifferentialEvolutionGA(strategy=strategy, bounds=(-5.0, 5.0),
+                                         initial_pop=[p.clone() for p in self.population],
+                                         fit_func=_sphere)
+            ga.run(RunConfig(epochs=30))
+
+            # The greedy selection never makes the population worse.
+            self.assertTrue(np.all(np.diff(ga.stats["avg"]) >= 0.0))
+            self.assertEqual(20 * 31, ga.f_evals)
+            self.assertEqual(31, len(ga.stats["mu_F"]))
+
+            # The array and the chromosomes are consistent.
+            self.assertTrue(np.allclose(ga.x_population,
+                                        [p.values() for p in ga.population]))
+        # _end_for_
+    # _end_def_
+
+    def test_run_repair(self):
+        """
+        Test that the trial vectors repaired by the feasibility
+        stage are stored in the population array.
+
+        :return: None.
+        """
+        ga = DifferentialEvolutionGA(bounds=(-5.0, 5.0), initial_pop=self.population,
+                                     fit_func=_sphere, feasible_func=_is_positive,
+                                     repair_func=_repair_positive)
+        ga.run(RunConfig(epochs=20))
+
+        # All the chromosomes are repaired (feasible).
+        self.assertTrue(all(_is_positive(ga.population)))
+
+        # The array and the chromosomes are consistent.
+        self.assertTrue(np.allclose(ga.x_population,
+                                    [p.values() for p in ga.population]))
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
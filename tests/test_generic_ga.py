@@ -1,10 +1,31 @@
+import os
+import time
+import asyncio
 import unittest
+import tempfile
+from statistics import fmean, pstdev
 from pygenalgo.genome.gene import Gene
 from pygenalgo.genome.chromosome import Chromosome
-from pygenalgo.engines.generic_ga import GenericGA
+from pygenalgo.engines.generic_ga import GenericGA, EpochRecord, _get_thread_executor
+from pygenalgo.engines.standard_ga import StandardGA, RunConfig
+from pygenalgo.operators.genetic_operator import GeneticOperator
 from pygenalgo.operators.mutation.mutate_operator import MutationOperator
 from pygenalgo.operators.selection.select_operator import SelectionOperator
 from pygenalgo.operators.crossover.crossover_operator import CrossoverOperator
+from pygenalgo.operators.mutation.random_mutator import RandomMutator
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+
+def _crashing_fit_func(individual):
+    """
+    Dummy fitness function that kills the worker process
+    when the first gene has the value 'h'.
+    """
+    if individual[0].value == 'h':
+        os._exit(1)
+    return 1.0
+# _end_def_
+
 
 class TestGenericGA(unittest.TestCase):
 
@@ -114,6 +135,390 @@ class TestGenericGA(unittest.TestCase):
         # _end_with_
     # _end_def_
 
+    def test_filter_feasible(self):
+        """
+        Ensure the feasibility stage assigns the penalty to the
+        infeasible chromosomes without calling the fitness function.
+
+        :return: None.
+        """
+        # Keep track of the evaluated chromosomes.
+        evaluated = []
+
+        def fit_func(x):
+            evaluated.append(x)
+            return 1.0
+        # _end_def_
+
+        # Feasible only if the first gene is a letter.
+        def feasible_func(batch):
+            return [p[0].value.isalpha() for p in batch]
+        # _end_def_
+
+        # A penalty or a repair function is required.
+        with self.assertRaises(ValueError):
+            _ = GenericGA(initial_pop=self.ga.population, fit_func=fit_func,
+                          select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                          crossx_op=CrossoverOperator(1.0), feasible_func=feasible_func)
+        # _end_with_
+
+        test_ga = GenericGA(initial_pop=self.ga.population, fit_func=fit_func,
+                            select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                            crossx_op=CrossoverOperator(1.0), feasible_func=feasible_func,
+                            infeasible_penalty=-100.0)
+
+        # Evaluate the whole population.
+        fit_list, _ = test_ga.evaluate_fitness(test_ga.population)
+
+        # Seven chromosomes start with a letter.
+        self.assertEqual(7, len(evaluated))
+        self.assertEqual(7, test_ga.f_evals)
+
+        # The rest of them have the penalty value.
+        self.assertEqual(5, fit_list.count(-100.0))
+
+        # A second batch in the same epoch (e.g. local search).
+        test_ga.evaluate_fitness(test_ga.population[:4])
+
+        # One (pooled) feasibility rate per epoch.
+        test_ga.update_stats(fit_list)
+        self.assertEqual(1, len(test_ga.stats["feasible"]))
+        self.assertAlmostEqual(10/16, test_ga.stats["feasible"][-1])
+
+        # In a run the series is aligned with the epochs.
+        run_ga = StandardGA(initial_pop=[p.clone() for p in self.ga.population],
+                            fit_func=fit_func, select_op=LinearRankSelector(),
+                            mutate_op=RandomMutator(), crossx_op=UniformCrossover(),
+                            feasible_func=feasible_func, infeasible_penalty=-100.0)
+        run_ga.run(RunConfig(epochs=5))
+        self.assertEqual(len(run_ga.stats["avg"]), len(run_ga.stats["feasible"]))
+    # _end_def_
+
+    def test_evaluate_fault_tolerant(self):
+        """
+        Ensure a crashed worker does not stop the evaluation
+        and the responsible chromosomes get the crash penalty.
+
+        :return: None.
+        """
+        # A crash penalty is required with retries.
+        with self.assertRaises(ValueError):
+            _ = GenericGA(initial_pop=self.ga.population, fit_func=_crashing_fit_func,
+                          select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                          crossx_op=CrossoverOperator(1.0), max_retries=1)
+        # _end_with_
+
+        test_ga = GenericGA(initial_pop=self.ga.population, fit_func=_crashing_fit_func,
+                            select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                            crossx_op=CrossoverOperator(1.0), n_cpus=2, max_retries=2,
+                            crash_penalty=-1.0)
+
+        # Evaluate the whole population in parallel.
+        fit_list, _ = test_ga.evaluate_fitness(test_ga.population, parallel_mode=True)
+
+        # The two chromosomes starting with 'h' are penalized.
+        self.assertEqual(2, fit_list.count(-1.0))
+        self.assertEqual(10, fit_list.count(1.0))
+        self.assertEqual(2, test_ga.fault_counters["penalized"])
+
+        # One broken pool, then each 'h' crashes in both of its retries.
+        self.assertEqual(1 + 2 * 2, test_ga.fault_counters["crashes"])
+        self.assertLessEqual(test_ga.fault_counters["retries"], 12 + 2)
+    # _end_def_
+
+    def test_checkpoint(self):
+        """
+        Ensure the save / load checkpoint methods
+        restore the state of the engine.
+
+        :return: None.
+        """
+        # Create some state.
+        self.ga.update_stats(self.ga.population_fitness())
+        self.ga.iteration = 3
+        self.ga.crossx_op.probability = 0.7
+        self.ga.mutate_op.inc_counter(5)
+        self.ga.population[0].invalidate_fitness()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "checkpoint.npz")
+
+            # Save the checkpoint.
+            self.ga.save_checkpoint(path)
+
+            # Only the final file should exist.
+            self.assertEqual(["checkpoint.npz"], os.listdir(tmp_dir))
+
+            # The next random numbers after the checkpoint.
+            next_ga = self.ga.rng_GA.random()
+            next_op = GeneticOperator._rng.random()
+
+            # Change the state.
+            population = [p.clone() for p in self.ga.population]
+            self.ga.population[1][0].value = 'z'
+            self.ga.population[1].fitness = -1.0
+            self.ga.crossx_op.probability = 0.1
+            self.ga.clear_all()
+
+            # Load the checkpoint.
+            self.ga.load_checkpoint(path)
+        # _end_with_
+
+        self.assertEqual(population, self.ga.population)
+        self.assertIsNone(self.ga.population[0].fitness)
+        self.assertEqual(1.0, self.ga.population[1].fitness)
+        self.assertEqual(3, self.ga.iteration)
+        self.assertEqual(0.7, self.ga.crossx_op.probability)
+        self.assertEqual(5, self.ga.mutate_op.counter)
+        self.assertEqual(1, len(self.ga.stats["avg"]))
+
+        # The random generators continue from the same state.
+        self.assertEqual(next_ga, self.ga.rng_GA.random())
+        self.assertEqual(next_op, GeneticOperator._rng.random())
+
+        # The next run starts after the checkpoint.
+        self.assertEqual(4, self.ga.start_run())
+        self.assertEqual(0, self.ga.start_run())
+    # _end_def_
+
+    def test_checkpoint_mixed_genome(self):
+        """
+        Ensure the checkpoint keeps the type of each gene
+        in genomes with values of different types.
+
+        :return: None.
+        """
+        pop = [Chromosome([Gene(k, lambda: 0), Gene(k + 0.5, lambda: 0.0),
+                           Gene(k % 2 == 0, lambda: True), Gene(str(k), lambda: 'x')],
+                          fitness=float(k)) for k in range(4)]
+
+        test_ga = GenericGA(initial_pop=pop, fit_func=lambda x: 0.0,
+                            select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                            crossx_op=CrossoverOperator(1.0))
+
+        # The values are stored in a common (string) array with their types.
+        state = test_ga._checkpoint_state()
+        self.assertEqual(16, len(state["genome_dtypes"]))
+
+        # Homogeneous genomes do not need the types.
+        self.assertNotIn("genome_dtypes", self.ga._checkpoint_state())
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "checkpoint.npz")
+
+            test_ga.save_checkpoint(path)
+
+            # Change the genome values.
+            for p in test_ga.population:
+                for gene in p.genome:
+                    gene.value = None
+                # _end_for_
+            # _end_for_
+
+            test_ga.load_checkpoint(path)
+        # _end_with_
+
+        for k, p in enumerate(test_ga.population):
+            self.assertEqual([k, k + 0.5, k % 2 == 0, str(k)], p.values())
+            self.assertEqual([int, float, bool, str], [type(v) for v in p.values()])
+        # _end_for_
+    # _end_def_
+
+    def test_evaluate_as_completed(self):
+        """
+        Ensure the 'as completed' mode stops the evaluations
+        when a solution is found, or the budget is reached.
+
+        :return: None.
+        """
+        # The solution is the chromosome that starts with '5'.
+        def fit_func(x):
+            return 1.0, x[0].value == '5'
+        # _end_def_
+
+        test_ga = GenericGA(initial_pop=self.ga.population, fit_func=fit_func,
+                            select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                            crossx_op=CrossoverOperator(1.0), n_cpus=2)
+
+        # Serial mode: stops right after the 6th chromosome.
+        _, found = test_ga.evaluate_fitness(test_ga.population, as_completed=True)
+        self.assertTrue(found)
+        self.assertEqual(6, test_ga.f_evals)
+        self.assertEqual(6, test_ga.stats["cancelled"][-1])
+
+        # Parallel mode: the budget is respected exactly.
+        test_ga.clear_all()
+        _, found = test_ga.evaluate_fitness(test_ga.population[6:], parallel_mode=True,
+                                            as_completed=True, max_evals=4)
+        self.assertFalse(found)
+        self.assertEqual(4, test_ga.f_evals)
+
+        # The cancelled chromosomes get the worst fitness of the batch.
+        def fit_func_2(x):
+            return float(ord(x[0].value)), False
+        # _end_def_
+
+        test_ga = GenericGA(initial_pop=self.ga.population, fit_func=fit_func_2,
+                            select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                            crossx_op=CrossoverOperator(1.0), n_cpus=2)
+        for p in test_ga.population:
+            p.invalidate_fitness()
+        # _end_for_
+
+        test_ga.evaluate_fitness(test_ga.population, as_completed=True, max_evals=5)
+        fit_values = [p.fitness for p in test_ga.population]
+        self.assertNotIn(None, fit_values)
+        self.assertTrue(all(v == min(fit_values[:5]) for v in fit_values[5:]))
+
+        # The running statistics of the completed evaluations.
+        self.assertAlmostEqual(fmean(fit_values[:5]), test_ga.stats["completed_avg"][-1])
+        self.assertAlmostEqual(pstdev(fit_values[:5]), test_ga.stats["completed_std"][-1])
+
+        # An error of a task is raised (and the other tasks are cancelled).
+        def fit_func_3(x):
+            if x[0].value == '3':
+                raise RuntimeError("Crashed evaluation.")
+            # _end_if_
+
+            return 1.0
+        # _end_def_
+
+        test_ga.fitness_func = fit_func_3
+
+        with self.assertRaises(RuntimeError):
+            test_ga.evaluate_fitness(test_ga.population, parallel_mode=True,
+                                     as_completed=True)
+        # _end_with_
+
+        # The batch evaluators and the fault tolerance are not supported.
+        test_ga = GenericGA(initial_pop=self.ga.population, fit_func=fit_func_2,
+                            select_op=SelectionOperator(1.0), mutate_op=MutationOperator(1.0),
+                            crossx_op=CrossoverOperator(1.0), n_cpus=2,
+                            max_retries=1, crash_penalty=-1.0)
+
+        with self.assertRaises(ValueError):
+            test_ga.evaluate_fitness(test_ga.population, parallel_mode=True,
+                                     as_completed=True)
+        # _end_with_
+
+        # The thread executor is reused by all the calls.
+        self.assertIs(_get_thread_executor(2), _get_thread_executor(2))
+    # _end_def_
+
+    def test_run_iter(self):
+        """
+        Ensure the run_iter method yields one record per epoch
+        and the run stops when the caller stops iterating.
+
+        :return: None.
+        """
+        # The generic engine has no evolutionary routine.
+        with self.assertRaises(NotImplementedError):
+            self.ga.run(RunConfig(epochs=2))
+
+        test_ga = StandardGA(initial_pop=[p.clone() for p in self.ga.population],
+                             fit_func=lambda x: float(ord(x[0].value)),
+                             select_op=LinearRankSelector(), mutate_op=RandomMutator(),
+                             crossx_op=UniformCrossover())
+
+        # Stop the run after three epochs.
+        records = []
+        for record in test_ga.run_iter(RunConfig(epochs=100), population_view=True):
+            records.append(record)
+
+            if record.epoch == 2:
+                break
+            # _end_if_
+        # _end_for_
+
+        self.assertEqual([0, 1, 2], [r.epoch for r in records])
+        self.assertTrue(all(isinstance(r, EpochRecord) for r in records))
+
+        # The records follow the state of the engine.
+        self.assertEqual(test_ga.f_evals, records[-1].f_evals)
+        self.assertEqual(test_ga.stats["avg"][-1], records[-1].avg)
+        self.assertEqual(test_ga.best_chromosome().fitness, records[-1].best)
+        self.assertEqual(tuple(test_ga.population), records[-1].population)
+
+        # Without the view the population is not included.
+        record = next(test_ga.run_iter(RunConfig(epochs=10)))
+        self.assertIsNone(record.population)
+        self.assertLessEqual(record.epoch_time, record.elapsed_time)
+    # _end_def_
+
+    def test_run_async(self):
+        """
+        Ensure the run_async method completes the run without blocking
+        the event loop, and stops cleanly when it is cancelled.
+
+        :return: None.
+        """
+        def slow_fit_func(x):
+            time.sleep(0.001)
+            return float(ord(x[0].value))
+        # _end_def_
+
+        def make_ga():
+            return StandardGA(initial_pop=[p.clone() for p in self.ga.population],
+                              fit_func=slow_fit_func, select_op=LinearRankSelector(),
+                              mutate_op=RandomMutator(), crossx_op=UniformCrossover())
+        # _end_def_
+
+        async def complete_runs():
+            # Count the ticks of the event loop during the runs.
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.001)
+                    ticks += 1
+                # _end_while_
+            # _end_def_
+
+            ticker_task = asyncio.create_task(ticker())
+
+            # Two concurrent runs in the same event loop.
+            engines = [make_ga(), make_ga()]
+            records = await asyncio.gather(*(ga.run_async(RunConfig(epochs=10))
+                                             for ga in engines))
+            ticker_task.cancel()
+
+            return engines, records, ticks
+        # _end_def_
+
+        engines, records, ticks = asyncio.run(complete_runs())
+
+        for test_ga, record in zip(engines, records):
+            self.assertEqual(9, record.epoch)
+            self.assertEqual(11, len(test_ga.stats["avg"]))
+        # _end_for_
+
+        # The event loop was not blocked.
+        self.assertGreater(ticks, 0)
+
+        async def cancel_run(test_ga):
+            task = asyncio.create_task(test_ga.run_async(RunConfig(epochs=10000)))
+
+            # Let the run start.
+            await asyncio.sleep(0.1)
+            task.cancel()
+
+            await task
+        # _end_def_
+
+        test_ga = make_ga()
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(cancel_run(test_ga))
+        # _end_with_
+
+        # The partial result is consistent (initial + completed epochs).
+        n_epochs = len(test_ga.stats["avg"]) - 1
+        self.assertTrue(0 < n_epochs < 10000)
+        self.assertEqual(n_epochs - 1, test_ga.iteration)
+        self.assertEqual((n_epochs + 1) * len(test_ga.population), test_ga.f_evals)
+    # _end_def_
+
 # _end_class_
 
 
@@ -0,0 +1,111 @@
+import unittest
+import numpy as np
+
+from pygenalgo.utils.hypervolume import (hypervolume,
+                                         hypervolume_contributions)
+
+
+class TestHypervolume(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestHypervolume - START -")
+
+        # Create a random generator with fixed seed.
+        cls.rng = np.random.default_rng(42)
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestHypervolume - FINISH -", end='\n\n')
+    # _end_def_
+
+    def test_known_values(self) -> None:
+        """
+        Test the hypervolume on simple sets of points.
+
+        :return: None.
+        """
+        # Two overlapping rectangles: 2 + 2 - 1.
+        pts = np.array([[1.0, 2.0], [2.0, 1.0]])
+        self.assertAlmostEqual(3.0, hypervolume(pts, np.zeros(2)))
+
+        # The same in the 'min' mode.
+        self.assertAlmostEqual(3.0, hypervolume(-pts, np.zeros(2), mode="min"))
+
+        # Adding a dominated point does not change it.
+        pts_dom = np.vstack([pts, [0.5, 0.5]])
+        self.assertAlmostEqual(3.0, hypervolume(pts_dom, np.zeros(2)))
+
+        # Two overlapping boxes (in 3-D and 4-D).
+        for n_dims in (3, 4):
+            pts = np.ones((2, n_dims))
+            pts[0, 0] = pts[1, 1] = 2.0
+            self.assertAlmostEqual(3.0, hypervolume(pts, np.zeros(n_dims)))
+        # _end_for_
+
+        # Points that do not dominate the reference are ignored.
+        self.assertEqual(0.0, hypervolume(pts, 5.0 * np.ones(4)))
+
+        # Wrong reference point.
+        with self.assertRaises(ValueError):
+            hypervolume(pts, np.zeros(3))
+        # _end_with_
+    # _end_def_
+
+    def test_exact_methods(self) -> None:
+        """
+        Test the exact methods against the Monte Carlo estimate.
+
+        :return: None.
+        """
+        for n_dims in (2, 3, 4, 5):
+            # Random points (on the positive sphere).
+            pts = np.abs(self.rng.normal(size=(20, n_dims)))
+            pts /= np.linalg.norm(pts, axis=1, keepdims=True)
+
+            # Compute the two estimates.
+            hv_exact = hypervolume(pts, np.zeros(n_dims), method="exact")
+            hv_monte = hypervolume(pts, np.zeros(n_dims), method="monte_carlo",
+                                   n_samples=200_000, rng=self.rng)
+
+            # They should be close.
+            self.assertTrue(np.isclose(hv_exact, hv_monte, rtol=0.02))
+        # _end_for_
+    # _end_def_
+
+    def test_contributions(self) -> None:
+        """
+        Test the contributions against leaving one point out.
+
+        :return: None.
+        """
+        for n_dims in (2, 3, 4):
+            # Random points, with a duplicate.
+            pts = np.abs(self.rng.normal(size=(15, n_dims)))
+            pts = np.vstack([pts, pts[0]])
+
+            # Compute the contributions.
+            contrib = hypervolume_contributions(pts, np.zeros(n_dims))
+
+            # Total hypervolume.
+            hv_total = hypervolume(pts, np.zeros(n_dims))
+
+            # Leave one out.
+            expected = [hv_total - hypervolume(np.delete(pts, i, axis=0),
+                                               np.zeros(n_dims))
+                        for i in range(pts.shape[0])]
+
+            # They should be identical.
+            self.assertTrue(np.allclose(expected, contrib))
+
+            # The duplicates do not contribute.
+            self.assertEqual(0.0, contrib[0])
+        # _end_for_
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,454 @@
+import os
+import time
+import pickle
+import unittest
+import tempfile
+import multiprocessing
+
+import numpy as np
+
+from tests import random_population
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.island_model_ga import (IslandModelGA, RunConfig, _SharedCounter,
+                                               _register_counter_lock, _COUNTER_LOCKS)
+from pygenalgo.operators.mutation.flip_mutator import FlipMutator
+from pygenalgo.operators.mutation.random_mutator import RandomMutator
+from pygenalgo.operators.selection.tournament_selector import TournamentSelector
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+from pygenalgo.operators.migration.clockwise_migration import ClockwiseMigration
+
+
+def _one_max(individual: Chromosome) -> float:
+    """
+    Dummy fitness function that counts the ones of the genome.
+    """
+    return float(sum(individual.values()))
+# _end_def_
+
+
+# Weights of the (16) genes.
+_WEIGHTS = np.random.default_rng(3).uniform(0.5, 1.5, 16)
+
+
+def _stalled_dot(individual: Chromosome) -> float:
+    """
+    Dummy fitness function with the weighted sum of the genome,
+    except for the short (8 genes) chromosomes that always get
+    zero fitness, so their island stalls at the first epoch.
+    """
+    # Get the values of the genes.
+    values = individual.values()
+
+    if len(values) == 8:
+        return 0.0
+    # _end_if_
+
+    return float(np.dot(_WEIGHTS, values))
+# _end_def_
+
+
+def _logged_one_max(log_dir: str):
+    """
+    Creates a fitness function that also logs the time of each
+    evaluation inside the (daemon) island workers, in one file
+    per process.
+    """
+    def fitness(individual: Chromosome) -> float:
+        # Log only the evaluations of the island workers.
+        if multiprocessing.current_process().daemon:
+            time.sleep(0.002)
+
+            with open(os.path.join(log_dir, f"{os.getpid()}.log"), "a") as f_out:
+                f_out.write(f"{time.time()}\n")
+            # _end_with_
+        # _end_if_
+
+        return _one_max(individual)
+    # _end_def_
+
+    return fitness
+# _end_def_
+
+
+def _max_overlap(log_dir: str) -> int:
+    """
+    Finds the maximum number of the island workers that were
+    evaluating at the same time (from their first to their last
+    logged evaluation).
+
+    :return: the maximum overlap of the workers.
+    """
+    # Busy interval of each worker.
+    intervals = []
+
+    for name in os.listdir(log_dir):
+        with open(os.path.join(log_dir, name)) as f_in:
+            times = [float(t) for t in f_in.read().split()]
+        # _end_with_
+
+        intervals.append((min(times), max(times)))
+    # _end_for_
+
+    # Sweep the start / end events.
+    events = sorted([(t0, 1) for t0, _ in intervals] +
+                    [(t1, -1) for _, t1 in intervals])
+
+    n_busy, max_busy = 0, 0
+
+    for _, step in events:
+        n_busy += step
+        max_busy = max(max_busy, n_busy)
+    # _end_for_
+
+    return max_busy
+# _end_def_
+
+
+class TestIslandModelGA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestIslandModelGA - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestIslandModelGA - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates a random population of 24 binary chromosomes.
+
+        :return: None.
+        """
+        self.population = random_population(24, 16, seed=5, binary=True)
+    # _end_def_
+
+    def _make_ga(self, fit_func=_one_max, n_cpus: int = 4) -> IslandModelGA:
+        """
+        Creates an island model GA (with 4 islands) that divides 'n_cpus'.
+
+        :return: the IslandModelGA.
+        """
+        test_ga = IslandModelGA(num_islands=4, migrate_op=ClockwiseMigration(),
+                                initial_pop=self.population, fit_func=fit_func,
+                                select_op=TournamentSelector(k=2),
+                                mutate_op=FlipMutator(0.05),
+                                crossx_op=UniformCrossover())
+
+        # Use the same CPUs on all the machines.
+        test_ga._n_cpus = n_cpus
+
+        return test_ga
+    # _end_def_
+
+    def test_shared_counter(self):
+        """
+        Test the reservations of the shared counter and that the
+        pickled counter needs the registered lock of the budget.
+
+        :return: None.
+        """
+        counter = _SharedCounter(4, limit=10, base=2)
+
+        # Only the remaining budget is granted.
+        self.assertEqual(5, counter.reserve(0, 5))
+        self.assertEqual(3, counter.reserve(1, 5))
+        self.assertTrue(counter.exhausted)
+
+        # The unused evaluations are returned.
+        counter.release(1, 2)
+        self.assertEqual(8, counter.used)
+
+        # Without the registered lock the budget can't be shared.
+        data = pickle.dumps(counter)
+
+        with self.assertRaises(RuntimeError):
+            _ = pickle.loads(data)
+        # _end_with_
+
+        # With the registered lock the copy shares the counts.
+        _register_counter_lock(*counter.initargs)
+
+        copy_counter = pickle.loads(data)
+        self.assertEqual(2, copy_counter.reserve(2, 5))
+        self.assertEqual(10, counter.used)
+
+        # Remove the registered lock.
+        del _COUNTER_LOCKS[counter.initargs[0]]
+
+        copy_counter.close()
+        counter.close()
+    # _end_def_
+
+    def test_execution_plan(self):
+        """
+        Test the split of the CPUs in islands x evaluation workers.
+
+        :return: None.
+        """
+        test_ga = self._make_ga()
+
+        # The free cores go to the evaluation workers.
+        self.assertEqual((2, 2), test_ga.execution_plan(4, RunConfig(island_jobs=2,
+                                                                      eval_workers=None)))
+        # The requested evaluation workers.
+        self.assertEqual((2, 1), test_ga.execution_plan(4, RunConfig(island_jobs=2)))
+
+        # No oversubscription.
+        self.assertEqual((3, 1), test_ga.execution_plan(4, RunConfig(island_jobs=3,
+                                                                      eval_workers=4)))
+        # Never more processes than the islands.
+        self.assertEqual((2, 2), test_ga.execution_plan(2, RunConfig(eval_workers=None)))
+    # _end_def_
+
+    def test_run_utilization(self):
+        """
+        Test that the persistent and the asynchronous islands run with the
+        planned islands x workers split and report its utilization.
+
+        :return: None.
+        """
+        for mode in ("persistent_islands", "async_migration"):
+            for island_jobs, utilization in ((2, 1.0), (3, 0.75)):
+
+                with tempfile.TemporaryDirectory() as log_dir:
+                    test_ga = self._make_ga(fit_func=_logged_one_max(log_dir))
+
+                    # Workers (pids) and their maximum overlap.
+                    workers, max_busy = set(), 0
+
+                    # One record per period (or one at the end).
+                    for k, _ in enumerate(test_ga.run_iter(
+                            RunConfig(epochs=6, n_periods=2, allow_migration=True,
+                                      island_jobs=island_jobs, eval_workers=None,
+                                      **{mode: True}))):
+
+                        # Move the logs of the period in their own directory.
+                        period_dir = os.path.join(log_dir, f"period_{k}")
+                        os.mkdir(period_dir)
+
+                        for name in os.listdir(log_dir):
+                            if name.endswith(".log"):
+                                os.replace(os.path.join(log_dir, name),
+                                           os.path.join(period_dir, name))
+                                workers.add(name)
+                            # _end_if_
+                        # _end_for_
+
+                        max_busy = max(max_busy, _max_overlap(period_dir))
+                    # _end_for_
+                # _end_with_
+
+                # Each island has its own worker, but only
+                # 'island_jobs' of them evolve at the same time.
+                self.assertEqual(4, len(workers))
+                self.assertLessEqual(max_busy, island_jobs)
+
+                # The utilization of the plan that runs (once in
+                # the asynchronous mode, or once per period).
+                self.assertTrue(len(test_ga.stats["utilization"]) > 0)
+                self.assertTrue(all(v == utilization for v in test_ga.stats["utilization"]))
+
+                # All the islands are returned.
+                self.assertEqual(24, len(test_ga.population))
+            # _end_for_
+        # _end_for_
+    # _end_def_
+
+    def test_run_persistent(self):
+        """
+        Test that the persistent workers give the same results as the
+        per-period workers (function evaluations, records and stats).
+
+        :return: None.
+        """
+        # Results of each mode.
+        results = {}
+
+        for persistent in (False, True):
+            test_ga = self._make_ga(n_cpus=2)
+
+            # Initial best fitness.
+            f_best_0 = max(_one_max(p) for p in test_ga.population)
+
+            records = list(test_ga.run_iter(RunConfig(epochs=12, n_periods=3,
+                                                      allow_migration=True,
+                                                      persistent_islands=persistent)))
+            results[persistent] = test_ga
+
+            # One record per period (with its last epoch).
+            self.assertEqual([3, 7, 11], [r.epoch for r in records])
+
+            # The best fitness (with elitism) does not get worse.
+            self.assertGreaterEqual(test_ga.best_chromosome().fitness, f_best_0)
+        # _end_for_
+
+        spawn_ga, persistent_ga = results[False], results[True]
+
+        # All the islands run all the epochs (the initial and
+        # the final consistency evaluations are both counted).
+        self.assertEqual(24 + 12 * 24 + 24, spawn_ga.f_evals)
+        self.assertEqual(spawn_ga.f_evals, persistent_ga.f_evals)
+
+        # The same populations and stats.
+        self.assertEqual(len(spawn_ga.population), len(persistent_ga.population))
+
+        for k in range(4):
+            self.assertEqual(13, len(persistent_ga.stats[k]["avg"]))
+            self.assertEqual(len(spawn_ga.stats[k]["avg"]), len(persistent_ga.stats[k]["avg"]))
+        # _end_for_
+
+        # The same number of migrations (one per period boundary).
+        self.assertEqual(spawn_ga.migrate_op.counter, persistent_ga.migrate_op.counter)
+    # _end_def_
+
+    def test_run_shared_budget(self):
+        """
+        Test that all the islands share the budget of function evaluations
+        (in the synchronous, persistent and asynchronous modes) and stop as
+        soon as it is used up.
+
+        :return: None.
+        """
+        # The initial population and about 3 epochs of each island
+        # (with a partial epoch to test the partial reservations).
+        f_max_eval = 24 + 3 * 24 + 5
+
+        for mode in ("sync", "persistent_islands", "async_migration"):
+            test_ga = self._make_ga(n_cpus=2)
+
+            test_ga.run(RunConfig(epochs=40, n_periods=4, allow_migration=True,
+                                  f_max_eval=f_max_eval,
+                                  **({} if mode == "sync" else {mode: True})))
+
+            # The budget is used exactly.
+            self.assertEqual(f_max_eval, test_ga.f_evals, msg=mode)
+
+            # The islands stopped when the budget was used up: 13 full
+            # epochs (of 6 evaluations) plus at most one partial epoch
+            # per island, instead of the 40 epochs of each island.
+            n_epochs = sum(len(test_ga.stats[k]["avg"]) - 1 for k in range(4))
+            self.assertLessEqual(n_epochs, 13 + 4, msg=mode)
+
+            # No more periods start after the first one.
+            self.assertEqual(1, len(test_ga.stats["utilization"]), msg=mode)
+
+            # All the islands are returned.
+            self.assertEqual(24, len(test_ga.population))
+        # _end_for_
+    # _end_def_
+
+    @staticmethod
+    def _make_stalled_ga(n_cpus: int) -> IslandModelGA:
+        """
+        Creates an island model GA (with 4 islands) of real-coded chromosomes,
+        where the first island (the chromosomes 0, 4, 8, ...) has short
+        chromosomes with constant fitness, so it stalls from its first epoch.
+        Every offspring is mutated, so the other islands never converge, and
+        the migration is disabled to keep the islands independent.
+
+        :return: the IslandModelGA.
+        """
+        rng = np.random.default_rng(11)
+
+        population = [Chromosome([Gene(float(v), lambda: float(rng.uniform(0.0, 1.0)))
+                                  for v in rng.uniform(0.0, 1.0, 8 if k % 4 == 0 else 16)])
+                      for k in range(24)]
+
+        test_ga = IslandModelGA(num_islands=4, migrate_op=ClockwiseMigration(0.0),
+                                initial_pop=population, fit_func=_stalled_dot,
+                                select_op=TournamentSelector(k=2),
+                                mutate_op=RandomMutator(1.0),
+                                crossx_op=UniformCrossover())
+
+        # Use the same CPUs on all the machines.
+        test_ga._n_cpus = n_cpus
+
+        return test_ga
+    # _end_def_
+
+    def test_run_elastic_restart(self):
+        """
+        Test that a stalled island is re-seeded (and keeps evolving)
+        with the "restart" policy, instead of finishing.
+
+        :return: None.
+        """
+        for persistent in (False, True):
+            # Results of each policy.
+            results = {}
+
+            for elastic in (None, "restart"):
+                test_ga = self._make_stalled_ga(n_cpus=2)
+
+                test_ga.run(RunConfig(epochs=12, n_periods=3, f_tol=1.0e-9,
+                                      allow_migration=True, elastic_islands=elastic,
+                                      persistent_islands=persistent))
+                results[elastic] = test_ga
+
+                # All the islands are returned.
+                self.assertEqual(24, len(test_ga.population))
+            # _end_for_
+
+            fixed_ga, restart_ga = results[None], results["restart"]
+
+            # Without the policy the stalled island finishes in the first
+            # period (after two epochs), while with the policy it restarts in
+            # the next two periods (one entry of the stats for each new
+            # population and two more epochs until it stalls again).
+            self.assertEqual(1 + 2, len(fixed_ga.stats[0]["avg"]))
+            self.assertEqual(1 + 2 + 2 * (1 + 2), len(restart_ga.stats[0]["avg"]))
+
+            # Each restart evaluates the new population (except its single
+            # seed) and then its two epochs.
+            self.assertEqual(fixed_ga.f_evals + 2 * (5 + 2 * 6), restart_ga.f_evals)
+
+            # The other islands are not affected.
+            for k in range(1, 4):
+                self.assertEqual(13, len(restart_ga.stats[k]["avg"]))
+            # _end_for_
+        # _end_for_
+    # _end_def_
+
+    def test_run_elastic_workers(self):
+        """
+        Test that the "workers" policy gives the cores of the stalled
+        island to the evaluation workers of the active islands.
+
+        :return: None.
+        """
+        # With one island all the cores are evaluation workers.
+        test_ga = self._make_ga(n_cpus=6)
+        self.assertEqual((1, 6), test_ga.execution_plan(
+            1, RunConfig(eval_workers=1, elastic_islands="workers")))
+
+        # Utilization of each policy.
+        utilization = {}
+
+        for elastic in (None, "workers"):
+            test_ga = self._make_stalled_ga(n_cpus=6)
+
+            test_ga.run(RunConfig(epochs=8, n_periods=2, f_tol=1.0e-9,
+                                  allow_migration=True, eval_workers=1,
+                                  elastic_islands=elastic))
+            utilization[elastic] = test_ga.stats["utilization"]
+
+            # All the islands are returned.
+            self.assertEqual(24, len(test_ga.population))
+        # _end_for_
+
+        # In the first period 4 islands x 1 worker (of 6 CPUs). In the second
+        # period the stalled island has finished and the other 3 islands use
+        # 2 workers each (with the policy) instead of the requested one.
+        self.assertEqual([4 / 6, 0.5], utilization[None])
+        self.assertEqual([4 / 6, 1.0], utilization["workers"])
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
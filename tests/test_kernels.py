@@ -0,0 +1,114 @@
+import unittest
+import numpy as np
+from pygenalgo.operators import kernels
+
+
+class TestKernels(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestKernels - START -")
+
+        # Create a random generator with fixed seed.
+        cls.rng = np.random.default_rng(42)
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestKernels - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates a random (N, D) population within limits.
+
+        :return: None.
+        """
+        self.x_lower = -np.ones(4)
+        self.x_upper = +np.ones(4)
+        self.x_pop = self.rng.uniform(-1.0, 1.0, size=(20, 4))
+    # _end_def_
+
+    def test_selection(self):
+        """
+        Test the selection kernels return valid indices and
+        that the tournament favours the fittest individuals.
+
+        :return: None.
+        """
+        # Fitness values: [0, 1, ..., 19].
+        fitness = np.arange(20, dtype=float)
+
+        for index in (kernels.tournament_select(self.rng, fitness, 5, 20),
+                      kernels.linear_rank_select(self.rng, fitness, 2.0, 20),
+                      kernels.stochastic_universal_select(self.rng, fitness, 20)):
+            self.assertEqual((20,), index.shape)
+            self.assertTrue(np.all((0 <= index) & (index < 20)))
+        # _end_for_
+
+        # The worst individual can never win a tournament of 2 or more.
+        index = kernels.tournament_select(self.rng, fitness, 20, 1000)
+        self.assertGreater(np.mean(fitness[index]), np.mean(fitness))
+    # _end_def_
+
+    def test_crossover(self):
+        """
+        Test the crossover kernels keep the offsprings within limits.
+
+        :return: None.
+        """
+        x1, x2 = self.x_pop[0::2], self.x_pop[1::2]
+
+        for c1, c2 in (kernels.sbx_crossover(self.rng, x1, x2, 20.0,
+                                             self.x_lower, self.x_upper),
+                       kernels.blend_crossover(self.rng, x1, x2, 0.5,
+                                               self.x_lower, self.x_upper)):
+            self.assertEqual(x1.shape, c1.shape)
+            self.assertEqual(x2.shape, c2.shape)
+            self.assertTrue(np.all((c1 >= -1.0) & (c1 <= 1.0)))
+            self.assertTrue(np.all((c2 >= -1.0) & (c2 <= 1.0)))
+        # _end_for_
+
+        # Identical parents give identical offsprings.
+        c1, c2 = kernels.sbx_crossover(self.rng, x1, x1.copy(), 20.0,
+                                       self.x_lower, self.x_upper)
+        self.assertTrue(np.array_equal(c1, x1))
+        self.assertTrue(np.array_equal(c2, x1))
+    # _end_def_
+
+    def test_mutation(self):
+        """
+        Test the mutation kernels change one gene per selected row.
+
+        :return: None.
+        """
+        rows = np.array([0, 5, 7])
+
+        for kernel, param in ((kernels.gaussian_mutation, np.array(0.5)),
+                              (kernels.polynomial_mutation, 20.0)):
+            x_new = self.x_pop.copy()
+            kernel(self.rng, x_new, rows, param, self.x_lower, self.x_upper)
+
+            # At most one gene per row has changed.
+            n_changes = np.sum(x_new != self.x_pop, axis=1)
+            self.assertTrue(np.all(n_changes[rows] <= 1))
+            self.assertEqual(0, np.sum(np.delete(n_changes, rows)))
+            self.assertTrue(np.all((x_new >= -1.0) & (x_new <= 1.0)))
+        # _end_for_
+    # _end_def_
+
+    def test_hamming_distance_batch(self):
+        """
+        Test the extreme values of the Hamming distance.
+
+        :return: None.
+        """
+        self.assertEqual(1.0, kernels.hamming_distance_batch(self.x_pop))
+        self.assertEqual(0.0, kernels.hamming_distance_batch(np.ones((5, 3))))
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
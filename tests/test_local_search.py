@@ -0,0 +1,186 @@
+import unittest
+
+import numpy as np
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.local_search import LocalSearch
+from pygenalgo.engines.standard_ga import StandardGA, RunConfig
+from pygenalgo.operators.mutation.gaussian_mutator import GaussianMutator
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+
+
+class TestLocalSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestLocalSearch - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestLocalSearch - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates a small population (with a single best chromosome)
+        and an evaluation function that counts the evaluations.
+
+        :return: None.
+        """
+        self.n_evals = 0
+
+        self.population = [Chromosome([Gene(float(v), lambda: 0.0) for v in x])
+                           for x in ([0.5, 0.5, 0.5], [3.0, 3.0, 3.0], [4.0, 0.0, 4.0])]
+
+        for p in self.population:
+            p.fitness = self._sphere(p)
+        # _end_for_
+    # _end_def_
+
+    @staticmethod
+    def _sphere(individual: Chromosome) -> float:
+        return -float(np.sum((np.array(individual.values()) - 1.0) ** 2))
+    # _end_def_
+
+    def _evaluate(self, batch: list[Chromosome]) -> tuple[list, bool]:
+        """
+        Evaluates the batch (like the engines) and counts the evaluations.
+        """
+        self.n_evals += len(batch)
+
+        for p in batch:
+            p.fitness = self._sphere(p)
+        # _end_for_
+
+        return [p.fitness for p in batch], False
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test the validation of the input parameters.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            _ = LocalSearch(method="gradient")
+
+        with self.assertRaises(ValueError):
+            _ = LocalSearch(budget=0)
+
+        with self.assertRaises(ValueError):
+            _ = LocalSearch(shrink=1.0)
+    # _end_def_
+
+    def test_methods(self):
+        """
+        Test that all the methods improve the best chromosome (Lamarckian)
+        within the budget.
+
+        :return: None.
+        """
+        for method in ("coordinate", "pattern", "nelder_mead"):
+            # Reset the population.
+            self.setUp()
+
+            f_before = self.population[0].fitness
+
+            n_improved, found = LocalSearch(method, top_k=1, budget=40,
+                                            step=0.2)(self.population, self._evaluate)
+
+            self.assertEqual(1, n_improved)
+            self.assertFalse(found)
+            self.assertLessEqual(self.n_evals, 40)
+
+            # The genome and the fitness are written back.
+            self.assertGreater(self.population[0].fitness, f_before)
+            self.assertEqual(self._sphere(self.population[0]),
+                             self.population[0].fitness)
+
+            # The other chromosomes are not changed.
+            self.assertEqual([3.0, 3.0, 3.0], self.population[1].values())
+        # _end_for_
+    # _end_def_
+
+    def test_baldwinian(self):
+        """
+        Test that the Baldwinian mode changes only the fitness.
+
+        :return: None.
+        """
+        best = self.population[0]
+
+        _ = LocalSearch("pattern", budget=30, lamarckian=False)(self.population,
+                                                                self._evaluate)
+        # Same object, same genome, better fitness.
+        self.assertIs(best, self.population[0])
+        self.assertEqual([0.5, 0.5, 0.5], best.values())
+        self.assertGreater(best.fitness, -0.75)
+    # _end_def_
+
+    def test_max_evals(self):
+        """
+        Test that the remaining budget of the run limits the search.
+
+        :return: None.
+        """
+        for method in ("coordinate", "pattern", "nelder_mead"):
+            # Reset the population.
+            self.setUp()
+
+            # The budget of the run is smaller than the one of the call.
+            _ = LocalSearch(method, budget=40)(self.population, self._evaluate,
+                                               max_evals=10)
+            self.assertLessEqual(self.n_evals, 10)
+
+            # No evaluations when the budget of the run is used up.
+            self.setUp()
+
+            n_improved, _ = LocalSearch(method, budget=40)(self.population, self._evaluate,
+                                                           max_evals=0)
+            self.assertEqual(0, n_improved)
+            self.assertEqual(0, self.n_evals)
+        # _end_for_
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test that the local search of the StandardGA stops when
+        the budget of function evaluations of the run is used up.
+
+        :return: None.
+        """
+        rng = np.random.default_rng(2)
+
+        population = [Chromosome([Gene(float(v), lambda: float(rng.uniform(-5.0, 5.0)))
+                                  for v in rng.uniform(-5.0, 5.0, 3)])
+                      for _ in range(10)]
+
+        test_ga = StandardGA(initial_pop=population, fit_func=self._sphere,
+                             select_op=LinearRankSelector(),
+                             mutate_op=GaussianMutator(0.5, sigma=0.5, lower_lim=-5.0 * np.ones(3),
+                                                       upper_lim=5.0 * np.ones(3)),
+                             crossx_op=UniformCrossover(),
+                             local_search=LocalSearch("pattern", top_k=2, budget=50))
+
+        # The evaluation of the offsprings may exceed the budget (up to
+        # one epoch), but the local search starts only within the budget.
+        test_ga.run(RunConfig(epochs=100, f_max_eval=300))
+
+        self.assertLess(test_ga.f_evals, 300 + 10)
+        self.assertLess(len(test_ga.stats["local_search"]), 100)
+
+        # In the 'as completed' mode the budget is respected exactly.
+        test_ga.run(RunConfig(epochs=100, f_max_eval=300, as_completed=True))
+
+        self.assertEqual(300, test_ga.f_evals)
+        self.assertLess(len(test_ga.stats["local_search"]), 100)
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+
+from tests import random_population
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.nsga2_ga import NSGA2GA, RunConfig
+from pygenalgo.operators.mutation.gaussian_mutator import GaussianMutator
+from pygenalgo.operators.selection.tournament_selector import TournamentSelector
+from pygenalgo.operators.crossover.simulated_binary_crossover import SimulatedBinaryCrossover
+from pygenalgo.operators.selection.crowded_tournament_selector import CrowdedTournamentSelector
+
+
+def _two_spheres(individual: Chromosome) -> tuple[float, float]:
+    """
+    Dummy bi-objective fitness function (maximization). The
+    Pareto set is the diagonal between the centres [0, 0, 0]
+    and [1, 1, 1].
+    """
+    x = np.asarray(individual.values(), dtype=float)
+    return -float(np.sum(x ** 2)), -float(np.sum((x - 1.0) ** 2))
+# _end_def_
+
+
+class TestNSGA2GA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestNSGA2GA - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestNSGA2GA - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object with a random population of
+        20 real-coded chromosomes (with 3 genes).
+
+        :return: None.
+        """
+        x_lower, x_upper = -2.0 * np.ones(3), 3.0 * np.ones(3)
+
+        self.ga = NSGA2GA(initial_pop=random_population(20, 3, -2.0, 3.0, seed=5),
+                          fit_func=_two_spheres, select_op=CrowdedTournamentSelector(),
+                          mutate_op=GaussianMutator(0.2, sigma=0.3,
+                                                    lower_lim=x_lower, upper_lim=x_upper),
+                          crossx_op=SimulatedBinaryCrossover(0.9, lower_lim=x_lower,
+                                                             upper_lim=x_upper))
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test that the unsupported selection operators are rejected.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            _ = NSGA2GA(initial_pop=random_population(20, 3, -2.0, 3.0, seed=5),
+                        fit_func=_two_spheres,
+                        select_op=TournamentSelector(), mutate_op=GaussianMutator(),
+                        crossx_op=SimulatedBinaryCrossover())
+    # _end_def_
+
+    def test_environmental_selection(self):
+        """
+        Test the truncation of the last front by crowding distance.
+
+        :return: None.
+        """
+        ga = self.ga
+
+        # Front 0: [0], front 1: [1, 2, 3, 4], front 2: [5].
+        fitness = [(5.0, 5.0), (0.0, 4.0), (1.0, 3.0), (1.5, 2.5), (4.0, 0.0), (0.0, 0.0)]
+        population = [Chromosome([Gene(k, lambda: 0)], fitness=f)
+                      for k, f in enumerate(fitness)]
+
+        # The whole fronts fit.
+        survivors = ga.environmental_selection(population, 5)
+        self.assertEqual([0, 1, 2, 3, 4], sorted(p.genome[0].value for p in survivors))
+        self.assertIs(population[0], survivors[0])
+
+        # The point [1.0, 3.0] is the most crowded of the front 1
+        # (the extremes have infinite distance), so it is dropped.
+        survivors = ga.environmental_selection(population, 4)
+        self.assertEqual([0, 1, 3, 4], sorted(p.genome[0].value for p in survivors))
+
+        # Only the first front is kept.
+        survivors = ga.environmental_selection(population, 1)
+        self.assertEqual([0], [p.genome[0].value for p in survivors])
+
+        # The size of the first front is stored in every call.
+        self.assertEqual([1, 1, 1], ga.stats["front_size"])
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test a short run: the population size, the function
+        evaluations and the growth of the first front.
+
+        :return: None.
+        """
+        ga = self.ga
+
+        ga.run(RunConfig(epochs=20))
+
+        # The population keeps its size.
+        self.assertEqual(20, len(ga.population))
+
+        # One evaluation per offspring (and the initial population).
+        self.assertEqual(20 * 21, ga.f_evals)
+
+        # One front size per epoch (and the initial population).
+        self.assertEqual(21, len(ga.stats["front_size"]))
+        self.assertEqual(21, len(ga.stats["avg"]))
+        self.assertGreater(ga.stats["front_size"][-1], ga.stats["front_size"][0])
+
+        # The population is sorted by front.
+        front = ga.pareto_front()
+        self.assertEqual(ga.stats["front_size"][-1], len(front))
+        self.assertEqual({id(p) for p in front},
+                         {id(p) for p in ga.population[:len(front)]})
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+import numpy as np
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.pareto_archive import ParetoArchive
+from pygenalgo.utils.utilities import np_pareto_front_index
+
+
+class TestParetoArchive(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestParetoArchive - START -")
+
+        # Create a random generator with fixed seed.
+        cls.rng = np.random.default_rng(42)
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestParetoArchive - FINISH -", end='\n\n')
+    # _end_def_
+
+    def test_init(self) -> None:
+        """
+        Test the input parameters of the constructor.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            ParetoArchive(max_size=1)
+        # _end_with_
+
+        with self.assertRaises(ValueError):
+            ParetoArchive(max_leaf=0)
+        # _end_with_
+
+        with self.assertRaises(ValueError):
+            ParetoArchive(n_children=1)
+        # _end_with_
+    # _end_def_
+
+    def test_update(self) -> None:
+        """
+        Test that the archive contains exactly the Pareto front of all
+        the inserted points (with small leaves to force many splits).
+
+        :return: None.
+        """
+        for n_dims in (2, 3, 4):
+            # Random points with ties.
+            pts = self.rng.integers(0, 8, size=(300, n_dims)).astype(float)
+
+            # Create an unbounded archive.
+            archive = ParetoArchive(max_leaf=4)
+
+            # Insert all the points (with their index).
+            for i, y in enumerate(pts):
+                archive.update(y, i)
+            # _end_for_
+
+            # Get the solutions.
+            front, items = archive.solutions()
+
+            # Get the expected Pareto front.
+            expected = pts[np_pareto_front_index(pts, rel_eps=0.0)]
+
+            # They should be identical.
+            self.assertEqual(len(archive), front.shape[0])
+            self.assertEqual(set(map(tuple, expected)), set(map(tuple, front)))
+
+            # The items follow their points.
+            self.assertTrue(all(np.array_equal(pts[i], y)
+                                for i, y in zip(items, front)))
+            # Duplicates and dominated points are rejected.
+            self.assertFalse(archive.update(front[0]))
+            self.assertFalse(archive.update(front[0] - 1.0))
+        # _end_for_
+    # _end_def_
+
+    def test_truncation(self) -> None:
+        """
+        Test that a bounded archive keeps its maximum size and
+        the extreme points of the front.
+
+        :return: None.
+        """
+        # Points on a quarter circle (all non-dominated).
+        theta = self.rng.uniform(0.0, 0.5 * np.pi, size=500)
+        pts = np.column_stack([np.cos(theta), np.sin(theta)])
+
+        # Create a bounded archive.
+        archive = ParetoArchive(max_size=50)
+
+        for y in pts:
+            archive.update(y)
+        # _end_for_
+
+        # Check the size.
+        self.assertEqual(50, len(archive))
+
+        # The boundary points have infinite crowding distance.
+        front, _ = archive.solutions()
+        self.assertEqual(pts[:, 0].max(), front[:, 0].max())
+        self.assertEqual(pts[:, 1].max(), front[:, 1].max())
+    # _end_def_
+
+    def test_update_population(self) -> None:
+        """
+        Test that the archive stores copies of the chromosomes.
+
+        :return: None.
+        """
+        # Create a small population.
+        population = [Chromosome([Gene(float(i), self.rng.random)]) for i in range(4)]
+
+        # Assign non-dominated fitness values.
+        for i, p in enumerate(population):
+            p.fitness = (float(i), float(-i))
+        # _end_for_
+
+        # Insert them in the archive.
+        archive = ParetoArchive()
+        self.assertEqual(4, archive.update_population(population))
+
+        # Changing the population does not affect the archive.
+        population[0].fitness = (-9.0, -9.0)
+        _, items = archive.solutions()
+        self.assertIn((0.0, 0.0), [p.fitness for p in items])
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,205 @@
+import os
+import unittest
+import tempfile
+
+import numpy as np
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.restart_strategy import RestartStrategy
+from pygenalgo.engines.standard_ga import StandardGA, RunConfig
+from pygenalgo.operators.mutation.random_mutator import RandomMutator
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+
+
+class TestRestartStrategy(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestRestartStrategy - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestRestartStrategy - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates a random population of real-valued chromosomes.
+
+        :return: None.
+        """
+        self.rng = np.random.default_rng(1)
+
+        self.population = [Chromosome([Gene(float(self.rng.uniform(-5.0, 5.0)),
+                                             lambda: float(self.rng.uniform(-5.0, 5.0)))
+                                        for _ in range(4)])
+                           for _ in range(10)]
+    # _end_def_
+
+    @staticmethod
+    def _sphere(individual: Chromosome) -> float:
+        return -float(np.sum(np.array(individual.values()) ** 2))
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test the validation of the input parameters.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            _ = RestartStrategy(window=0)
+
+        with self.assertRaises(ValueError):
+            _ = RestartStrategy(pop_growth=0.5)
+
+        with self.assertRaises(TypeError):
+            _ = StandardGA(initial_pop=self.population, fit_func=self._sphere,
+                           select_op=LinearRankSelector(),
+                           mutate_op=RandomMutator(),
+                           crossx_op=UniformCrossover(),
+                           restart=10)
+    # _end_def_
+
+    def test_is_stagnant(self):
+        """
+        Test the stagnation of the best fitness and the diversity.
+
+        :return: None.
+        """
+        restart = RestartStrategy(window=3)
+
+        # Improvement in the last window.
+        self.assertFalse(restart.is_stagnant([1.0, 1.0, 1.0, 2.0], self.population))
+
+        # No improvement in the last window.
+        self.assertTrue(restart.is_stagnant([1.0, 2.0, 2.0, 2.0, 2.0], self.population))
+
+        # Collapsed population.
+        restart = RestartStrategy(window=3, min_diversity=0.1)
+        clones = [self.population[0].clone() for _ in range(10)]
+
+        self.assertTrue(restart.is_stagnant([1.0], clones))
+        self.assertFalse(restart.is_stagnant([1.0], self.population))
+    # _end_def_
+
+    def test_new_population(self):
+        """
+        Test the growth of the population and the elite archive.
+
+        :return: None.
+        """
+        for p in self.population:
+            p.fitness = self._sphere(p)
+        # _end_for_
+
+        restart = RestartStrategy(pop_growth=2.0, max_pop_size=15, n_elites=2)
+
+        new_population = restart.new_population(self.population)
+
+        # The size is limited.
+        self.assertEqual(len(new_population), 15)
+
+        # The elites keep their fitness.
+        best = sorted(p.fitness for p in self.population)[-2:]
+        self.assertEqual(sorted(p.fitness for p in new_population[:2]), best)
+
+        # The rest must be evaluated.
+        self.assertTrue(all(p.fitness is None for p in new_population[2:]))
+
+        # The restart limits.
+        restart = RestartStrategy(max_restarts=1, max_time=1.0)
+        self.assertTrue(restart.allows_restart(0, 0.5))
+        self.assertFalse(restart.allows_restart(1, 0.5))
+        self.assertFalse(restart.allows_restart(0, 1.5))
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test that the StandardGA restarts within the budget of evaluations.
+
+        :return: None.
+        """
+        StandardGA.set_seed(7)
+
+        restart = RestartStrategy(window=5, pop_growth=1.5, max_pop_size=40)
+
+        test_ga = StandardGA(initial_pop=self.population, fit_func=self._sphere,
+                             select_op=LinearRankSelector(),
+                             mutate_op=RandomMutator(),
+                             crossx_op=UniformCrossover(),
+                             restart=restart)
+
+        test_ga.run(RunConfig(epochs=200, f_max_eval=1500))
+
+        # At least one restart took place.
+        self.assertGreater(len(test_ga.stats["restarts"]), 0)
+
+        # The population has grown.
+        self.assertGreater(len(test_ga.population), 10)
+
+        # The budget of evaluations is respected (up to one epoch).
+        self.assertLess(test_ga.f_evals, 1500 + len(test_ga.population))
+
+        # The archive keeps the best fitness of the last restart.
+        last_restart = test_ga.stats["restarts"][-1]
+        self.assertGreaterEqual(restart.archive[0].fitness,
+                                test_ga.stats["best"][last_restart - 1])
+    # _end_def_
+
+    def test_checkpoint(self):
+        """
+        Test the save / load round trip of the StandardGA after a restart
+        (grown population and elite archive).
+
+        :return: None.
+        """
+        StandardGA.set_seed(7)
+
+        def make_ga(population):
+            return StandardGA(initial_pop=population, fit_func=self._sphere,
+                              select_op=LinearRankSelector(),
+                              mutate_op=RandomMutator(),
+                              crossx_op=UniformCrossover(),
+                              restart=RestartStrategy(window=5, pop_growth=1.5,
+                                                      max_pop_size=40, n_elites=2))
+        # _end_def_
+
+        test_ga = make_ga(self.population)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "checkpoint.npz")
+
+            test_ga.run(RunConfig(epochs=100, checkpoint_path=path))
+
+            # At least one (growing) restart took place.
+            self.assertGreater(len(test_ga.stats["restarts"]), 0)
+            self.assertGreater(len(test_ga.population), 10)
+
+            # Load the checkpoint in a new engine (with the initial size).
+            new_ga = make_ga([p.clone() for p in self.population])
+            new_ga.load_checkpoint(path)
+        # _end_with_
+
+        # The population is restored with its grown size.
+        self.assertEqual(len(test_ga.population), len(new_ga.population))
+        self.assertEqual(test_ga.population, new_ga.population)
+        self.assertEqual(test_ga.population_fitness(), new_ga.population_fitness())
+
+        # The elite archive is restored.
+        archive, new_archive = test_ga._restart.archive, new_ga._restart.archive
+
+        self.assertEqual(2, len(new_archive))
+        self.assertEqual([p.values() for p in archive], [p.values() for p in new_archive])
+        self.assertEqual([p.fitness for p in archive], [p.fitness for p in new_archive])
+        self.assertEqual(test_ga.stats["restarts"], new_ga.stats["restarts"])
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,7 +32,16 @@ class TestRunConfig(unittest.TestCase):
         self.assertFalse(config.verbose)
         self.assertIsNone(config.f_tol)
         self.assertIsNone(config.f_max_eval)
+        self.assertFalse(config.as_completed)
         self.assertFalse(config.allow_migration)
+        self.assertFalse(config.persistent_islands)
+        self.assertFalse(config.async_migration)
+        self.assertIsNone(config.elastic_islands)
+        self.assertIsNone(config.island_jobs)
+        self.assertEqual(config.eval_workers, 1)
+        self.assertEqual(config.eval_backend, "threading")
+        self.assertIsNone(config.checkpoint_path)
+        self.assertEqual(config.checkpoint_every, 1)
     # _end_def_
 
     def test_custom_values(self) -> None:
@@ -89,6 +98,34 @@ class TestRunConfig(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             _ = RunConfig(shuffle=10)
+
+        with self.assertRaises(TypeError):
+            _ = RunConfig(persistent_islands=1)
+
+        with self.assertRaises(ValueError):
+            _ = RunConfig(elastic_islands="cores")
+
+        with self.assertRaises(ValueError):
+            _ = RunConfig(eval_workers=0)
+
+        with self.assertRaises(ValueError):
+            _ = RunConfig(eval_backend="dask")
+
+        # The island workers can not start loky processes.
+        for mode in ("persistent_islands", "async_migration"):
+            with self.assertRaises(ValueError):
+                _ = RunConfig(eval_backend="loky", allow_migration=True, **{mode: True})
+            # _end_with_
+
+            # Without migration the mode is not used.
+            _ = RunConfig(eval_backend="loky", allow_migration=False, **{mode: True})
+        # _end_for_
+
+        with self.assertRaises(ValueError):
+            _ = RunConfig(checkpoint_every=0)
+
+        with self.assertRaises(TypeError):
+            _ = RunConfig(checkpoint_path=10)
     # _end_def_
 
 # _end_class_
@@ -0,0 +1,131 @@
+import sys
+import time
+import unittest
+import threading
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.utils.simulator_pool import SimulatorPool
+
+# Dummy simulator: returns the sum of the values, but it
+# hangs when the first value is '-1' and exits when '-2'.
+SIMULATOR_CODE = """
+import sys, time
+for line in sys.stdin:
+    x = [float(v) for v in line.split()]
+    if x[0] == -1:
+        time.sleep(60)
+    if x[0] == -2:
+        sys.exit(1)
+    print(sum(x), flush=True)
+"""
+
+
+class TestSimulatorPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestSimulatorPool - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestSimulatorPool - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object with default settings.
+
+        :return: None.
+        """
+        self.command = [sys.executable, "-u", "-c", SIMULATOR_CODE]
+    # _end_def_
+
+    def test_evaluate_batch(self):
+        """
+        Ensure the batch is evaluated correctly and in order.
+
+        :return: None.
+        """
+        # Create a test population.
+        population = [Chromosome([Gene(float(i), lambda: 0.0),
+                                  Gene(1.0, lambda: 0.0)]) for i in range(20)]
+
+        with SimulatorPool(self.command, n_procs=3, minimize=True) as pool:
+            results = pool.evaluate_batch(population)
+        # _end_with_
+
+        # Check the values (minimization).
+        self.assertEqual([-(i + 1.0) for i in range(20)],
+                         [r.f_value for r in results])
+    # _end_def_
+
+    def test_failed_simulators(self):
+        """
+        Ensure the hung and killed simulators are handled.
+
+        :return: None.
+        """
+        # Create a test population.
+        population = [Chromosome([Gene(-1.0, lambda: 0.0)]),
+                      Chromosome([Gene(-2.0, lambda: 0.0)]),
+                      Chromosome([Gene(5.0, lambda: 0.0)])]
+
+        with SimulatorPool(self.command, n_procs=2, timeout=0.5,
+                           max_retries=1, penalty=-100.0) as pool:
+            results = pool.evaluate_batch(population)
+
+            # Both failing chromosomes are penalized.
+            self.assertEqual([-100.0, -100.0, 5.0],
+                             [r.f_value for r in results])
+            self.assertEqual(2, pool.counters["timeouts"])
+            self.assertEqual(2, pool.counters["crashes"])
+            self.assertEqual(2, pool.counters["penalized"])
+        # _end_with_
+
+        # Without penalty, an error is raised.
+        with SimulatorPool(self.command, timeout=0.5, max_retries=0) as pool:
+            with self.assertRaises(RuntimeError):
+                _ = pool(population[1])
+        # _end_with_
+    # _end_def_
+
+    def test_close_during_batch(self):
+        """
+        Ensure the pool can be closed while a batch (with a
+        failing simulator) is still running.
+
+        :return: None.
+        """
+        # Create a test population (the first one hangs).
+        population = [Chromosome([Gene(-1.0, lambda: 0.0)]),
+                      Chromosome([Gene(5.0, lambda: 0.0)])]
+
+        pool = SimulatorPool(self.command, n_procs=2, timeout=0.5,
+                             max_retries=0, penalty=-100.0)
+        pool.start()
+
+        # Run the batch in the background.
+        batch = threading.Thread(target=pool.evaluate_batch, args=(population,))
+        batch.start()
+
+        # Close the pool while the first request waits for its timeout.
+        time.sleep(0.1)
+
+        closing = threading.Thread(target=pool.close)
+        closing.start()
+
+        # Both threads finish (no deadlock).
+        closing.join(timeout=10.0)
+        batch.join(timeout=10.0)
+
+        self.assertFalse(closing.is_alive())
+        self.assertFalse(batch.is_alive())
+        self.assertEqual(1, pool.counters["timeouts"])
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+
+import numpy as np
+
+from tests import random_population
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.sms_emoa_ga import SMSEMOAGA, RunConfig
+from pygenalgo.operators.mutation.gaussian_mutator import GaussianMutator
+from pygenalgo.operators.crossover.simulated_binary_crossover import SimulatedBinaryCrossover
+from pygenalgo.operators.selection.pareto_tournament_selector import ParetoTournamentSelector
+
+
+def _two_spheres(individual: Chromosome) -> tuple[float, float]:
+    """
+    Dummy bi-objective fitness function (maximization). The
+    Pareto set is the diagonal between the centres [0, 0, 0]
+    and [1, 1, 1].
+    """
+    x = np.asarray(individual.values(), dtype=float)
+    return -float(np.sum(x ** 2)), -float(np.sum((x - 1.0) ** 2))
+# _end_def_
+
+
+class TestSMSEMOAGA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestSMSEMOAGA - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestSMSEMOAGA - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object with a random population of
+        12 real-coded chromosomes (with 3 genes).
+
+        :return: None.
+        """
+        x_lower, x_upper = -2.0 * np.ones(3), 3.0 * np.ones(3)
+
+        self.ga = SMSEMOAGA(initial_pop=random_population(12, 3, -2.0, 3.0, seed=11),
+                            fit_func=_two_spheres, select_op=ParetoTournamentSelector(),
+                            mutate_op=GaussianMutator(0.2, sigma=0.3,
+                                                      lower_lim=x_lower, upper_lim=x_upper),
+                            crossx_op=SimulatedBinaryCrossover(0.9, lower_lim=x_lower,
+                                                               upper_lim=x_upper))
+    # _end_def_
+
+    def test_s_metric_selection(self):
+        """
+        Test that the chromosome with the lowest hypervolume
+        contribution, on the worst front, is removed.
+
+        :return: None.
+        """
+        ga = self.ga
+
+        # Front 0: [0], front 1: [1, 2, 3, 4].
+        fitness = [(5.0, 5.0), (0.0, 4.0), (1.0, 3.0), (1.5, 2.5), (4.0, 0.0)]
+        population = [Chromosome([Gene(k, lambda: 0)], fitness=f)
+                      for k, f in enumerate(fitness)]
+
+        # With the reference point at [-1, -1] the contributions of the
+        # worst front are: [1.0, 0.5, 1.25, 2.5], so [1.0, 3.0] is removed.
+        survivors = ga.s_metric_selection(population)
+        self.assertEqual([0, 1, 3, 4], [p.genome[0].value for p in survivors])
+
+        # A single point on the worst front is removed directly.
+        population.append(Chromosome([Gene(5, lambda: 0)], fitness=(-1.0, -1.0)))
+
+        survivors = ga.s_metric_selection(population)
+        self.assertEqual([0, 1, 2, 3, 4], [p.genome[0].value for p in survivors])
+    # _end_def_
+
+    def test_update_hypervolume(self):
+        """
+        Test that the Monte Carlo estimate of the hypervolume does
+        not use the random generator of the evolution.
+
+        :return: None.
+        """
+        x_lower, x_upper = -2.0 * np.ones(3), 3.0 * np.ones(3)
+
+        ga = SMSEMOAGA(initial_pop=random_population(12, 3, -2.0, 3.0, seed=11),
+                       fit_func=_two_spheres, select_op=ParetoTournamentSelector(),
+                       mutate_op=GaussianMutator(0.2, sigma=0.3,
+                                                 lower_lim=x_lower, upper_lim=x_upper),
+                       crossx_op=SimulatedBinaryCrossover(0.9, lower_lim=x_lower,
+                                                          upper_lim=x_upper),
+                       ref_point=np.zeros(4))
+
+        # 60 non-dominated points (on the unit sphere) with
+        # 4 objectives use the Monte Carlo method.
+        x_pts = np.abs(np.random.default_rng(1).normal(size=(60, 4)))
+        fit_list = [tuple(x) for x in x_pts / np.linalg.norm(x_pts, axis=1, keepdims=True)]
+
+        # Get the state of the evolution generator.
+        state = ga.rng_GA.bit_generator.state
+
+        hv_value = ga.update_hypervolume(fit_list)
+
+        self.assertTrue(0.0 < hv_value <= 1.0)
+        self.assertEqual(state, ga.rng_GA.bit_generator.state)
+
+        # The same seed gives the same estimate.
+        SMSEMOAGA.set_seed(3)
+        hv_value_1 = ga.update_hypervolume(fit_list)
+
+        SMSEMOAGA.set_seed(3)
+        hv_value_2 = ga.update_hypervolume(fit_list)
+
+        self.assertEqual(hv_value_1, hv_value_2)
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test a short run: the population size, the function
+        evaluations and the hypervolume stats.
+
+        :return: None.
+        """
+        ga = self.ga
+
+        ga.run(RunConfig(epochs=10))
+
+        # The population keeps its size.
+        self.assertEqual(12, len(ga.population))
+
+        # One evaluation per steady state step (and the initial population).
+        self.assertEqual(12 * 11, ga.f_evals)
+
+        # One hypervolume per epoch (and the initial population).
+        hv_values = ga.stats["hypervolume"]
+        self.assertEqual(11, len(hv_values))
+        self.assertEqual(11, len(ga.stats["avg"]))
+
+        # The S-metric selection never decreases the hypervolume
+        # (with the fixed reference point of the run).
+        self.assertTrue(np.all(np.diff(hv_values) >= -1.0e-9))
+        self.assertGreater(hv_values[-1], hv_values[0])
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+from pygenalgo.engines.generic_ga import EpochRecord
+from pygenalgo.engines.standard_ga import StandardGA, RunConfig
+from pygenalgo.utils.termination import (WallClock, EvaluationBudget, TargetFitness,
+                                         BestFitnessStall, HypervolumeStall,
+                                         DiversityCollapse, AnyOf)
+from pygenalgo.operators.mutation.random_mutator import RandomMutator
+from pygenalgo.operators.crossover.uniform_crossover import UniformCrossover
+from pygenalgo.operators.selection.linear_rank_selector import LinearRankSelector
+
+
+class _Engine:
+    """
+    Minimal engine with the fields that are used by the criteria.
+    """
+    def __init__(self, population=None, stats=None):
+        self.population = population or []
+        self.stats = stats or {}
+    # _end_def_
+
+# _end_class_
+
+
+def _record(epoch=0, best=0.0, f_evals=0, elapsed_time=0.0, population=None):
+    return EpochRecord(epoch=epoch, best=best, avg=0.0, std=0.0, f_evals=f_evals,
+                       elapsed_time=elapsed_time, epoch_time=0.0,
+                       population=population)
+# _end_def_
+
+
+class TestTermination(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestTermination - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestTermination - FINISH -", end='\n\n')
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test the validation of the input parameters.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            _ = WallClock(0.0)
+
+        with self.assertRaises(ValueError):
+            _ = EvaluationBudget(0)
+
+        with self.assertRaises(ValueError):
+            _ = BestFitnessStall(window=0)
+
+        with self.assertRaises(ValueError):
+            _ = DiversityCollapse(1.5)
+
+        with self.assertRaises(TypeError):
+            _ = AnyOf(WallClock(1.0), 10)
+
+        with self.assertRaises(TypeError):
+            _ = RunConfig(termination=10.0)
+    # _end_def_
+
+    def test_simple_criteria(self):
+        """
+        Test the criteria that depend only on the current record.
+
+        :return: None.
+        """
+        engine = _Engine()
+
+        self.assertFalse(WallClock(2.0)(engine, _record(elapsed_time=1.0)))
+        self.assertTrue(WallClock(2.0)(engine, _record(elapsed_time=2.5)))
+
+        self.assertFalse(EvaluationBudget(100)(engine, _record(f_evals=99)))
+        self.assertTrue(EvaluationBudget(100)(engine, _record(f_evals=100)))
+
+        self.assertFalse(TargetFitness(1.0)(engine, _record(best=0.5)))
+        self.assertFalse(TargetFitness(1.0)(engine, _record(best=None)))
+        self.assertTrue(TargetFitness(1.0)(engine, _record(best=1.0)))
+
+        # Identical chromosomes (no diversity).
+        population = [Chromosome([Gene(1, lambda: 0), Gene(0, lambda: 0)])
+                      for _ in range(4)]
+
+        self.assertTrue(DiversityCollapse(0.1)(_Engine(population), _record()))
+
+        population[0][0].value = 0
+        population[1][1].value = 1
+        self.assertFalse(DiversityCollapse(0.1)(engine, _record(population=tuple(population))))
+    # _end_def_
+
+    def test_stall_criteria(self):
+        """
+        Test the criteria with a window of epochs.
+
+        :return: None.
+        """
+        engine = _Engine()
+        stall = BestFitnessStall(window=3, tol=0.1)
+
+        # Improvements less than 'tol' are stalls.
+        results = [stall(engine, _record(epoch=i, best=b))
+                   for i, b in enumerate([1.0, 2.0, 2.05, 2.05, 2.1])]
+        self.assertEqual([False, False, False, False, True], results)
+
+        # A new run clears the history.
+        self.assertFalse(stall(engine, _record(epoch=0, best=2.1)))
+
+        # Hypervolume from the stats of the engine.
+        hv_stall = HypervolumeStall(window=2)
+        self.assertFalse(hv_stall(_Engine(stats={"hypervolume": [1.0, 1.0, 1.5]}), _record()))
+        self.assertTrue(hv_stall(_Engine(stats={"hypervolume": [1.0, 1.5, 1.5, 1.4]}), _record()))
+        self.assertFalse(hv_stall(_Engine(), _record()))
+    # _end_def_
+
+    def test_combinations(self):
+        """
+        Test the combination of the criteria and the reason.
+
+        :return: None.
+        """
+        engine = _Engine()
+
+        any_of = WallClock(10.0) | EvaluationBudget(100)
+        all_of = WallClock(10.0) & EvaluationBudget(100)
+
+        record = _record(f_evals=200, elapsed_time=1.0)
+
+        self.assertTrue(any_of(engine, record))
+        self.assertEqual("EvaluationBudget(100)", any_of.reason)
+
+        self.assertFalse(all_of(engine, record))
+        self.assertIsNone(all_of.reason)
+
+        self.assertTrue(all_of(engine, _record(f_evals=200, elapsed_time=20.0)))
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test that the StandardGA stops when the criterion is met.
+
+        :return: None.
+        """
+        population = [Chromosome([Gene(i % 2, lambda: 0) for i in range(4)])
+                      for _ in range(8)]
+
+        test_ga = StandardGA(initial_pop=population, fit_func=lambda x: 1.0,
+                             select_op=LinearRankSelector(),
+                             mutate_op=RandomMutator(),
+                             crossx_op=UniformCrossover())
+
+        # The fitness never improves.
+        records = list(test_ga.run_iter(RunConfig(epochs=100,
+                                                  termination=BestFitnessStall(window=5))))
+        self.assertEqual(6, len(records))
+        self.assertEqual(6, len(test_ga.stats["avg"]) - 1)
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+from pygenalgo.operators.migration.topology import (Topology, RingTopology,
+                                                    TorusTopology, HypercubeTopology,
+                                                    RandomRegularTopology)
+
+
+class TestTopology(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestTopology - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestTopology - FINISH -", end='\n\n')
+    # _end_def_
+
+    def test_ring(self):
+        """
+        Test the directed and the bidirectional rings.
+
+        :return: None.
+        """
+        ring = RingTopology(4)
+
+        self.assertEqual(4, ring.n_islands)
+        self.assertEqual((1,), ring.targets(0))
+        self.assertEqual((3,), ring.sources(0))
+
+        ring = RingTopology(5, bidirectional=True)
+
+        self.assertEqual((1, 4), ring.targets(0))
+        self.assertEqual((1, 4), ring.sources(0))
+
+        # A single island has no neighbours.
+        self.assertEqual((), RingTopology(1).targets(0))
+    # _end_def_
+
+    def test_torus(self):
+        """
+        Test the torus grid (von Neumann neighbours with wrap around).
+
+        :return: None.
+        """
+        torus = TorusTopology(3, 4)
+
+        self.assertEqual(12, torus.n_islands)
+
+        # Island (0, 0): up (2, 0), down (1, 0), left (0, 3), right (0, 1).
+        self.assertEqual((1, 3, 4, 8), torus.targets(0))
+
+        # All the islands have four neighbours.
+        self.assertTrue(all(len(torus.targets(i)) == 4 for i in range(12)))
+    # _end_def_
+
+    def test_hypercube(self):
+        """
+        Test the hypercube (neighbours differ in one bit).
+
+        :return: None.
+        """
+        cube = HypercubeTopology(3)
+
+        self.assertEqual(8, cube.n_islands)
+        self.assertEqual((1, 2, 4), cube.targets(0))
+        self.assertEqual((1, 4, 7), cube.targets(5))
+    # _end_def_
+
+    def test_random_regular(self):
+        """
+        Test the random k-regular graph.
+
+        :return: None.
+        """
+        graph = RandomRegularTopology(10, 3, seed=1)
+
+        for i in range(10):
+            # Exactly k neighbours without self loops.
+            self.assertEqual(3, len(graph.targets(i)))
+            self.assertNotIn(i, graph.targets(i))
+
+            # The graph is undirected.
+            self.assertEqual(graph.targets(i), graph.sources(i))
+        # _end_for_
+
+        # The same seed gives the same graph.
+        other = RandomRegularTopology(10, 3, seed=1)
+        self.assertTrue(all(graph.targets(i) == other.targets(i) for i in range(10)))
+
+        # Odd number of stubs.
+        with self.assertRaises(ValueError):
+            _ = RandomRegularTopology(5, 3)
+        # _end_with_
+
+        # Degree too high.
+        with self.assertRaises(ValueError):
+            _ = RandomRegularTopology(4, 4)
+        # _end_with_
+    # _end_def_
+
+    def test_wrong_targets(self):
+        """
+        Test the sanity checks of the adjacency lists.
+
+        :return: None.
+        """
+        with self.assertRaises(ValueError):
+            _ = Topology([])
+        # _end_with_
+
+        with self.assertRaises(ValueError):
+            _ = Topology([[1], [2]])
+        # _end_with_
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+
+from pygenalgo.genome.gene import Gene
+from pygenalgo.genome.chromosome import Chromosome
+
+from pygenalgo.utils.auxiliary import SubPopulation
+from pygenalgo.operators.migration.topology import RingTopology
+from pygenalgo.operators.migration.topology_migration import TopologyMigration
+
+
+class TestTopologyMigration(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestTopologyMigration - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestTopologyMigration - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object with default settings.
+
+        :return: None.
+        """
+        # Create an object with a migration probability of 1.0.
+        self.mig_op = TopologyMigration(RingTopology(3), migration_probability=1.0)
+    # _end_def_
+
+    def test_migrate(self):
+        """
+        Each island should receive the best chromosome of its
+        source island (in the ring), except the skipped ones.
+
+        :return: None.
+        """
+        # Create a list of three SubPopulation objects,
+        # where the best fitness of the i-th island is 10*i.
+        pop = [SubPopulation(i, [Chromosome(genome=[Gene(f"{i}{j}", lambda: str('x'))],
+                                            fitness=float(10*i - j))
+                                 for j in range(4)])
+               for i in range(3)]
+
+        # Perform the migration.
+        self.mig_op(pop)
+
+        # Island 1 gets the best of island 0, etc.
+        for i, island in enumerate(pop):
+            # Get the fitness of the source.
+            source = 10.0 * ((i - 1) % 3)
+
+            self.assertIn(source, [p.fitness for p in island.population])
+        # _end_for_
+
+        self.assertEqual(1, self.mig_op.counter)
+
+        # Without island 0, the island 1 gets nothing.
+        pop = pop[1:]
+        before = [p.fitness for p in pop[0].population]
+        self.mig_op(pop)
+        self.assertEqual(before, [p.fitness for p in pop[0].population])
+    # _end_def_
+
+    def test_wrong_topology(self):
+        """
+        The topology should be a Topology object.
+
+        :return: None.
+        """
+        with self.assertRaises(TypeError):
+            _ = TopologyMigration([[1], [0]])
+        # _end_with_
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()
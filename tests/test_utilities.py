@@ -3,7 +3,8 @@ import numpy as np
 
 from utils.utilities import (np_pareto_front,
                              np_pareto_front_index)
-from pygenalgo.utils.utilities import two_indices_fast
+from pygenalgo.utils.utilities import (two_indices_fast, non_dominated_sort,
+                                       non_dominated_ranks, crowding_distance)
 
 
 class TestUtilities(unittest.TestCase):
@@ -239,7 +240,7 @@ class TestUtilities(unittest.TestCase):
 
     def test_branching_large_input_returns_expected_set(self) -> None:
         """
-        Force the loop-branch by making memory_bytes exceed 500MB.
+        Force the blocked-branch by making memory_bytes exceed 500MB.
 
         :return: None.
         """
@@ -260,13 +261,119 @@ class TestUtilities(unittest.TestCase):
         # One dominated point
         pts[789] = -0.5
 
-        # Should use the loop-branch.
+        # Should use the blocked-branch.
         idx = np_pareto_front_index(pts, mode="max", rel_eps=0.0,
                                     exclude_duplicates=False)
         # Expected set.
         self.assertFrontEqual(idx, expected_set={123, 456})
     # _end_def_
 
+    def test_max_bytes(self) -> None:
+        """
+        Test that the blocked-branch (with a tiny memory ceiling)
+        agrees with the batch-branch.
+
+        :return: None.
+        """
+        # Sample points with many objectives.
+        pts = self.rng.normal(size=(300, 5))
+
+        for rel_eps in (0.0, 1.0e-2):
+            # Batch mode.
+            idx_batch = np_pareto_front_index(pts, rel_eps=rel_eps)
+
+            # Blocked mode (a few points per block).
+            idx_block = np_pareto_front_index(pts, rel_eps=rel_eps, max_bytes=100)
+
+            # They should be identical.
+            self.assertFrontEqual(idx_block, expected_set=set(idx_batch))
+        # _end_for_
+
+        # The memory ceiling must be positive.
+        with self.assertRaises(ValueError):
+            np_pareto_front_index(pts, max_bytes=0)
+        # _end_with_
+    # _end_def_
+
+    def test_non_dominated_sort(self) -> None:
+        """
+        Test the non_dominated_sort returns all the fronts in order.
+
+        :return: None.
+        """
+        # Sample points.
+        pts = np.array([
+            [3.0, 1.0],  # 0 rank 0
+            [1.0, 3.0],  # 1 rank 0
+            [2.0, 0.5],  # 2 rank 1
+            [0.5, 2.0],  # 3 rank 1
+            [0.0, 0.0],  # 4 rank 2
+            [3.0, 1.0],  # 5 rank 0 (duplicate of 0)
+        ], dtype=float)
+
+        fronts = non_dominated_sort(pts, mode="max")
+
+        # Check the fronts.
+        self.assertEqual(3, len(fronts))
+        self.assertFrontEqual(fronts[0], expected_set={0, 1, 5})
+        self.assertFrontEqual(fronts[1], expected_set={2, 3})
+        self.assertFrontEqual(fronts[2], expected_set={4})
+
+        # The 'min' mode reverses the order of the fronts.
+        fronts = non_dominated_sort(pts, mode="min")
+        self.assertFrontEqual(fronts[0], expected_set={4})
+
+        # The first front agrees with the np_pareto_front_index.
+        pts = self.rng.normal(size=(200, 3))
+        self.assertFrontEqual(non_dominated_sort(pts)[0],
+                              expected_set=set(np_pareto_front_index(pts, rel_eps=0.0)))
+    # _end_def_
+
+    def test_non_dominated_ranks(self) -> None:
+        """
+        Test the sweep-based ranks (two and three objectives) against
+        the quadratic method, by adding a constant objective to force
+        the latter.
+
+        :return: None.
+        """
+        for n_dims in (2, 3):
+
+            # Random points with many ties.
+            pts = self.rng.integers(0, 10, size=(500, n_dims)).astype(float)
+
+            # Add a constant objective that does not change the dominance.
+            pts_ref = np.hstack([pts, np.ones((500, 1))])
+
+            for mode in ("max", "min"):
+                self.assertTrue(np.array_equal(non_dominated_ranks(pts, mode=mode),
+                                               non_dominated_ranks(pts_ref, mode=mode)))
+            # _end_for_
+        # _end_for_
+    # _end_def_
+
+    def test_crowding_distance(self) -> None:
+        """
+        Test the crowding_distance on a simple linear front.
+
+        :return: None.
+        """
+        # Points on the line f1 + f2 = 4.
+        pts = np.array([[0.0, 4.0], [1.0, 3.0], [3.0, 1.0], [4.0, 0.0]])
+
+        # Compute the crowding distance.
+        dist = crowding_distance(pts)
+
+        # Boundary points have infinite distance.
+        self.assertTrue(np.isinf(dist[0]) and np.isinf(dist[3]))
+
+        # Interior points: (3/4) + (3/4) in each objective.
+        self.assertTrue(np.allclose(dist[1:3], [1.5, 1.5]))
+
+        # Two points are always boundaries.
+        self.assertTrue(np.all(np.isinf(crowding_distance(pts[:2]))))
+    # _end_def_
+
 # _end_class_
 
 
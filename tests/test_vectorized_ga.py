@@ -0,0 +1,171 @@
+import os
+import unittest
+import tempfile
+
+import numpy as np
+
+from tests import random_population
+from pygenalgo.engines.vectorized_ga import VectorizedGA, RunConfig
+from pygenalgo.operators.mutation.flip_mutator import FlipMutator
+from pygenalgo.operators.mutation.gaussian_mutator import GaussianMutator
+from pygenalgo.operators.selection.tournament_selector import TournamentSelector
+from pygenalgo.operators.crossover.simulated_binary_crossover import SimulatedBinaryCrossover
+
+
+def _neg_sphere(x_pop: np.ndarray) -> np.ndarray:
+    """
+    Dummy (batched) fitness function: the negative sphere function.
+    """
+    return -np.sum(x_pop ** 2, axis=1)
+# _end_def_
+
+
+class TestVectorizedGA(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        print(">> TestVectorizedGA - START -")
+    # _end_def_
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        print(">> TestVectorizedGA - FINISH -", end='\n\n')
+    # _end_def_
+
+    def setUp(self) -> None:
+        """
+        Creates the test object with a random population of
+        40 real-coded chromosomes (with 5 genes).
+
+        :return: None.
+        """
+        x_lower, x_upper = -5.0 * np.ones(5), 5.0 * np.ones(5)
+
+        self.ga = VectorizedGA(initial_pop=random_population(40, 5, -5.0, 5.0, seed=7),
+                               fit_func=_neg_sphere, select_op=TournamentSelector(k=3),
+                               mutate_op=GaussianMutator(0.2, sigma=0.5,
+                                                         lower_lim=x_lower, upper_lim=x_upper),
+                               crossx_op=SimulatedBinaryCrossover(0.9, lower_lim=x_lower,
+                                                                  upper_lim=x_upper))
+    # _end_def_
+
+    def test_init(self):
+        """
+        Test that the unsupported operators and settings are rejected.
+
+        :return: None.
+        """
+        # Test population and bounds.
+        population = random_population(40, 5, -5.0, 5.0, seed=7)
+        x_lower, x_upper = -5.0 * np.ones(5), 5.0 * np.ones(5)
+
+        with self.assertRaises(ValueError):
+            _ = VectorizedGA(initial_pop=population, fit_func=_neg_sphere,
+                             select_op=TournamentSelector(), mutate_op=FlipMutator(),
+                             crossx_op=SimulatedBinaryCrossover())
+        # _end_with_
+
+        # The feasibility stage and the fault tolerance are not supported.
+        with self.assertRaises(ValueError):
+            _ = VectorizedGA(initial_pop=population, fit_func=_neg_sphere,
+                             select_op=TournamentSelector(),
+                             mutate_op=GaussianMutator(lower_lim=x_lower, upper_lim=x_upper),
+                             crossx_op=SimulatedBinaryCrossover(),
+                             feasible_func=lambda pop: [True] * len(pop),
+                             infeasible_penalty=-1.0)
+        # _end_with_
+
+        with self.assertRaises(ValueError):
+            _ = VectorizedGA(initial_pop=population, fit_func=_neg_sphere,
+                             select_op=TournamentSelector(),
+                             mutate_op=GaussianMutator(lower_lim=x_lower, upper_lim=x_upper),
+                             crossx_op=SimulatedBinaryCrossover(),
+                             max_retries=1, crash_penalty=-1.0)
+        # _end_with_
+
+        # The parallel evaluations are not supported.
+        for config in (RunConfig(parallel=True), RunConfig(parallel=True, as_completed=True)):
+            with self.assertRaises(ValueError):
+                self.ga.run(config)
+            # _end_with_
+        # _end_for_
+    # _end_def_
+
+    def test_run(self):
+        """
+        Test the shape of the population, the number of function
+        evaluations and the improvement of the best fitness.
+
+        :return: None.
+        """
+        ga = self.ga
+
+        # Initial best fitness.
+        f_best_0 = float(np.max(_neg_sphere(ga.x_population)))
+
+        ga.run(RunConfig(epochs=30, elitism=True))
+
+        # The population keeps its shape.
+        self.assertEqual((40, 5), ga.x_population.shape)
+        self.assertEqual((40,), ga.f_population.shape)
+        self.assertEqual(40, len(ga.population))
+
+        # One batch per epoch (plus the initial one).
+        self.assertEqual(40 * 31, ga.f_evals)
+        self.assertEqual(31, len(ga.stats["avg"]))
+
+        # The best fitness improves (elitism keeps the best).
+        f_best = float(np.max(ga.f_population))
+        self.assertGreater(f_best, f_best_0)
+        self.assertEqual(f_best, ga.best_chromosome().fitness)
+
+        # The fitness array agrees with the population array.
+        self.assertTrue(np.allclose(ga.f_population, _neg_sphere(ga.x_population)))
+    # _end_def_
+
+    def test_checkpoint(self):
+        """
+        Test that the periodic checkpoint stores the population
+        arrays and that a loaded checkpoint resumes the run.
+
+        :return: None.
+        """
+        ga = self.ga
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "checkpoint.npz")
+
+            ga.run(RunConfig(epochs=10, checkpoint_path=path, checkpoint_every=1))
+
+            # The checkpoint is written.
+            self.assertEqual(["checkpoint.npz"], os.listdir(tmp_dir))
+
+            # Load it in a new engine (with the same settings).
+            x_lower, x_upper = -5.0 * np.ones(5), 5.0 * np.ones(5)
+
+            new_ga = VectorizedGA(initial_pop=random_population(40, 5, -5.0, 5.0, seed=7),
+                                  fit_func=_neg_sphere, select_op=TournamentSelector(k=3),
+                                  mutate_op=GaussianMutator(0.2, sigma=0.5, lower_lim=x_lower,
+                                                            upper_lim=x_upper),
+                                  crossx_op=SimulatedBinaryCrossover(0.9, lower_lim=x_lower,
+                                                                     upper_lim=x_upper))
+            new_ga.load_checkpoint(path)
+        # _end_with_
+
+        # The population arrays are restored.
+        self.assertTrue(np.array_equal(ga.x_population, new_ga.x_population))
+        self.assertTrue(np.array_equal(ga.f_population, new_ga.f_population))
+
+        # The run continues after the last saved epoch.
+        new_ga.run(RunConfig(epochs=15))
+
+        self.assertEqual(40 * 16, new_ga.f_evals)
+        self.assertEqual(16, len(new_ga.stats["avg"]))
+        self.assertEqual(ga.stats["avg"], new_ga.stats["avg"][:11])
+    # _end_def_
+
+# _end_class_
+
+
+if __name__ == '__main__':
+    unittest.main()